@@ -2,6 +2,10 @@ import pygame
 import os
 from typing import Optional, Dict, Any, List
 
+from assets import load_image
+from sim_clock import WALL_CLOCK
+from player_state import PlayerState
+
 class Character:
     # --- 설정 상수 ---
     BODY_SIZE = (200, 200) 
@@ -12,12 +16,16 @@ class Character:
     AWAKENING_ANIM_SPEED_MS = 200 
     HIT_ANIM_DURATION_MS = 150 
     # --- (설정 상수 종료) ---
+
+    # 📢 경기 스냅샷(snapshot.py)이 저장/복원하는 애니메이션 상태 (이미지는 저장하지 않음)
+    SNAPSHOT_ATTRS = ("attack_timer", "is_attacking", "hit_timer", "is_confused", "is_frozen", "is_dashing", "dash_timer")
     
-    def __init__(self, codename: str, player_id: int, state_dict: Dict[str, Any], skill_state_dict: Dict[str, Any]):
+    def __init__(self, codename: str, player_id: int, state_dict: PlayerState, skill_state_dict: Dict[str, Any], clock=None):
         self.codename = codename
+        self.clock = clock or WALL_CLOCK # 📢 각성 종료/깜빡임 계산에 사용하는 (시뮬레이션) 시계
         self.player_id = player_id
         
-        self.state = state_dict 
+        self.state = state_dict # 📢 match.PlayerState (각성/바라보는 방향 플래그를 이 객체에 기록)
         self.skill_state = skill_state_dict 
 
         # 애니메이션 상태
@@ -33,34 +41,41 @@ class Character:
         self.is_dashing = False
         self.dash_timer = 0
         
-        if "facing_right" not in self.state:
-            self.state["facing_right"] = True
-
         self.images = self._load_parts()
+        # 📢 왼쪽을 볼 때 사용할 반전 이미지도 레지스트리에서 미리 받아둡니다. (매 프레임 flip 방지)
+        self.images_flipped = self._load_parts(flip=True)
+
+    @classmethod
+    def _part_sizes(cls):
+        """파트 이름과 크기 (머리, 몸통, 오른손, 왼손, 각성 헤드)"""
+        return [
+            ("head", cls.BODY_SIZE),
+            ("body", cls.BODY_SIZE),
+            ("righthand", cls.HAND_SIZE),
+            ("lefthand", cls.HAND_SIZE),
+            ("head_gak_1", cls.BODY_SIZE),
+            ("head_gak_2", cls.BODY_SIZE),
+        ]
+
+    @staticmethod
+    def _load_part(codename: str, part_name: str, size: tuple, flip: bool = False) -> Optional[pygame.Surface]:
+        path = os.path.join("assets", "characters", codename, f"{part_name}.png")
+        return load_image(path, size, flip=flip)
 
-    def _safe_load_image(self, part_name: str, size: tuple) -> Optional[pygame.Surface]:
-        """안전하게 이미지를 로드하고 크기를 조정합니다."""
-        path = os.path.join("assets", "characters", self.codename, f"{part_name}.png")
-        if not os.path.exists(path):
-            return None
-        try:
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, size) 
-            return img
-        except pygame.error:
-            return None
-
-    def _load_parts(self):
+    @classmethod
+    def preload_parts(cls, codename: str) -> None:
+        """[추가] 맵 로딩 중 다른 스레드에서 파트 이미지를 레지스트리에 미리 올려둡니다."""
+        for flip in (False, True):
+            for part_name, size in cls._part_sizes():
+                cls._load_part(codename, part_name, size, flip)
+
+    def _safe_load_image(self, part_name: str, size: tuple, flip: bool = False) -> Optional[pygame.Surface]:
+        """안전하게 이미지를 로드하고 크기를 조정합니다. (프로세스 전역 레지스트리 사용)"""
+        return self._load_part(self.codename, part_name, size, flip)
+
+    def _load_parts(self, flip: bool = False):
         """캐릭터의 모든 파트(머리, 오른손, 왼손)와 각성 헤드를 로드합니다."""
-        return {
-            "head": self._safe_load_image("head", self.BODY_SIZE), 
-            "body": self._safe_load_image("body", self.BODY_SIZE), 
-            "righthand": self._safe_load_image("righthand", self.HAND_SIZE),
-            "lefthand": self._safe_load_image("lefthand", self.HAND_SIZE),
-            
-            "head_gak_1": self._safe_load_image("head_gak_1", self.BODY_SIZE),
-            "head_gak_2": self._safe_load_image("head_gak_2", self.BODY_SIZE),
-        }
+        return {part_name: self._safe_load_image(part_name, size, flip) for part_name, size in self._part_sizes()}
 
     def start_attack_animation(self):
         """공격 애니메이션을 시작합니다."""
@@ -74,9 +89,9 @@ class Character:
 
     def start_awakening(self, duration_ms: int):
         """[추가] 각성 상태를 시작하고 종료 타이머를 설정합니다."""
-        if not self.state.get("is_awakened", False):
-            self.state["is_awakened"] = True
-            self.state["awakening_end_time"] = pygame.time.get_ticks() + duration_ms
+        if not self.state.is_awakened:
+            self.state.is_awakened = True
+            self.state.awakening_end_time = self.clock.get_ticks() + duration_ms
 
     def start_dash(self, dash_duration_ms: int):
         """대시 애니메이션 상태를 시작합니다."""
@@ -87,7 +102,7 @@ class Character:
         """
         캐릭터의 애니메이션 타이머 및 각성/대시 상태를 업데이트합니다.
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         
         # 📢 상태 저장
         self.is_confused = is_confused 
@@ -105,9 +120,9 @@ class Character:
             self.hit_timer -= dt
             
         # 3. 각성 상태 타이머 업데이트
-        if self.state.get("is_awakened", False) and current_time > self.state.get("awakening_end_time", 0):
-            self.state["is_awakened"] = False
-            self.state["awakening_end_time"] = 0 
+        if self.state.is_awakened and current_time > self.state.awakening_end_time:
+            self.state.is_awakened = False
+            self.state.awakening_end_time = 0 
             
         # 💨 4. 대시 타이머 업데이트
         if self.is_dashing:
@@ -118,46 +133,43 @@ class Character:
 
     def draw(self, screen: pygame.Surface, current_x: float, current_y: float, opponent_x: float, 
              is_invincible: bool, is_confused: bool = False, is_frozen: bool = False):
-        """캐릭터의 파트를 화면에 그립니다. (머리 + 두 손)"""
-        
-        # 0. 방향 업데이트
-        if current_x < opponent_x:
-            self.state["facing_right"] = True
-        elif current_x > opponent_x:
-            self.state["facing_right"] = False
+        """캐릭터의 파트를 화면에 그립니다. (머리 + 두 손)
+        📢 바라보는 방향(state.facing_right)은 경기 틱(match.py animation 시스템)에서 정해지므로 여기서는 읽기만 합니다.
+        (opponent_x는 기존 호출과의 호환을 위해 남겨 둔 인자)"""
             
         # 0.5. 무적 깜빡임 효과
-        if is_invincible and (pygame.time.get_ticks() // 100 % 2) == 0:
+        if is_invincible and (self.clock.get_ticks() // 100 % 2) == 0:
             return 
         
         # 1. 그릴 위치
         x, y = int(current_x), int(current_y) 
         body_width = self.BODY_SIZE[0]
         hand_width = self.HAND_SIZE[0]
-        facing_right = self.state["facing_right"]
+        facing_right = self.state.facing_right
+        
+        # 📢 바라보는 방향에 맞는 (미리 반전된) 이미지 세트 선택
+        images = self.images if facing_right else self.images_flipped
         
         # 2. 머리 이미지 결정
-        main_img = self.images.get("head") or self.images.get("body") 
+        main_img = images.get("head") or images.get("body") 
         
-        if self.state.get("is_awakened", False) and self.codename == "haegol":
-            current_time = pygame.time.get_ticks()
+        if self.state.is_awakened and self.codename == "haegol":
+            current_time = self.clock.get_ticks()
             frame_index = (current_time // self.AWAKENING_ANIM_SPEED_MS) % 2 
             
             if frame_index == 0:
-                main_img = self.images.get("head_gak_1") or main_img
+                main_img = images.get("head_gak_1") or main_img
             else:
-                main_img = self.images.get("head_gak_2") or main_img
+                main_img = images.get("head_gak_2") or main_img
         
         # 3. 머리/몸통 그리기
         if main_img:
             draw_img = main_img
-            if not facing_right:
-                draw_img = pygame.transform.flip(main_img, True, False)
             
             # 3.5. 피격 시 흔들림 효과
             offset_x = 0
             if self.hit_timer > 0:
-                offset_x = 4 if (pygame.time.get_ticks() // 50 % 2) == 0 else -4 
+                offset_x = 4 if (self.clock.get_ticks() // 50 % 2) == 0 else -4 
 
             screen.blit(draw_img, (x + offset_x, y)) 
             
@@ -188,14 +200,13 @@ class Character:
         L_BASE_OFFSET_Y = 0 
         
         # --- 오른손 그리기 ---
-        hand_img_right = self.images["righthand"]
+        hand_img_right = images["righthand"]
         if hand_img_right:
             
             draw_hand_right = hand_img_right
             if facing_right:
                 hand_x = x + R_BASE_OFFSET_X + attack_swing_offset
             else:
-                draw_hand_right = pygame.transform.flip(hand_img_right, True, False)
                 hand_x = x + body_width - R_BASE_OFFSET_X - hand_width - attack_swing_offset
             
             hand_y = y + R_BASE_OFFSET_Y
@@ -204,14 +215,13 @@ class Character:
 
 
         # --- 왼손 그리기 ---
-        hand_img_left = self.images["lefthand"]
+        hand_img_left = images["lefthand"]
         if hand_img_left:
             
             draw_hand_left = hand_img_left
             if facing_right:
                 hand_x_left = x + L_BASE_OFFSET_X
             else:
-                draw_hand_left = pygame.transform.flip(hand_img_left, True, False)
                 hand_x_left = x + body_width - L_BASE_OFFSET_X - hand_width
 
             hand_y_left = y + L_BASE_OFFSET_Y
@@ -0,0 +1,191 @@
+# assets.py
+
+import os
+import threading
+import pygame
+from typing import Dict, List, Optional, Tuple, Any, Iterator
+
+import atlas
+import derived_cache
+
+# 📢 프로세스 전역 이미지 레지스트리
+# 키: (path, size, flip, alpha) -> 공유 Surface (로드 실패 시 None도 캐시하여 디스크 재확인을 막습니다)
+# 반환되는 Surface는 여러 객체가 공유하므로, 호출 측에서 직접 fill/set_alpha 등으로 수정하면 안 됩니다.
+_surface_cache: Dict[Tuple[Any, ...], Optional[pygame.Surface]] = {}
+
+_cache_stats = {"hits": 0, "misses": 0, "bytes": 0}
+
+# 📢 맵 로딩 중 스레드 풀에서 미리 로드할 수 있도록 잠금을 둡니다.
+# _lock: 캐시/통계 갱신용, _key_locks: 같은 키를 두 스레드가 동시에 디코딩하지 않도록 키별 잠금
+_lock = threading.Lock()
+_key_locks: Dict[Tuple[Any, ...], threading.Lock] = {}
+_MISSING = object()
+
+# 📢 에셋 id: 레지스트리에 들어온 Surface마다 붙는 작은 정수 (들어온 순서, 0부터)
+# 스냅샷/리플레이는 투사체의 이미지를 복사하지 않고 이 id로 참조합니다. (snapshot.py)
+_asset_ids: Dict[int, int] = {}  # id(Surface) -> 에셋 id
+_assets_by_id: List[pygame.Surface] = []
+
+
+def _make_key(path: str, size: Optional[Tuple[int, int]], flip: bool, alpha: bool) -> Tuple[Any, ...]:
+    norm_size = (int(size[0]), int(size[1])) if size else None
+    return (os.path.normpath(path), norm_size, bool(flip), bool(alpha))
+
+
+def _surface_bytes(surface: Optional[pygame.Surface]) -> int:
+    if surface is None:
+        return 0
+    # 아틀라스 서브서피스도 자기 영역만큼만 계산합니다.
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def _decode(path: str, alpha: bool) -> Optional[pygame.Surface]:
+    """디스크에서 PNG를 한 번 디코딩합니다. 디스플레이가 없으면 convert 없이 원본을 사용합니다."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        img = pygame.image.load(path)
+    except (pygame.error, FileNotFoundError):
+        return None
+    try:
+        img = img.convert_alpha() if alpha else img.convert()
+    except pygame.error:
+        # 디스플레이 모드가 아직 설정되지 않은 경우 (헤드리스 등)
+        pass
+    return img
+
+
+def _store(key: Tuple[Any, ...], surface: Optional[pygame.Surface]) -> Optional[pygame.Surface]:
+    with _lock:
+        _surface_cache[key] = surface
+        _cache_stats["bytes"] += _surface_bytes(surface)
+        if surface is not None and id(surface) not in _asset_ids:
+            _asset_ids[id(surface)] = len(_assets_by_id)
+            _assets_by_id.append(surface)
+    return surface
+
+
+def _count(stat: str) -> None:
+    with _lock:
+        _cache_stats[stat] += 1
+
+
+def load_image(path: str, size: Optional[Tuple[int, int]] = None, flip: bool = False, alpha: bool = True) -> Optional[pygame.Surface]:
+    """
+    이미지를 레지스트리를 통해 로드합니다.
+    같은 (path, size, flip, alpha) 조합은 프로세스 전체에서 한 번만 디코딩/스케일링됩니다.
+    """
+    key = _make_key(path, size, flip, alpha)
+    cached = _surface_cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        _count("hits")
+        return cached
+
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+    with key_lock:
+        # 다른 스레드가 먼저 로드했을 수 있으므로 다시 확인합니다.
+        cached = _surface_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            _count("hits")
+            return cached
+        _count("misses")
+        return _load_uncached(key, path, alpha)
+
+
+def _load_uncached(key: Tuple[Any, ...], path: str, alpha: bool) -> Optional[pygame.Surface]:
+    _, size_key, flip_key, _ = key
+
+    # 1. 반전 이미지는 같은 크기의 정방향 이미지에서 만듭니다. (PNG 재디코딩 없음)
+    if flip_key:
+        base = load_image(path, size_key, False, alpha)
+        if base is None:
+            return _store(key, None)
+        return _store(key, pygame.transform.flip(base, True, False))
+
+    # 2. 원본 (크기 조정 없음)
+    if size_key is None:
+        return _store(key, _decode(path, alpha))
+
+    # 3. 미리 스케일된 아틀라스 번들에 있으면 PNG 디코딩 없이 서브서피스를 사용합니다.
+    if alpha:
+        packed = atlas.lookup(path, size_key)
+        if packed is not None:
+            return _store(key, packed)
+
+    # 4. 이전 실행에서 디스크 파생 자산 캐시에 저장해 둔 스케일 결과가 있으면 사용합니다.
+    derived = derived_cache.load(path, size_key, alpha)
+    if derived is not None:
+        return _store(key, derived)
+
+    # 5. 크기 조정 이미지: 원본이 이미 캐시되어 있으면 재사용하고,
+    #    아니면 원본은 캐시에 남기지 않습니다. (1024px 원본을 상주시키지 않기 위함)
+    source_key = _make_key(path, None, False, alpha)
+    source = _surface_cache.get(source_key)
+    if source is None:
+        source = _decode(path, alpha)
+    if source is None:
+        return _store(key, None)
+
+    img = source
+    try:
+        if img.get_size() != size_key:
+            img = pygame.transform.scale(img, size_key)
+            derived_cache.store(path, size_key, alpha, img)
+    except pygame.error:
+        img = None
+    return _store(key, img)
+
+
+def load_background(path: str, size: Tuple[int, int], fallback_color: Tuple[int, int, int] = (0, 0, 0)) -> pygame.Surface:
+    """
+    씬 배경 이미지를 화면 해상도에 맞게 한 번만 디코딩/스케일/convert() 하여 재사용합니다.
+    이미지가 없으면 단색 Surface를 (해상도별로 한 번만) 만들어 반환하므로 항상 blit 가능합니다.
+    """
+    img = load_image(path, size, alpha=False)
+    if img is not None:
+        return img
+
+    key = ("<fill>", (int(size[0]), int(size[1])), tuple(fallback_color))
+    fallback = _surface_cache.get(key)
+    if fallback is None:
+        fallback = pygame.Surface(key[1])
+        fallback.fill(fallback_color)
+        _store(key, fallback)
+    return fallback
+
+
+def asset_id(surface: pygame.Surface) -> Optional[int]:
+    """레지스트리 Surface의 에셋 id (레지스트리를 거치지 않고 만든 Surface면 None)"""
+    return _asset_ids.get(id(surface))
+
+
+def asset_surface(asset: int) -> pygame.Surface:
+    """에셋 id의 Surface (clear_cache() 이전에 받은 id는 쓸 수 없습니다)"""
+    return _assets_by_id[asset]
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """캐시 적중/실패 횟수, 항목 수, 보유 중인 픽셀 바이트 수를 반환합니다."""
+    with _lock:
+        stats = dict(_cache_stats)
+        stats["entries"] = len(_surface_cache)
+    return stats
+
+
+def iter_cache_keys() -> Iterator[Tuple[Any, ...]]:
+    """현재 레지스트리에 있는 (path, size, flip, alpha) 키 목록. (아틀라스 패커 등 도구용)"""
+    with _lock:
+        return iter(list(_surface_cache.keys()))
+
+
+def clear_cache() -> None:
+    """모든 캐시된 Surface를 해제합니다. (통계도 초기화)"""
+    with _lock:
+        _surface_cache.clear()
+        _key_locks.clear()
+        _asset_ids.clear()
+        _assets_by_id.clear()
+        _cache_stats["hits"] = 0
+        _cache_stats["misses"] = 0
+        _cache_stats["bytes"] = 0
@@ -0,0 +1,174 @@
+# atlas.py
+
+import os
+import mmap
+import struct
+import threading
+import pygame
+from typing import Dict, Optional, Tuple, List
+
+# 📢 캐릭터 텍스처 아틀라스 번들
+# tools/pack_atlas.py 가 assets/characters/* 의 PNG들을 게임에서 쓰는 크기로 미리 스케일하여
+# 캐릭터별 아틀라스 페이지(RGBA 원시 픽셀)와 이진 인덱스로 묶어 한 파일에 저장합니다.
+# 런타임에는 파일을 한 번만 열어 mmap 하고, 요청된 (path, size)의 서브서피스를 넘겨줍니다.
+# 📢 항목마다 패킹 당시 원본 PNG의 수정 시각/크기를 저장해 두고, 원본이 바뀐 항목은 없는 것으로 취급합니다.
+# (번들을 다시 만들지 않아도 바뀐 이미지는 PNG에서 로드됩니다)
+
+BUNDLE_PATH = os.path.join("assets", "atlas", "characters.atlas")
+
+MAGIC = b"BATL"
+VERSION = 2
+
+# 헤더: magic, version, page_count, entry_count
+HEADER_FMT = "<4sHHI"
+# 페이지: name_len, width, height, data_offset (이름 바이트가 뒤따름)
+PAGE_FMT = "<HHHQ"
+# 항목: path_len, width, height, page_index, x, y, 원본 mtime_ns, 원본 크기 (경로 바이트가 뒤따름)
+ENTRY_FMT = "<HHHHHHQQ"
+
+# 페이지 픽셀 데이터 정렬 (mmap 슬라이스 정렬용)
+DATA_ALIGN = 16
+
+
+def normalize_path(path: str) -> str:
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def source_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """원본 파일의 (mtime_ns, 크기). 파일이 없으면 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class AtlasBundle:
+    """mmap 된 아틀라스 번들. 페이지 Surface는 처음 요청될 때 한 번만 만들어집니다."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.pages: List[Tuple[str, int, int, int]] = []
+        self.entries: Dict[Tuple[str, Tuple[int, int]], Tuple[int, pygame.Rect]] = {}
+        # 원본 경로 -> 패킹 당시 (mtime_ns, 크기), 원본 경로 -> 지금도 같은지 (처음 확인할 때 한 번만 stat)
+        self.stamps: Dict[str, Tuple[int, int]] = {}
+        self._fresh: Dict[str, bool] = {}
+        self._page_surfaces: Dict[int, pygame.Surface] = {}
+        self._parse_index()
+
+    def _parse_index(self):
+        mm = self._mm
+        magic, version, page_count, entry_count = struct.unpack_from(HEADER_FMT, mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"지원하지 않는 아틀라스 번들입니다: {self.path}")
+        offset = struct.calcsize(HEADER_FMT)
+
+        page_size = struct.calcsize(PAGE_FMT)
+        for _ in range(page_count):
+            name_len, w, h, data_offset = struct.unpack_from(PAGE_FMT, mm, offset)
+            offset += page_size
+            name = mm[offset:offset + name_len].decode("utf-8")
+            offset += name_len
+            self.pages.append((name, w, h, data_offset))
+
+        entry_size = struct.calcsize(ENTRY_FMT)
+        for _ in range(entry_count):
+            path_len, w, h, page_index, x, y, mtime_ns, source_size = struct.unpack_from(ENTRY_FMT, mm, offset)
+            offset += entry_size
+            path = mm[offset:offset + path_len].decode("utf-8")
+            offset += path_len
+            self.entries[(path, (w, h))] = (page_index, pygame.Rect(x, y, w, h))
+            self.stamps[path] = (mtime_ns, source_size)
+
+    def _page_surface(self, page_index: int) -> pygame.Surface:
+        surface = self._page_surfaces.get(page_index)
+        if surface is not None:
+            return surface
+        with _bundle_lock:
+            surface = self._page_surfaces.get(page_index)
+            if surface is None:
+                surface = self._load_page(page_index)
+        return surface
+
+    def _load_page(self, page_index: int) -> pygame.Surface:
+        _, w, h, data_offset = self.pages[page_index]
+        # mmap 메모리를 복사 없이 참조하는 Surface를 만든 뒤 디스플레이 포맷으로 한 번 변환합니다.
+        view = memoryview(self._mm)[data_offset:data_offset + w * h * 4]
+        surface = pygame.image.frombuffer(view, (w, h), "RGBA")
+        try:
+            surface = surface.convert_alpha()
+        except pygame.error:
+            # 디스플레이가 없으면 mmap과 분리된 사본을 보관합니다.
+            surface = surface.copy()
+        self._page_surfaces[page_index] = surface
+        return surface
+
+    def is_fresh(self, path: str) -> bool:
+        """번들에 든 이미지가 지금의 원본 PNG와 같은지 (수정 시각/크기 비교)."""
+        fresh = self._fresh.get(path)
+        if fresh is None:
+            fresh = source_stamp(path) == self.stamps.get(path)
+            self._fresh[path] = fresh
+        return fresh
+
+    def get(self, path: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """미리 스케일된 (path, size) 이미지의 서브서피스를 반환합니다. 없거나 원본이 바뀌었으면 None."""
+        norm = normalize_path(path)
+        entry = self.entries.get((norm, (int(size[0]), int(size[1]))))
+        if entry is None or not self.is_fresh(norm):
+            return None
+        page_index, rect = entry
+        return self._page_surface(page_index).subsurface(rect)
+
+    def close(self):
+        self._page_surfaces.clear()
+        self._mm.close()
+        self._file.close()
+
+
+_bundle: Optional[AtlasBundle] = None
+_bundle_checked = False
+# 📢 미리 로드 스레드에서 동시에 번들을 열거나 페이지를 변환하지 않도록 하는 잠금
+_bundle_lock = threading.RLock()
+
+
+def get_bundle() -> Optional[AtlasBundle]:
+    """번들을 프로세스당 한 번만 엽니다. 번들이 없거나 손상되었으면 None (PNG 로드로 대체)."""
+    global _bundle, _bundle_checked
+    if _bundle_checked:
+        return _bundle
+    with _bundle_lock:
+        if not _bundle_checked:
+            if os.path.exists(BUNDLE_PATH):
+                try:
+                    _bundle = AtlasBundle(BUNDLE_PATH)
+                except (OSError, ValueError, struct.error) as e:
+                    print(f"아틀라스 번들 로드 오류: {e}")
+                    _bundle = None
+            _bundle_checked = True
+    return _bundle
+
+
+def lookup(path: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+    bundle = get_bundle()
+    if bundle is None:
+        return None
+    return bundle.get(path, size)
+
+
+def reset_bundle() -> None:
+    """번들을 닫고 다음 조회 때 다시 열도록 합니다. (패커 재실행 후 등)"""
+    global _bundle, _bundle_checked
+    if _bundle is not None:
+        _bundle.close()
+    _bundle = None
+    _bundle_checked = False
+
+
+def disable_bundle() -> None:
+    """번들을 사용하지 않고 항상 원본 PNG를 로드하도록 합니다. (패커가 원본 기준으로 수집할 때)"""
+    global _bundle_checked
+    reset_bundle()
+    _bundle_checked = True
@@ -0,0 +1,44 @@
+# audio.py
+
+import threading
+import pygame
+
+import startup_profile
+
+# 📢 믹서 지연 초기화
+# 오디오 장치를 여는 pygame.mixer.init()은 환경에 따라 수십~수백 ms가 걸리므로,
+# 모듈 import 시점이 아니라 처음 소리가 필요할 때 한 번만 초기화합니다.
+# 오디오 장치가 없으면 False를 반환하고, 게임은 소리 없이 계속 진행됩니다.
+
+_lock = threading.Lock()
+_mixer_failed = False
+
+
+def ensure_mixer() -> bool:
+    global _mixer_failed
+    if pygame.mixer.get_init():
+        return True
+    if _mixer_failed:
+        return False
+    with _lock:
+        if pygame.mixer.get_init():
+            return True
+        if _mixer_failed:
+            return False
+        with startup_profile.timed("init:mixer"):
+            try:
+                pygame.mixer.init()
+            except pygame.error as e:
+                print(f"오디오 장치 초기화 오류 (소리 없이 진행합니다): {e}")
+                _mixer_failed = True
+                return False
+    return True
+
+
+def music_busy() -> bool:
+    return bool(pygame.mixer.get_init()) and pygame.mixer.music.get_busy()
+
+
+def stop_music() -> None:
+    if pygame.mixer.get_init():
+        pygame.mixer.music.stop()
@@ -0,0 +1,111 @@
+# combat_events.py
+
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# 📢 전투 이벤트 버스 (틱 단위 일괄 전달)
+# 경기 시뮬레이션(match.Match)은 피격/회복/상태 이상/투사체 생성/KO/효과음 이벤트를 틱 동안 대기열에 쌓고,
+# 틱이 끝날 때(Match.step) 구독자마다 그 틱의 이벤트를 한 번에 넘깁니다.
+# 오디오/HUD/통계/리플레이 같은 하위 시스템은 구독/해지만 하면 되고, 프레임마다 상태를 조회할 필요가 없습니다.
+# - 어떤 구독자도 원하지 않는 종류의 이벤트는 대기열에 넣지 않습니다. (구독자가 없으면 emit은 집합 조회 한 번)
+# - 이벤트의 대상/시전자는 "p1"/"p2" 문자열이고 detail에는 객체 대신 이름/값을 넣어 리플레이 기록에 그대로 쓸 수 있습니다.
+
+# --- 이벤트 종류 ---
+HIT = "hit"          # 피해 (target, owner=공격자, source=스킬, amount=실제 감소한 체력, detail="poison"이면 지속 피해)
+HEAL = "heal"        # 회복 (target, source, amount=실제 회복량)
+STATUS = "status"    # 상태 이상 적용 (target, detail=효과 이름, amount=지속 시간 ms)
+SPAWN = "spawn"      # 투사체/히트박스/이펙트 생성 (owner, source, detail=클래스 이름)
+KO = "ko"            # 체력 0 (target, owner=마지막 공격자, source)
+SOUND = "sound"      # 효과음 (detail=sound_bank 이름)
+
+EVENT_KINDS = (HIT, HEAL, STATUS, SPAWN, KO, SOUND)
+
+
+class CombatEvent(NamedTuple):
+    kind: str
+    target: Optional[str] = None
+    owner: Optional[str] = None
+    source: Optional[str] = None
+    amount: float = 0
+    detail: Any = None
+
+
+# listener(tick, events) — events는 그 틱에 발생한, 구독한 종류의 이벤트 목록 (발생 순서)
+Listener = Callable[[int, List[CombatEvent]], Any]
+
+
+class CombatEventBus:
+    """틱 동안 이벤트를 모았다가 flush()에서 구독자에게 일괄 전달하는 버스 (Match.events, 스킬은 world["events"])"""
+
+    def __init__(self):
+        self._queue: List[CombatEvent] = []
+        self._listeners: List[Tuple[Listener, Optional[frozenset]]] = []
+        self.wanted: frozenset = frozenset() # 구독자들이 원하는 이벤트 종류의 합집합 (읽기 전용, 틱 루프는 `종류 in wanted`로 확인)
+
+    def subscribe(self, listener: Listener, kinds: Optional[Iterable[str]] = None) -> Listener:
+        """구독합니다. kinds가 None이면 모든 종류를 받습니다. (해지할 때 쓰도록 listener를 그대로 돌려줌)"""
+        self._listeners.append((listener, None if kinds is None else frozenset(kinds)))
+        self._update_wanted()
+        return listener
+
+    def unsubscribe(self, listener: Listener) -> None:
+        self._listeners = [(l, k) for l, k in self._listeners if l is not listener]
+        self._update_wanted()
+
+    def _update_wanted(self) -> None:
+        wanted = set()
+        for _, kinds in self._listeners:
+            wanted.update(EVENT_KINDS if kinds is None else kinds)
+        self.wanted = frozenset(wanted)
+        if not wanted:
+            self._queue.clear()
+
+    def wants(self, kind: str) -> bool:
+        """이 종류의 이벤트를 받을 구독자가 있는지 (이벤트를 만드는 데 비용이 드는 곳에서 먼저 확인)"""
+        return kind in self.wanted
+
+    def emit(self, kind: str, target: Optional[str] = None, owner: Optional[str] = None,
+             source: Optional[str] = None, amount: float = 0, detail: Any = None) -> None:
+        if kind in self.wanted:
+            self._queue.append(CombatEvent(kind, target, owner, source, amount, detail))
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._queue)
+
+    def flush(self, tick: int) -> None:
+        """이번 틱의 이벤트를 구독자마다 한 번에 넘기고 대기열을 비웁니다."""
+        events = self._queue
+        if not events:
+            return
+        self._queue = []
+        for listener, kinds in list(self._listeners):
+            batch = events if kinds is None else [e for e in events if e.kind in kinds]
+            if batch:
+                listener(tick, batch)
+
+    def clear(self) -> None:
+        self._queue.clear()
+
+
+def sound_listener(play: Callable[[str], Any]) -> Listener:
+    """SOUND 이벤트를 play(이름)으로 재생하는 구독자 (gameplay는 sound_bank.play)"""
+    def listener(tick: int, events: List[CombatEvent]) -> None:
+        for event in events:
+            play(event.detail)
+    return listener
+
+
+class EventLog:
+    """받은 이벤트를 (틱, 이벤트)로 모두 기록하는 구독자 (리플레이 검증/디버깅용)"""
+
+    def __init__(self):
+        self.entries: List[Tuple[int, CombatEvent]] = []
+
+    def __call__(self, tick: int, events: List[CombatEvent]) -> None:
+        self.entries.extend((tick, event) for event in events)
+
+    def counts(self) -> Dict[str, int]:
+        out: Dict[str, int] = {}
+        for _, event in self.entries:
+            out[event.kind] = out.get(event.kind, 0) + 1
+        return out
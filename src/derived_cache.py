@@ -0,0 +1,195 @@
+# derived_cache.py
+
+import os
+import json
+import struct
+import hashlib
+import threading
+import pygame
+from typing import Dict, Optional, Tuple, Any
+
+# 📢 디스크 파생 자산 캐시
+# 원본 PNG를 디코딩 + transform.scale 한 결과(화면에 바로 쓸 수 있는 픽셀 데이터)를
+# (원본 내용 해시, 목표 크기, 픽셀 포맷)을 키로 .cache/derived/ 에 저장합니다.
+# 다음 실행부터는 PNG 디코딩과 리샘플링 없이 파일을 읽어 convert() 한 번으로 끝납니다.
+# 원본 파일 내용이 바뀌면 해시가 달라지므로 이전 항목은 자동으로 쓰이지 않습니다.
+
+CACHE_DIR = os.path.join(".cache", "derived")
+
+MAGIC = b"BDRV"
+VERSION = 1
+
+# 헤더: magic, version, width, height, 포맷 문자열 (RGB/RGBA, 4바이트로 채움)
+HEADER_FMT = "<4sHHH4s"
+
+# 원본 해시 인덱스: normpath -> [mtime_ns, file_size, hash]
+# (파일 시각/크기가 같으면 원본을 다시 읽지 않고 저장된 해시를 사용합니다)
+# 📢 새로 계산한 해시는 메모리 인덱스에만 넣고, flush_index()에서 한 번에 저장합니다. (미리 로드가 끝날 때, 종료할 때)
+INDEX_FILE = "index.json"
+
+_enabled = True
+# _lock: 인덱스/통계 갱신용 (미리 로드 스레드 풀에서 동시에 호출됨)
+_lock = threading.Lock()
+_index: Optional[Dict[str, Any]] = None
+_index_dirty = False
+_stats = {"hits": 0, "misses": 0, "writes": 0}
+
+
+def set_cache_dir(path: str) -> None:
+    """캐시 디렉토리를 바꿉니다. (벤치마크 등에서 빈 캐시로 측정할 때)"""
+    global CACHE_DIR, _index, _index_dirty
+    with _lock:
+        CACHE_DIR = path
+        _index = None
+        _index_dirty = False
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _pixel_format(alpha: bool) -> str:
+    return "RGBA" if alpha else "RGB"
+
+
+def _load_index() -> Dict[str, Any]:
+    global _index
+    if _index is None:
+        try:
+            with open(os.path.join(CACHE_DIR, INDEX_FILE), "r", encoding="utf-8") as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+
+def _count(stat: str) -> None:
+    with _lock:
+        _stats[stat] += 1
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def source_hash(path: str) -> Optional[str]:
+    """원본 파일 내용의 해시. 시각/크기가 인덱스와 같으면 파일을 읽지 않습니다."""
+    norm = os.path.normpath(path)
+    try:
+        st = os.stat(norm)
+    except OSError:
+        return None
+
+    with _lock:
+        entry = _load_index().get(norm)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    try:
+        with open(norm, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+    global _index_dirty
+    with _lock:
+        _load_index()[norm] = [st.st_mtime_ns, st.st_size, digest]
+        _index_dirty = True
+    return digest
+
+
+def flush_index() -> None:
+    """새로 계산한 해시가 있으면 인덱스를 한 번 저장합니다.
+    저장할 때 원본이 없어졌거나 시각/크기가 바뀐 항목은 지웁니다."""
+    global _index_dirty
+    with _lock:
+        if not _index_dirty:
+            return
+        index = _load_index()
+        for norm, entry in list(index.items()):
+            try:
+                st = os.stat(norm)
+            except OSError:
+                del index[norm]
+                continue
+            if entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                del index[norm]
+        try:
+            _write_atomic(os.path.join(CACHE_DIR, INDEX_FILE), json.dumps(index).encode("utf-8"))
+        except OSError:
+            pass
+        _index_dirty = False
+
+
+def _entry_path(digest: str, size: Tuple[int, int], alpha: bool) -> str:
+    return os.path.join(CACHE_DIR, f"{digest}_{size[0]}x{size[1]}_{_pixel_format(alpha)}.px")
+
+
+def load(path: str, size: Tuple[int, int], alpha: bool) -> Optional[pygame.Surface]:
+    """캐시된 (path, size, 포맷) 픽셀 데이터를 Surface로 반환합니다. 없거나 손상되었으면 None."""
+    if not _enabled:
+        return None
+    digest = source_hash(path)
+    if digest is None:
+        return None
+
+    fmt = _pixel_format(alpha)
+    try:
+        with open(_entry_path(digest, size, alpha), "rb") as f:
+            data = f.read()
+    except OSError:
+        _count("misses")
+        return None
+
+    header_size = struct.calcsize(HEADER_FMT)
+    try:
+        magic, version, w, h, stored_fmt = struct.unpack_from(HEADER_FMT, data, 0)
+    except struct.error:
+        _count("misses")
+        return None
+    if (magic != MAGIC or version != VERSION or (w, h) != tuple(size)
+            or stored_fmt.rstrip(b"\0").decode("ascii", "replace") != fmt
+            or len(data) - header_size != w * h * len(fmt)):
+        _count("misses")
+        return None
+
+    surface = pygame.image.frombuffer(memoryview(data)[header_size:], (w, h), fmt)
+    try:
+        surface = surface.convert_alpha() if alpha else surface.convert()
+    except pygame.error:
+        # 디스플레이가 없으면 읽어 온 버퍼와 분리된 사본을 사용합니다.
+        surface = surface.copy()
+    _count("hits")
+    return surface
+
+
+def store(path: str, size: Tuple[int, int], alpha: bool, surface: pygame.Surface) -> None:
+    """스케일된 결과를 캐시에 저장합니다. 저장 실패는 게임 진행에 영향을 주지 않습니다."""
+    if not _enabled or surface is None:
+        return
+    digest = source_hash(path)
+    if digest is None:
+        return
+
+    fmt = _pixel_format(alpha)
+    w, h = surface.get_size()
+    header = struct.pack(HEADER_FMT, MAGIC, VERSION, w, h, fmt.encode("ascii"))
+    try:
+        _write_atomic(_entry_path(digest, (w, h), alpha), header + pygame.image.tobytes(surface, fmt))
+        _count("writes")
+    except (OSError, pygame.error) as e:
+        print(f"파생 자산 캐시 저장 오류 ({path}): {e}")
+
+
+def get_stats() -> Dict[str, int]:
+    with _lock:
+        return dict(_stats)
@@ -0,0 +1,223 @@
+# ecs.py
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, ValuesView
+
+# 📢 엔티티-컴포넌트-시스템 코어
+# - 엔티티는 정수 id입니다.
+# - 컴포넌트는 종류(이름)별 저장소(ComponentStore)에 빈틈없이 모아 둡니다. (sparse set: 조밀 배열 + 엔티티 -> 위치)
+# - 뷰(View)는 여러 종류를 모두 가진 엔티티의 (엔티티, 컴포넌트...) 행 목록이며, 컴포넌트를 붙이거나 뗄 때만 증분 갱신됩니다.
+#   시스템은 매 틱 view.rows를 그대로 순회하므로 관심 있는 엔티티만, 살아 있는 수만큼만 돕니다.
+#   행 순서는 뷰에 들어온 순서이고, order(행 -> 정렬 키)를 주면 그 키 순서로 유지됩니다. (투사체의 생성 순서 등)
+#   행은 엔티티 -> 행 딕셔너리에 들어 있어 추가/삭제가 O(1)이고, 순회 중에는 엔티티를 만들거나 지우면 안 됩니다.
+# - 스케줄러(Scheduler)는 이름 붙은 시스템을 정해진 순서로 실행합니다.
+#   새 메커니즘은 컴포넌트와 시스템을 만들어 add(..., after="collision")처럼 끼워 넣으면 되고 루프를 고칠 필요가 없습니다.
+
+Entity = int
+
+
+class ComponentStore:
+    """한 종류의 컴포넌트 저장소 (조밀 배열 entities/data + 엔티티 -> 위치 index)"""
+
+    __slots__ = ("name", "entities", "data", "index")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.entities: List[Entity] = []
+        self.data: List[Any] = []
+        self.index: Dict[Entity, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self.index
+
+    def get(self, entity: Entity, default: Any = None) -> Any:
+        i = self.index.get(entity)
+        return default if i is None else self.data[i]
+
+    def set(self, entity: Entity, value: Any) -> None:
+        i = self.index.get(entity)
+        if i is None:
+            self.index[entity] = len(self.entities)
+            self.entities.append(entity)
+            self.data.append(value)
+        else:
+            self.data[i] = value
+
+    def discard(self, entity: Entity) -> bool:
+        """컴포넌트를 뗍니다. 마지막 항목을 빈자리로 옮겨 배열을 조밀하게 유지합니다."""
+        i = self.index.pop(entity, None)
+        if i is None:
+            return False
+        last = len(self.entities) - 1
+        if i != last:
+            moved = self.entities[last]
+            self.entities[i] = moved
+            self.data[i] = self.data[last]
+            self.index[moved] = i
+        self.entities.pop()
+        self.data.pop()
+        return True
+
+
+class View:
+    """names 종류를 모두 가진 엔티티의 행 목록. rows의 각 행은 (엔티티, 컴포넌트1, 컴포넌트2, ...)"""
+
+    __slots__ = ("names", "rows", "version", "order", "_row_of", "_last_key")
+
+    def __init__(self, names: Tuple[str, ...], order: Optional[Callable[[tuple], Any]] = None):
+        self.names = names
+        self.version = 0 # 행이 바뀔 때마다 증가 (뷰에서 파생한 캐시의 무효화용)
+        self.order = order
+        self._row_of: Dict[Entity, tuple] = {} # 딕셔너리 순서 = 행 순서
+        self._last_key: Any = None
+        self.rows: ValuesView[tuple] = self._row_of.values()
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def get(self, entity: Entity) -> Optional[tuple]:
+        return self._row_of.get(entity)
+
+    def _refresh(self, registry: "Registry", entity: Entity) -> None:
+        stores = registry.stores
+        if not all(entity in stores[name] for name in self.names):
+            self._drop(entity)
+            return
+        row = (entity,) + tuple(stores[name].get(entity) for name in self.names)
+        is_new = entity not in self._row_of
+        self._row_of[entity] = row # 이미 있던 엔티티는 자리를 유지합니다.
+        if is_new and self.order is not None:
+            key = self.order(row)
+            if self._last_key is not None and key < self._last_key:
+                self._resort()
+            else:
+                self._last_key = key
+        self.version += 1
+
+    def _resort(self) -> None:
+        """정렬 키보다 앞선 행이 나중에 들어온 경우 (드묾): 딕셔너리를 키 순서로 다시 채웁니다."""
+        order = self.order
+        items = sorted(self._row_of.items(), key=lambda item: order(item[1]))
+        self._row_of.clear()
+        self._row_of.update(items)
+        self._last_key = order(items[-1][1])
+
+    def _drop(self, entity: Entity) -> None:
+        if self._row_of.pop(entity, None) is not None:
+            if not self._row_of:
+                self._last_key = None
+            self.version += 1
+
+
+class Registry:
+    """엔티티와 컴포넌트 저장소, 뷰를 관리합니다."""
+
+    def __init__(self):
+        self._next_entity = 0
+        self.stores: Dict[str, ComponentStore] = {}
+        self._views: Dict[Tuple[str, ...], View] = {}
+        self._views_by_name: Dict[str, List[View]] = {}
+
+    def store(self, name: str) -> ComponentStore:
+        store = self.stores.get(name)
+        if store is None:
+            store = self.stores[name] = ComponentStore(name)
+        return store
+
+    def create(self, **components: Any) -> Entity:
+        """새 엔티티를 만들고 컴포넌트(이름=값)를 붙입니다."""
+        entity = self._next_entity
+        self._next_entity += 1
+        for name, value in components.items():
+            self.add(entity, name, value)
+        return entity
+
+    def destroy(self, entity: Entity) -> None:
+        for name, store in self.stores.items(): # remove()는 저장소를 추가/삭제하지 않음
+            if entity in store:
+                self.remove(entity, name)
+
+    def add(self, entity: Entity, name: str, value: Any) -> None:
+        self.store(name).set(entity, value)
+        for view in self._views_by_name.get(name, ()):
+            view._refresh(self, entity)
+
+    def remove(self, entity: Entity, name: str) -> None:
+        store = self.stores.get(name)
+        if store is not None and store.discard(entity):
+            for view in self._views_by_name.get(name, ()):
+                view._drop(entity)
+
+    def get(self, entity: Entity, name: str, default: Any = None) -> Any:
+        store = self.stores.get(name)
+        return default if store is None else store.get(entity, default)
+
+    def has(self, entity: Entity, name: str) -> bool:
+        store = self.stores.get(name)
+        return store is not None and entity in store
+
+    def view(self, *names: str, order: Optional[Callable[[tuple], Any]] = None) -> View:
+        """names를 모두 가진 엔티티의 뷰 (같은 names면 같은 객체, 이후 변경이 자동으로 반영됨)
+        order: 행 -> 정렬 키. 주면 rows가 항상 그 키 순서입니다. (처음 만들 때만 적용)"""
+        view = self._views.get(names)
+        if view is None:
+            view = self._views[names] = View(names, order)
+            for name in names:
+                self.store(name)
+                self._views_by_name.setdefault(name, []).append(view)
+            smallest = min((self.stores[name] for name in names), key=len)
+            for entity in sorted(smallest.entities):
+                view._refresh(self, entity)
+        return view
+
+
+System = Callable[..., Any]
+
+
+class Scheduler:
+    """이름 붙은 시스템을 순서대로 실행합니다. run(*args)는 각 시스템을 system(*args)로 호출합니다."""
+
+    def __init__(self, systems: Iterable[Tuple[str, System]] = ()):
+        self._order: List[Tuple[str, System]] = []
+        self._funcs: Tuple[System, ...] = ()
+        for name, system in systems:
+            self.add(name, system)
+
+    def names(self) -> List[str]:
+        return [name for name, _ in self._order]
+
+    def _position(self, name: str) -> int:
+        for i, (existing, _) in enumerate(self._order):
+            if existing == name:
+                return i
+        raise KeyError(f"등록되지 않은 시스템입니다: {name}")
+
+    def add(self, name: str, system: System, before: Optional[str] = None, after: Optional[str] = None) -> None:
+        """시스템을 추가합니다. before/after가 없으면 맨 뒤에 붙습니다."""
+        if any(existing == name for existing, _ in self._order):
+            raise ValueError(f"이미 등록된 시스템입니다: {name}")
+        if before is not None:
+            i = self._position(before)
+        elif after is not None:
+            i = self._position(after) + 1
+        else:
+            i = len(self._order)
+        self._order.insert(i, (name, system))
+        self._funcs = tuple(system for _, system in self._order)
+
+    def get(self, name: str) -> System:
+        return self._order[self._position(name)][1]
+
+    def replace(self, name: str, system: System) -> None:
+        self._order[self._position(name)] = (name, system)
+        self._funcs = tuple(system for _, system in self._order)
+
+    def remove(self, name: str) -> None:
+        del self._order[self._position(name)]
+        self._funcs = tuple(system for _, system in self._order)
+
+    def run(self, *args: Any) -> None:
+        for system in self._funcs:
+            system(*args)
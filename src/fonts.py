@@ -0,0 +1,94 @@
+# fonts.py
+
+import os
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Any
+
+import startup_profile
+
+DEFAULT_FONT_PATH = "assets/font/NotoSansKR-Bold.ttf"
+
+# 📢 렌더링된 텍스트 Surface LRU 캐시의 최대 항목 수
+TEXT_CACHE_MAX_ENTRIES = 512
+
+# 폰트 풀: (file, size) -> Font (매 프레임 Font 객체를 새로 만들지 않기 위함)
+_font_pool: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+# 텍스트 캐시: (font, text, color, outline) -> Surface
+_text_cache: "OrderedDict[Tuple[Any, ...], pygame.Surface]" = OrderedDict()
+
+_text_stats = {"hits": 0, "misses": 0}
+
+
+def get_font(path: Optional[str] = DEFAULT_FONT_PATH, size: int = 30) -> pygame.font.Font:
+    """(file, size)별로 한 번만 Font를 생성합니다. 파일이 없으면 기본 폰트로 대체합니다."""
+    key = (os.path.normpath(path) if path else None, int(size))
+    font = _font_pool.get(key)
+    if font is not None:
+        return font
+
+    # 📢 폰트 모듈은 처음 Font가 필요할 때 한 번만 초기화합니다.
+    if not pygame.font.get_init():
+        with startup_profile.timed("init:font"):
+            pygame.font.init()
+
+    try:
+        font = pygame.font.Font(path, size)
+    except (FileNotFoundError, OSError, pygame.error):
+        font = pygame.font.Font(None, size)
+    _font_pool[key] = font
+    return font
+
+
+def _render_outlined(font: pygame.font.Font, text: str, color, outline_color, outline_width: int) -> pygame.Surface:
+    """외곽선 텍스트를 한 장의 Surface로 미리 합성합니다. (프레임마다 48번 render 하던 것을 1회 blit으로)"""
+    inner = font.render(text, True, color)
+    outline = font.render(text, True, outline_color)
+    w = outline_width
+    surface = pygame.Surface((inner.get_width() + w * 2, inner.get_height() + w * 2), pygame.SRCALPHA)
+    for dx in range(-w, w + 1):
+        for dy in range(-w, w + 1):
+            if dx != 0 or dy != 0:
+                surface.blit(outline, (w + dx, w + dy))
+    surface.blit(inner, (w, w))
+    return surface
+
+
+def render_text(font: pygame.font.Font, text: str, color, outline_color=None, outline_width: int = 0) -> pygame.Surface:
+    """
+    렌더링된 텍스트 Surface를 LRU 캐시에서 반환합니다.
+    같은 (font, text, color, outline) 조합은 한 번만 래스터화됩니다.
+    """
+    outline = (tuple(outline_color), outline_width) if outline_color is not None and outline_width > 0 else None
+    key = (font, text, tuple(color), outline)
+
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_stats["hits"] += 1
+        _text_cache.move_to_end(key)
+        return surface
+
+    _text_stats["misses"] += 1
+    if outline:
+        surface = _render_outlined(font, text, color, outline_color, outline_width)
+    else:
+        surface = font.render(text, True, color)
+
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_MAX_ENTRIES:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def format_countdown(label: str, remaining_ms: float) -> str:
+    """카운트다운 문구를 0.1초 단위로 양자화하여 캐시 적중률을 높입니다."""
+    tenths = max(0, int(remaining_ms) // 100)
+    return f"{label}: {tenths // 10}.{tenths % 10}s"
+
+
+def get_text_cache_stats() -> Dict[str, int]:
+    stats = dict(_text_stats)
+    stats["entries"] = len(_text_cache)
+    stats["fonts"] = len(_font_pool)
+    return stats
@@ -2,60 +2,51 @@ import pygame
 import typing
 import sys
 import os
+import time
 import random 
 from typing import Dict, Any, List, Tuple
 
 # scenes.characters에서 필요한 것을 임포트합니다.
-from scenes.characters import character_config, character_skill_state, get_charactername_by_codename
-
-# 사용자 요청에 따라 파일명 그대로 유지 (skills.skills_skills_loader)
-from skills.skills_skills_loader import get_skills_for_character 
-
-# skills_base에서 필요한 공용 클래스 임포트
-from skills.skills_base import UltimateBeltEffect, MeleeHitbox, Projectile, UltimateSkillBase
-# LeesaengseonBombSkill은 해당 파일에 정의되어 있으므로 여기서 가져옵니다.
-from skills.leesaengseon_skills import LeesaengseonBombSkill 
-# 🧊 IcemanUltimateSkill, IceBlock 임포트 (아이스맨 궁극기 처리를 위해)
-from skills.iceman_skills import IcemanUltimateSkill, IceBlock 
-
-# 🧙‍♀️ 마녀 궁극기 처리를 위해 PoisonPotionUltimate 임포트 (witch_skills.py에 정의되어 있다고 가정)
-from skills.witch_skills import PoisonPotionUltimate
-
-# Character 클래스가 정의되어 있다고 가정
-from animation import Character
-
-pygame.mixer.init()
-pygame.font.init()
+from scenes.characters import character_config, get_charactername_by_codename
+
+# 📢 전투 규칙(상태/스킬/투사체/충돌)은 match.Match가 담당하고, 이 파일은 창/입력/렌더링만 담당합니다.
+from match import (Match, SIM_DT_MS, CHAR_SIZE, HITBOX_WIDTH, HITBOX_HEIGHT,
+                   HITBOX_Y_OFFSET_FROM_IMAGE_TOP, ADJ_X_OFFSET)
+# 📢 항목/대량 투사체/캐릭터 그리기는 렌더링 시스템이 경기의 뷰를 순회하며 담당합니다.
+from ecs import Scheduler
+from render_systems import RENDER_SYSTEMS
+
+# 📢 프로세스 전역 이미지 레지스트리 (재경기 시 디스크 I/O 없음)
+from assets import load_image
+# 📢 맵 로딩 중 미리 로드된 스킬/사운드/이미지
+from preload import take_preloaded, roulette_sizes
+# 📢 폰트 풀 / 렌더링된 텍스트 캐시
+from fonts import get_font, render_text, format_countdown, DEFAULT_FONT_PATH
+# 📢 믹서는 import 시점이 아니라 경기 시작 시 필요할 때 초기화합니다. (폰트는 get_font가 초기화)
+from audio import ensure_mixer, stop_music
+# 📢 효과음은 프로세스 전역 사운드 뱅크에서 한 번만 디코딩되고, 채널 관리자를 통해 재생됩니다.
+import sound_bank
+# 📢 틱마다 두 플레이어의 입력을 비트마스크로 바꿔 진행하고 기록합니다. (경기가 끝나면 REPLAY_DIR에 저장)
+from input_bits import KeyState, keys_to_masks, step_masks
+from replay import InputRecorder, REPLAY_EXTENSION
+from settings import REPLAY_DIR
 
 # =========================================================
-# 🎯 궁극기 게이지 획득 상수 정의
-FIXED_ULT_GAIN_ON_HIT = 3 
-FIXED_ULT_GAIN_ON_ATTACK = 5 
-GAUGE_PASSIVE_GAIN_PER_MS = 1 / 1000 
-
-# 📢 조커 상태 관련 상수
-CONFUSION_DURATION_MS = 3000 
-MOVE_BOOST_PERCENTAGE = 0.5 
-
 # 📢 디버그 상수: 충돌 박스 시각화 활성화/비활성화
 DEBUG_DRAW_HITBOX = False
 
-# 📢 캐릭터 충돌 박스 조정 상수 (기존 설정 유지)
-CHAR_SIZE = 200 
-HITBOX_WIDTH = 160 
-HITBOX_HEIGHT = 160 
-
-HITBOX_Y_OFFSET_FROM_IMAGE_TOP = CHAR_SIZE - HITBOX_HEIGHT 
-ADJ_X_OFFSET = (CHAR_SIZE - HITBOX_WIDTH) / 2 
-
-IMAGE_Y_ADJUSTMENT = 60 
-
 # 📢 룰렛 관련 상수 추가
 ROULETTE_SPIN_DURATION_MS = 3000  # 룰렛이 멈추는 데 걸리는 최소 시간 (3초)
 ROULETTE_MAX_SPEED = 10           # 최대 회전 속도 (각도/프레임)
 
-# 📢 [추가]: 점프 관련 상수
-MAX_JUMPS = 2 # 2단 점프 허용
+# 📢 고정 시간 간격 시뮬레이션: 게임 로직은 항상 SIM_HZ(60Hz) 틱으로 진행되고,
+# 렌더링은 직전 두 틱 사이를 보간하여 그립니다. (디스플레이 주사율과 무관하게 같은 게임 진행)
+# 한 프레임이 너무 오래 걸렸을 때 (창 이동, 승리 화면 대기 등) 따라잡을 최대 시뮬레이션 시간
+MAX_CATCHUP_MS = 250
+# 렌더링 프레임 상한 (CPU 과점유 방지용, 시뮬레이션 속도와는 무관)
+MAX_RENDER_FPS = 144
+# 📢 RUNNING 중 시뮬레이션 일시정지/재개 키
+PAUSE_KEY = pygame.K_p
 # =========================================================
 
 def gameplay(screen, map_image_path):
@@ -68,24 +59,23 @@ def gameplay(screen, map_image_path):
     SCREEN_WIDTH = screen.get_width()
     SCREEN_HEIGHT = screen.get_height()
     
-    # 바닥 높이 조정
-    GROUND_Y = SCREEN_HEIGHT * 0.90
-    
-    # 무적 시간 설정 (0.5초)
-    INVINCIBILITY_DURATION = 500 # ms
-    
     # 📢 [추가]: 볼륨 변수 초기화 (0.0 ~ 1.0)
     global_volume = 0.5 
     
+    p1_codename = character_config.get("selected_1p", "default_p1")
+    p2_codename = character_config.get("selected_2p", "default_p2")
+    
+    # 📢 map_loading 카운트다운 동안 미리 로드된 결과 (없으면 None → 아래에서 직접 로드)
+    preloaded = take_preloaded(p1_codename, p2_codename, map_image_path, (SCREEN_WIDTH, SCREEN_HEIGHT)) or {}
+    
     # 초기 설정
-    try:
-        background = pygame.image.load(map_image_path).convert()
-        background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-    except Exception:
+    background = load_image(map_image_path, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+    if background is None:
         background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         background.fill((0, 0, 100))
 
     # BGM 파일 로드 및 재생
+    ensure_mixer()
     try:
         pygame.mixer.music.load(os.path.join("assets", "audio", "bgm.mp3"))
         # 📢 BGM 볼륨 설정 시 global_volume 적용
@@ -94,98 +84,37 @@ def gameplay(screen, map_image_path):
     except Exception as e:
         print(f"Error loading BGM: {e}") 
 
-    p1_codename = character_config.get("selected_1p", "default_p1")
-    p2_codename = character_config.get("selected_2p", "default_p2")
-    
-    # 캐릭터 초기 상태
-    initial_y = GROUND_Y - HITBOX_HEIGHT
-    
-    # 📢 [수정]: jump_count 변수 추가 (2단 점프 구현용)
-    p1 = {"x": 200, "y": initial_y, "vx": 0, "vy": 0, "on_ground": True, "hp": 200, "ultimate_gauge": 0, "max_hp": 200,
-          "is_stunned": False, "stun_end_time": 0, "invincible_end_time": 0, 
-          "is_confused": False, "confusion_end_time": 0, "speed_boost_end_time": 0, 
-          "is_frozen": False, "frozen_end_time": 0, 
-          "is_dashing": False, "dash_end_time": 0, "last_input_key": None,
-          "status_effects": [], "jump_count": 0} 
-          
-    # 📢 [수정]: jump_count 변수 추가 (2단 점프 구현용)
-    p2 = {"x": SCREEN_WIDTH - 400, "y": initial_y, "vx": 0, "vy": 0, "on_ground": True, "hp": 200, "ultimate_gauge": 0, "max_hp": 200,
-          "is_stunned": False, "stun_end_time": 0, "invincible_end_time": 0,
-          "is_confused": False, "confusion_end_time": 0, "speed_boost_end_time": 0,
-          "is_frozen": False, "frozen_end_time": 0,
-          "is_dashing": False, "dash_end_time": 0, "last_input_key": None,
-          "status_effects": [], "jump_count": 0} 
-    
-    p1_skill_state = character_skill_state.get(p1_codename, {}).copy()
-    p2_skill_state = character_skill_state.get(p2_codename, {}).copy()
-
-    p1_skills = get_skills_for_character(p1_codename)
-    p2_skills = get_skills_for_character(p2_codename)
-    p1_skill1, p1_skill2, p1_ultimate = p1_skills
-    p2_skill1, p2_skill2, p2_ultimate = p2_skills
-
-    p1_char = Character(p1_codename, 1, p1, p1_skill_state)
-    p2_char = Character(p2_codename, 2, p2, p2_skill_state)
-
-    projectiles = []
-    # 🌟 [추가]: 룰렛 랜덤값 저장을 위한 world 초기화
-    world = {
-        "screen_width": SCREEN_WIDTH,
-        "screen_height": SCREEN_HEIGHT,
-        "GROUND_Y": GROUND_Y,
-        "projectiles": projectiles,
-        "roulette_total_spin_time": ROULETTE_SPIN_DURATION_MS + 2000, 
-        "roulette_speed": ROULETTE_MAX_SPEED
-    }
-
-    # 물리 상수
-    BASE_SPEED = 6 
-    jump_power = -18
-    gravity = 1
-    
+    # 📢 경기 상태/전투 규칙 (시뮬레이션 시계는 match.clock, 0ms에서 시작)
+    match = Match(p1_codename, p2_codename, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                  p1_skills=preloaded.get("p1_skills"), p2_skills=preloaded.get("p2_skills"),
+                  on_sound=sound_bank.play)
+    sim_clock = match.clock
+    p1, p2 = match.p1, match.p2
+    render_systems = Scheduler(RENDER_SYSTEMS)
+    GROUND_Y = match.ground_y
+
+    # 🌟 [추가]: 룰렛 랜덤값 저장
+    world = match.world
+    world["roulette_total_spin_time"] = ROULETTE_SPIN_DURATION_MS + 2000
+    world["roulette_speed"] = ROULETTE_MAX_SPEED
+
     # 폰트 로드
-    try:
-        font = pygame.font.Font("assets/font/NotoSansKR-Bold.ttf", 30)
-        large_font = pygame.font.Font("assets/font/NotoSansKR-Bold.ttf", 60)
-    except Exception:
-        font = pygame.font.Font(None, 30)
-        large_font = pygame.font.Font(None, 60)
+    font = get_font(DEFAULT_FONT_PATH, 30)
+    large_font = get_font(DEFAULT_FONT_PATH, 60)
         
-    # 📢 [수정]: 사운드 클립 로드 및 볼륨 설정
-    attack_sound = None
-    skill_sound = None
-    jump_sound = None # 📢 [추가]: 점프 사운드
-    victory_sound = None # 📢 [추가]: 승리 사운드
-    try:
-        attack_sound = pygame.mixer.Sound(os.path.join("assets", "audio", "attack.wav"))
-        skill_sound = pygame.mixer.Sound(os.path.join("assets", "audio", "skill.wav"))
-        jump_sound = pygame.mixer.Sound(os.path.join("assets", "audio", "jump.wav")) # 📢 점프 사운드 로드
-        victory_sound = pygame.mixer.Sound(os.path.join("assets", "audio", "victory.wav")) # 📢 승리 사운드 로드
-        
-        # 📢 효과음 볼륨 설정 시 global_volume 적용
-        attack_sound.set_volume(global_volume)
-        skill_sound.set_volume(global_volume)
-        jump_sound.set_volume(global_volume) # 📢 볼륨 적용
-        victory_sound.set_volume(global_volume) # 📢 볼륨 적용
-        
-    except Exception as e:
-        # 사운드 로드 실패 시 출력
-        print(f"Error loading sounds: {e}") 
+    # 📢 [수정]: 효과음은 사운드 뱅크에서 한 번만 디코딩됩니다. (맵 로딩 중 미리 로드되었으면 즉시 반환)
+    sound_bank.load_all()
+    # 📢 효과음 볼륨 설정 시 global_volume 적용
+    sound_bank.set_volume(global_volume)
 
     # 룰렛 이미지 로드 
     # 📢 [수정]: 룰렛 이미지 경로를 'assets/img'로 변경
-    try:
-        roulette_img = pygame.image.load(os.path.join("assets", "img", "roulette.png")).convert_alpha()
-        roulette_pin_img = pygame.image.load(os.path.join("assets", "img", "pin.png")).convert_alpha()
-        
-        # 룰렛 크기 조정 (화면 너비의 약 40%)
-        roulette_size = int(SCREEN_WIDTH * 0.4)
-        roulette_img = pygame.transform.scale(roulette_img, (roulette_size, roulette_size))
-        # 핀 크기 조정 (룰렛 크기의 약 10%)
-        pin_size = int(roulette_size * 0.1)
-        roulette_pin_img = pygame.transform.scale(roulette_pin_img, (pin_size, pin_size))
-        
-    except Exception:
+    # 룰렛 크기 (화면 너비의 약 40%), 핀 크기 (룰렛 크기의 약 10%)
+    roulette_size, pin_size = roulette_sizes(SCREEN_WIDTH)
+    roulette_img = load_image(os.path.join("assets", "img", "roulette.png"), (roulette_size, roulette_size))
+    roulette_pin_img = load_image(os.path.join("assets", "img", "pin.png"), (pin_size, pin_size))
+    
+    if roulette_img is None or roulette_pin_img is None:
         # 이미지 로드 실패 시 대체
         roulette_size = 300
         pin_size = 30
@@ -250,28 +179,26 @@ def gameplay(screen, map_image_path):
     def draw_confusion_status(screen, x, y, char_state, font):
         if char_state.get("is_confused", False):
             end_time = char_state.get("confusion_end_time", 0)
-            remaining_time_ms = max(0, end_time - pygame.time.get_ticks())
-            remaining_time_s = remaining_time_ms / 1000
+            remaining_time_ms = max(0, end_time - sim_clock.get_ticks())
             
-            text = font.render(f"혼란: {remaining_time_s:.1f}s", True, (128, 0, 128)) # 보라색
+            # 📢 0.1초 단위로 양자화된 문구는 캐시에서 재사용됩니다.
+            text = render_text(font, format_countdown("혼란", remaining_time_ms), (128, 0, 128)) # 보라색
             screen.blit(text, (x + CHAR_SIZE // 2 - text.get_width() // 2, y + HITBOX_Y_OFFSET_FROM_IMAGE_TOP - 30)) 
 
     def draw_stun_status(screen, x, y, char_state, font):
         if char_state.get("is_stunned", False):
             end_time = char_state.get("stun_end_time", 0)
-            remaining_time_ms = max(0, end_time - pygame.time.get_ticks())
-            remaining_time_s = remaining_time_ms / 1000
+            remaining_time_ms = max(0, end_time - sim_clock.get_ticks())
             
-            text = font.render(f"기절: {remaining_time_s:.1f}s", True, (255, 0, 0))
+            text = render_text(font, format_countdown("기절", remaining_time_ms), (255, 0, 0))
             screen.blit(text, (x + CHAR_SIZE // 2 - text.get_width() // 2, y + HITBOX_Y_OFFSET_FROM_IMAGE_TOP - 60))
     
     def draw_frozen_status(screen, x, y, char_state, font):
         if char_state.get("is_frozen", False):
             end_time = char_state.get("frozen_end_time", 0)
-            remaining_time_ms = max(0, end_time - pygame.time.get_ticks())
-            remaining_time_s = remaining_time_ms / 1000
+            remaining_time_ms = max(0, end_time - sim_clock.get_ticks())
             
-            text = font.render(f"빙결: {remaining_time_s:.1f}s", True, (0, 191, 255)) # 하늘색
+            text = render_text(font, format_countdown("빙결", remaining_time_ms), (0, 191, 255)) # 하늘색
             screen.blit(text, (x + CHAR_SIZE // 2 - text.get_width() // 2, y + HITBOX_Y_OFFSET_FROM_IMAGE_TOP - 90)) 
 
     def draw_poison_status(screen, x, y, char_state, font):
@@ -279,15 +206,14 @@ def gameplay(screen, map_image_path):
         if is_poisoned:
             poison_effect = next((eff for eff in char_state["status_effects"] if eff["type"] == "poison"), None)
             end_time = poison_effect.get("expires_at", 0)
-            remaining_time_ms = max(0, end_time - pygame.time.get_ticks())
-            remaining_time_s = remaining_time_ms / 1000
+            remaining_time_ms = max(0, end_time - sim_clock.get_ticks())
 
-            text = font.render(f"독: {remaining_time_s:.1f}s", True, (0, 150, 0)) # 독 상태: 녹색
+            text = render_text(font, format_countdown("독", remaining_time_ms), (0, 150, 0)) # 독 상태: 녹색
             screen.blit(text, (x + CHAR_SIZE // 2 - text.get_width() // 2, y + HITBOX_Y_OFFSET_FROM_IMAGE_TOP - 120))
             
     # 📢 텍스트 중앙 정렬 헬퍼
     def draw_text(screen, text, font, color, x, y):
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(font, text, color)
         screen.blit(text_surface, (x - text_surface.get_width() // 2, y - text_surface.get_height() // 2))
 
     # 📢 버튼 렌더링 헬퍼 (클릭 체크는 이제 외부 Rect를 사용)
@@ -325,91 +251,60 @@ def gameplay(screen, map_image_path):
         screen.blit(pin_img, (pin_x - pin_size // 2, pin_y))
 
 
-    def deal_damage(target_state, target_char_obj, attacker_state, damage, current_time):
-        # 무적 시간 확인
-        if current_time < target_state.get("invincible_end_time", 0):
-            return 
-            
-        target_state["hp"] = max(0, target_state["hp"] - damage)
-        target_char_obj.start_hit_animation()
-        target_state["invincible_end_time"] = current_time + INVINCIBILITY_DURATION # 무적 시간 적용
+    def lerp(prev, current, alpha):
+        return prev + (current - prev) * alpha
 
-        target_gain = FIXED_ULT_GAIN_ON_HIT 
-        target_state["ultimate_gauge"] = min(100, target_state["ultimate_gauge"] + target_gain)
-        
-        if attacker_state:
-            attacker_gain = FIXED_ULT_GAIN_ON_ATTACK
-            attacker_state["ultimate_gauge"] = min(100, attacker_state["ultimate_gauge"] + attacker_gain)
-
-    def apply_stun(defender_state, duration_ms, current_time):
-        # 🧊 빙결 상태가 아닐 때만 스턴 적용
-        if not defender_state.get("is_stunned", False) and not defender_state.get("is_frozen", False):
-            defender_state["is_stunned"] = True
-            defender_state["stun_end_time"] = current_time + duration_ms
-
-    def apply_freeze(defender_state, duration_ms, current_time):
-        if not defender_state.get("is_frozen", False):
-            defender_state["is_frozen"] = True
-            defender_state["frozen_end_time"] = current_time + duration_ms
+    # 📢 RUNNING 상태 렌더링 (alpha: 직전 틱 → 현재 틱 사이의 보간 비율)
+    def render_running(alpha):
+        render_systems.run(match, screen, alpha)
+
+        p1_x = lerp(p1.prev_x, p1.x, alpha)
+        p1_y = lerp(p1.prev_y, p1.y, alpha)
+        p2_x = lerp(p2.prev_x, p2.x, alpha)
+        p2_y = lerp(p2.prev_y, p2.y, alpha)
+
+        if DEBUG_DRAW_HITBOX:
+            draw_hitbox(screen, p1_x + ADJ_X_OFFSET, p1_y + HITBOX_Y_OFFSET_FROM_IMAGE_TOP, HITBOX_WIDTH, HITBOX_HEIGHT, color=(255, 0, 0))
+            draw_hitbox(screen, p2_x + ADJ_X_OFFSET, p2_y + HITBOX_Y_OFFSET_FROM_IMAGE_TOP, HITBOX_WIDTH, HITBOX_HEIGHT, color=(255, 0, 0))
             
-    def apply_poison_to_target(target: dict, source_obj) -> None:
-        """독 속성이 있는 객체(투사체/히트박스)와 충돌 시 target에 독 상태효과로 등록."""
-        
-        if not getattr(source_obj, "causes_poison", False):
-            return
+            pygame.draw.line(screen, (255, 255, 0), (0, GROUND_Y), (SCREEN_WIDTH, GROUND_Y), 2)
             
-        duration_ms = getattr(source_obj, "poison_duration", 2000)
-        poison_dps = getattr(source_obj, "poison_dps", 0.015) 
-        now = pygame.time.get_ticks()
+            for _, proj, _ in match.items.rows:
+                draw_hitbox(screen, proj.x, proj.y, proj.size, proj.size, color=(0, 255, 0))
+
+
+        # UI 렌더링
+        p2_ui_x = SCREEN_WIDTH - 250
+        draw_hp_bar(screen, 50, 50, p1.hp, p1.max_hp)
+        draw_ultimate_gauge(screen, 50, 75, p1.ultimate_gauge)
+        draw_stun_status(screen, p1_x, p1_y, p1, font)
+        draw_confusion_status(screen, p1_x, p1_y, p1, font) 
+        draw_frozen_status(screen, p1_x, p1_y, p1, font) 
+        draw_poison_status(screen, p1_x, p1_y, p1, font) 
         
-        target.setdefault("status_effects", [])
-        
-        existing_poison = next((eff for eff in target["status_effects"] if eff["type"] == "poison"), None)
-        
-        if existing_poison:
-            existing_poison["expires_at"] = now + int(duration_ms)
-            existing_poison["dps"] = float(poison_dps) 
-        else:
-            target["status_effects"].append({
-                "type": "poison",
-                "started_at": now,
-                "expires_at": now + int(duration_ms),
-                "dps": float(poison_dps),
-                "last_tick": now
-            })
-
-    def update_status_effects_for_entity(entity: dict) -> None:
-        """프레임마다 호출: entity의 status_effects를 처리하여 연속 데미지 적용."""
-        if not isinstance(entity, dict):
-            return
-        effects = entity.get("status_effects")
-        if not effects:
-            return
-        now = pygame.time.get_ticks()
-        new_effects = []
-        for eff in effects:
-            if now >= eff.get("expires_at", 0):
-                continue
-            if eff.get("type") == "poison":
-                last = eff.get("last_tick", eff.get("started_at", now))
-                elapsed_ms = now - last
-                # 100ms마다 데미지 틱이 발생하도록 설정 
-                if elapsed_ms >= 100: 
-                    elapsed_s = elapsed_ms / 1000.0
-                    max_hp = entity.get("max_hp", 100)
-                    # 독 데미지: dps * max_hp * 0.1 (100ms당)
-                    dmg = eff.get("dps", 0.0) * max_hp * 0.4
-                    entity["hp"] = max(0, entity.get("hp", 0) - int(dmg))
-                    eff["last_tick"] = now
-                new_effects.append(eff)
-            else:
-                new_effects.append(eff)
-        entity["status_effects"] = new_effects
+        draw_hp_bar(screen, p2_ui_x, 50, p2.hp, p2.max_hp)
+        draw_ultimate_gauge(screen, p2_ui_x, 75, p2.ultimate_gauge)
+        draw_stun_status(screen, p2_x, p2_y, p2, font)
+        draw_confusion_status(screen, p2_x, p2_y, p2, font) 
+        draw_frozen_status(screen, p2_x, p2_y, p2, font) 
+        draw_poison_status(screen, p2_x, p2_y, p2, font) 
+
+    # 📢 시뮬레이션 시각: sim_clock은 고정 간격(SIM_DT_MS)으로만 전진합니다.
+    # 실제 경과 시간을 누적기에 쌓아 두고, 한 프레임에 여러 틱을 돌거나 틱 없이 렌더링만 할 수 있습니다.
+    accumulator = 0.0
+    pending_keydowns = []
+    # 📢 시뮬레이션 입력은 틱마다 두 플레이어의 행동 비트마스크입니다. (리플레이가 같은 비트마스크로 같은 경기를 재현)
+    sim_keys = KeyState()
+    previous_masks = (0, 0)
+    recorder = InputRecorder(p1_codename, p2_codename, map_image_path, 0, (SCREEN_WIDTH, SCREEN_HEIGHT))
         
     # --- 메인 루프 ---
     while running:
-        dt = clock.tick(60) # dt는 밀리초
+        # 📢 렌더링 주사율은 시뮬레이션과 무관합니다. (60/144/240Hz 모두 같은 게임 진행)
+        frame_ms = clock.tick(MAX_RENDER_FPS)
         current_time = pygame.time.get_ticks()
+        # 📢 스트리밍 중인 긴 효과음의 다음 조각을 대기열에 넣습니다.
+        sound_bank.update()
         
         screen.blit(background, (0, 0))
         keys = pygame.key.get_pressed()
@@ -417,43 +312,18 @@ def gameplay(screen, map_image_path):
         # 📢 이벤트 루프 (게임 상태에 따라 다르게 처리)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                match.close()
                 return None
             
-            # RUNNING 상태에서만 키 입력 처리
+            # RUNNING 상태에서만 키 입력 처리 (다음 시뮬레이션 틱에서 적용)
             if game_state == "RUNNING" and event.type == pygame.KEYDOWN:
-                # P1 입력
-                if event.key == pygame.K_a:
-                    p1["last_input_key"] = 'a'
-                elif event.key == pygame.K_d:
-                    p1["last_input_key"] = 'd'
-                
-                # 📢 [수정]: P1 점프 (W 키)
-                elif event.key == pygame.K_w:
-                    # 📢 [수정]: 2단 점프 로직
-                    if not p1.get("is_stunned", False) and not p1.get("is_frozen", False):
-                        if p1["jump_count"] < MAX_JUMPS:
-                            p1["vy"] = jump_power
-                            p1["on_ground"] = False
-                            p1["jump_count"] += 1
-                            if jump_sound: jump_sound.play() # 📢 점프 사운드 재생
-
-                
-                # P2 입력
-                elif event.key == pygame.K_LEFT:
-                    p2["last_input_key"] = 'left'
-                elif event.key == pygame.K_RIGHT:
-                    p2["last_input_key"] = 'right'
-                
-                # 📢 [수정]: P2 점프 (UP 키)
-                elif event.key == pygame.K_UP:
-                    # 📢 [수정]: 2단 점프 로직
-                    if not p2.get("is_stunned", False) and not p2.get("is_frozen", False):
-                        if p2["jump_count"] < MAX_JUMPS:
-                            p2["vy"] = jump_power
-                            p2["on_ground"] = False
-                            p2["jump_count"] += 1
-                            if jump_sound: jump_sound.play() # 📢 점프 사운드 재생
-
+                if event.key == PAUSE_KEY:
+                    if sim_clock.paused:
+                        sim_clock.resume()
+                    else:
+                        sim_clock.pause()
+                elif not sim_clock.paused:
+                    pending_keydowns.append(event.key)
 
             # 룰렛/종료 화면에서의 마우스 클릭 처리
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -483,399 +353,44 @@ def gameplay(screen, map_image_path):
                     # 📢 [수정]: '다시 시작' 버튼 클릭 시, 'Title' 씬으로 복귀
                     if restart_button_rect.collidepoint(mouse_pos):
                         # 📢 [수정]: 룰렛 정지 후 승리 사운드가 반복 재생되는 것을 방지하기 위해 멈춥니다.
-                        if victory_sound: victory_sound.stop()
+                        sound_bank.stop("victory")
+                        match.close()
                         return "Title" 
 
         # =========================================================
         # 📢 게임 상태 분기 처리 시작
         # =========================================================
         
-        # --- 1. RUNNING 상태 (기존 게임 로직) ---
+        # --- 1. RUNNING 상태 (고정 간격 시뮬레이션 + 보간 렌더링) ---
         if game_state == "RUNNING":
-            
-            # --- 상태 및 물리 업데이트 ---
-            for char_state in [p1, p2]:
-                
-                # 🧊 빙결 상태 해제 로직 (가장 먼저 처리)
-                if char_state.get("is_frozen", False):
-                    if current_time > char_state["frozen_end_time"]:
-                        char_state["is_frozen"] = False
-                        char_state["frozen_end_time"] = 0
-                    else:
-                        char_state["is_stunned"] = False
-                        char_state["is_confused"] = False
-                        char_state["speed_boost_end_time"] = 0
-                        char_state["is_dashing"] = False 
-                        char_state["vx"] = 0 
-                
-                # 스턴 상태 해제 로직 (빙결 상태가 아닐 때만 유효)
-                if char_state.get("is_stunned", False) and not char_state.get("is_frozen", False):
-                    if current_time > char_state["stun_end_time"]:
-                        char_state["is_stunned"] = False
-                        char_state["stun_end_time"] = 0
-                    else:
-                        char_state["vx"] = 0 
-                
-                # 💨 대시 상태 해제 로직 (빙결 상태가 아닐 때만 유효)
-                if char_state.get("is_dashing", False) and not char_state.get("is_frozen", False):
-                    if current_time > char_state["dash_end_time"]:
-                        char_state["is_dashing"] = False
-                        char_state["dash_end_time"] = 0
-                        char_state["vx"] = 0 
-                
-                # 혼란 상태 해제 로직
-                if char_state.get("is_confused", False) and current_time > char_state["confusion_end_time"]:
-                    char_state["is_confused"] = False
-                    char_state["confusion_end_time"] = 0
-                    
-                # 이동 속도 버프 해제 로직
-                if char_state.get("speed_boost_end_time", 0) > 0 and current_time > char_state["speed_boost_end_time"]:
-                    char_state["speed_boost_end_time"] = 0
-
-                is_invincible = current_time < char_state.get("invincible_end_time", 0)
-                char_state["is_invincible"] = is_invincible
-                
-            # 2. 게이지 및 이동 로직 (조커 및 아이스맨 기능 반영)
-            for char_state in [p1, p2]:
-                passive_gain = GAUGE_PASSIVE_GAIN_PER_MS * dt
-                char_state["ultimate_gauge"] = min(100, char_state["ultimate_gauge"] + passive_gain)
-                
-                # 🟢 독 상태 지속 데미지 업데이트
-                update_status_effects_for_entity(char_state)
-
-            # P1 이동 처리 (빙결, 스턴, 대시 상태 반영)
-            p1_speed = BASE_SPEED
-            if current_time < p1.get("speed_boost_end_time", 0):
-                p1_speed *= (1.0 + MOVE_BOOST_PERCENTAGE)
-
-            if not p1.get("is_stunned", False) and not p1.get("is_frozen", False) and not p1.get("is_dashing", False):
-                is_confused = p1.get("is_confused", False)
-                
-                if is_confused:
-                    if keys[pygame.K_a]: p1["vx"] = p1_speed 
-                    elif keys[pygame.K_d]: p1["vx"] = -p1_speed 
-                    else: p1["vx"] = 0
-                else:
-                    if keys[pygame.K_a]: p1["vx"] = -p1_speed
-                    elif keys[pygame.K_d]: p1["vx"] = p1_speed
-                    else: p1["vx"] = 0
-                    
-                # 📢 [수정]: 점프 키 (K_w) 입력은 이미 KEYDOWN 이벤트에서 처리했으므로 여기선 제거
-            elif not p1.get("is_dashing", False):
-                p1["vx"] = 0 
-
-
-            # P2 이동 처리 (빙결, 스턴, 대시 상태 반영)
-            p2_speed = BASE_SPEED
-            if current_time < p2.get("speed_boost_end_time", 0):
-                p2_speed *= (1.0 + MOVE_BOOST_PERCENTAGE)
-
-            if not p2.get("is_stunned", False) and not p2.get("is_frozen", False) and not p2.get("is_dashing", False):
-                is_confused = p2.get("is_confused", False)
-                
-                if is_confused:
-                    if keys[pygame.K_LEFT]: p2["vx"] = p2_speed 
-                    elif keys[pygame.K_RIGHT]: p2["vx"] = -p2_speed 
-                    else: p2["vx"] = 0
-                else:
-                    if keys[pygame.K_LEFT]: p2["vx"] = -p2_speed
-                    elif keys[pygame.K_RIGHT]: p2["vx"] = p2_speed
-                    else: p2["vx"] = 0
-                    
-                # 📢 [수정]: 점프 키 (K_UP) 입력은 이미 KEYDOWN 이벤트에서 처리했으므로 여기선 제거
-            elif not p2.get("is_dashing", False):
-                p2["vx"] = 0 
-
-
-            # --- 스킬 입력 처리 (빙결/스턴 상태 반영) ---
-            # ... (스킬 입력 로직은 기존과 동일)
-            if not p1.get("is_stunned", False) and not p1.get("is_frozen", False):
-                if keys[pygame.K_e]:
-                    new_projs = p1_skill1.activate(p1, p2, p1_skill_state.get("skill1", {}), world, p1_char, owner="p1")
-                    projectiles.extend(new_projs)
-                    # 📢 기술1 사운드 재생 (투사체가 생성되었을 경우)
-                    if new_projs and attack_sound: attack_sound.play() 
-                if keys[pygame.K_r]:
-                    new_projs = p1_skill2.activate(p1, p2, p1_skill_state.get("skill2", {}), world, p1_char, owner="p1")
-                    projectiles.extend(new_projs)
-                    # 📢 기술2 사운드 재생 (투사체가 생성되었을 경우)
-                    if new_projs and attack_sound: attack_sound.play() 
-                if keys[pygame.K_s]:
-                    new_projs = p1_ultimate.activate(p1, p2, p1_skill_state.get("ultimate", {}), world, p1_char, owner="p1")
-                    projectiles.extend(new_projs)
-                    # 📢 궁극기 사운드 재생 (투사체가 생성되었을 경우)
-                    if new_projs and skill_sound: skill_sound.play() 
-                    
-            if not p2.get("is_stunned", False) and not p2.get("is_frozen", False):
-                if keys[pygame.K_RETURN]:
-                    new_projs = p2_skill1.activate(p2, p1, p2_skill_state.get("skill1", {}), world, p2_char, owner="p2")
-                    projectiles.extend(new_projs)
-                    # 📢 기술1 사운드 재생 (투사체가 생성되었을 경우)
-                    if new_projs and attack_sound: attack_sound.play() 
-                if keys[pygame.K_RSHIFT]:
-                    new_projs = p2_skill2.activate(p2, p1, p2_skill_state.get("skill2", {}), world, p2_char, owner="p2")
-                    projectiles.extend(new_projs)
-                    # 📢 기술2 사운드 재생 (투사체가 생성되었을 경우)
-                    if new_projs and attack_sound: attack_sound.play() 
-                if keys[pygame.K_DOWN]:
-                    new_projs = p2_ultimate.activate(p2, p1, p2_skill_state.get("ultimate", {}), world, p2_char, owner="p2")
-                    projectiles.extend(new_projs)
-                    # 📢 궁극기 사운드 재생 (투사체가 생성되었을 경우)
-                    if new_projs and skill_sound: skill_sound.play()
-
-
-            # --- 스킬 지속 시간/단계 업데이트 루프 ---
-            ult_objects = {"p1": p1_ultimate, "p2": p2_ultimate}
-            ult_states = {"p1": p1_skill_state.get("ultimate", {}), "p2": p2_skill_state.get("ultimate", {})}
-            char_states = {"p1": p1, "p2": p2}
-            
-            new_projectiles_from_skills = []
-            for owner_key, ult_obj in ult_objects.items():
-                ult_state = ult_states[owner_key]
-                char_state = char_states[owner_key]
-                
-                if isinstance(ult_obj, UltimateSkillBase) and ult_state.get("is_active"):
-                    ult_result = ult_obj.update(dt, world, char_state, ult_state, owner=owner_key)
-                    new_projectiles_from_skills.extend(ult_result)
-                    if owner_key == "p1":
-                        p1_skill_state["ultimate"] = ult_state
-                    else:
-                        p2_skill_state["ultimate"] = ult_state
-                        
-            projectiles.extend(new_projectiles_from_skills) 
-
-
-            # 물리 업데이트
-            for char_state in [p1, p2]:
-                
-                if char_state.get("is_dashing", False) and not char_state.get("is_frozen", False):
-                    char_state["x"] += char_state["vx"] * (dt / 1000)
-                else:
-                    char_state["vy"] += gravity
-                    char_state["x"] += char_state["vx"]
-                
-                char_state["y"] += char_state["vy"]
-                
-                if char_state["y"] >= initial_y: 
-                    char_state["y"] = initial_y
-                    char_state["vy"] = 0
-                    char_state["on_ground"] = True
-                    char_state["jump_count"] = 0 # 📢 [추가]: 땅에 닿으면 점프 카운트 초기화
-                else:
-                    char_state["on_ground"] = False
-
-                char_state["x"] = max(0, min(SCREEN_WIDTH - CHAR_SIZE, char_state["x"]))
-                
-            p1_char.update(dt, p1.get("is_invincible", False), p1.get("is_confused", False), p1.get("is_frozen", False))
-            p2_char.update(dt, p2.get("is_invincible", False), p2.get("is_confused", False), p2.get("is_frozen", False))
-
-            # 발사체 업데이트
-            # ... (발사체 업데이트 로직은 기존과 동일)
-            new_projectiles = []
-            explosion_effects = []
-            for proj in projectiles:
-                
-                if hasattr(proj, 'attached_to_char') and proj.attached_to_char in ["p1", "p2"]:
-                    owner_key = proj.attached_to_char
-                    owner_state = p1 if owner_key == "p1" else p2
-                    
-                    if owner_state.get("is_dashing", False):
-                        # CHAR_SIZE는 위에서 정의된 200
-                        is_facing_right = owner_state.get("last_input_key") in ['d', 'D', 'right']
-                        EFFECT_SIZE = 300 
-                        
-                        if is_facing_right:
-                            hitbox_x = owner_state["x"] + CHAR_SIZE
-                        else:
-                            hitbox_x = owner_state["x"] - EFFECT_SIZE
-                            
-                        proj.x = hitbox_x
-                        proj.y = owner_state["y"]
-
-                    elif not owner_state.get("is_frozen", False):
-                        pass 
-                    
-                proj.update(world)
-                
-                # 포물선 투사체(중력 $\neq 0$)의 바닥 충돌 처리 로직 통합
-                if proj.gravity != 0 and proj.damage > 0 and proj.y + proj.size >= GROUND_Y and proj.active:
-                    explosion_center_x = proj.x + proj.size / 2
-                    explosion_center_y = GROUND_Y
-                    proj.active = False
-                    
-                    if hasattr(proj, 'collision_skill_instance') and isinstance(proj.collision_skill_instance, PoisonPotionUltimate):
-                        new_effects = proj.collision_skill_instance.create_explosion_effect(explosion_center_x, explosion_center_y, proj.owner)
-                        explosion_effects.extend(new_effects)
-                        
-                    elif isinstance(p1_skill2 if proj.owner == "p1" else p2_skill2, LeesaengseonBombSkill):
-                        effect_creator = p1_skill2 if proj.owner == "p1" else p2_skill2
-                        new_effects = effect_creator.create_explosion_effect(explosion_center_x, explosion_center_y, proj.owner)
-                        explosion_effects.extend(new_effects)
-
-                
-                if proj.active:
-                    new_projectiles.append(proj)
-                    
-            projectiles[:] = new_projectiles
-            projectiles.extend(explosion_effects)
-            world["projectiles"] = projectiles
-
-            # 실제 충돌 박스 생성
-            p1_rect = pygame.Rect(p1["x"] + ADJ_X_OFFSET, p1["y"] + HITBOX_Y_OFFSET_FROM_IMAGE_TOP, HITBOX_WIDTH, HITBOX_HEIGHT)
-            p2_rect = pygame.Rect(p2["x"] + ADJ_X_OFFSET, p2["y"] + HITBOX_Y_OFFSET_FROM_IMAGE_TOP, HITBOX_WIDTH, HITBOX_HEIGHT)
-            
-            # --- 충돌 처리 ---
-            # ... (충돌 처리 로직은 기존과 동일)
-            for proj in projectiles:
-                proj_rect = pygame.Rect(proj.x, proj.y, proj.size, proj.size)
-                
-                target_char = None
-                target_state = None
-                attacker_state = None 
-                
-                if proj.owner == "p1":
-                    if proj_rect.colliderect(p2_rect):
-                        target_char = p2_char
-                        target_state = p2
-                        attacker_state = p1 
-                elif proj.owner == "p2":
-                    if proj_rect.colliderect(p1_rect):
-                        target_char = p1_char
-                        target_state = p1
-                        attacker_state = p2 
-
-                if target_char:
-                    if hasattr(proj, 'is_ice_block'):
-                        continue
-                    
-                    if hasattr(proj, 'causes_confusion') and proj.causes_confusion:
-                        if current_time >= target_state.get("invincible_end_time", 0):
-                            target_state["is_confused"] = True
-                            target_state["confusion_end_time"] = current_time + proj.confusion_duration_ms 
-                            proj.active = False 
-                        continue
-
-                    if hasattr(proj, 'is_gas_cloud') and proj.damage > 0:
-                        apply_poison_to_target(target_state, proj)
-                        continue 
-                        
-                    if hasattr(proj, 'is_ultimate_area') and proj.damage > 0 and proj.active:
-                        if hasattr(proj, 'hit_once_only') and proj.hit_once_only and hasattr(proj, 'hit_already') and proj.hit_already:
-                            continue
-
-                        if current_time >= target_state.get("invincible_end_time", 0):
-                            deal_damage(target_state, target_char, attacker_state, proj.damage, current_time) 
-                            
-                            apply_freeze(target_state, proj.freeze_duration, current_time)
-                            
-                            ice_effect = IceBlock(
-                                x=target_state["x"], 
-                                y=target_state["y"], 
-                                size=CHAR_SIZE, 
-                                owner=proj.owner, 
-                                duration_ms=proj.freeze_duration
-                            )
-                            projectiles.append(ice_effect)
-
-                            if hasattr(proj, 'hit_once_only') and proj.hit_once_only:
-                                proj.hit_already = True 
-                                
-                        continue
-
-                    elif proj.damage > 0 and current_time >= target_state.get("invincible_end_time", 0):
-                        
-                        is_proj_that_explodes = (proj.gravity != 0 and not isinstance(proj, (MeleeHitbox, UltimateBeltEffect)))
-                        
-                        if is_proj_that_explodes:
-                            explosion_center_x = proj.x + proj.size / 2
-                            explosion_center_y = proj.y + proj.size / 2
-                            proj.active = False
-
-                            if hasattr(proj, 'collision_skill_instance') and isinstance(proj.collision_skill_instance, PoisonPotionUltimate):
-                                new_effects = proj.collision_skill_instance.create_explosion_effect(explosion_center_x, explosion_center_y, proj.owner)
-                                projectiles.extend(new_effects)
-
-                            elif isinstance(p1_skill2 if proj.owner == "p1" else p2_skill2, LeesaengseonBombSkill):
-                                effect_creator = p1_skill2 if proj.owner == "p1" else p2_skill2
-                                new_effects = effect_creator.create_explosion_effect(explosion_center_x, explosion_center_y, proj.owner)
-                                projectiles.extend(new_effects)
-                                
-                            continue
-
-                        deal_damage(target_state, target_char, attacker_state, proj.damage, current_time) 
-                        
-                        if hasattr(proj, 'causes_poison') and proj.causes_poison:
-                            apply_poison_to_target(target_state, proj)
-                        
-                        if hasattr(proj, 'stuns_target') and proj.stuns_target:
-                            apply_stun(target_state, duration_ms=proj.stun_duration_ms, current_time=current_time)
-                        
-                        is_persistent_proj = isinstance(proj, (MeleeHitbox, UltimateBeltEffect))
-                        
-                        if proj.gravity == 0 and not is_persistent_proj:
-                            proj.active = False
-                            
-                            if hasattr(proj, 'collision_effect_class') and proj.collision_effect_class:
-                                effect_size = getattr(proj, 'collision_effect_size', 100)
-                                effect_class = proj.collision_effect_class
-                                
-                                effect_x = target_state["x"] + CHAR_SIZE // 2 - effect_size // 2
-                                effect_y = target_state["y"] + CHAR_SIZE // 2 - effect_size // 2
-                                
-                                new_effect = effect_class(
-                                    x=effect_x, 
-                                    y=effect_y, 
-                                    owner=proj.owner, 
-                                    size=effect_size
-                                )
-                                projectiles.append(new_effect)
-
-            # --- 렌더링 ---
-            
-            for proj in projectiles:
-                proj.draw(screen)
-
-            p1_image_y = p1["y"] - HITBOX_Y_OFFSET_FROM_IMAGE_TOP + IMAGE_Y_ADJUSTMENT 
-            p2_image_y = p2["y"] - HITBOX_Y_OFFSET_FROM_IMAGE_TOP + IMAGE_Y_ADJUSTMENT
-
-            p1_char.draw(screen, p1["x"], p1_image_y, p2["x"], p1.get("is_invincible", False), p1.get("is_confused", False), p1.get("is_frozen", False))
-            p2_char.draw(screen, p2["x"], p2_image_y, p1["x"], p2.get("is_invincible", False), p2.get("is_confused", False), p2.get("is_frozen", False))
-
-            if DEBUG_DRAW_HITBOX:
-                draw_hitbox(screen, p1_rect.x, p1_rect.y, HITBOX_WIDTH, HITBOX_HEIGHT, color=(255, 0, 0))
-                draw_hitbox(screen, p2_rect.x, p2_rect.y, HITBOX_WIDTH, HITBOX_HEIGHT, color=(255, 0, 0))
-                
-                pygame.draw.line(screen, (255, 255, 0), (0, GROUND_Y), (SCREEN_WIDTH, GROUND_Y), 2)
-                
-                for proj in projectiles:
-                    draw_hitbox(screen, proj.x, proj.y, proj.size, proj.size, color=(0, 255, 0))
-
-
-            # UI 렌더링
-            p2_ui_x = SCREEN_WIDTH - 250
-            draw_hp_bar(screen, 50, 50, p1["hp"], p1["max_hp"])
-            draw_ultimate_gauge(screen, 50, 75, p1["ultimate_gauge"])
-            draw_stun_status(screen, p1["x"], p1["y"], p1, font)
-            draw_confusion_status(screen, p1["x"], p1["y"], p1, font) 
-            draw_frozen_status(screen, p1["x"], p1["y"], p1, font) 
-            draw_poison_status(screen, p1["x"], p1["y"], p1, font) 
-            
-            draw_hp_bar(screen, p2_ui_x, 50, p2["hp"], p2["max_hp"])
-            draw_ultimate_gauge(screen, p2_ui_x, 75, p2["ultimate_gauge"])
-            draw_stun_status(screen, p2["x"], p2["y"], p2, font)
-            draw_confusion_status(screen, p2["x"], p2["y"], p2, font) 
-            draw_frozen_status(screen, p2["x"], p2["y"], p2, font) 
-            draw_poison_status(screen, p2["x"], p2["y"], p2, font) 
-
-            
-            # 📢 승리 조건 확인
-            if p1["hp"] <= 0:
-                game_state = "ENDED"
-                winner_codename = p2_codename
-                
-            elif p2["hp"] <= 0:
+            # 일시정지 중에는 시뮬레이션 시계와 누적기가 멈춥니다. (재개 시 밀린 시간을 따라잡지 않음)
+            if not sim_clock.paused:
+                # 너무 오래 멈췄던 프레임은 MAX_CATCHUP_MS까지만 따라잡습니다. (그 이상은 버림)
+                accumulator = min(accumulator + frame_ms, MAX_CATCHUP_MS)
+
+            while accumulator >= SIM_DT_MS and not match.finished:
+                accumulator -= SIM_DT_MS
+                masks = keys_to_masks(keys, pending_keydowns)
+                step_masks(match, sim_keys, masks, previous_masks)
+                recorder.record(*masks)
+                previous_masks = masks
+                pending_keydowns.clear()
+
+            if match.finished:
                 game_state = "ENDED"
-                winner_codename = p1_codename
+                winner_codename = match.winner
+                replay_path = os.path.join(REPLAY_DIR, time.strftime("%Y%m%d_%H%M%S")
+                                           + f"_{p1_codename}_vs_{p2_codename}{REPLAY_EXTENSION}")
+                try:
+                    recorder.save(replay_path)
+                except OSError as e:
+                    print(f"Error saving replay: {e}")
+
+            alpha = min(1.0, accumulator / SIM_DT_MS)
+            render_running(alpha)
+
+            if sim_clock.paused:
+                draw_text(screen, "일시정지", large_font, (255, 255, 255), SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
                 
         # --- 2. ENDED 상태 (승리 화면 표시 후 ROULETTE_SETUP으로 전환) ---
         elif game_state == "ENDED":
@@ -883,10 +398,12 @@ def gameplay(screen, map_image_path):
             draw_text(screen, f"{winner_name} 승리!", large_font, (255, 255, 255), SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
             
             # 📢 [추가]: BGM을 멈춥니다.
-            pygame.mixer.music.stop() 
+            stop_music() 
             
             pygame.display.flip()
             pygame.time.wait(2000) 
+            # 📢 경기 화면은 더 그리지 않으므로 남은 투사체/이펙트를 풀에 반납합니다.
+            match.close()
             game_state = "ROULETTE_SETUP"
 
 
@@ -918,7 +435,7 @@ def gameplay(screen, map_image_path):
                 roulette_speed = initial_max_speed * deceleration_factor
                 
                 # 📢 룰렛 각도 업데이트 
-                roulette_angle = (roulette_angle + roulette_speed * (dt / 16.66)) % 360.0
+                roulette_angle = (roulette_angle + roulette_speed * (frame_ms / 16.66)) % 360.0
             
             else:
                 roulette_speed = 0.0
@@ -943,5 +460,6 @@ def gameplay(screen, map_image_path):
         pygame.display.flip()
         
     # 📢 [추가]: 게임 종료 시 사운드 재생 상태 정리
-    pygame.mixer.music.stop()
+    stop_music()
+    match.close()
     return "Title"
\ No newline at end of file
@@ -0,0 +1,186 @@
+# headless.py
+
+import os
+import json
+import random
+from typing import Dict, Any, List, Callable, Set, Iterable
+
+# 📢 창 없이 경기를 돌리므로 SDL 드라이버는 더미를 사용합니다. (pygame을 import 하는 match보다 먼저 설정)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from match import Match, KEY_BINDINGS, SIM_DT_MS, CHAR_SIZE
+# 📢 행동 이름/비트마스크/키 상태는 gameplay도 쓰므로 input_bits에 있습니다. (이 모듈은 SDL 더미 드라이버를 설정함)
+from input_bits import ACTIONS, KeyState, actions_to_mask
+
+# 📢 헤드리스 경기 실행
+# 창/렌더링/사운드 없이 match.Match를 CPU가 허용하는 만큼 빠르게 돌리고 결과를 JSON으로 돌려줍니다.
+# 입력은 컨트롤러(봇 또는 스크립트)가 틱마다 "누르고 있는 행동" 집합으로 만들고,
+# 새로 눌린 행동은 gameplay와 똑같이 KEYDOWN으로도 전달됩니다. (점프, 마지막 방향키)
+
+DEFAULT_MAP = os.path.join("assets", "maps", "sky_island.png")
+# 승부가 나지 않으면 무승부로 끝내는 시뮬레이션 시간
+DEFAULT_MAX_DURATION_MS = 180_000
+# 봇이 새로 판단하는 간격 (틱, 60Hz 기준 100ms)
+BOT_REACTION_TICKS = 6
+
+# 컨트롤러: (match, side, rng) -> 이번 틱에 누르고 있는 행동 집합
+Controller = Callable[[Match, str, random.Random], Set[str]]
+
+
+# --- 컨트롤러 ---
+
+def idle_bot(match: Match, side: str, rng: random.Random) -> Set[str]:
+    """아무것도 누르지 않습니다."""
+    return set()
+
+
+def random_bot(match: Match, side: str, rng: random.Random) -> Set[str]:
+    """행동마다 30% 확률로 누르고, 5% 확률로 점프합니다."""
+    actions = {action for action in ("left", "right", "skill1", "skill2", "ultimate") if rng.random() < 0.3}
+    if rng.random() < 0.05:
+        actions.add("jump")
+    return actions
+
+
+def aggressive_bot(match: Match, side: str, rng: random.Random) -> Set[str]:
+    """상대에게 접근하며 준비된 스킬을 바로 쓰고, 게이지가 차면 궁극기를 씁니다."""
+    # 📢 사람처럼 BOT_REACTION_TICKS마다 한 번만 판단하고, 그 사이에는 같은 키를 누르고 있습니다.
+    memory = match.world.setdefault("bot_memory", {})
+    if match.tick % BOT_REACTION_TICKS and side in memory:
+        return memory[side]
+    me, enemy = (match.p1, match.p2) if side == "p1" else (match.p2, match.p1)
+    skills = match.p1_skills if side == "p1" else match.p2_skills
+    actions: Set[str] = set()
+
+    gap = enemy.x - me.x
+    if abs(gap) > CHAR_SIZE * 1.5:
+        actions.add("right" if gap > 0 else "left")
+    elif abs(gap) < CHAR_SIZE * 0.5:
+        actions.add("left" if gap > 0 else "right")
+
+    for slot, skill in zip(("skill1", "skill2", "ultimate"), skills):
+        if not skill.ready():
+            continue
+        if slot == "ultimate" and me.ultimate_gauge < getattr(skill, "ult_cost_percent", 0):
+            continue
+        actions.add(slot)
+
+    if me.on_ground and rng.random() < 0.02 * BOT_REACTION_TICKS:
+        actions.add("jump")
+    memory[side] = actions
+    return actions
+
+
+BOTS: Dict[str, Controller] = {
+    "idle": idle_bot,
+    "random": random_bot,
+    "aggressive": aggressive_bot,
+}
+
+
+class ScriptedInput:
+    """틱 번호별 행동 스크립트. 각 항목의 행동은 다음 항목까지 계속 누르고 있습니다.
+
+    형식: [[tick, ["right", "skill1"]], [90, []], ...]
+    """
+
+    def __init__(self, entries: List[List[Any]]):
+        self.entries = sorted((int(tick), frozenset(actions)) for tick, actions in entries)
+        unknown = {a for _, actions in self.entries for a in actions} - set(ACTIONS)
+        if unknown:
+            raise ValueError(f"알 수 없는 행동: {sorted(unknown)}")
+        self._index = 0
+        self._current: frozenset = frozenset()
+        self._last_tick = -1
+
+    def __call__(self, match: Match, side: str, rng: random.Random) -> Set[str]:
+        if match.tick < self._last_tick:
+            # 새 경기: 처음부터 다시 재생
+            self._index = 0
+            self._current = frozenset()
+        self._last_tick = match.tick
+        while self._index < len(self.entries) and self.entries[self._index][0] <= match.tick:
+            self._current = self.entries[self._index][1]
+            self._index += 1
+        return set(self._current)
+
+
+def load_script(path: str) -> Dict[str, ScriptedInput]:
+    """{"p1": [[tick, [actions]], ...], "p2": [...]} 형식의 JSON 스크립트를 읽습니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {side: ScriptedInput(entries) for side, entries in data.items() if side in KEY_BINDINGS}
+
+
+def make_controller(spec: str) -> Controller:
+    """봇 이름으로 컨트롤러를 찾습니다."""
+    if spec in BOTS:
+        return BOTS[spec]
+    raise ValueError(f"알 수 없는 입력: {spec} (사용 가능: {', '.join(BOTS)})")
+
+
+# --- 경기 실행 ---
+
+class BotDriver:
+    """컨트롤러의 행동을 키 입력으로 바꿔 match를 한 틱씩 진행합니다."""
+
+    def __init__(self, match: Match, p1_input: Controller, p2_input: Controller, seed: int = 0, recorder=None):
+        self.match = match
+        self.rng = random.Random(seed)
+        self.controllers = (("p1", p1_input), ("p2", p2_input))
+        self.held: Dict[str, Set[str]] = {"p1": set(), "p2": set()}
+        self.keys = KeyState()
+        self.recorder = recorder # replay.InputRecorder (틱마다 두 플레이어의 행동 비트마스크를 기록)
+
+    def step(self) -> None:
+        match, held = self.match, self.held
+        pressed = self.keys.pressed
+        pressed.clear()
+        keydowns = []
+        for side, controller in self.controllers:
+            bindings = KEY_BINDINGS[side]
+            actions = controller(match, side, self.rng)
+            for action in ACTIONS: # 집합 순회 순서에 의존하지 않도록 고정된 순서로 처리
+                if action in actions:
+                    pressed.add(bindings[action])
+                    # 새로 눌린 행동은 KEYDOWN (점프, 대시 방향)
+                    if action not in held[side]:
+                        keydowns.append(bindings[action])
+            held[side] = actions
+        if self.recorder is not None:
+            self.recorder.record(actions_to_mask(held["p1"]), actions_to_mask(held["p2"]))
+        match.step(self.keys, keydowns)
+
+
+def run_match(p1_codename: str, p2_codename: str,
+              p1_input: Controller = aggressive_bot, p2_input: Controller = aggressive_bot,
+              seed: int = 0, max_duration_ms: float = DEFAULT_MAX_DURATION_MS,
+              map_path: str = DEFAULT_MAP, listeners: Iterable[Callable] = (), recorder=None,
+              clash: bool = False) -> Dict[str, Any]:
+    """한 경기를 끝까지 (또는 max_duration_ms까지) 돌리고 결과 딕셔너리를 반환합니다.
+    listeners: 경기의 전투 이벤트 버스(Match.events)에 붙일 구독자 (모든 종류 구독)
+    recorder: 틱마다 입력을 기록할 replay.InputRecorder (리플레이에는 투사체 상쇄 여부가 기록되지 않음)
+    clash: 투사체 상쇄 규칙 사용 (Match.enable_clash)"""
+    if clash and recorder is not None:
+        raise ValueError("투사체 상쇄 경기는 리플레이로 기록할 수 없습니다.")
+    match = Match(p1_codename, p2_codename)
+    if clash:
+        match.enable_clash()
+    for listener in listeners:
+        match.events.subscribe(listener)
+    if len(match.p1_skills) < 3 or len(match.p2_skills) < 3:
+        raise ValueError(f"스킬이 등록되지 않은 캐릭터입니다: {p1_codename}, {p2_codename}")
+
+    driver = BotDriver(match, p1_input, p2_input, seed, recorder)
+    max_ticks = int(max_duration_ms / SIM_DT_MS)
+    while not match.finished and match.tick < max_ticks:
+        driver.step()
+
+    result = match.get_result()
+    match.close()
+    result["map"] = map_path
+    result["seed"] = seed
+    result["timed_out"] = not match.finished
+    return result
@@ -0,0 +1,70 @@
+# input_bits.py
+
+from typing import Dict, Iterable, Sequence, Set, Tuple
+
+from match import Match, KEY_BINDINGS
+
+# 📢 틱당 입력 표현 (헤드리스 실행, 롤백 넷코드, 입력 기록/리플레이가 공유)
+# 한 플레이어의 한 틱 입력은 "누르고 있는 행동"의 비트마스크 1바이트이고, 직전 틱과 비교해 새로 켜진 비트가 KEYDOWN입니다.
+# step_masks()로 진행하면 같은 비트마스크 열은 항상 같은 경기 결과를 만듭니다.
+
+ACTIONS = ("left", "right", "jump", "skill1", "skill2", "ultimate")
+# 행동 비트 (ACTIONS 순서대로 1, 2, 4, ...)
+ACTION_BITS: Dict[str, int] = {action: 1 << i for i, action in enumerate(ACTIONS)}
+SIDES = ("p1", "p2")
+
+
+class KeyState:
+    """pygame.key.get_pressed() 대용 (눌린 키 코드만 보관)"""
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed: Iterable[int] = ()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+def actions_to_mask(actions: Iterable[str]) -> int:
+    mask = 0
+    for action in actions:
+        mask |= ACTION_BITS[action]
+    return mask
+
+
+def mask_to_actions(mask: int) -> Set[str]:
+    return {action for action, bit in ACTION_BITS.items() if mask & bit}
+
+
+def keys_to_masks(keys, keydowns: Iterable[int] = ()) -> Tuple[int, int]:
+    """pygame 키 상태(+ 이번 틱 전에 들어온 KEYDOWN 키 코드)를 두 플레이어의 비트마스크로 바꿉니다.
+    한 프레임 안에 눌렀다 뗀 키도 KEYDOWN이 있으면 이번 틱에는 누른 것으로 칩니다."""
+    downs = set(keydowns)
+    masks = []
+    for side in SIDES:
+        mask = 0
+        for action, key in KEY_BINDINGS[side].items():
+            if keys[key] or key in downs:
+                mask |= ACTION_BITS[action]
+        masks.append(mask)
+    return masks[0], masks[1]
+
+
+def step_masks(match: Match, keys: KeyState, masks: Sequence[int], previous: Sequence[int]) -> None:
+    """두 플레이어의 이번 틱 비트마스크(masks)로 match를 한 틱 진행합니다.
+    previous: 직전 틱의 비트마스크. 새로 켜진 비트는 BotDriver와 같은 순서(p1 → p2, ACTIONS 순서)로 KEYDOWN이 됩니다."""
+    pressed = keys.pressed
+    pressed.clear()
+    keydowns = []
+    for side, mask, prev in zip(SIDES, masks, previous):
+        if not mask:
+            continue
+        bindings = KEY_BINDINGS[side]
+        for action in ACTIONS:
+            bit = ACTION_BITS[action]
+            if mask & bit:
+                pressed.add(bindings[action])
+                if not prev & bit:
+                    keydowns.append(bindings[action])
+    match.step(keys, keydowns)
@@ -1,28 +1,45 @@
+# 📢 시작 시간 측정 기준점이므로 가장 먼저 import 합니다.
+import startup_profile
+
 import pygame
 import sys
 import os 
 
+startup_profile.mark("import pygame")
+
 from scenes.title import title
 from scenes.characters import characters
 from scenes.maps import maps
 from maps.loading import map_loading
 
+startup_profile.mark("import scenes")
+
 from gameplay import gameplay
 from scenes.maps import map_config
+from preload import GAMEPLAY_SCREEN_SIZE
+from settings import GAME_VOLUME, MENU_SCREEN_SIZE
+from audio import ensure_mixer, music_busy
+import derived_cache
+
+startup_profile.mark("import gameplay")
 
 # BGM 경로 정의
 BGM_BATTLE_PATH = "assets/bgm/BGM07battle2.wav" # 사용하지 않지만 경로 정의는 유지
 BGM_MENU_PATH = "assets/bgm/F1_starting_grid.mp3" # 통합 BGM
 
-pygame.init()
+# 📢 pygame.init()은 믹서/폰트까지 모두 초기화하므로, 첫 화면에 필요한 디스플레이만 초기화합니다.
+# 믹서는 BGM이 처음 필요할 때(audio.ensure_mixer), 폰트는 처음 Font를 만들 때(fonts.get_font) 초기화됩니다.
+pygame.display.init()
 
-GAME_VOLUME = 0.05 
-pygame.mixer.music.set_volume(GAME_VOLUME)
+startup_profile.mark("init display")
 
-screen = pygame.display.set_mode((1080, 720))
+screen = pygame.display.set_mode(MENU_SCREEN_SIZE)
+
+startup_profile.mark("set_mode")
 
 FPS = 120
 clock = pygame.time.Clock()
+clock.tick() # SDL 타이머 시작 (pygame.init()을 호출하지 않으므로 get_ticks가 0에서 멈추지 않도록)
 
 current_screen = "Title"
 past_screen = "Title"
@@ -56,18 +73,18 @@ while current_screen:
         if is_gameplay_mode:
             if screen.get_flags() & pygame.FULLSCREEN == 0:
                 pygame.mouse.set_visible(False)
-                screen = pygame.display.set_mode((1920, 1080), pygame.FULLSCREEN)
+                screen = pygame.display.set_mode(GAMEPLAY_SCREEN_SIZE, pygame.FULLSCREEN)
         else:
             if screen.get_flags() & pygame.FULLSCREEN != 0:
                 pygame.mouse.set_visible(True)
-                screen = pygame.display.set_mode((1080, 720))
+                screen = pygame.display.set_mode(MENU_SCREEN_SIZE)
                 
         past_screen = current_screen
     
     # B. 씬 실행 로직
     
     # 📢 [BGM 통합 로직]: Title에서 BGM 씬으로 넘어올 때 BGM을 켜줍니다.
-    if current_screen in CONTINUOUS_BGM_SCREENS and not pygame.mixer.music.get_busy() and os.path.exists(BGM_MENU_PATH):
+    if current_screen in CONTINUOUS_BGM_SCREENS and not music_busy() and os.path.exists(BGM_MENU_PATH) and ensure_mixer():
         try:
             # 혹시 모를 잔여 음악 정리
             if pygame.mixer.music.get_busy():
@@ -84,7 +101,7 @@ while current_screen:
         
         # 📢 [핵심 수정]: gameplay 씬 진입 직전, BGM이 중단되었다면 즉시 메뉴 BGM을 복구/재생
         # 이 코드는 gameplay 내부에서 BGM이 중단되는 경우를 방어하여 BGM 연속성을 보장합니다.
-        if not pygame.mixer.music.get_busy() and os.path.exists(BGM_MENU_PATH):
+        if not music_busy() and os.path.exists(BGM_MENU_PATH) and ensure_mixer():
             try:
                 # 안전하게 중지 후 다시 로드 및 재생
                 pygame.mixer.music.load(BGM_MENU_PATH)
@@ -106,7 +123,7 @@ while current_screen:
     elif current_screen in screens:
         
         # Title 씬으로 돌아갈 때만 BGM 중지
-        if current_screen == "Title" and pygame.mixer.music.get_busy():
+        if current_screen == "Title" and music_busy():
             pygame.mixer.music.stop()
             
         # Title, Characters, Maps, map_loading 같은 일반 씬 실행
@@ -120,5 +137,11 @@ while current_screen:
     if pygame.display.get_init():
         pygame.display.update()
 
+    # 📢 첫 타이틀 프레임 표시 시점 기록 (프로파일 모드에서는 여기서 종료)
+    if past_screen == "Title" and startup_profile.first_frame():
+        current_screen = None
+
+# 📢 미리 로드 밖(메뉴 배경 등)에서 새로 계산한 원본 해시도 인덱스에 남깁니다.
+derived_cache.flush_index()
 pygame.quit()
 sys.exit()
\ No newline at end of file
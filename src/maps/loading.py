@@ -1,8 +1,8 @@
 import pygame
 from scenes.maps import map_config, get_mapname_by_codename
 from scenes.characters import character_config, get_charactername_by_codename
-
-pygame.mixer.init()
+from fonts import get_font, render_text, DEFAULT_FONT_PATH
+from preload import start_preload
 
 start_time = None
 end_time = None
@@ -15,6 +15,9 @@ def map_loading(screen, current_map):
     if start_time is None:
         start_time = pygame.time.get_ticks()
         end_time = start_time + 5000 
+        # 📢 카운트다운 동안 선택된 캐릭터/맵 자산을 백그라운드 스레드에서 미리 로드합니다.
+        start_preload(character_config['selected_1p'], character_config['selected_2p'],
+                      f"assets/maps/{map_config['selected_map']}.png")
 
     remaining = (end_time - pygame.time.get_ticks()) / 1000
 
@@ -23,22 +26,23 @@ def map_loading(screen, current_map):
     center_x = screen.get_width() // 2
     center_y = screen.get_height() // 2
 
-    font = pygame.font.Font("assets/font/NotoSansKR-Bold.ttf", 70)
-    font_small = pygame.font.Font("assets/font/NotoSansKR-Bold.ttf", 35)
+    # 📢 폰트 풀 / 텍스트 캐시 사용 (매 프레임 Font 생성 및 재래스터화 방지)
+    font = get_font(DEFAULT_FONT_PATH, 70)
+    font_small = get_font(DEFAULT_FONT_PATH, 35)
 
-    text_map = font.render(f"Map: {get_mapname_by_codename(map_config['selected_map'])}", True, (255, 255, 255))
+    text_map = render_text(font, f"Map: {get_mapname_by_codename(map_config['selected_map'])}", (255, 255, 255))
     text_map_rect = text_map.get_rect(center=(center_x, center_y - 290))
     screen.blit(text_map, text_map_rect)
 
-    text_remaining = font.render(f"{remaining:.0f}초 후 게임이 시작됩니다", True, (255, 255, 255))
+    text_remaining = render_text(font, f"{remaining:.0f}초 후 게임이 시작됩니다", (255, 255, 255))
     text_remaining_rect = text_remaining.get_rect(center=(center_x, center_y - 200))
     screen.blit(text_remaining, text_remaining_rect)
 
-    text1p = font_small.render(f"Player 1: {get_charactername_by_codename(character_config['selected_1p'])}", True, (255, 255, 255))
+    text1p = render_text(font_small, f"Player 1: {get_charactername_by_codename(character_config['selected_1p'])}", (255, 255, 255))
     text1p_rect = text1p.get_rect(center=(center_x, center_y + 50))
     screen.blit(text1p, text1p_rect)
 
-    text2p = font_small.render(f"Player 2: {get_charactername_by_codename(character_config['selected_2p'])}", True, (255, 255, 255))
+    text2p = render_text(font_small, f"Player 2: {get_charactername_by_codename(character_config['selected_2p'])}", (255, 255, 255))
     text2p_rect = text2p.get_rect(center=(center_x, center_y + 90))
     screen.blit(text2p, text2p_rect)
 
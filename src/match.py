@@ -0,0 +1,925 @@
+# match.py
+
+import copy
+import pygame
+from typing import Dict, Any, Iterable, List, Optional, Callable, Tuple
+
+from scenes.characters import character_skill_state
+from skills.skills_skills_loader import get_skills_for_character
+from skills.skills_base import UltimateSkillBase
+from skills.collision import COLLISION_TABLE, collision_handler
+from animation import Character
+from sim_clock import SimClock
+from player_state import PlayerState, ON_GROUND, STUNNED, CONFUSED, FROZEN, DASHING, INVINCIBLE, FACING_RIGHT
+from projectile_engine import ProjectileEngine, F_HIT_ONCE
+from spatial_hash import SpatialHash, DEFAULT_CELL_SIZE
+from ecs import Registry, Scheduler, Entity
+from status_effects import StatusEngine
+from snapshot import SnapshotBuffer, save_match, load_match
+from combat_events import CombatEventBus, sound_listener, HIT, STATUS, SPAWN, KO, SOUND
+
+# 📢 경기 시뮬레이션 (전투 규칙)
+# gameplay()의 창/이벤트/렌더링과 분리된 한 경기의 상태와 고정 간격 틱입니다.
+# gameplay()는 이 객체를 실시간으로 돌리며 그리고, tools/simulate.py는 디스플레이 없이 최대 속도로 돌립니다.
+# 같은 캐릭터/입력이면 어느 쪽에서 돌려도 같은 결과가 나옵니다.
+
+# =========================================================
+# 🎯 궁극기 게이지 획득 상수 정의
+FIXED_ULT_GAIN_ON_HIT = 3
+FIXED_ULT_GAIN_ON_ATTACK = 5
+GAUGE_PASSIVE_GAIN_PER_MS = 1 / 1000
+
+# 📢 조커 상태 관련 상수
+CONFUSION_DURATION_MS = 3000
+MOVE_BOOST_PERCENTAGE = 0.5
+
+# 📢 캐릭터 충돌 박스 조정 상수 (기존 설정 유지)
+CHAR_SIZE = 200
+HITBOX_WIDTH = 160
+HITBOX_HEIGHT = 160
+
+HITBOX_Y_OFFSET_FROM_IMAGE_TOP = CHAR_SIZE - HITBOX_HEIGHT
+ADJ_X_OFFSET = (CHAR_SIZE - HITBOX_WIDTH) / 2
+
+# 📢 [추가]: 점프 관련 상수
+MAX_JUMPS = 2 # 2단 점프 허용
+
+# 무적 시간 설정 (0.5초)
+INVINCIBILITY_DURATION = 500 # ms
+
+# 물리 상수
+BASE_SPEED = 6
+JUMP_POWER = -18
+GRAVITY = 1
+
+STARTING_HP = 200
+
+# 📢 고정 시간 간격 시뮬레이션: 게임 로직은 항상 60Hz 틱으로 진행됩니다.
+SIM_HZ = 60
+SIM_DT_MS = 1000 / SIM_HZ
+
+# 📢 플레이어별 조작 키 (행동 이름 -> pygame 키)
+KEY_BINDINGS: Dict[str, Dict[str, int]] = {
+    "p1": {"left": pygame.K_a, "right": pygame.K_d, "jump": pygame.K_w,
+           "skill1": pygame.K_e, "skill2": pygame.K_r, "ultimate": pygame.K_s},
+    "p2": {"left": pygame.K_LEFT, "right": pygame.K_RIGHT, "jump": pygame.K_UP,
+           "skill1": pygame.K_RETURN, "skill2": pygame.K_RSHIFT, "ultimate": pygame.K_DOWN},
+}
+SKILL_SLOTS = ("skill1", "skill2", "ultimate")
+
+# 방향키 KEYDOWN이 기록하는 마지막 입력 이름 (스킬이 last_input_key로 방향을 정함)
+LAST_INPUT_KEYS: Dict[str, Dict[str, str]] = {
+    "p1": {"left": "a", "right": "d"},
+    "p2": {"left": "left", "right": "right"},
+}
+
+# 📢 캐릭터 엔티티의 컴포넌트 종류 (ecs.Registry 저장소 이름)
+BODY = "body"        # PlayerState: 위치/속도/체력/게이지/상태 플래그
+FIGHTER = "fighter"  # Fighter: 조작 키/스킬/상대
+SPRITE = "sprite"    # animation.Character: 애니메이션 상태
+HITBOX = "hitbox"    # Hitbox: 이번 틱 충돌 박스
+# 📢 경기 항목 엔티티(투사체/근접 히트박스/이펙트/얼음 블록)의 컴포넌트 종류
+ITEM = "item"          # Projectile 객체: 위치/속도/수명/그리기 (스킬 코드가 속성을 직접 읽고 쓰므로 객체 그대로)
+LIFETIME = "lifetime"  # Lifetime: 생성 순서/생성 틱 (항목 뷰는 생성 순서로 순회 = 충돌 처리 순서)
+COLLIDER = "collider"  # 충돌 처리 함수 (COLLISION_TABLE, 충돌하지 않는 "none" 항목에는 붙지 않음)
+ATTACHED = "attached"  # 캐릭터에 붙어 움직이는 항목(돌진 히트박스/이펙트)의 캐릭터 owner
+# =========================================================
+
+
+def new_player_state(x: float, y: float) -> PlayerState:
+    """플레이어 상태 (📢 슬롯 + 비트필드. 스킬 코드는 기존처럼 딕셔너리 형태로도 접근할 수 있습니다.)"""
+    return PlayerState(x, y, STARTING_HP)
+
+
+def _overlaps_hitbox(proj, left: int, top: int) -> bool:
+    """투사체 사각형과 캐릭터 충돌 박스(left, top, HITBOX_WIDTH, HITBOX_HEIGHT)가 겹치는지 (pygame.Rect.colliderect와 같은 판정)"""
+    x, y, size = int(proj.x), int(proj.y), int(proj.size)
+    return size > 0 and x < left + HITBOX_WIDTH and left < x + size and y < top + HITBOX_HEIGHT and top < y + size
+
+
+def _new_stats() -> Dict[str, Any]:
+    return {"damage_by_skill": {}, "skill_uses": {}, "ultimate_uses": 0}
+
+
+# --- 📢 충돌 동작 처리 함수 (Projectile.COLLISION 이름별, skills/collision.py 테이블에 등록) ---
+# 형식: handler(match, proj, target_state, target_char, attacker_state, current_time)
+
+@collision_handler("none")
+def _collide_none(match, proj, target_state, target_char, attacker_state, current_time) -> None:
+    """시각 효과 (예: 빙결 얼음)는 충돌을 무시합니다."""
+
+
+@collision_handler("confuse")
+def _collide_confuse(match, proj, target_state, target_char, attacker_state, current_time) -> None:
+    if current_time >= target_state.invincible_end_time:
+        match.status.apply(target_state, "confusion", proj.confusion_duration_ms, current_time)
+        proj.active = False
+
+
+@collision_handler("poison_cloud")
+def _collide_poison_cloud(match, proj, target_state, target_char, attacker_state, current_time) -> None:
+    if proj.damage > 0:
+        match.apply_poison_to_target(target_state, proj)
+
+
+@collision_handler("freeze_area")
+def _collide_freeze_area(match, proj, target_state, target_char, attacker_state, current_time) -> None:
+    """광역 피해 + 빙결 (hit_once_only면 한 번만), 빙결된 위치에 freeze_effect_class 이펙트 생성"""
+    if proj.damage <= 0:
+        return
+    if proj.hit_once_only and getattr(proj, 'hit_already', False):
+        return
+    if current_time < target_state.invincible_end_time:
+        return
+    source = getattr(proj, "source_skill", None)
+    match.deal_damage(target_state, target_char, attacker_state, proj.damage, current_time, source)
+    match.status.apply(target_state, "freeze", proj.freeze_duration, current_time)
+
+    freeze_effect_class = getattr(proj, 'freeze_effect_class', None)
+    if freeze_effect_class:
+        ice_effect = freeze_effect_class.acquire(
+            x=target_state.x,
+            y=target_state.y,
+            size=CHAR_SIZE,
+            owner=proj.owner,
+            duration_ms=proj.freeze_duration,
+            clock=match.clock
+        )
+        ice_effect.source_skill = source
+        match.world["projectiles"].append(ice_effect)
+
+    if proj.hit_once_only:
+        proj.hit_already = True
+
+
+def _apply_hit(match, proj, target_state, target_char, attacker_state, current_time) -> None:
+    """피해 + 독/스턴 부가 효과"""
+    match.deal_damage(target_state, target_char, attacker_state, proj.damage, current_time, getattr(proj, "source_skill", None))
+
+    if getattr(proj, 'causes_poison', False):
+        match.apply_poison_to_target(target_state, proj)
+
+    if proj.stuns_target:
+        match.status.apply(target_state, "stun", proj.stun_duration_ms, current_time)
+
+
+@collision_handler("persistent")
+def _collide_persistent(match, proj, target_state, target_char, attacker_state, current_time) -> None:
+    """근접 히트박스/띠 이펙트: 피해를 주고 사라지지 않습니다. (무적 시간이 연속 피해를 막음)"""
+    if proj.damage > 0 and current_time >= target_state.invincible_end_time:
+        _apply_hit(match, proj, target_state, target_char, attacker_state, current_time)
+
+
+@collision_handler("projectile")
+def _collide_projectile(match, proj, target_state, target_char, attacker_state, current_time) -> None:
+    """일반 투사체: 포물선 투사체는 폭발하고, 직선 투사체는 피해를 준 뒤 사라지며 충돌 이펙트를 남깁니다."""
+    if proj.damage <= 0 or current_time < target_state.invincible_end_time:
+        return
+
+    if proj.gravity != 0:
+        # 폭발 이펙트/히트박스가 피해를 줍니다.
+        proj.active = False
+        match._explode(proj, proj.x + proj.size / 2, proj.y + proj.size / 2, match.world["projectiles"])
+        return
+
+    _apply_hit(match, proj, target_state, target_char, attacker_state, current_time)
+    proj.active = False
+
+    effect_class = getattr(proj, 'collision_effect_class', None)
+    if effect_class:
+        effect_size = getattr(proj, 'collision_effect_size', 100)
+        new_effect = effect_class.acquire(
+            x=target_state.x + CHAR_SIZE // 2 - effect_size // 2,
+            y=target_state.y + CHAR_SIZE // 2 - effect_size // 2,
+            owner=proj.owner,
+            size=effect_size,
+            clock=match.clock
+        )
+        new_effect.source_skill = getattr(proj, "source_skill", None)
+        match.world["projectiles"].append(new_effect)
+
+
+class Fighter:
+    """캐릭터 엔티티의 조작/스킬 컴포넌트"""
+
+    __slots__ = ("key", "codename", "bindings", "skills", "skill_state", "opponent")
+
+    def __init__(self, key: str, codename: str, skills: List[Any], skill_state: Dict[str, Any]):
+        self.key = key # 투사체 owner와 같은 "p1"/"p2"
+        self.codename = codename
+        self.bindings = KEY_BINDINGS[key]
+        self.skills = skills
+        self.skill_state = skill_state
+        self.opponent: Entity = -1
+
+
+class Hitbox:
+    """캐릭터 충돌 박스 (pygame.Rect와 같은 정수 좌표, hitboxes 시스템이 틱마다 갱신)"""
+
+    __slots__ = ("left", "top", "width", "height")
+
+    def __init__(self, width: int = HITBOX_WIDTH, height: int = HITBOX_HEIGHT):
+        self.left = 0
+        self.top = 0
+        self.width = width
+        self.height = height
+
+
+class Lifetime:
+    """항목 엔티티의 생성 순서 (경기 안에서 계속 증가, 같은 틱에 생긴 항목끼리는 생성 대기열 순서)와 생성 틱"""
+
+    __slots__ = ("seq", "born_tick")
+
+    def __init__(self, seq: int, born_tick: int):
+        self.seq = seq
+        self.born_tick = born_tick
+
+
+def _spawn_order(row: tuple) -> int:
+    """항목 뷰의 정렬 키 (행의 두 번째 컴포넌트가 Lifetime)"""
+    return row[2].seq
+
+
+class Match:
+    """두 캐릭터의 한 경기. step()을 호출할 때마다 시뮬레이션 시계가 SIM_DT_MS만큼 전진합니다."""
+
+    def __init__(self, p1_codename: str, p2_codename: str, screen_size: Tuple[int, int] = (1920, 1080),
+                 p1_skills: Optional[List] = None, p2_skills: Optional[List] = None,
+                 on_sound: Optional[Callable[[str], Any]] = None):
+        self.p1_codename = p1_codename
+        self.p2_codename = p2_codename
+        self.screen_width, self.screen_height = screen_size
+        # 바닥 높이 조정
+        self.ground_y = self.screen_height * 0.90
+        self.initial_y = self.ground_y - HITBOX_HEIGHT
+        # 📢 전투 이벤트 버스 (피격/회복/상태 이상/생성/KO/효과음, 틱이 끝날 때 구독자에게 일괄 전달)
+        # 오디오/HUD/리플레이는 events.subscribe(...)로 붙이고, 구독자가 없으면 이벤트를 만들지 않습니다.
+        self.events = CombatEventBus()
+        # 효과음 재생 콜백 (gameplay는 sound_bank.play, 헤드리스 실행은 None) — SOUND 이벤트 구독자로 연결
+        if on_sound is not None:
+            self.events.subscribe(sound_listener(on_sound), (SOUND,))
+
+        # 📢 경기 시뮬레이션 시계 (0ms에서 시작, 고정 간격 틱에서만 전진)
+        # 스킬/이펙트/캐릭터/상태 이상은 모두 이 시계를 사용하므로 경기를 일시정지하거나 디스플레이 없이 빠르게 돌릴 수 있습니다.
+        self.clock = SimClock()
+        self.tick = 0
+
+        self.p1 = new_player_state(200, self.initial_y)
+        self.p2 = new_player_state(self.screen_width - 400, self.initial_y)
+
+        # 📢 스킬 상태는 경기마다 깊은 복사 (같은 캐릭터끼리의 경기나 연속 경기에서 궁극기 단계가 공유되지 않도록)
+        self.p1_skill_state = copy.deepcopy(character_skill_state.get(p1_codename, {}))
+        self.p2_skill_state = copy.deepcopy(character_skill_state.get(p2_codename, {}))
+
+        self.p1_skills = list(p1_skills or get_skills_for_character(p1_codename))
+        self.p2_skills = list(p2_skills or get_skills_for_character(p2_codename))
+        for skill in self.p1_skills + self.p2_skills:
+            skill.clock = self.clock
+            skill.last_used = None # 이전 경기의 시각이 남아 있지 않도록 초기화
+
+        self.p1_char = Character(p1_codename, 1, self.p1, self.p1_skill_state, clock=self.clock)
+        self.p2_char = Character(p2_codename, 2, self.p2, self.p2_skill_state, clock=self.clock)
+
+        # 📢 엔티티-컴포넌트 레지스트리 (ecs.py). 캐릭터는 body/fighter/sprite/hitbox 컴포넌트를 가진 엔티티,
+        # 투사체/근접 히트박스/이펙트/얼음 블록은 item/lifetime(+collider/attached) 컴포넌트를 가진 엔티티이고,
+        # 틱은 SYSTEMS 순서의 시스템들이 각자 필요한 뷰만 순회하며 진행합니다. (p1/p2 고정 분기 없음)
+        # 새 메커니즘은 컴포넌트를 붙이고 self.systems.add(이름, 시스템, after=...)로 끼워 넣습니다.
+        self.ecs = Registry()
+        fighter1 = Fighter("p1", p1_codename, self.p1_skills, self.p1_skill_state)
+        fighter2 = Fighter("p2", p2_codename, self.p2_skills, self.p2_skill_state)
+        e1 = self.ecs.create(body=self.p1, fighter=fighter1, sprite=self.p1_char, hitbox=Hitbox())
+        e2 = self.ecs.create(body=self.p2, fighter=fighter2, sprite=self.p2_char, hitbox=Hitbox())
+        fighter1.opponent, fighter2.opponent = e2, e1
+        self.bodies = self.ecs.view(BODY)
+        self.fighters = self.ecs.view(BODY, FIGHTER, SPRITE)
+        self.hitboxes = self.ecs.view(BODY, HITBOX)
+        # 항목 뷰는 생성 순서(Lifetime.seq)로 정렬되어 있어 업데이트/충돌 처리 순서가 생성 순서와 같습니다.
+        self.items = self.ecs.view(ITEM, LIFETIME, order=_spawn_order)
+        self.colliders = self.ecs.view(ITEM, LIFETIME, COLLIDER, order=_spawn_order)
+        self.attached = self.ecs.view(ITEM, ATTACHED)
+        self._bodies_by_key: Dict[str, PlayerState] = {"p1": self.p1, "p2": self.p2}
+        # KEYDOWN 키 -> (PlayerState, 행동) (점프, 마지막 방향키)
+        self._keydown_actions: Dict[int, Tuple[PlayerState, str]] = {}
+        for _, body, fighter, _ in self.fighters.rows:
+            self._keydown_actions[fighter.bindings["left"]] = (body, LAST_INPUT_KEYS[fighter.key]["left"])
+            self._keydown_actions[fighter.bindings["right"]] = (body, LAST_INPUT_KEYS[fighter.key]["right"])
+            self._keydown_actions[fighter.bindings["jump"]] = (body, "jump")
+        # 충돌 대상 캐시: 공격자 owner -> (대상 PlayerState, 대상 Character, 공격자 PlayerState, 대상 Hitbox, 대상 owner)
+        self._targets: Dict[str, Tuple[PlayerState, Character, PlayerState, Hitbox, str]] = {}
+        self._targets_version = -1
+        self.systems = Scheduler(SYSTEMS)
+        self._keydowns: Iterable[int] = () # 이번 틱 직전의 KEYDOWN (input 시스템이 적용)
+
+        # 📢 항목 생성 대기열 (world["projectiles"]). 스킬/충돌 처리는 새 객체를 여기에 넣고,
+        # 경기가 정해진 시점(스킬 단계 끝, 투사체 단계 끝, 충돌 처리 중)에 넣은 순서대로 엔티티로 만듭니다. (_spawn_queued)
+        # 스킬이 같은 객체를 world에 넣고 반환도 하면 엔티티가 두 개가 되어 기존처럼 두 번 처리되므로,
+        # 객체는 마지막 엔티티가 지워질 때 한 번만 풀에 반납합니다. (_item_refs: id(객체) -> 엔티티 수)
+        self._spawn_queue: List[Any] = []
+        self._next_seq = 0
+        self._item_refs: Dict[int, int] = {}
+        self._fresh: List[Any] = [] # 아직 SPAWN 이벤트를 보내지 않은 새 항목 객체
+        self._dead: List[Tuple[Entity, Any]] = [] # 이번 틱에 비활성화된 항목 (비워서 재사용하는 작업 리스트)
+        # 📢 항목끼리의 충돌 광역 단계 (균일 격자 공간 해시, 선택). enable_broad_phase()로 켭니다.
+        # 켜면 항목 엔티티 id를 핸들로 격자에 등록하고 매 틱 위치를 증분 갱신하며, 모든 항목 쌍 질의(projectile_pairs)에만 씁니다.
+        # 캐릭터 대 항목 충돌은 캐릭터가 두 명뿐이라 선형 검사가 더 싸므로 항상 colliders 뷰를 순회합니다. (src/tools/bench_broadphase.py)
+        self.grid: Optional[SpatialHash] = None
+        # 📢 대량 투사체 엔진 (NumPy 구조체 배열, 선택). 처음 필요할 때 enable_bullets()로 만듭니다.
+        self.bullets: Optional[ProjectileEngine] = None
+        # 📢 상태 이상 엔진 (빙결/스턴/혼란/대시/버프/독). 스킬은 world["status"].apply(...)로 겁니다.
+        self.status = StatusEngine(self.clock, on_damage=self._on_status_damage, on_applied=self._on_status_applied)
+        self.world: Dict[str, Any] = {
+            "screen_width": self.screen_width,
+            "screen_height": self.screen_height,
+            "GROUND_Y": self.ground_y,
+            "projectiles": self._spawn_queue,
+            "clock": self.clock,
+            "status": self.status,
+            "events": self.events,
+        }
+
+        self.winner: Optional[str] = None # 승리한 캐릭터 codename
+        self.finished = False
+        # 📢 경기 통계 (스킬별 피해량, 스킬/궁극기 사용 횟수)
+        self.stats: Dict[str, Dict[str, Any]] = {"p1": _new_stats(), "p2": _new_stats()}
+
+    # --- 헬퍼 ---
+    def enable_bullets(self, capacity: int = 1024) -> ProjectileEngine:
+        """대량 투사체 엔진을 만들어 돌려줍니다. (이미 있으면 그대로, NumPy가 없으면 RuntimeError)"""
+        if self.bullets is None:
+            self.bullets = ProjectileEngine((self.screen_width, self.screen_height), self.ground_y, capacity)
+        return self.bullets
+
+    def _state(self, owner: str) -> PlayerState:
+        return self._bodies_by_key[owner]
+
+    def _key(self, state: PlayerState) -> str:
+        return "p1" if state is self.p1 else "p2"
+
+    def _play(self, name: str) -> None:
+        self.events.emit(SOUND, detail=name)
+
+    def _record_damage(self, owner: Optional[str], source: Optional[str], damage: float) -> None:
+        if owner not in self.stats or damage <= 0:
+            return
+        by_skill = self.stats[owner]["damage_by_skill"]
+        key = source or "unknown"
+        by_skill[key] = by_skill.get(key, 0) + damage
+
+    @staticmethod
+    def _tag(projs: List[Any], source: str) -> List[Any]:
+        """생성된 투사체/이펙트에 발동한 스킬 이름을 붙입니다. (통계용)"""
+        for proj in projs:
+            if getattr(proj, "source_skill", None) is None:
+                proj.source_skill = source
+        return projs
+
+    def _activate(self, owner: str, slot: str, skill, user, target, skill_state, user_obj) -> List[Any]:
+        last_used = skill.last_used
+        new_projs = skill.activate(user, target, skill_state.get(slot, {}), self.world, user_obj, owner=owner)
+        # 📢 실제로 발동했는지는 last_used 변화로 판단합니다. (각성처럼 투사체가 없는 궁극기 포함)
+        if skill.last_used != last_used:
+            uses = self.stats[owner]["skill_uses"]
+            uses[skill.name] = uses.get(skill.name, 0) + 1
+            if slot == "ultimate":
+                self.stats[owner]["ultimate_uses"] += 1
+        return self._tag(new_projs, skill.name)
+
+    def deal_damage(self, target_state, target_char_obj, attacker_state, damage, current_time, source=None):
+        # 무적 시간 확인
+        if current_time < target_state.invincible_end_time:
+            return
+
+        hp_before = target_state.hp
+        target_state.hp = max(0, target_state.hp - damage)
+        target_char_obj.start_hit_animation()
+        target_state.invincible_end_time = current_time + INVINCIBILITY_DURATION # 무적 시간 적용
+
+        target_gain = FIXED_ULT_GAIN_ON_HIT
+        target_state.ultimate_gauge = min(100, target_state.ultimate_gauge + target_gain)
+
+        attacker = None
+        if attacker_state:
+            attacker_gain = FIXED_ULT_GAIN_ON_ATTACK
+            attacker_state.ultimate_gauge = min(100, attacker_state.ultimate_gauge + attacker_gain)
+            attacker = self._key(attacker_state)
+            self._record_damage(attacker, source, hp_before - target_state.hp)
+        self._emit_hit(target_state, attacker, source, hp_before - target_state.hp, None)
+
+    def _emit_hit(self, target_state: PlayerState, attacker: Optional[str], source: Optional[str],
+                  dealt: float, detail: Optional[str]) -> None:
+        events = self.events
+        target = self._key(target_state)
+        events.emit(HIT, target, attacker, source, dealt, detail)
+        if dealt > 0 and target_state.hp <= 0:
+            events.emit(KO, target, attacker, source)
+
+    def _on_status_damage(self, target_state: PlayerState, owner: Optional[str], source: Optional[str], dealt: float) -> None:
+        """독 같은 지속 피해 (StatusEngine.on_damage)"""
+        self._record_damage(owner, source, dealt)
+        self._emit_hit(target_state, owner, source, dealt, "poison")
+
+    def _on_status_applied(self, target_state: PlayerState, name: str, duration_ms: float) -> None:
+        self.events.emit(STATUS, self._key(target_state), amount=duration_ms, detail=name)
+
+    def _emit_spawns(self) -> None:
+        """지난 전달 이후 새로 생긴 항목마다 SPAWN 이벤트 (같은 객체가 두 번 들어 있으면 한 번만)"""
+        seen = set()
+        emit = self.events.emit
+        for proj in self._fresh:
+            if id(proj) in seen:
+                continue
+            seen.add(id(proj))
+            emit(SPAWN, owner=proj.owner, source=getattr(proj, "source_skill", None), detail=type(proj).__name__)
+        self._fresh.clear()
+
+    # --- 📢 항목 엔티티 (투사체/근접 히트박스/이펙트/얼음 블록) ---
+
+    @property
+    def projectiles(self) -> List[Any]:
+        """살아 있는 항목 객체 목록 (생성 순서, 새 리스트). 여기에 추가해도 경기에 들어가지 않으므로 spawn()을 사용합니다."""
+        return [proj for _, proj, _ in self.items.rows]
+
+    def spawn(self, *objs: Any) -> List[Entity]:
+        """항목 객체를 바로 엔티티로 만듭니다. (틱 사이에서 도구가 사용, 스킬은 world["projectiles"]에 추가)"""
+        self._spawn_queue.extend(objs)
+        return self._spawn_queued()
+
+    def _spawn_queued(self) -> List[Entity]:
+        """생성 대기열의 객체를 넣은 순서대로 엔티티로 만들고 대기열을 비웁니다."""
+        queue = self._spawn_queue
+        if not queue:
+            return []
+        created = [self._create_item(proj) for proj in queue]
+        queue.clear()
+        return created
+
+    def _create_item(self, proj, lifetime: Optional[Lifetime] = None) -> Entity:
+        """항목 엔티티를 만듭니다. lifetime을 주면(스냅샷 복원) 그 생성 순서를 그대로 쓰고 SPAWN 이벤트를 보내지 않습니다."""
+        if lifetime is None:
+            lifetime = Lifetime(self._next_seq, self.tick)
+            self._next_seq += 1
+            if SPAWN in self.events.wanted:
+                self._fresh.append(proj)
+        components = {ITEM: proj, LIFETIME: lifetime}
+        handler = COLLISION_TABLE[type(proj)]
+        if handler is not _collide_none:
+            components[COLLIDER] = handler
+        # 캐릭터에 붙는 항목은 스킬이 반환하기 전에 attached_to_char를 정합니다. (iceman 돌진)
+        owner = getattr(proj, "attached_to_char", None)
+        if owner in self._bodies_by_key:
+            components[ATTACHED] = owner
+        entity = self.ecs.create(**components)
+        refs = self._item_refs
+        refs[id(proj)] = refs.get(id(proj), 0) + 1
+        if self.grid is not None:
+            size = int(proj.size)
+            self.grid.update(entity, int(proj.x), int(proj.y), size, size)
+        return entity
+
+    def _destroy_item(self, entity: Entity, proj, release: bool = True) -> None:
+        """항목 엔티티를 지웁니다. 객체를 가진 마지막 엔티티면 객체를 풀에 반납합니다. (release=False면 반납하지 않음)"""
+        self.ecs.destroy(entity)
+        if self.grid is not None:
+            self.grid.remove(entity)
+        refs = self._item_refs
+        left = refs[id(proj)] - 1
+        if left:
+            refs[id(proj)] = left
+        else:
+            del refs[id(proj)]
+            if release:
+                proj.release()
+
+    def _restore_items(self, objs: List[Any], lifetimes: List[Lifetime], next_seq: int) -> None:
+        """스냅샷 복원: 항목 엔티티를 저장된 객체/생성 순서로 다시 만듭니다.
+        저장 이후에 생긴 객체는 풀에 반납하고, 저장 시점에도 있던 객체는 반납하지 않습니다. (속성은 snapshot.load_match가 먼저 복원)"""
+        keep = set(map(id, objs))
+        for entity, proj, _ in list(self.items.rows):
+            self._destroy_item(entity, proj, release=id(proj) not in keep)
+        self._spawn_queue.clear()
+        self._fresh.clear()
+        for proj, lifetime in zip(objs, lifetimes):
+            self._create_item(proj, lifetime)
+        self._next_seq = next_seq
+
+    def apply_poison_to_target(self, target: PlayerState, source_obj) -> None:
+        """독 속성이 있는 객체(투사체/히트박스)와 충돌 시 target에 독 상태효과를 겁니다."""
+
+        if not getattr(source_obj, "causes_poison", False):
+            return
+
+        duration_ms = getattr(source_obj, "poison_duration", 2000)
+        poison_dps = getattr(source_obj, "poison_dps", 0.015)
+        self.status.apply(target, "poison", int(duration_ms), dps=poison_dps, owner=source_obj.owner,
+                          source=getattr(source_obj, "source_skill", None))
+
+    # 📢 KEYDOWN 입력 (점프, 마지막 방향키). 다음 틱 직전에 적용합니다.
+    def apply_keydown(self, key) -> None:
+        action = self._keydown_actions.get(key)
+        if action is None:
+            return
+        state, name = action
+        if name == "jump":
+            self._jump(state)
+        else:
+            state.last_input_key = name
+
+    def _jump(self, state: PlayerState) -> None:
+        # 📢 [수정]: 2단 점프 로직
+        if not state.flags & (STUNNED | FROZEN):
+            if state.jump_count < MAX_JUMPS:
+                state.vy = JUMP_POWER
+                state.flags &= ~ON_GROUND
+                state.jump_count += 1
+                self._play("jump") # 📢 점프 사운드 재생
+
+    def step(self, keys, keydowns=()) -> None:
+        """시뮬레이션 한 틱 (SIM_DT_MS 고정). 렌더링 프레임 수와 관계없이 같은 입력이면 같은 결과가 나옵니다.
+
+        keys: pygame.key.get_pressed()처럼 키 코드로 눌림 여부를 조회할 수 있는 객체
+        keydowns: 이번 틱 직전에 발생한 KEYDOWN 키 코드들
+        """
+        if self.finished or self.clock.paused:
+            return
+        self.clock.advance(SIM_DT_MS)
+        self.tick += 1
+        self._keydowns = keydowns
+        self.systems.run(self, self.clock.get_ticks(), SIM_DT_MS, keys)
+        self._keydowns = ()
+        # 📢 이번 틱의 전투 이벤트를 구독자에게 한 번에 전달합니다.
+        if self.events.pending:
+            self.events.flush(self.tick)
+
+    def _integrate_physics(self, dt) -> None:
+        """속도/중력 적용과 바닥/화면 경계 처리 (스킬 발동 후 단계)"""
+        SCREEN_WIDTH = self.screen_width
+        for _, char_state in self.bodies.rows:
+
+            if char_state.flags & (DASHING | FROZEN) == DASHING:
+                char_state.x += char_state.vx * (dt / 1000)
+            else:
+                char_state.vy += GRAVITY
+                char_state.x += char_state.vx
+
+            char_state.y += char_state.vy
+
+            if char_state.y >= self.initial_y:
+                char_state.y = self.initial_y
+                char_state.vy = 0
+                char_state.flags |= ON_GROUND
+                char_state.jump_count = 0 # 📢 [추가]: 땅에 닿으면 점프 카운트 초기화
+            else:
+                char_state.flags &= ~ON_GROUND
+
+            char_state.x = max(0, min(SCREEN_WIDTH - CHAR_SIZE, char_state.x))
+
+    def _collision_targets(self) -> Dict[str, Tuple[PlayerState, Character, PlayerState, Hitbox, str]]:
+        """공격자 owner -> 충돌 대상 (캐릭터 엔티티가 바뀔 때만 다시 만듭니다)"""
+        fighters = self.fighters
+        if self._targets_version != fighters.version:
+            ecs = self.ecs
+            targets = {}
+            for _, body, fighter, _ in fighters.rows:
+                opponent = fighter.opponent
+                targets[fighter.key] = (ecs.get(opponent, BODY), ecs.get(opponent, SPRITE), body,
+                                        ecs.get(opponent, HITBOX), ecs.get(opponent, FIGHTER).key)
+            self._targets = targets
+            self._targets_version = fighters.version
+        return self._targets
+
+    # --- 📢 충돌 광역 단계 (spatial_hash.SpatialHash) ---
+
+    def enable_broad_phase(self, cell_size: int = DEFAULT_CELL_SIZE) -> SpatialHash:
+        """항목 격자를 켭니다. 이후 매 틱 투사체/히트박스/이펙트 엔티티의 사각형을 격자에 증분 갱신합니다.
+        투사체 상쇄(enable_clash)처럼 항목끼리의 모든 쌍 검사가 필요할 때 켭니다. 그 질의(projectile_pairs)는
+        전부 쌍 검사보다 항목 100개에서 약 2.5배, 1,000개에서 약 5배 빠르고 10개 안팎에서는 약 2배 느립니다.
+        캐릭터 충돌은 켜도 선형 검사 그대로이므로, 쌍 질의를 쓰지 않으면 갱신 비용만 늘어납니다. (src/tools/bench_broadphase.py)"""
+        if self.grid is None:
+            self.grid = SpatialHash(cell_size)
+            self._register_items()
+        return self.grid
+
+    def _register_items(self) -> None:
+        """살아 있는 항목 엔티티를 격자에 등록합니다."""
+        grid = self.grid
+        for entity, proj, _ in self.items.rows:
+            size = int(proj.size)
+            grid.update(entity, int(proj.x), int(proj.y), size, size)
+
+    def projectile_pairs(self) -> List[Tuple[Any, Any]]:
+        """충돌 사각형이 겹치는 항목 객체 쌍 (엔티티 id 순서 = 생성 순서). 광역 단계가 켜져 있어야 합니다.
+        이번 틱에 비활성화되어 아직 지워지지 않은 항목도 포함되므로 호출하는 쪽에서 active를 확인합니다."""
+        items = self.ecs.store(ITEM)
+        return [(items.get(a), items.get(b)) for a, b in self.grid.overlapping_pairs()]
+
+    def enable_clash(self) -> None:
+        """투사체 상쇄 규칙을 켭니다. (광역 단계를 켜고 clash 시스템을 collision 뒤에 끼워 넣음)
+        두 피어/리플레이가 같은 결과를 내려면 양쪽 경기 모두 켜야 합니다."""
+        self.enable_broad_phase()
+        if "clash" not in self.systems.names():
+            self.systems.add("clash", _system_clash, after="collision")
+
+    def _explode(self, proj, center_x: float, center_y: float, out: List[Any]) -> None:
+        """포물선 투사체의 폭발: 투사체를 만든 스킬(collision_skill_instance)이 만든 폭발 이펙트/히트박스를 out에 추가합니다."""
+        effect_creator = getattr(proj, 'collision_skill_instance', None)
+        if effect_creator is not None and hasattr(effect_creator, 'create_explosion_effect'):
+            new_effects = effect_creator.create_explosion_effect(center_x, center_y, proj.owner)
+            out.extend(self._tag(new_effects, effect_creator.name))
+
+    def _collide_bullets(self, bullets: ProjectileEngine, current_time, targets) -> None:
+        """대량 투사체와 캐릭터 충돌 (1P 투사체 → 2P, 2P 투사체 → 1P 순서)
+        객체 투사체와 같이 무적 시간이 아닐 때 인덱스 순서상 첫 번째 투사체만 피해를 주고,
+        피해 직후 무적이 되므로 같은 틱에 겹친 나머지 투사체는 그대로 통과합니다."""
+        for target_state, target_char, attacker_state, box, target in targets.values():
+            if current_time < target_state.invincible_end_time:
+                continue
+            hit = bullets.hits(target, box.left, box.top, box.width, box.height)
+            hit = hit[bullets.damage[hit] > 0]
+            if not len(hit):
+                continue
+            first = int(hit[0])
+            self.deal_damage(target_state, target_char, attacker_state, float(bullets.damage[first]), current_time, "bullets")
+            bullets.char_hits += 1
+            if bullets.flags[first] & F_HIT_ONCE:
+                bullets.remove([first])
+
+    # --- 📢 스냅샷 (snapshot.py) ---
+
+    def snapshot(self, buffer: Optional[SnapshotBuffer] = None) -> SnapshotBuffer:
+        """현재 틱의 경기 상태를 buffer에 저장합니다. (틱 사이에서만 호출, 버퍼를 넘기면 새로 할당하지 않고 재사용)"""
+        return save_match(self, buffer)
+
+    def restore(self, buffer: SnapshotBuffer) -> None:
+        """snapshot()으로 저장한 시점으로 되돌립니다. 대기 중인 전투 이벤트는 버리고, 광역 단계 격자는 다시 만듭니다."""
+        load_match(self, buffer)
+        self.events.clear()
+        if self.grid is not None:
+            self.grid.clear()
+            self._register_items()
+
+    def close(self) -> None:
+        """경기가 끝난 뒤 남은 항목 엔티티를 지우고 객체를 풀에 반납합니다. (이후 이 경기를 다시 진행하거나 그리면 안 됩니다)"""
+        for entity, proj, _ in list(self.items.rows):
+            self._destroy_item(entity, proj)
+        self._spawn_queue.clear()
+        self._fresh.clear()
+        if self.grid is not None:
+            self.grid.clear()
+        if self.bullets is not None:
+            self.bullets.clear()
+        self.status.clear()
+        self.events.clear()
+
+    def get_result(self) -> Dict[str, Any]:
+        """경기 결과 요약 (JSON 직렬화 가능)"""
+        return {
+            "p1": self.p1_codename,
+            "p2": self.p2_codename,
+            "winner": self.winner,
+            "winner_side": None if self.winner is None else ("p2" if self.p1.hp <= 0 else "p1"),
+            "ticks": self.tick,
+            "duration_ms": round(self.clock.get_ticks(), 3),
+            "hp": {"p1": self.p1.hp, "p2": self.p2.hp},
+            "damage_by_skill": {side: {k: round(v, 3) for k, v in s["damage_by_skill"].items()} for side, s in self.stats.items()},
+            "skill_uses": {side: dict(s["skill_uses"]) for side, s in self.stats.items()},
+            "ultimate_uses": {side: s["ultimate_uses"] for side, s in self.stats.items()},
+        }
+
+
+# --- 📢 시스템 (Match.systems가 SYSTEMS 순서로 틱마다 실행) ---
+# 형식: system(match, current_time, dt, keys). 각 시스템은 필요한 뷰(match.bodies/fighters/hitboxes/items/colliders/attached)만 순회합니다.
+
+def _system_input(match: Match, current_time, dt, keys) -> None:
+    """이번 틱 직전의 KEYDOWN 입력 (점프, 마지막 방향키)"""
+    for key in match._keydowns:
+        match.apply_keydown(key)
+
+
+def _system_prev_positions(match: Match, current_time, dt, keys) -> None:
+    """이전 틱 위치 저장 (렌더링 보간용)"""
+    for _, body in match.bodies.rows:
+        body.prev_x = body.x
+        body.prev_y = body.y
+    for _, proj, _ in match.items.rows:
+        proj.prev_x = proj.x
+        proj.prev_y = proj.y
+
+
+def _system_status(match: Match, current_time, dt, keys) -> None:
+    """상태 이상 만료와 독 지속 피해 (시각이 된 것만, status_effects.StatusEngine), 피격 무적 플래그, 궁극기 게이지 자연 충전"""
+    match.status.advance(current_time)
+    passive_gain = GAUGE_PASSIVE_GAIN_PER_MS * dt
+    for _, body in match.bodies.rows:
+        if current_time < body.invincible_end_time:
+            body.flags |= INVINCIBLE
+        else:
+            body.flags &= ~INVINCIBLE
+        body.ultimate_gauge = min(100, body.ultimate_gauge + passive_gain)
+
+
+def _system_movement(match: Match, current_time, dt, keys) -> None:
+    """이동 입력 (빙결, 스턴, 대시, 혼란, 이동 속도 버프 반영)"""
+    for _, char_state, fighter, _ in match.fighters.rows:
+        bindings = fighter.bindings
+        speed = BASE_SPEED
+        if current_time < char_state.speed_boost_end_time:
+            speed *= (1.0 + MOVE_BOOST_PERCENTAGE)
+
+        flags = char_state.flags
+        if not flags & (STUNNED | FROZEN | DASHING):
+            # 혼란 상태에서는 좌우가 반대로 적용됩니다.
+            direction = -1 if flags & CONFUSED else 1
+
+            if keys[bindings["left"]]: char_state.vx = -speed * direction
+            elif keys[bindings["right"]]: char_state.vx = speed * direction
+            else: char_state.vx = 0
+
+            # 📢 [수정]: 점프 키 입력은 이미 KEYDOWN 이벤트에서 처리했으므로 여기선 제거
+        elif flags & STUNNED or not flags & DASHING:
+            # 스턴 중에는 대시 중이어도 멈춥니다.
+            char_state.vx = 0
+
+
+def _system_skills(match: Match, current_time, dt, keys) -> None:
+    """스킬 입력 처리 (빙결/스턴 상태 반영)와 활성화된 궁극기의 지속 시간/단계 업데이트"""
+    queue = match._spawn_queue # 스킬이 world["projectiles"]에 추가한 객체 뒤에 반환한 객체를 붙입니다.
+    ecs = match.ecs
+    for _, user, fighter, user_obj in match.fighters.rows:
+        if user.flags & (STUNNED | FROZEN):
+            continue
+        bindings = fighter.bindings
+        for slot, skill in zip(SKILL_SLOTS, fighter.skills):
+            if keys[bindings[slot]]:
+                target = ecs.get(fighter.opponent, BODY)
+                new_projs = match._activate(fighter.key, slot, skill, user, target, fighter.skill_state, user_obj)
+                queue.extend(new_projs)
+                # 📢 기술 사운드 재생 (투사체가 생성되었을 경우)
+                if new_projs: match._play("skill" if slot == "ultimate" else "attack")
+
+    # --- 스킬 지속 시간/단계 업데이트 루프 ---
+    for _, body, fighter, _ in match.fighters.rows:
+        skills = fighter.skills
+        if len(skills) < 3:
+            continue
+        skill_state = fighter.skill_state
+        ult_obj = skills[2]
+        ult_state = skill_state.get("ultimate", {})
+
+        if isinstance(ult_obj, UltimateSkillBase) and ult_state.get("is_active"):
+            ult_result = ult_obj.update(dt, match.world, body, ult_state, owner=fighter.key)
+            queue.extend(match._tag(ult_result, ult_obj.name))
+            skill_state["ultimate"] = ult_state
+
+    match._spawn_queued()
+    if match._fresh:
+        match._emit_spawns()
+
+
+def _system_physics(match: Match, current_time, dt, keys) -> None:
+    match._integrate_physics(dt)
+
+
+def _system_animation(match: Match, current_time, dt, keys) -> None:
+    # 📢 바라보는 방향은 이번 틱 위치로 정합니다. (그릴 때 정하면 렌더링 여부/보간 비율에 따라 다음 스킬의 방향이 달라져
+    # 헤드리스 실행이나 리플레이가 실제 경기와 어긋납니다. 규칙은 기존 Character.draw와 같음: 같은 x면 그대로)
+    ecs = match.ecs
+    for _, body, fighter, _ in match.fighters.rows:
+        opponent_x = ecs.get(fighter.opponent, BODY).x
+        if body.x < opponent_x:
+            body.flags |= FACING_RIGHT
+        elif body.x > opponent_x:
+            body.flags &= ~FACING_RIGHT
+    for _, body, _, sprite in match.fighters.rows:
+        sprite.update(dt, body.is_invincible, body.is_confused, body.is_frozen)
+
+
+def _system_attach(match: Match, current_time, dt, keys) -> None:
+    """캐릭터에 붙은 항목 (돌진 히트박스/이펙트): 캐릭터가 대시 중이면 진행 방향 앞에 둡니다."""
+    bodies = match._bodies_by_key
+    for _, proj, owner in match.attached.rows:
+        owner_state = bodies[owner]
+
+        if owner_state.flags & DASHING:
+            # CHAR_SIZE는 위에서 정의된 200
+            is_facing_right = owner_state.last_input_key in ('d', 'D', 'right')
+            EFFECT_SIZE = 300
+
+            if is_facing_right:
+                hitbox_x = owner_state.x + CHAR_SIZE
+            else:
+                hitbox_x = owner_state.x - EFFECT_SIZE
+
+            proj.x = hitbox_x
+            proj.y = owner_state.y
+
+
+def _system_projectiles(match: Match, current_time, dt, keys) -> None:
+    """항목 업데이트 (생성 순서)
+    📢 비활성화된 항목 엔티티는 순회가 끝난 뒤 지우고 객체는 풀에 반납합니다.
+    바닥에 닿은 포물선 투사체의 폭발은 생성 대기열에 넣어 이 단계 끝에 엔티티로 만듭니다."""
+    world = match.world
+    GROUND_Y = match.ground_y
+    queue = match._spawn_queue
+    dead = match._dead
+    grid = match.grid
+    for entity, proj, _ in match.items.rows:
+        proj.update(world)
+
+        # 포물선 투사체(중력 $\neq 0$)의 바닥 충돌 처리 로직 통합
+        if proj.gravity != 0 and proj.damage > 0 and proj.y + proj.size >= GROUND_Y and proj.active:
+            proj.active = False
+            match._explode(proj, proj.x + proj.size / 2, GROUND_Y, queue)
+
+        if proj.active:
+            if grid is not None:
+                size = int(proj.size)
+                grid.update(entity, int(proj.x), int(proj.y), size, size)
+        else:
+            dead.append((entity, proj))
+
+    for entity, proj in dead:
+        match._destroy_item(entity, proj)
+    dead.clear()
+    match._spawn_queued()
+
+    bullets = match.bullets
+    if bullets is not None and bullets.count:
+        bullets.update()
+
+
+def _update_hitboxes(match: Match) -> None:
+    """실제 충돌 박스 (📢 pygame.Rect와 같은 정수 좌표 판정을 Rect 객체 없이 계산)"""
+    for _, body, box in match.hitboxes.rows:
+        box.left = int(body.x + ADJ_X_OFFSET)
+        box.top = int(body.y + HITBOX_Y_OFFSET_FROM_IMAGE_TOP)
+
+
+def _system_collision(match: Match, current_time, dt, keys) -> None:
+    """📢 충돌 항목(colliders 뷰, 생성 순서)마다 클래스에 선언된 충돌 동작(Projectile.COLLISION)의 처리 함수를 호출합니다. (skills/collision.py)
+    처리 중에 생긴 이펙트(충돌 이펙트/얼음 블록/폭발)도 같은 틱에 생성 순서대로 이어서 검사합니다."""
+    _update_hitboxes(match)
+    targets = match._collision_targets()
+    colliders = match.colliders
+    rows = colliders.rows
+    boxes = {owner: (target[3].left, target[3].top, target) for owner, target in targets.items()}
+    while rows:
+        for _, proj, _, handler in rows:
+            box = boxes.get(proj.owner)
+            if box is not None and _overlaps_hitbox(proj, box[0], box[1]):
+                target = box[2]
+                handler(match, proj, target[0], target[1], target[2], current_time)
+        rows = [row for row in map(colliders.get, match._spawn_queued()) if row is not None]
+
+    bullets = match.bullets
+    if bullets is not None and bullets.count:
+        match._collide_bullets(bullets, current_time, targets)
+
+    if match._fresh:
+        match._emit_spawns()
+
+
+def _clashes(proj) -> bool:
+    """상쇄되는 항목: 피해가 있는 일반 투사체 (충돌 동작 "projectile"). 근접 히트박스/띠/범위 이펙트는 상쇄되지 않습니다."""
+    return proj.active and proj.damage > 0 and COLLISION_TABLE[type(proj)] is _collide_projectile
+
+
+def _system_clash(match: Match, current_time, dt, keys) -> None:
+    """📢 투사체 상쇄 (Match.enable_clash로 켬): 서로 다른 캐릭터의 일반 투사체가 겹치면 둘 다 사라지고,
+    포물선 투사체는 그 자리에서 폭발합니다. 겹친 쌍은 격자 광역 단계의 모든 항목 쌍 질의로 찾습니다. (생성 순서)"""
+    queue = match._spawn_queue
+    for a, b in match.projectile_pairs():
+        if a.owner == b.owner or not (_clashes(a) and _clashes(b)):
+            continue
+        for proj in (a, b):
+            proj.active = False
+            if proj.gravity != 0:
+                match._explode(proj, proj.x + proj.size / 2, proj.y + proj.size / 2, queue)
+    match._spawn_queued()
+    if match._fresh:
+        match._emit_spawns()
+
+
+def _system_victory(match: Match, current_time, dt, keys) -> None:
+    """📢 승리 조건 확인 (체력이 0인 캐릭터의 상대가 승리)"""
+    ecs = match.ecs
+    for _, body, fighter, _ in match.fighters.rows:
+        if body.hp <= 0:
+            match.finished = True
+            match.winner = ecs.get(fighter.opponent, FIGHTER).codename
+            return
+
+
+# 틱마다 실행하는 기본 시스템 (순서대로). Match.systems.add/replace/remove로 경기마다 바꿀 수 있습니다.
+SYSTEMS: Tuple[Tuple[str, Callable[..., None]], ...] = (
+    ("input", _system_input),
+    ("prev_positions", _system_prev_positions),
+    ("status", _system_status),
+    ("movement", _system_movement),
+    ("skills", _system_skills),
+    ("physics", _system_physics),
+    ("animation", _system_animation),
+    ("attach", _system_attach),
+    ("projectiles", _system_projectiles),
+    ("collision", _system_collision),
+    ("victory", _system_victory),
+)
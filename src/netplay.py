@@ -0,0 +1,286 @@
+# netplay.py
+
+import heapq
+import random
+import socket
+import struct
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from input_bits import KeyState, step_masks
+from snapshot import SnapshotRing
+
+# 📢 롤백 넷코드 (GGPO 방식, 2인 경기, UDP)
+# 각 피어는 자기 입력을 input_delay틱 뒤의 틱에 예약해 상대에게 보내고, 상대 입력이 아직 오지 않은 틱은
+# 마지막으로 확정된 상대 입력이 계속된다고 예측해서 먼저 시뮬레이션합니다.
+# 실제 입력이 도착했는데 예측과 다르면 그 틱의 스냅샷(snapshot.SnapshotRing)으로 되돌리고 현재 틱까지 다시 시뮬레이션합니다.
+# - 확정되지 않은 틱이 max_rollback틱을 넘으면 상대 입력이 올 때까지 진행을 멈춥니다. (되돌릴 스냅샷이 항상 링에 있음)
+# - 손실 대비: 상대가 받았다고 알려 온(ack) 틱 이후의 입력을 패킷마다 모두 다시 보냅니다.
+# - 시간 맞추기: 상대보다 앞서 있는 피어가 가끔 한 프레임을 쉬어 두 피어의 틱을 맞춥니다.
+# 입력은 틱마다 input_bits.ACTION_BITS 비트마스크(1바이트)이고, 키 입력/KEYDOWN 변환은 input_bits.step_masks가 합니다.
+# 📢 되돌린 뒤 다시 시뮬레이션하는 동안에도 전투 이벤트/효과음 콜백이 다시 불립니다. (resimulating이 True인 동안은 무시)
+
+DEFAULT_INPUT_DELAY = 2
+DEFAULT_MAX_ROLLBACK = 8
+
+# 한 패킷에 담는 최대 입력 수
+MAX_INPUTS_PER_PACKET = 64
+# 시간 맞추기: 이 프레임 간격마다 한 번까지만 쉽니다. 틱 차이는 지수 이동 평균으로 흔들림(지터)을 줄여 비교합니다.
+TIME_SYNC_INTERVAL = 10
+TIME_SYNC_SMOOTHING = 0.1
+# 연결 확인 패킷 간격
+CONNECT_RETRY_S = 0.05
+
+# 패킷: 종류(1바이트) + 내용
+MSG_SYNC = 1   # 연결 확인 (상대의 SYNC를 받았는지)
+MSG_INPUT = 2  # 입력 (시작 틱, 상대 입력을 받은 틱 수, 보낸 피어의 현재 틱, 앞선 틱 수, 개수, 비트마스크들)
+
+_SYNC = struct.Struct("!BB")
+_INPUT = struct.Struct("!BIIIhB")
+
+
+class UdpTransport:
+    """논블로킹 UDP 소켓. latency_ms/jitter_ms/loss를 주면 보내는 패킷을 그만큼 늦추거나 버립니다. (루프백 시험용)"""
+
+    def __init__(self, local_addr: Tuple[str, int], remote_addr: Tuple[str, int],
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0, loss: float = 0.0, seed: Optional[int] = None):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(local_addr)
+        self.sock.setblocking(False)
+        self.remote_addr = remote_addr
+        self.latency_s = latency_ms / 1000
+        self.jitter_s = jitter_ms / 1000
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self._outgoing: List[Tuple[float, int, bytes]] = [] # (보낼 시각, 순번, 데이터) 최소 힙
+        self._sequence = 0
+        self.sent = 0
+        self.dropped = 0
+        self.received = 0
+
+    def send(self, data: bytes) -> None:
+        if self.loss and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        if self.latency_s or self.jitter_s:
+            due = time.perf_counter() + self.latency_s + self.rng.uniform(0, self.jitter_s)
+            heapq.heappush(self._outgoing, (due, self._sequence, data))
+            self._sequence += 1
+            self._flush()
+        else:
+            self._send_now(data)
+
+    def _send_now(self, data: bytes) -> None:
+        try:
+            self.sock.sendto(data, self.remote_addr)
+            self.sent += 1
+        except OSError: # 상대 소켓이 아직/이미 없음 (ICMP 거부) — UDP이므로 손실로 취급
+            self.dropped += 1
+
+    def _flush(self) -> None:
+        outgoing = self._outgoing
+        now = time.perf_counter()
+        while outgoing and outgoing[0][0] <= now:
+            self._send_now(heapq.heappop(outgoing)[2])
+
+    def receive(self) -> List[bytes]:
+        """도착한 패킷들 (상대 주소에서 온 것만). 늦춰 둔 보낼 패킷도 이때 내보냅니다."""
+        self._flush()
+        packets = []
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(2048)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                continue
+            if addr == self.remote_addr:
+                packets.append(data)
+        self.received += len(packets)
+        return packets
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class RollbackSession:
+    """한 피어의 롤백 세션. 프레임마다 advance(로컬 입력 비트마스크)를 호출합니다.
+
+    local_inputs[t]: 틱 t의 로컬 입력 (처음 input_delay틱은 0)
+    remote_inputs[t]: 확정된 상대 입력 (빈틈없이 앞에서부터)
+    """
+
+    def __init__(self, match, local_side: str, transport: UdpTransport,
+                 input_delay: int = DEFAULT_INPUT_DELAY, max_rollback: int = DEFAULT_MAX_ROLLBACK):
+        if local_side not in ("p1", "p2"):
+            raise ValueError(f"알 수 없는 쪽: {local_side}")
+        if input_delay < 0 or max_rollback < 1:
+            raise ValueError("input_delay는 0 이상, max_rollback은 1 이상이어야 합니다.")
+        self.match = match
+        self.local_side = local_side
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.ring = SnapshotRing(max_rollback + 2)
+        self.keys = KeyState()
+        self.local_inputs: List[int] = [0] * input_delay
+        self.remote_inputs: List[int] = []
+        self._used_remote: List[int] = [] # 틱마다 시뮬레이션에 쓴 상대 입력 (확정 또는 예측)
+        self._rollback_to: Optional[int] = None
+        self._remote_acked = 0   # 상대가 받은 로컬 입력 수
+        self._remote_tick = 0    # 상대가 마지막으로 알려 온 현재 틱
+        self._remote_advantage = 0.0 # 상대가 본 틱 차이 (평균)
+        self._local_advantage = 0.0  # 내가 본 틱 차이 (평균)
+        self._last_sync_wait = 0
+        self.resimulating = False
+        self.stats: Dict[str, Any] = {"rollbacks": 0, "rollback_ticks": 0, "max_rollback_ticks": 0,
+                                      "rollback_ms": 0.0, "max_rollback_ms": 0.0, "stalls": 0, "sync_waits": 0}
+
+    @property
+    def confirmed_tick(self) -> int:
+        """이 틱 전까지는 두 입력이 모두 확정되었습니다."""
+        return min(len(self.remote_inputs), len(self.local_inputs))
+
+    # --- 연결 ---
+
+    def connect(self, timeout_s: float = 10.0) -> bool:
+        """상대와 SYNC 패킷을 주고받을 때까지 기다립니다. (상대가 내 SYNC를 받았다고 알려 오면 True)"""
+        deadline = time.perf_counter() + timeout_s
+        seen_peer = False
+        while time.perf_counter() < deadline:
+            self.transport.send(_SYNC.pack(MSG_SYNC, seen_peer))
+            wait_until = time.perf_counter() + CONNECT_RETRY_S
+            while time.perf_counter() < wait_until:
+                for data in self.transport.receive():
+                    if data[0] == MSG_INPUT:
+                        return True # 상대는 이미 시작함
+                    if data[0] == MSG_SYNC and len(data) == _SYNC.size:
+                        seen_peer = True
+                        if data[1]:
+                            # 상대가 아직 내 SYNC(seen_peer)를 못 받았을 수 있으므로 한 번 더 보냅니다.
+                            self.transport.send(_SYNC.pack(MSG_SYNC, True))
+                            return True
+                time.sleep(0.001)
+        return False
+
+    # --- 패킷 ---
+
+    def send_inputs(self) -> None:
+        """상대가 아직 받지 못한 로컬 입력을 보냅니다."""
+        start = self._remote_acked
+        masks = bytes(self.local_inputs[start:start + MAX_INPUTS_PER_PACKET])
+        advantage = max(-32768, min(32767, self.match.tick - self._remote_tick))
+        self.transport.send(_INPUT.pack(MSG_INPUT, start, len(self.remote_inputs), self.match.tick,
+                                        advantage, len(masks)) + masks)
+
+    def _receive(self) -> None:
+        remote, used = self.remote_inputs, self._used_remote
+        for data in self.transport.receive():
+            if data[0] != MSG_INPUT or len(data) < _INPUT.size:
+                continue
+            _, start, acked, tick, advantage, count = _INPUT.unpack_from(data)
+            self._remote_acked = max(self._remote_acked, min(acked, len(self.local_inputs)))
+            if tick >= self._remote_tick:
+                self._remote_tick = tick
+                self._remote_advantage += (advantage - self._remote_advantage) * TIME_SYNC_SMOOTHING
+            masks = data[_INPUT.size:_INPUT.size + count]
+            # 빈틈없이 이어지는 입력만 받습니다. (앞쪽이 빠진 패킷은 버리고 재전송을 기다림)
+            if start > len(remote):
+                continue
+            for t in range(len(remote), start + len(masks)):
+                mask = masks[t - start]
+                remote.append(mask)
+                if t < len(used) and used[t] != mask and (self._rollback_to is None or t < self._rollback_to):
+                    self._rollback_to = t
+
+    def _remote_mask(self, tick: int) -> int:
+        remote = self.remote_inputs
+        if tick < len(remote):
+            return remote[tick]
+        return remote[-1] if remote else 0 # 📢 예측: 마지막 확정 입력이 계속됨
+
+    # --- 시뮬레이션 ---
+
+    def _simulate(self, tick: int) -> None:
+        """틱 tick의 입력으로 한 틱 진행합니다. (match.tick == tick)"""
+        local = self.local_inputs
+        remote = self._remote_mask(tick)
+        used = self._used_remote
+        if tick < len(used):
+            used[tick] = remote
+        else:
+            used.append(remote)
+        prev_local = local[tick - 1] if tick else 0
+        prev_remote = used[tick - 1] if tick else 0
+        if self.local_side == "p1":
+            step_masks(self.match, self.keys, (local[tick], remote), (prev_local, prev_remote))
+        else:
+            step_masks(self.match, self.keys, (remote, local[tick]), (prev_remote, prev_local))
+
+    def _rollback(self) -> None:
+        target, self._rollback_to = self._rollback_to, None
+        match = self.match
+        end = match.tick
+        if target >= end:
+            return
+        start = time.perf_counter()
+        if not self.ring.restore(match, target):
+            raise RuntimeError(f"되돌릴 스냅샷이 없습니다: 틱 {target} (현재 {end})")
+        self.resimulating = True
+        try:
+            tick = target
+            while tick < end and not match.finished:
+                if tick != target:
+                    self.ring.save(match)
+                self._simulate(tick)
+                tick += 1
+        finally:
+            self.resimulating = False
+        self.ring.discard_after(match.tick)
+        del self._used_remote[match.tick:]
+        depth = end - target
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        stats = self.stats
+        stats["rollbacks"] += 1
+        stats["rollback_ticks"] += depth
+        stats["max_rollback_ticks"] = max(stats["max_rollback_ticks"], depth)
+        stats["rollback_ms"] += elapsed_ms
+        stats["max_rollback_ms"] = max(stats["max_rollback_ms"], elapsed_ms)
+
+    def _apply_remote(self) -> None:
+        """받은 입력을 반영합니다. (예측이 틀렸으면 되돌려 다시 시뮬레이션)"""
+        self._receive()
+        if self._rollback_to is not None:
+            self._rollback()
+
+    def poll(self) -> None:
+        """진행하지 않는 프레임(경기 종료 후 확정 대기 등): 받은 입력을 반영하고 로컬 입력을 다시 보냅니다."""
+        self._apply_remote()
+        self.send_inputs()
+
+    def advance(self, local_mask: int) -> bool:
+        """한 프레임: 로컬 입력을 input_delay틱 뒤에 예약하고 한 틱 진행합니다.
+        진행하지 못했으면 (상대 입력 대기, 시간 맞추기, 경기 종료) False이고 이번 로컬 입력은 버려집니다."""
+        self._apply_remote()
+        match = self.match
+        tick = match.tick
+        wait = match.finished
+        if not wait and tick - len(self.remote_inputs) >= self.max_rollback:
+            self.stats["stalls"] += 1
+            wait = True
+        self._local_advantage += (tick - self._remote_tick - self._local_advantage) * TIME_SYNC_SMOOTHING
+        if not wait and tick - self._last_sync_wait >= TIME_SYNC_INTERVAL:
+            # 내가 본 틱 차이와 상대가 본 틱 차이의 차이가 두 피어 틱 차이의 두 배입니다. 한 틱 이상 앞서 있으면 한 프레임 쉽니다.
+            if self._local_advantage - self._remote_advantage >= 2:
+                self._last_sync_wait = tick
+                self.stats["sync_waits"] += 1
+                wait = True
+        if wait:
+            self.send_inputs()
+            return False
+
+        self.local_inputs.append(local_mask)
+        self.send_inputs()
+        self.ring.save(match)
+        self._simulate(tick)
+        return True
@@ -0,0 +1,153 @@
+# player_state.py
+
+from typing import Dict, Any, List, Optional, Iterator
+
+# 📢 플레이어 상태 (슬롯 + 상태 플래그 비트필드)
+# 기존 p1/p2 딕셔너리(20여 개 키를 틱마다 .get(..., 기본값)으로 조회)를 대체합니다.
+# - 숫자 값은 __slots__ 필드로, 참/거짓 상태(빙결, 스턴, 대시 ...)는 flags 정수 하나에 비트로 저장합니다.
+#   경기 루프는 `state.flags & (STUNNED | FROZEN)`처럼 여러 상태를 한 번에 검사합니다.
+# - 스킬/렌더링 코드가 아직 user["x"], user.get("is_dashing") 형태를 쓰므로 딕셔너리 호환 접근을 지원합니다.
+#   필드가 아닌 키(조커 버프의 speed_multiplier 등)는 extra 딕셔너리에 보관됩니다.
+
+# --- 상태 플래그 비트 ---
+ON_GROUND = 1 << 0
+STUNNED = 1 << 1
+CONFUSED = 1 << 2
+FROZEN = 1 << 3
+DASHING = 1 << 4
+INVINCIBLE = 1 << 5
+FACING_RIGHT = 1 << 6
+AWAKENED = 1 << 7
+
+# 딕셔너리 키 -> 플래그 비트 (기존 키 이름 유지)
+FLAG_KEYS: Dict[str, int] = {
+    "on_ground": ON_GROUND,
+    "is_stunned": STUNNED,
+    "is_confused": CONFUSED,
+    "is_frozen": FROZEN,
+    "is_dashing": DASHING,
+    "is_invincible": INVINCIBLE,
+    "facing_right": FACING_RIGHT,
+    "is_awakened": AWAKENED,
+}
+
+
+def _flag_property(bit: int, doc: str) -> property:
+    def getter(self) -> bool:
+        return bool(self.flags & bit)
+
+    def setter(self, value: bool) -> None:
+        if value:
+            self.flags |= bit
+        else:
+            self.flags &= ~bit
+
+    return property(getter, setter, doc=doc)
+
+
+class PlayerState:
+    """한 플레이어의 위치/물리/체력/게이지/상태 이상 (📢 p1/p2 딕셔너리 대체)"""
+
+    # 슬롯 필드 (딕셔너리 키와 같은 이름)
+    FIELDS = ("x", "y", "prev_x", "prev_y", "vx", "vy", "hp", "max_hp", "ultimate_gauge", "jump_count",
+              "stun_end_time", "invincible_end_time", "confusion_end_time", "speed_boost_end_time",
+              "frozen_end_time", "dash_end_time", "awakening_end_time", "last_input_key", "status_effects")
+
+    __slots__ = FIELDS + ("flags", "extra")
+
+    x: float
+    y: float
+    prev_x: float
+    prev_y: float
+    vx: float
+    vy: float
+    hp: float
+    max_hp: float
+    ultimate_gauge: float
+    jump_count: int
+    stun_end_time: float
+    invincible_end_time: float
+    confusion_end_time: float
+    speed_boost_end_time: float
+    frozen_end_time: float
+    dash_end_time: float
+    awakening_end_time: float
+    last_input_key: Optional[str]
+    status_effects: List[Dict[str, Any]]
+    flags: int
+    extra: Dict[str, Any]
+
+    def __init__(self, x: float, y: float, hp: float):
+        self.x = x
+        self.y = y
+        self.prev_x = x # 렌더링 보간용 이전 틱 위치
+        self.prev_y = y
+        self.vx = 0
+        self.vy = 0
+        self.hp = hp
+        self.max_hp = hp
+        self.ultimate_gauge = 0
+        self.jump_count = 0 # 📢 2단 점프 구현용
+        self.stun_end_time = 0
+        self.invincible_end_time = 0
+        self.confusion_end_time = 0
+        self.speed_boost_end_time = 0
+        self.frozen_end_time = 0
+        self.dash_end_time = 0
+        self.awakening_end_time = 0
+        self.last_input_key = None
+        self.status_effects = []
+        self.flags = ON_GROUND | FACING_RIGHT
+        self.extra = {}
+
+    on_ground = _flag_property(ON_GROUND, "땅에 닿아 있는지")
+    is_stunned = _flag_property(STUNNED, "스턴 상태")
+    is_confused = _flag_property(CONFUSED, "혼란 상태 (좌우 반전)")
+    is_frozen = _flag_property(FROZEN, "빙결 상태")
+    is_dashing = _flag_property(DASHING, "대시 중")
+    is_invincible = _flag_property(INVINCIBLE, "피격 후 무적 시간")
+    facing_right = _flag_property(FACING_RIGHT, "오른쪽을 보고 있는지")
+    is_awakened = _flag_property(AWAKENED, "각성 상태")
+
+    # --- 딕셔너리 호환 접근 (스킬/렌더링 코드 이전 기간 동안 사용) ---
+    def __getitem__(self, key: str) -> Any:
+        if key in _ATTR_KEYS:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _ATTR_KEYS:
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in _ATTR_KEYS or key in self.extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _ATTR_KEYS:
+            return getattr(self, key)
+        return self.extra.get(key, default)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in _ATTR_KEYS:
+            return getattr(self, key)
+        return self.extra.setdefault(key, default)
+
+    def keys(self) -> Iterator[str]:
+        yield from _ATTR_KEYS
+        yield from self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 딕셔너리 형태로 변환 (디버그 출력/직렬화용)"""
+        return {key: self[key] for key in self.keys()}
+
+    def __repr__(self) -> str:
+        return f"PlayerState({self.to_dict()!r})"
+
+
+# 딕셔너리 키로 접근 가능한 속성 (슬롯 필드 + 플래그 프로퍼티)
+_ATTR_KEYS = frozenset(PlayerState.FIELDS) | frozenset(FLAG_KEYS)
@@ -0,0 +1,100 @@
+# preload.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Optional, Tuple, List
+
+import derived_cache
+from assets import load_image
+from audio import ensure_mixer
+import sound_bank
+from animation import Character
+from skills.skills_skills_loader import get_skills_for_character, get_runtime_images_for_character
+
+# 📢 맵 로딩 카운트다운 동안 다음 경기에 필요한 자산을 스레드 풀에서 미리 준비합니다.
+# gameplay()는 take_preloaded()로 완성된 스킬 객체/사운드를 받아가고,
+# 이미지들은 프로세스 전역 레지스트리에 올라가 있으므로 첫 프레임이 멈추지 않습니다.
+
+# main.py가 gameplay 씬에서 사용하는 전체 화면 해상도
+GAMEPLAY_SCREEN_SIZE = (1920, 1080)
+
+PRELOAD_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+# 현재 진행 중인 미리 로드 작업: {"key": (p1, p2, map, size), "futures": {...}}
+_pending: Optional[Dict[str, Any]] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=PRELOAD_WORKERS, thread_name_prefix="preload")
+    return _executor
+
+
+def roulette_sizes(screen_width: int) -> Tuple[int, int]:
+    """룰렛 크기 (화면 너비의 약 40%)와 핀 크기 (룰렛 크기의 약 10%)"""
+    roulette_size = int(screen_width * 0.4)
+    return roulette_size, int(roulette_size * 0.1)
+
+
+def _load_map_assets(map_image_path: str, screen_size: Tuple[int, int]) -> None:
+    load_image(map_image_path, screen_size, alpha=False)
+    roulette_size, pin_size = roulette_sizes(screen_size[0])
+    load_image(os.path.join("assets", "img", "roulette.png"), (roulette_size, roulette_size))
+    load_image(os.path.join("assets", "img", "pin.png"), (pin_size, pin_size))
+
+
+def _load_character_assets(codename: Optional[str]) -> List[Any]:
+    """캐릭터 파트/발동 이펙트 이미지를 레지스트리에 올리고, 새 스킬 객체 [skill1, skill2, ultimate]를 만듭니다."""
+    if not codename:
+        return []
+    Character.preload_parts(codename)
+    for path, size in get_runtime_images_for_character(codename):
+        load_image(path, size)
+    return get_skills_for_character(codename)
+
+
+def start_preload(p1_codename: Optional[str], p2_codename: Optional[str], map_image_path: str,
+                  screen_size: Tuple[int, int] = GAMEPLAY_SCREEN_SIZE) -> None:
+    """맵 로딩 씬 진입 시 한 번 호출합니다. 이미 같은 조합을 로드 중이면 아무것도 하지 않습니다."""
+    global _pending
+    key = (p1_codename, p2_codename, map_image_path, tuple(screen_size))
+    if _pending is not None and _pending["key"] == key:
+        return
+
+    executor = _get_executor()
+    futures: Dict[str, Future] = {
+        "map": executor.submit(_load_map_assets, map_image_path, tuple(screen_size)),
+        "p1_skills": executor.submit(_load_character_assets, p1_codename),
+        "p2_skills": executor.submit(_load_character_assets, p2_codename),
+    }
+    if ensure_mixer():
+        # 📢 사운드 뱅크에 미리 디코딩해 두면 gameplay의 sound_bank.load_all()은 즉시 반환됩니다.
+        futures["sounds"] = executor.submit(sound_bank.load_all)
+    _pending = {"key": key, "futures": futures}
+
+
+def take_preloaded(p1_codename: Optional[str], p2_codename: Optional[str], map_image_path: str,
+                   screen_size: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """
+    gameplay() 시작 시 호출합니다. 같은 조합의 미리 로드 결과가 있으면 (필요하면 완료까지 기다린 뒤) 반환하고,
+    없거나 조합이 다르면 None을 반환합니다. (이 경우 gameplay가 직접 로드합니다)
+    """
+    global _pending
+    pending, _pending = _pending, None
+    if pending is None or pending["key"] != (p1_codename, p2_codename, map_image_path, tuple(screen_size)):
+        return None
+
+    result: Optional[Dict[str, Any]] = {}
+    for name, future in pending["futures"].items():
+        try:
+            result[name] = future.result()
+        except Exception as e:
+            print(f"Preload error ({name}): {e}")
+            result = None
+            break
+    # 📢 미리 로드 중에 새로 계산한 원본 해시를 인덱스 파일에 한 번에 저장합니다.
+    derived_cache.flush_index()
+    return result
@@ -0,0 +1,195 @@
+# projectile_engine.py
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+# 📢 NumPy는 선택 의존성입니다. 설치되어 있지 않으면 HAS_NUMPY가 False이고 대량 투사체 엔진을 만들 수 없습니다.
+# (일반 경기의 스킬 투사체는 이 엔진을 쓰지 않으므로 NumPy 없이도 게임은 그대로 동작합니다.)
+try:
+    import numpy as np
+except ImportError: # pragma: no cover - 선택 의존성
+    np = None
+
+HAS_NUMPY = np is not None
+
+# 📢 대량 투사체(탄막) 엔진: 구조체 배열(SoA)
+# 스킬 투사체(Projectile 객체)는 종류마다 update()/충돌 규칙이 달라 객체 단위로 처리하지만,
+# 같은 규칙(직선/포물선 이동, 바닥 충돌, 화면 밖 제거, 캐릭터 충돌 시 피해)을 따르는 수천 개의 단순 투사체는
+# 위치/속도/중력/크기/소유자/피해량/플래그를 NumPy 배열 하나씩에 모아 틱마다 몇 번의 벡터 연산으로 처리합니다.
+# 이동/제거/충돌 규칙은 Projectile.update()와 match.py 시스템(projectiles/collision)의 일반 투사체 규칙과 같습니다.
+# - 이동: vy += gravity, x += vx, y += vy
+# - 화면 밖: x < -size, x > screen_w + size, y > screen_h 이면 제거
+# - 바닥: gravity != 0 이고 damage > 0 인 투사체가 y + size >= GROUND_Y 이면 제거
+# - 충돌: pygame.Rect와 같은 정수(0 방향 절사) 좌표로 상대 캐릭터 충돌 박스와 AABB 검사
+
+OWNER_CODES = {"p1": 0, "p2": 1}
+
+# flags 비트
+F_HIT_ONCE = 1 << 0   # 캐릭터에 맞으면 사라짐 (끄면 관통)
+F_NO_GROUND = 1 << 1  # 바닥 충돌로 사라지지 않음
+
+# 처음 배열 크기 (부족하면 두 배씩 늘립니다)
+INITIAL_CAPACITY = 1024
+
+
+class ProjectileEngine:
+    """단순 투사체를 NumPy 배열로 한꺼번에 처리하는 엔진 (Match.bullets)"""
+
+    # (이름, dtype) — 살아 있는 투사체는 항상 [0, count) 구간에 빈틈없이 모여 있습니다.
+    FIELDS = (("x", "f8"), ("y", "f8"), ("prev_x", "f8"), ("prev_y", "f8"),
+              ("vx", "f8"), ("vy", "f8"), ("gravity", "f8"), ("size", "i4"),
+              ("damage", "f8"), ("owner", "i1"), ("kind", "i2"), ("flags", "u1"))
+
+    def __init__(self, screen_size: Tuple[int, int], ground_y: float, capacity: int = INITIAL_CAPACITY):
+        if not HAS_NUMPY:
+            raise RuntimeError("대량 투사체 엔진에는 NumPy가 필요합니다. (pip install numpy)")
+        self.screen_width, self.screen_height = screen_size
+        self.ground_y = ground_y
+        self.count = 0
+        self.capacity = 0
+        self._grow(max(1, capacity))
+        # 종류(kind)별 이미지. spawn의 kind는 register_kind()가 돌려준 번호입니다.
+        self.images: List[pygame.Surface] = []
+        self._blit_pairs: List[list] = [] # draw()가 재사용하는 [이미지, Rect] 쌍
+        # 누적 통계 (스트레스 장면/벤치마크용)
+        self.culled = 0
+        self.ground_hits = 0
+        self.char_hits = 0
+
+    def _grow(self, capacity: int) -> None:
+        for name, dtype in self.FIELDS:
+            arr = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                arr[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def register_kind(self, img: pygame.Surface) -> int:
+        """그릴 이미지를 등록하고 spawn에 넘길 종류 번호를 돌려줍니다.
+        수천 개를 그릴 때는 픽셀 알파 이미지보다 set_colorkey(..., pygame.RLEACCEL) 이미지가 훨씬 빠릅니다."""
+        self.images.append(img)
+        return len(self.images) - 1
+
+    def spawn(self, x, y, vx, vy=0.0, gravity=0.0, size=40, damage=5, owner="p1", kind=0, flags=F_HIT_ONCE) -> int:
+        """투사체를 추가합니다. 인자는 스칼라 또는 같은 길이의 배열이며, 추가한 개수를 돌려줍니다."""
+        n = max(np.size(x), np.size(y), np.size(vx), np.size(vy))
+        if n == 0:
+            return 0
+        if self.count + n > self.capacity:
+            capacity = self.capacity
+            while self.count + n > capacity:
+                capacity *= 2
+            self._grow(capacity)
+        s = slice(self.count, self.count + n)
+        self.x[s] = x
+        self.y[s] = y
+        self.prev_x[s] = x
+        self.prev_y[s] = y
+        self.vx[s] = vx
+        self.vy[s] = vy
+        self.gravity[s] = gravity
+        self.size[s] = size
+        self.damage[s] = damage
+        self.owner[s] = OWNER_CODES[owner] if isinstance(owner, str) else owner
+        self.kind[s] = kind
+        self.flags[s] = flags
+        self.count += n
+        return n
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def snapshot(self, out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """살아 있는 구간 [0, count)의 배열과 통계를 out에 복사합니다. (out의 배열이 충분히 크면 새로 할당하지 않음)"""
+        n = self.count
+        if out is None or len(out["x"]) < n:
+            out = {name: np.empty(max(n, 1), dtype=dtype) for name, dtype in self.FIELDS}
+        for name, _ in self.FIELDS:
+            out[name][:n] = getattr(self, name)[:n]
+        out["count"] = n
+        out["stats"] = (self.culled, self.ground_hits, self.char_hits)
+        return out
+
+    def restore(self, saved: Dict[str, Any]) -> None:
+        n = saved["count"]
+        if n > self.capacity:
+            self._grow(max(n, self.capacity * 2))
+        for name, _ in self.FIELDS:
+            getattr(self, name)[:n] = saved[name][:n]
+        self.count = n
+        self.culled, self.ground_hits, self.char_hits = saved["stats"]
+
+    def update(self) -> None:
+        """이동, 화면 밖 제거, 바닥 충돌 제거 (경기 루프가 객체 투사체를 갱신한 직후 호출)"""
+        n = self.count
+        if not n:
+            return
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        size = self.size[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+
+        vy += self.gravity[:n]
+        x += vx
+        y += vy
+
+        culled = (x < -size) | (x > self.screen_width + size) | (y > self.screen_height)
+        grounded = ((self.gravity[:n] != 0) & (self.damage[:n] > 0) & (y + size >= self.ground_y)
+                    & ((self.flags[:n] & F_NO_GROUND) == 0) & ~culled)
+        self.culled += int(np.count_nonzero(culled))
+        self.ground_hits += int(np.count_nonzero(grounded))
+        self._compact(~(culled | grounded))
+
+    def hits(self, target: str, left: int, top: int, width: int, height: int):
+        """target의 충돌 박스(left, top, width, height)와 겹치는 상대 투사체의 인덱스 배열 (인덱스 순서)"""
+        n = self.count
+        if not n:
+            return np.empty(0, dtype=np.intp)
+        # pygame.Rect와 같이 0 방향으로 절사한 정수 좌표로 비교합니다.
+        xi = np.trunc(self.x[:n])
+        yi = np.trunc(self.y[:n])
+        size = self.size[:n]
+        mask = ((self.owner[:n] != OWNER_CODES[target]) & (size > 0)
+                & (xi < left + width) & (xi + size > left) & (yi < top + height) & (yi + size > top))
+        return np.flatnonzero(mask)
+
+    def remove(self, indices) -> None:
+        """인덱스의 투사체를 제거합니다. (hits() 결과를 처리한 뒤 호출)"""
+        if len(indices):
+            keep = np.ones(self.count, dtype=bool)
+            keep[indices] = False
+            self._compact(keep)
+
+    def _compact(self, keep) -> None:
+        kept = int(np.count_nonzero(keep))
+        if kept == self.count:
+            return
+        n = self.count
+        for name, _ in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:kept] = arr[:n][keep]
+        self.count = kept
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        """직전 틱과 현재 틱 사이를 보간한 위치에 종류별 이미지를 한 번의 blits 호출로 그립니다."""
+        n = self.count
+        if not n or not self.images:
+            return
+        if alpha >= 1.0:
+            xs, ys = self.x[:n], self.y[:n]
+        else:
+            xs = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+            ys = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        # 📢 blits 인자는 프레임마다 (이미지, (x, y)) 튜플 수천 개를 새로 만들지 않고 [이미지, Rect] 쌍을 재사용합니다.
+        # (GC 추적 객체가 프레임마다 대량으로 생기면 세대 수집이 자주 돌아 프레임 시간이 튑니다.)
+        pairs = self._blit_pairs
+        while len(pairs) < n:
+            pairs.append([None, pygame.Rect(0, 0, 0, 0)])
+        images = self.images
+        for pair, kind, px, py in zip(pairs, self.kind[:n].tolist(), xs.astype(np.int32).tolist(), ys.astype(np.int32).tolist()):
+            pair[0] = images[kind]
+            rect = pair[1]
+            rect.x = px
+            rect.y = py
+        screen.blits(pairs[:n], doreturn=False)
@@ -0,0 +1,59 @@
+# render_systems.py
+
+from typing import Callable, Tuple
+
+import pygame
+
+from match import Match, BODY, HITBOX_Y_OFFSET_FROM_IMAGE_TOP
+
+# 📢 렌더링 시스템 (경기 화면의 항목/대량 투사체/캐릭터 그리기)
+# 시뮬레이션 시스템(match.SYSTEMS)과 같은 ecs.Scheduler로 돌리며, 형식은 system(match, screen, alpha)입니다.
+# alpha는 직전 틱 → 현재 틱 사이의 보간 비율이고, 1.0이면 현재 틱 위치 그대로 그립니다. (리플레이 창)
+# 각 시스템은 경기의 뷰(match.items/fighters)만 순회하므로 항목은 생성 순서대로, 캐릭터는 엔티티 순서대로 그려집니다.
+# HUD/디버그 표시처럼 화면마다 다른 것은 각 화면(gameplay, tools/replays.py)이 이어서 그립니다.
+
+IMAGE_Y_ADJUSTMENT = 60 # 캐릭터 이미지를 충돌 박스 기준 위치보다 아래로 내려 그리는 양
+
+
+def lerp(prev: float, current: float, alpha: float) -> float:
+    return prev + (current - prev) * alpha
+
+
+def _render_items(match: Match, screen: pygame.Surface, alpha: float) -> None:
+    """투사체/히트박스/이펙트/얼음 블록: 직전 틱과 현재 틱 위치 사이를 보간한 위치에 그린 뒤 원래 위치로 되돌립니다."""
+    for _, proj, _ in match.items.rows:
+        if alpha >= 1.0:
+            proj.draw(screen)
+            continue
+        x, y = proj.x, proj.y
+        proj.x = lerp(proj.prev_x, x, alpha)
+        proj.y = lerp(proj.prev_y, y, alpha)
+        try:
+            proj.draw(screen)
+        finally:
+            proj.x, proj.y = x, y
+
+
+def _render_bullets(match: Match, screen: pygame.Surface, alpha: float) -> None:
+    if match.bullets is not None:
+        match.bullets.draw(screen, alpha)
+
+
+def _render_fighters(match: Match, screen: pygame.Surface, alpha: float) -> None:
+    """캐릭터 (바라보는 방향은 상대의 보간 위치로 정합니다)"""
+    ecs = match.ecs
+    for _, body, fighter, sprite in match.fighters.rows:
+        opponent = ecs.get(fighter.opponent, BODY)
+        x = lerp(body.prev_x, body.x, alpha)
+        y = lerp(body.prev_y, body.y, alpha)
+        image_y = y - HITBOX_Y_OFFSET_FROM_IMAGE_TOP + IMAGE_Y_ADJUSTMENT
+        sprite.draw(screen, x, image_y, lerp(opponent.prev_x, opponent.x, alpha),
+                    body.is_invincible, body.is_confused, body.is_frozen)
+
+
+# 기본 렌더링 시스템 (그리는 순서대로). Scheduler(RENDER_SYSTEMS).add(...)로 화면마다 끼워 넣을 수 있습니다.
+RENDER_SYSTEMS: Tuple[Tuple[str, Callable[..., None]], ...] = (
+    ("items", _render_items),
+    ("bullets", _render_bullets),
+    ("fighters", _render_fighters),
+)
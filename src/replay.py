@@ -0,0 +1,235 @@
+# replay.py
+
+import os
+import struct
+import time
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from input_bits import KeyState, step_masks
+from match import Match, SIM_DT_MS
+
+# 📢 입력 기록/리플레이
+# 경기 시뮬레이션은 같은 입력이면 항상 같은 결과를 내므로 (match.Match, 고정 틱) 틱마다 두 플레이어의 입력 비트마스크만 기록합니다.
+# (input_bits.ACTION_BITS: 이동 left/right, jump, skill1, skill2, ultimate)
+# 같은 입력이 이어지는 구간은 (비트마스크 1바이트, 틱 수 가변 길이 정수) 한 쌍으로 적으므로 (런 길이 인코딩)
+# 한 경기(수천 틱)가 수 KB 안에 들어갑니다.
+#
+# 파일 형식 (리틀 엔디언):
+#   헤더: "RPLY", 버전(1바이트), 화면 너비/높이(각 2바이트), 시드(4바이트), 틱 수(4바이트)
+#         1P/2P 캐릭터 codename, 맵 경로 (각각 가변 길이 정수 길이 + UTF-8)
+#   본문: 1P, 2P 순서로 런 개수(가변 길이 정수) + 런마다 (비트마스크 1바이트, 길이 가변 길이 정수)
+# 시드는 봇 입력을 만든 난수 시드입니다. (경기 시뮬레이션 자체는 난수를 쓰지 않으므로 사람끼리의 경기는 0)
+
+MAGIC = b"RPLY"
+FORMAT_VERSION = 1
+REPLAY_EXTENSION = ".rpl"
+
+_HEADER = struct.Struct("<4sBHHII")
+
+# 재생 속도: 0이면 제한 없음 (CPU가 허용하는 만큼)
+UNCAPPED = 0.0
+# 렌더링할 때 화면을 갱신하는 간격 (초)
+RENDER_INTERVAL_S = 1 / 60
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("리플레이 파일이 잘렸습니다.")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_text(out: bytearray, text: str) -> None:
+    encoded = text.encode("utf-8")
+    _write_varint(out, len(encoded))
+    out += encoded
+
+
+def _read_text(data: bytes, pos: int) -> Tuple[str, int]:
+    length, pos = _read_varint(data, pos)
+    if pos + length > len(data):
+        raise ValueError("리플레이 파일이 잘렸습니다.")
+    return data[pos:pos + length].decode("utf-8"), pos + length
+
+
+class Replay:
+    """한 경기의 입력 기록. runs[0]/runs[1]은 1P/2P의 [비트마스크, 틱 수] 런 목록입니다."""
+
+    __slots__ = ("p1", "p2", "map_path", "seed", "screen_size", "runs")
+
+    def __init__(self, p1: str, p2: str, map_path: str = "", seed: int = 0,
+                 screen_size: Tuple[int, int] = (1920, 1080)):
+        self.p1 = p1
+        self.p2 = p2
+        self.map_path = map_path
+        self.seed = seed
+        self.screen_size = screen_size
+        self.runs: Tuple[List[List[int]], List[List[int]]] = ([], [])
+
+    @property
+    def ticks(self) -> int:
+        return sum(count for _, count in self.runs[0])
+
+    def masks(self) -> Iterator[Tuple[int, int]]:
+        """틱마다 (1P 비트마스크, 2P 비트마스크)"""
+        runs1, runs2 = iter(self.runs[0]), iter(self.runs[1])
+        mask1 = left1 = mask2 = left2 = 0
+        for _ in range(self.ticks):
+            if not left1:
+                mask1, left1 = next(runs1)
+            if not left2:
+                mask2, left2 = next(runs2)
+            left1 -= 1
+            left2 -= 1
+            yield mask1, mask2
+
+    def new_match(self, **kwargs: Any) -> Match:
+        """기록과 같은 캐릭터/화면 크기의 새 경기 (kwargs는 Match에 그대로 전달)"""
+        return Match(self.p1, self.p2, self.screen_size, **kwargs)
+
+    # --- 직렬화 ---
+
+    def to_bytes(self) -> bytes:
+        width, height = self.screen_size
+        out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, width, height, self.seed, self.ticks))
+        _write_text(out, self.p1)
+        _write_text(out, self.p2)
+        _write_text(out, self.map_path)
+        for runs in self.runs:
+            _write_varint(out, len(runs))
+            for mask, count in runs:
+                out.append(mask)
+                _write_varint(out, count)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if len(data) < _HEADER.size:
+            raise ValueError("리플레이 파일이 잘렸습니다.")
+        magic, version, width, height, seed, ticks = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("리플레이 파일이 아닙니다.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 리플레이 버전입니다: {version}")
+        pos = _HEADER.size
+        p1, pos = _read_text(data, pos)
+        p2, pos = _read_text(data, pos)
+        map_path, pos = _read_text(data, pos)
+        replay = cls(p1, p2, map_path, seed, (width, height))
+        for runs in replay.runs:
+            count, pos = _read_varint(data, pos)
+            for _ in range(count):
+                if pos >= len(data):
+                    raise ValueError("리플레이 파일이 잘렸습니다.")
+                mask = data[pos]
+                length, pos = _read_varint(data, pos + 1)
+                runs.append([mask, length])
+            if sum(length for _, length in runs) != ticks:
+                raise ValueError("리플레이 파일의 틱 수가 맞지 않습니다.")
+        return replay
+
+    def save(self, path: str) -> int:
+        """파일로 저장하고 크기(바이트)를 돌려줍니다."""
+        data = self.to_bytes()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data)
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class InputRecorder:
+    """틱마다 record(1P 비트마스크, 2P 비트마스크)를 호출해 Replay를 만듭니다. (같은 입력이 이어지면 마지막 런을 늘림)"""
+
+    def __init__(self, p1: str, p2: str, map_path: str = "", seed: int = 0,
+                 screen_size: Tuple[int, int] = (1920, 1080)):
+        self.replay = Replay(p1, p2, map_path, seed, screen_size)
+
+    def record(self, p1_mask: int, p2_mask: int) -> None:
+        for runs, mask in zip(self.replay.runs, (p1_mask, p2_mask)):
+            if runs and runs[-1][0] == mask:
+                runs[-1][1] += 1
+            else:
+                runs.append([mask, 1])
+
+    def save(self, path: str) -> int:
+        return self.replay.save(path)
+
+
+class ReplayPlayer:
+    """기록된 입력으로 경기를 다시 진행합니다."""
+
+    def __init__(self, replay: Replay, match: Optional[Match] = None):
+        self.replay = replay
+        self.match = match if match is not None else replay.new_match()
+        self.keys = KeyState()
+        self._masks = replay.masks()
+        self._previous: Tuple[int, int] = (0, 0)
+
+    def step(self) -> bool:
+        """한 틱 진행합니다. 기록이 끝났거나 경기가 끝났으면 False"""
+        if self.match.finished:
+            return False
+        masks = next(self._masks, None)
+        if masks is None:
+            return False
+        step_masks(self.match, self.keys, masks, self._previous)
+        self._previous = masks
+        return True
+
+    def run(self, speed: float = 1.0, render: Optional[Callable[[Match], Any]] = None) -> Match:
+        """끝까지 재생합니다. speed: 1이면 실시간(60틱/초), 4면 4배속, UNCAPPED(0)이면 제한 없음.
+        render(match)를 주면 최대 RENDER_INTERVAL_S마다 한 번 그립니다. (False를 돌려주면 재생 중단)"""
+        perf = time.perf_counter
+        tick_s = SIM_DT_MS / 1000
+        start = perf()
+        played = 0
+        alive = True
+        while alive:
+            if speed > 0:
+                # 흐른 시간만큼 진행합니다. (렌더링이 늦어져도 재생 속도는 유지)
+                due = int((perf() - start) * speed / tick_s) + 1
+                while played < due:
+                    alive = self.step()
+                    if not alive:
+                        break
+                    played += 1
+            elif render is None:
+                while self.step():
+                    pass
+                alive = False
+            else:
+                # 제한 없음 + 렌더링: 화면 갱신 간격 동안 진행하고 한 번 그림
+                frame_end = perf() + RENDER_INTERVAL_S
+                while alive and perf() < frame_end:
+                    alive = self.step()
+            rendered_at = perf()
+            if render is not None and render(self.match) is False:
+                break
+            if alive and speed > 0:
+                wake = start + played * tick_s / speed
+                if render is not None:
+                    wake = max(wake, rendered_at + RENDER_INTERVAL_S)
+                delay = wake - perf()
+                if delay > 0:
+                    time.sleep(delay)
+        return self.match
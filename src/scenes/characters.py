@@ -1,23 +1,10 @@
-import os
 import pygame
 import copy
 from typing import Dict, Any, List, Tuple
 
-# 📢 [핵심 수정 1] pygame.mixer.init() 제거. main.py에서 초기화됩니다.
+from assets import load_image, load_background
+from fonts import get_font, render_text, DEFAULT_FONT_PATH
 
-# 📢 [추가] main.py에서 GAME_VOLUME을 가져와 사용합니다.
-try:
-    import main 
-    SHARED_VOLUME = main.GAME_VOLUME
-except (ImportError, AttributeError):
-    # main 모듈이 없거나 GAME_VOLUME이 없을 경우 기본값 0.5 사용
-    SHARED_VOLUME = 0.5 
-
-# 📢 Pygame 폰트 및 믹서 초기화가 main.py에서 이미 되었어야 합니다.
-# 필요한 경우, 안전을 위해 mixer만 초기화합니다. (main.py에 init이 있다면 불필요)
-if not pygame.mixer.get_init():
-    pygame.mixer.init()
-    
 # 📢 [수정]: 이 파일은 'Character' 씬의 로직과 캐릭터 데이터를 정의합니다.
 
 character_config: Dict[str, Any] = {
@@ -72,15 +59,10 @@ def get_charactername_by_codename(codename: str | None) -> str | None:
     return None
 
 def _safe_load_image(path: str, size: Tuple[int, int] | None = None) -> pygame.Surface | None:
-    if not path or not os.path.exists(path):
-        return None
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        if size:
-            img = pygame.transform.scale(img, size)
-        return img
-    except Exception:
+    # 📢 프로세스 전역 레지스트리를 사용하므로 매 프레임 PNG를 다시 디코딩하지 않습니다.
+    if not path:
         return None
+    return load_image(path, size)
 
 def characters(screen: pygame.Surface, current_scene: str) -> str | None:
     global character_config, text_1p, text_2p, start_time, process
@@ -95,18 +77,13 @@ def characters(screen: pygame.Surface, current_scene: str) -> str | None:
     # 배경 및 화면 설정
     pygame.display.set_caption("Bounce Attack (REMASTERED) - 캐릭터 선택")
 
-    background = _safe_load_image("assets/img/characters.png", (screen.get_width(), screen.get_height()))
-    if background:
-        screen.blit(background, (0, 0))
-    else:
-        screen.fill((30, 120, 60))
+    # 📢 해상도별로 한 번만 디코딩/convert된 배경을 재사용합니다.
+    background = load_background("assets/img/characters.png", screen.get_size(), fallback_color=(30, 120, 60))
+    screen.blit(background, (0, 0))
 
-    try:
-        font = pygame.font.Font("assets/font/NotoSansKR-Bold.ttf", 40)
-        small_font = pygame.font.Font("assets/font/NotoSansKR-Bold.ttf", 24)
-    except Exception:
-        font = pygame.font.Font(None, 40)
-        small_font = pygame.font.Font(None, 24)
+    # 📢 폰트 풀에서 재사용 (파일이 없으면 기본 폰트로 대체)
+    font = get_font(DEFAULT_FONT_PATH, 40)
+    small_font = get_font(DEFAULT_FONT_PATH, 24)
 
     # elapsed 계산
     elapsed = pygame.time.get_ticks() - start_time if start_time is not None else 0
@@ -115,31 +92,31 @@ def characters(screen: pygame.Surface, current_scene: str) -> str | None:
     blink = (pygame.time.get_ticks() // 750) % 2
 
     if process == 1: # P1 선택 중
-        text_1p = font.render("선택 준비", True, (255, 255, 0))
-        text_2p = font.render("Player 2", True, (255, 255, 255))
+        text_1p = render_text(font, "선택 준비", (255, 255, 0))
+        text_2p = render_text(font, "Player 2", (255, 255, 255))
         if blink:
-            text_1p = font.render("", True, (0, 255, 0))
+            text_1p = render_text(font, "", (0, 255, 0))
     
     elif process == 2: # P2 선택 중
         text_1p_name = get_charactername_by_codename(character_config["selected_1p"]) or "확정"
-        text_1p = font.render(text_1p_name, True, (0, 255, 0))
-        text_2p = font.render("선택 준비", True, (255, 255, 0))
+        text_1p = render_text(font, text_1p_name, (0, 255, 0))
+        text_2p = render_text(font, "선택 준비", (255, 255, 0))
         if blink:
-            text_2p = font.render("", True, (0, 255, 0))
+            text_2p = render_text(font, "", (0, 255, 0))
     
     elif process == 3: # 선택 완료, 맵 이동 대기
         text_1p_name = get_charactername_by_codename(character_config["selected_1p"]) or "오류"
         text_2p_name = get_charactername_by_codename(character_config["selected_2p"]) or "오류"
-        text_1p = font.render(text_1p_name, True, (0, 255, 0))
-        text_2p = font.render(text_2p_name, True, (0, 255, 0))
+        text_1p = render_text(font, text_1p_name, (0, 255, 0))
+        text_2p = render_text(font, text_2p_name, (0, 255, 0))
         
         # 선택 완료 후 딜레이 (3초 대기 후 맵 씬으로 이동)
         if elapsed > 3000:
             return "Maps"
     
     else: # 예외 처리 (process 0)
-        text_1p = font.render("Player 1", True, (255, 255, 255))
-        text_2p = font.render("Player 2", True, (255, 255, 255))
+        text_1p = render_text(font, "Player 1", (255, 255, 255))
+        text_2p = render_text(font, "Player 2", (255, 255, 255))
 
 
     # 텍스트 렌더링
@@ -185,7 +162,7 @@ def characters(screen: pygame.Surface, current_scene: str) -> str | None:
         else:
             # 📢 [UI 수정]: 이미지 로드 실패 시 이름만 빨간색으로 표시
             name = get_charactername_by_codename(show_codename) or show_codename
-            label = small_font.render(f"No Image: {name}", True, (255, 0, 0)) # 빨간색으로 오류 표시
+            label = render_text(small_font, f"No Image: {name}", (255, 0, 0)) # 빨간색으로 오류 표시
             screen.blit(label, label.get_rect(center=(centerx, centery)))
 
     _draw_preview_for_player(1, text_1p_rect.centerx, text_1p_rect.centery + 130)
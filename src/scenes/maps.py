@@ -1,7 +1,7 @@
 import pygame
 import os
 
-pygame.mixer.init()
+from assets import load_image, load_background
 
 # 📢 [수정]: 맵 목록에 '하늘섬' 맵을 추가했습니다.
 # '수영장' 맵 오른쪽 (X: 466)에 배치했습니다. (160 너비 + 약 50 픽셀 간격)
@@ -24,14 +24,8 @@ def maps(screen, current_scene):
 
   pygame.display.set_caption("Bounce Attack (REMASTERED) - 맵 선택")
 
-  # 배경 로드
-  try:
-      background = pygame.image.load("assets/img/maps.png")
-      background = pygame.transform.scale(background, (screen.get_width(), screen.get_height()))
-  except pygame.error:
-      background = pygame.Surface((screen.get_width(), screen.get_height()))
-      background.fill((0, 0, 0)) # 배경 이미지 없으면 검은색으로 대체
-      
+  # 배경 로드 (📢 해상도별로 한 번만 디코딩/스케일, 이미지 없으면 검은색으로 대체)
+  background = load_background("assets/img/maps.png", screen.get_size(), fallback_color=(0, 0, 0))
   screen.blit(background, (0, 0))
 
   # 📢 [수정]: 맵 리스트를 반복하여 모든 맵을 로드하고 렌더링합니다.
@@ -39,18 +33,15 @@ def maps(screen, current_scene):
       target_rect = map_data["rect"]
       codename = map_data["codename"]
       
-      try:
-          # assets/maps/{codename}.png 경로에서 맵 이미지 로드
-          map_image = pygame.image.load(os.path.join("assets", "maps", f"{codename}.png"))
-          map_image = pygame.transform.scale(map_image, (target_rect.width, target_rect.height))
-          
+      # assets/maps/{codename}.png 경로에서 맵 이미지 로드 (📢 레지스트리 캐시 사용)
+      map_image = load_image(os.path.join("assets", "maps", f"{codename}.png"), (target_rect.width, target_rect.height), alpha=False)
+      
+      if map_image:
           # 이미지를 목표 Rect의 중앙에 맞춥니다.
           image_rect = map_image.get_rect(center=target_rect.center)
           screen.blit(map_image, image_rect)
-          
-      except pygame.error as e:
+      else:
           # 이미지 로드 실패 시 대체 표시 (디버그용)
-          print(f"Error loading map image {codename}.png: {e}")
           pygame.draw.rect(screen, (255, 0, 0), target_rect, 2)
 
   for event in pygame.event.get():
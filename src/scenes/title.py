@@ -1,36 +1,28 @@
 import pygame
 # 📢 [추가]: 캐릭터 선택 상태 초기화를 위해 scenes.characters 모듈을 가져옵니다.
 import scenes.characters
+from assets import load_background
+from fonts import get_font, render_text, DEFAULT_FONT_PATH
 
 def title(screen, current_scene):
     pygame.display.set_caption("Bounce Attack (REMASTERED)")
 
-    background = pygame.image.load("assets/img/background.png")
-    background = pygame.transform.scale(background, (screen.get_width(), screen.get_height()))
+    # 📢 해상도별로 한 번만 디코딩/스케일된 배경을 재사용합니다. (프레임당 blit 1회)
+    background = load_background("assets/img/background.png", screen.get_size())
     screen.blit(background, (0, 0))
 
     button_rect = pygame.Rect(440, 620, 200, 60)
 
-    try:
-        font = pygame.font.Font("assets/font/NotoSansKR-Bold.ttf", 50)
-    except Exception:
-        font = pygame.font.Font(None, 50)
+    # 📢 폰트 풀에서 재사용 (파일이 없으면 기본 폰트로 대체)
+    font = get_font(DEFAULT_FONT_PATH, 50)
         
     text_str = "게임 시작"
 
     blink = (pygame.time.get_ticks() // 750) % 2
 
     if blink:
-        outline_color = (0, 0, 0)
-        offsets = [-3, -2, -1, 0, 1, 2, 3]
-        for dx in offsets:
-            for dy in offsets:
-                if dx != 0 or dy != 0:
-                    outline = font.render(text_str, True, outline_color)
-                    outline_rect = outline.get_rect(center=(button_rect.centerx + dx, button_rect.centery + dy + 20))
-                    screen.blit(outline, outline_rect)
-
-        text = font.render(text_str, True, (255, 255, 255))
+        # 📢 외곽선(3px) + 본문을 한 장으로 미리 합성한 Surface를 캐시에서 가져와 1회 blit
+        text = render_text(font, text_str, (255, 255, 255), outline_color=(0, 0, 0), outline_width=3)
         text_rect = text.get_rect(center=(button_rect.centerx, button_rect.centery + 20))
         screen.blit(text, text_rect)
 
@@ -0,0 +1,13 @@
+# settings.py
+
+# 📢 여러 씬이 공유하는 게임 설정
+# (진입 모듈인 main.py를 다른 모듈에서 import 하면 main.py가 다시 실행되므로, 공용 값은 여기에 둡니다.)
+
+# 메뉴/게임 BGM 및 효과음 볼륨
+GAME_VOLUME = 0.05
+
+# 메뉴 씬(타이틀/캐릭터/맵 선택/맵 로딩)의 창 크기
+MENU_SCREEN_SIZE = (1080, 720)
+
+# 📢 경기 입력 기록(replay.py)을 저장할 폴더 (경기가 끝날 때마다 한 파일)
+REPLAY_DIR = "replays"
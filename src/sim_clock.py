@@ -0,0 +1,50 @@
+# sim_clock.py
+
+import pygame
+from typing import Dict, Any
+
+# 📢 시뮬레이션 시계
+# 게임 로직(스킬 쿨다운, 투사체/이펙트 수명, 상태 이상, 캐릭터 애니메이션)은 벽시계(pygame.time.get_ticks)가 아니라
+# world["clock"]의 시각을 사용합니다. 시각은 gameplay의 고정 간격 틱에서만 전진하므로,
+# 경기를 실시간보다 빠르게 돌리거나, 일시정지하거나, 디스플레이 없이 틱 단위로 결정적으로 진행할 수 있습니다.
+# 시계를 넘겨받지 못한 객체는 WALL_CLOCK(기존 동작)을 사용합니다.
+
+
+class SimClock:
+    """고정 간격으로만 전진하는 시뮬레이션 시각 (ms, 경기 시작 시 0)"""
+
+    def __init__(self, start_ms: float = 0.0):
+        self.now_ms = float(start_ms)
+        self.paused = False
+
+    def get_ticks(self) -> float:
+        return self.now_ms
+
+    def advance(self, dt_ms: float) -> float:
+        """dt_ms만큼 전진합니다. (일시정지 중이면 그대로)"""
+        if not self.paused:
+            self.now_ms += dt_ms
+        return self.now_ms
+
+    def pause(self) -> None:
+        self.paused = True
+
+    def resume(self) -> None:
+        self.paused = False
+
+
+class WallClock:
+    """pygame.time.get_ticks()를 그대로 사용하는 시계 (시뮬레이션 시계가 없을 때의 기본값)"""
+
+    paused = False
+
+    def get_ticks(self) -> int:
+        return pygame.time.get_ticks()
+
+
+WALL_CLOCK = WallClock()
+
+
+def get_clock(world: Dict[str, Any]):
+    """world에 실린 시뮬레이션 시계를 반환합니다. 없으면 벽시계."""
+    return world.get("clock") or WALL_CLOCK
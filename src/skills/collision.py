@@ -0,0 +1,43 @@
+# skills/collision.py
+
+from typing import Callable, Dict, List, Type
+
+# 📢 투사체 충돌 동작 디스패치 테이블
+# 투사체 클래스는 캐릭터와 겹쳤을 때의 동작을 클래스 속성 COLLISION(동작 이름)으로 한 번만 선언하고,
+# 클래스가 정의될 때(Projectile.__init_subclass__) 또는 동작이 등록될 때 COLLISION_TABLE[클래스]에 처리 함수가 연결됩니다.
+# 경기 루프는 충돌마다 hasattr/isinstance 검사 없이 COLLISION_TABLE[type(proj)](...)를 한 번 호출합니다.
+#
+# 처리 함수 형식: handler(match, proj, target_state, target_char, attacker_state, current_time) -> None
+# 기본 동작은 match.py가 등록하고, 새 스킬은 자기 모듈에서 @collision_handler("이름")으로 동작을 추가할 수 있습니다.
+
+CollisionHandler = Callable[..., None]
+
+# 동작 이름 -> 처리 함수
+COLLISION_HANDLERS: Dict[str, CollisionHandler] = {}
+# 투사체 클래스 -> 처리 함수 (경기 루프가 사용하는 테이블)
+COLLISION_TABLE: Dict[Type, CollisionHandler] = {}
+# 처리 함수가 아직 등록되지 않은 동작을 선언한 클래스 (동작 이름 -> 클래스 목록)
+_pending: Dict[str, List[Type]] = {}
+
+
+def bind_collision(cls: Type) -> None:
+    """cls.COLLISION에 해당하는 처리 함수를 테이블에 연결합니다. (아직 등록 전이면 등록될 때 연결)"""
+    name = cls.COLLISION
+    handler = COLLISION_HANDLERS.get(name)
+    if handler is None:
+        _pending.setdefault(name, []).append(cls)
+    else:
+        COLLISION_TABLE[cls] = handler
+
+
+def collision_handler(name: str) -> Callable[[CollisionHandler], CollisionHandler]:
+    """충돌 동작 등록 데코레이터. 이 동작을 선언한 클래스(이미 정의된 것 포함)에 연결됩니다."""
+    def decorator(func: CollisionHandler) -> CollisionHandler:
+        COLLISION_HANDLERS[name] = func
+        for cls in list(COLLISION_TABLE):
+            if cls.COLLISION == name:
+                COLLISION_TABLE[cls] = func
+        for cls in _pending.pop(name, ()):
+            COLLISION_TABLE[cls] = func
+        return func
+    return decorator
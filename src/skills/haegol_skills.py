@@ -2,6 +2,7 @@
 
 import pygame
 from .skills_base import Skill, UltimateSkillBase, MeleeHitbox, AnimatedEffect, _safe_load_and_scale
+from .skills_skills_loader import register_character
 from typing import List
 
 class HaegolSwingSkill(Skill):
@@ -14,32 +15,21 @@ class HaegolSwingSkill(Skill):
         self.awakened_damage = 10 
         self.effect_size = 300 
         self.effect_frames = self._load_effect_frames()
+        self.effect_frames_flipped = self._load_effect_frames(flip=True)
 
-    def _load_effect_frames(self):
-        # ... (기존 _load_effect_frames 로직 유지) ...
-        frames = []
-        loaded_successfully = False
-        try:
-            temp_frames = []
-            for i in range(1, 4): 
-                path = f"assets/characters/haegol/ultimate_skill_{i}.png"
-                img = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.scale(img, (self.effect_size, self.effect_size))
-                temp_frames.append(img)
-            if len(temp_frames) == 3:
-                frames = temp_frames
-                loaded_successfully = True
-        except Exception:
-            pass
-        if not loaded_successfully:
-            placeholder_surface = pygame.Surface((self.effect_size, self.effect_size), pygame.SRCALPHA)
-            placeholder_surface.fill((0, 255, 255, 200)) 
-            frames = [placeholder_surface, placeholder_surface, placeholder_surface]
-        return frames
+    def _load_effect_frames(self, flip: bool = False):
+        # 📢 레지스트리에서 공유 Surface를 받아오므로 매 경기마다 다시 디코딩하지 않습니다.
+        size = (self.effect_size, self.effect_size)
+        temp_frames = [_safe_load_and_scale(f"assets/characters/haegol/ultimate_skill_{i}.png", size, flip=flip) for i in range(1, 4)]
+        if all(temp_frames):
+            return temp_frames
+        placeholder_surface = pygame.Surface((self.effect_size, self.effect_size), pygame.SRCALPHA)
+        placeholder_surface.fill((0, 255, 255, 200)) 
+        return [placeholder_surface, placeholder_surface, placeholder_surface]
 
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, owner: str = "p1", **kwargs):
         if not self.ready(): return []
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         if user_obj: user_obj.start_attack_animation() 
         CHAR_SIZE = 200
         is_awakened = user_obj and user_obj.state.get("is_awakened", False)
@@ -50,7 +40,7 @@ class HaegolSwingSkill(Skill):
         center_offset = (CHAR_SIZE // 2) + 150 * direction 
         hitbox_start_x = user["x"] + center_offset - current_hitbox_size // 2
         hitbox_y = user["y"] + CHAR_SIZE // 2 - current_hitbox_size // 2
-        hitbox = MeleeHitbox(x=hitbox_start_x, y=hitbox_y, damage=current_damage, owner=owner, duration_ms=200, size=current_hitbox_size)
+        hitbox = MeleeHitbox.acquire(x=hitbox_start_x, y=hitbox_y, damage=current_damage, owner=owner, duration_ms=200, size=current_hitbox_size, clock=self.clock)
         projectiles = world.setdefault("projectiles", [])
         projectiles.append(hitbox)
         
@@ -65,13 +55,13 @@ class HaegolSwingSkill(Skill):
             # 캐릭터가 오른쪽을 보는데 (is_facing_right=True), 이펙트는 왼쪽으로 회전해야 한다고 가정합니다.
             if is_facing_right:
                  # 오른쪽을 볼 때 (direction=1) 프레임을 뒤집어 (왼쪽으로 회전하는 것처럼) 보이게 합니다.
-                 frames_to_use = [pygame.transform.flip(f, True, False) for f in self.effect_frames]
+                 frames_to_use = self.effect_frames_flipped
             
             # 캐릭터가 왼쪽을 볼 때는 (is_facing_right=False) 기본 프레임을 사용하여,
             # (기본 프레임이 오른쪽으로 회전하는 이미지라면) 왼쪽으로 회전하는 것처럼 보이게 합니다.
             # (이전의 'if not is_facing_right' 로직을 다시 제거했습니다.)
             
-            stab_effect = AnimatedEffect(x=effect_x, y=effect_y, frames=frames_to_use, frame_duration_ms=200, owner=owner, size=self.effect_size)
+            stab_effect = AnimatedEffect.acquire(x=effect_x, y=effect_y, frames=frames_to_use, frame_duration_ms=200, owner=owner, size=self.effect_size, clock=self.clock)
             projectiles.append(stab_effect)
             
         return [hitbox]
@@ -80,34 +70,31 @@ class HaegolBoneSkill(Skill):
     """해골 캐릭터의 뼈 발사 스킬"""
     def __init__(self, name: str, cooldown_ms: int):
         img_path = "assets/characters/haegol/skill1.png"
-        super().__init__(name, cooldown_ms=cooldown_ms, img_path=img_path)
+        super().__init__(name, cooldown_ms=cooldown_ms)
         self.proj_size = 170
         self.damage = 5
         
-        if self.img:
-            self.img = pygame.transform.scale(self.img, (self.proj_size, self.proj_size))
+        size = (self.proj_size, self.proj_size)
+        self.img = _safe_load_and_scale(img_path, size)
+        self.img_flipped = _safe_load_and_scale(img_path, size, flip=True)
         
-        self.awakened_img = None
-        try:
-            awakened_path = "assets/characters/haegol/ultimate_skill2.png"
-            img_ult = pygame.image.load(awakened_path).convert_alpha()
-            self.awakened_img = pygame.transform.scale(img_ult, (self.proj_size, self.proj_size))
-        except Exception:
-            self.awakened_img = self.img 
+        awakened_path = "assets/characters/haegol/ultimate_skill2.png"
+        self.awakened_img = _safe_load_and_scale(awakened_path, size) or self.img
+        self.awakened_img_flipped = _safe_load_and_scale(awakened_path, size, flip=True) or self.img_flipped
 
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, owner: str = "p1", **kwargs):
         if not self.ready(): return []
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         if user_obj: user_obj.start_attack_animation() 
         
         CHAR_SIZE = 200
         is_awakened = user_obj and user_obj.state.get("is_awakened", False) 
         
         if is_awakened:
-            base_proj_img = self.awakened_img
+            base_proj_img, base_proj_img_flipped = self.awakened_img, self.awakened_img_flipped
             current_damage = self.damage * 2 
         else:
-            base_proj_img = self.img
+            base_proj_img, base_proj_img_flipped = self.img, self.img_flipped
             current_damage = self.damage
             
         from .skills_base import Projectile 
@@ -126,13 +113,13 @@ class HaegolBoneSkill(Skill):
         # 수정: 오른쪽을 볼 때 뒤집음 (반대 방향)
         # 이렇게 하면, 투사체의 방향성이 캐릭터가 보는 방향과 반대가 됩니다.
         if proj_img and is_facing_right:
-             proj_img = pygame.transform.flip(proj_img, True, False)
+             proj_img = base_proj_img_flipped
             
         vx = 15 * direction
         spawn_x = user["x"] + (CHAR_SIZE // 2 + 60 * direction) - self.proj_size // 2
         spawn_y = user["y"] + CHAR_SIZE // 2 - self.proj_size // 2
         
-        proj = Projectile(spawn_x, spawn_y, vx, proj_img, damage=current_damage, owner=owner, size=self.proj_size)
+        proj = Projectile.acquire(spawn_x, spawn_y, vx, proj_img, damage=current_damage, owner=owner, size=self.proj_size, clock=self.clock)
         projectiles = world.setdefault("projectiles", [])
         projectiles.append(proj)
         
@@ -154,10 +141,19 @@ class HaegolUltimateSkill(UltimateSkillBase):
             return []
             
         # 3. 쿨다운 리셋 및 게이지 소모 (성공적으로 발동할 때만 소모)
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         user["ultimate_gauge"] = max(0, user["ultimate_gauge"] - self.ult_cost_percent)
             
         # 4. 궁극기 발동 (각성)
         if user_obj: user_obj.start_awakening(self.duration_ms)
         
-        return []
\ No newline at end of file
+        return []
+
+
+# 📢 스킬 레지스트리 등록 (해골이 선택될 때 이 모듈이 import 됩니다)
+@register_character("haegol")
+def create_haegol_skills() -> List[Skill]:
+    swing_skill = HaegolSwingSkill(name="haegol_swing", cooldown_ms=500) 
+    bone_skill = HaegolBoneSkill(name="haegol_bone", cooldown_ms=1000) 
+    ultimate_skill = HaegolUltimateSkill(name="haegol_ultimate", cooldown_ms=100) 
+    return [swing_skill, bone_skill, ultimate_skill]
@@ -3,8 +3,14 @@
 import pygame
 from typing import Optional, List
 from .skills_base import Skill, UltimateSkillBase, MeleeHitbox, AnimatedEffect, _safe_load_and_scale, Projectile 
+from .skills_skills_loader import register_character
 import os 
 
+# 📢 스킬 발동 중에 생성되는 이펙트 이미지 (맵 로딩 중 미리 로드/아틀라스 패킹 대상)
+RUNTIME_IMAGES = [
+    ("assets/characters/iceman/ice.png", (200, 200)), # IceBlock (CHAR_SIZE)
+]
+
 # =========================================================
 # 🧊 Iceman 투사체/이펙트 정의
 # =========================================================
@@ -13,7 +19,9 @@ class IceBlock(AnimatedEffect):
     """
     아이스맨 궁극기에 의해 얼려진 적 캐릭터 위치에 생성되는 시각적 이펙트.
     """
-    def __init__(self, x: float, y: float, size: int, owner: str, duration_ms: int):
+    COLLISION = "none" # 시각 효과만 (충돌 무시)
+
+    def __init__(self, x: float, y: float, size: int, owner: str, duration_ms: int, clock=None):
         ice_path = "assets/characters/iceman/ice.png" 
         
         ice_img = _safe_load_and_scale(ice_path, (size, size))
@@ -26,10 +34,16 @@ class IceBlock(AnimatedEffect):
             frame_duration_ms=duration_ms, 
             owner=owner,
             size=size,
-            loops=1 # 한 번 재생 후 duration_ms 뒤 소멸
+            loops=1, # 한 번 재생 후 duration_ms 뒤 소멸
+            clock=clock
         )
         self.is_ice_block = True
 
+
+class IcemanFrostArea(AnimatedEffect):
+    """아이스맨 궁극기 2단계 광역 이펙트 (스킬이 damage/freeze_duration/hit_once_only/freeze_effect_class를 설정)"""
+    COLLISION = "freeze_area"
+
 # =========================================================
 # 🧊 Iceman 스킬 정의
 # =========================================================
@@ -37,14 +51,14 @@ class IceBlock(AnimatedEffect):
 class IcemanPunchSkill(Skill):
     """기술 1: 전방 주먹질 (근접 공격)"""
     def __init__(self, name: str, cooldown_ms: int):
-        img_path = "assets/characters/iceman/skill1.png"
-        super().__init__(name, cooldown_ms=cooldown_ms, img_path=img_path)
+        # 📢 근접 공격은 투사체 이미지를 쓰지 않으므로 원본(1024px) 이미지를 로드하지 않습니다.
+        super().__init__(name, cooldown_ms=cooldown_ms)
         self.hitbox_size = 150
         self.damage = 8
         
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, owner: str = "p1", **kwargs):
         if not self.ready(): return []
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         if user_obj: user_obj.start_attack_animation() 
 
         CHAR_SIZE = 200
@@ -55,13 +69,14 @@ class IcemanPunchSkill(Skill):
         hitbox_start_x = user["x"] + center_offset - self.hitbox_size // 2
         hitbox_y = user["y"] 
         
-        hitbox = MeleeHitbox(
+        hitbox = MeleeHitbox.acquire(
             x=hitbox_start_x, 
             y=hitbox_y, 
             damage=self.damage, 
             owner=owner, 
             duration_ms=200, 
-            size=self.hitbox_size
+            size=self.hitbox_size,
+            clock=self.clock
         )
         
         return [hitbox]
@@ -70,8 +85,8 @@ class IcemanPunchSkill(Skill):
 class IcemanDashSkill(Skill):
     """기술 2: 얼음 돌진 (데미지 + 1.5초 스턴)"""
     def __init__(self, name: str, cooldown_ms: int):
-        img_path = "assets/characters/iceman/skill2.png"
-        super().__init__(name, cooldown_ms=cooldown_ms, img_path=img_path)
+        # 📢 이펙트 프레임은 아래에서 필요한 크기로만 로드합니다.
+        super().__init__(name, cooldown_ms=cooldown_ms)
         self.dash_distance = 250 # 돌진 거리
         self.dash_duration = 300 # ms
         self.stun_duration = 1500 # ms (1.5초)
@@ -80,17 +95,18 @@ class IcemanDashSkill(Skill):
         self.dash_speed = (self.dash_distance / self.dash_duration) * 1000 # 픽셀/초
         
         self.effect_frames = self._load_effect_frames()
+        self.effect_frames_flipped = self._load_effect_frames(flip=True)
 
-    def _load_effect_frames(self) -> List[pygame.Surface]:
+    def _load_effect_frames(self, flip: bool = False) -> List[pygame.Surface]:
         path = "assets/characters/iceman/skill2.png"
-        img = _safe_load_and_scale(path, (self.effect_size, self.effect_size))
+        img = _safe_load_and_scale(path, (self.effect_size, self.effect_size), flip=flip)
         return [img] if img else []
 
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, owner: str = "p1", **kwargs):
         if not self.ready(): return []
         if user.get("is_dashing", False): return []
         
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
 
         CHAR_SIZE = 200
         
@@ -109,8 +125,7 @@ class IcemanDashSkill(Skill):
 
         # 2. 캐릭터 상태 업데이트
         user["vx"] = self.dash_speed * direction # 픽셀/초
-        user["dash_end_time"] = pygame.time.get_ticks() + self.dash_duration
-        user["is_dashing"] = True 
+        world["status"].apply(user, "dash", self.dash_duration)
         if user_obj: 
             user_obj.start_dash(self.dash_duration)
         
@@ -124,13 +139,14 @@ class IcemanDashSkill(Skill):
 
         # 4. MeleeHitbox 생성: 300ms 후 소멸
         hitbox_size = 200 
-        hitbox = MeleeHitbox(
+        hitbox = MeleeHitbox.acquire(
             x=hitbox_x, 
             y=hitbox_y, 
             damage=self.damage, 
             owner=owner, 
             duration_ms=self.dash_duration, # 300ms
-            size=hitbox_size
+            size=hitbox_size,
+            clock=self.clock
         )
         hitbox.stuns_target = True
         hitbox.stun_duration_ms = self.stun_duration
@@ -142,16 +158,17 @@ class IcemanDashSkill(Skill):
         
         # 🎯 이펙트 이미지 좌우 반전
         if not is_facing_right:
-            frames_to_use = [pygame.transform.flip(f, True, False) for f in self.effect_frames if f is not None]
+            frames_to_use = self.effect_frames_flipped
 
-        dash_effect = AnimatedEffect(
+        dash_effect = AnimatedEffect.acquire(
             x=hitbox_x, 
             y=hitbox_y, 
             frames=frames_to_use, 
             frame_duration_ms=self.dash_duration, # 총 지속 시간 300ms
             owner=owner, 
             size=self.effect_size,
-            loops=1 # 300ms 후 반드시 소멸되도록 명시 (skills_base.py 로직과 연동)
+            loops=1, # 300ms 후 반드시 소멸되도록 명시 (skills_base.py 로직과 연동)
+            clock=self.clock
         )
         dash_effect.attached_to_char = owner 
 
@@ -196,25 +213,26 @@ class IcemanUltimateSkill(UltimateSkillBase):
         if not self.ready() or user.get("ultimate_gauge", 0) < self.ult_cost_percent: 
             return []
             
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         user["ultimate_gauge"] = max(0, user["ultimate_gauge"] - self.ult_cost_percent)
             
         GROUND_Y = world.get("GROUND_Y", 950)
         char_center_x = user["x"] + 100
         
         # 1단계 이펙트 (1초 지속)
-        ult1_effect = AnimatedEffect(
+        ult1_effect = AnimatedEffect.acquire(
             x=char_center_x - self.initial_effect_size / 2,
             y=GROUND_Y - self.initial_effect_size, 
             frames=self.ult1_frames,
             frame_duration_ms=self.ult1_duration, # 1초
             owner=owner,
             size=self.initial_effect_size,
-            loops=1 
+            loops=1,
+            clock=self.clock
         )
         
         skill_state["is_active"] = True
-        skill_state["start_time"] = pygame.time.get_ticks()
+        skill_state["start_time"] = self.clock.get_ticks()
         skill_state["ult2_activated"] = False 
         
         return [ult1_effect]
@@ -225,7 +243,7 @@ class IcemanUltimateSkill(UltimateSkillBase):
         if not skill_state.get("is_active"):
             return []
 
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         start_time = skill_state.get("start_time", 0)
         
         # 1단계 (1초)가 끝났고, 아직 2단계가 활성화되지 않았다면 2단계 시작
@@ -260,19 +278,30 @@ class IcemanUltimateSkill(UltimateSkillBase):
         _ = args
         _ = kwargs
         
-        ult2_effect = AnimatedEffect(
+        ult2_effect = IcemanFrostArea.acquire(
             x=x - self.final_effect_size / 2, # x를 중앙으로 정렬
             y=y - self.final_effect_size, # y를 바닥에 정렬
             frames=self.ult2_frames,
             frame_duration_ms=self.duration_ms - self.ult1_duration, # 3000ms
             owner=owner,
             size=self.final_effect_size,
-            loops=1 # 3초 후 소멸되도록 명시
+            loops=1, # 3초 후 소멸되도록 명시
+            clock=self.clock
         )
         # 🌟 2단계 기능 속성 부여
         ult2_effect.damage = self.damage 
-        ult2_effect.is_ultimate_area = True 
         ult2_effect.freeze_duration = self.freeze_duration 
         ult2_effect.hit_once_only = True # 광역 데미지/빙결은 한 번만 적용
+        # 📢 빙결된 캐릭터 위치에 생성할 이펙트 클래스 (gameplay가 아이스맨 모듈을 직접 import 하지 않도록)
+        ult2_effect.freeze_effect_class = IceBlock
         
-        return [ult2_effect]
\ No newline at end of file
+        return [ult2_effect]
+
+
+# 📢 스킬 레지스트리 등록 (아이스맨이 선택될 때 이 모듈이 import 됩니다)
+@register_character("iceman", runtime_images=RUNTIME_IMAGES)
+def create_iceman_skills() -> List[Skill]:
+    punch_skill = IcemanPunchSkill(name="iceman_punch", cooldown_ms=500)
+    dash_skill = IcemanDashSkill(name="iceman_dash", cooldown_ms=3000)
+    ultimate_skill = IcemanUltimateSkill(name="iceman_ultimate", cooldown_ms=180)
+    return [punch_skill, dash_skill, ultimate_skill]
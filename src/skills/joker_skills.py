@@ -5,6 +5,12 @@ from typing import List, Optional
 
 # skills_base에서 Projectile, AnimatedEffect 등을 임포트
 from .skills_base import Skill, UltimateSkillBase, Projectile, AnimatedEffect, _safe_load_and_scale
+from .skills_skills_loader import register_character
+# 📢 스킬 발동 중에 생성되는 이펙트 이미지 (맵 로딩 중 미리 로드/아틀라스 패킹 대상)
+RUNTIME_IMAGES = [
+    ("assets/characters/joker/ultimate.png", (100, 100)), # JokerGasCloud (gas_size_initial)
+]
+
 # --------------------------------------------------------------------------
 # 📢 조커 (Joker) 스킬 투사체/이펙트 정의
 # --------------------------------------------------------------------------
@@ -14,8 +20,8 @@ class JokerSpinningGun(Projectile):
     (참고용: 기술 1이 Projectile로 변경되어 현재 사용되지 않음)
     원래 조커의 기술 1: 회전하며 날아가는 총
     """
-    def __init__(self, x: float, y: float, vx: float, img: Optional[pygame.Surface], damage: int, owner: str, size: int):
-        super().__init__(x, y, vx, img, damage, owner, size) 
+    def __init__(self, x: float, y: float, vx: float, img: Optional[pygame.Surface], damage: int, owner: str, size: int, clock=None):
+        super().__init__(x, y, vx, img, damage, owner, size, clock=clock) 
         self.base_img = img 
         self.current_angle = 0
         self.rotation_speed = 15
@@ -34,9 +40,11 @@ class JokerSpinningGun(Projectile):
 
 class JokerConfusionBullet(Projectile):
     """조커의 기술 2: 혼란 상태를 유발하는 총알"""
-    def __init__(self, x: float, y: float, vx: float, img: Optional[pygame.Surface], owner: str, size: int, confusion_duration: int):
+    COLLISION = "confuse"
+
+    def __init__(self, x: float, y: float, vx: float, img: Optional[pygame.Surface], owner: str, size: int, confusion_duration: int, clock=None):
         # 혼란 총알은 데미지가 0이어야 함
-        super().__init__(x, y, vx, img, damage=0, owner=owner, size=size) 
+        super().__init__(x, y, vx, img, damage=0, owner=owner, size=size, clock=clock) 
         self.causes_confusion = True
         self.confusion_duration_ms = confusion_duration
         
@@ -51,7 +59,9 @@ class JokerConfusionBullet(Projectile):
 
 class JokerGasCloud(AnimatedEffect):
     """조커의 궁극기: 가스 구름 (지속 피해 DoT + 크기 변화)"""
-    def __init__(self, x: float, y: float, initial_size: int, final_size: int, damage: int, owner: str, duration_ms: int, damage_interval_ms: int):
+    COLLISION = "poison_cloud"
+
+    def __init__(self, x: float, y: float, initial_size: int, final_size: int, damage: int, owner: str, duration_ms: int, damage_interval_ms: int, clock=None):
         
         gas_path = "assets/characters/joker/ultimate.png"
         
@@ -72,7 +82,8 @@ class JokerGasCloud(AnimatedEffect):
             frame_duration_ms=duration_ms, 
             owner=owner, 
             size=initial_size,
-            scale_factor=scale_rate 
+            scale_factor=scale_rate,
+            clock=clock
         ) 
         
         # self.frames 대신 지역 변수 frames_list를 사용하여 original_frame을 설정합니다.
@@ -85,8 +96,8 @@ class JokerGasCloud(AnimatedEffect):
         self.damage = damage
         self.is_gas_cloud = True 
         self.damage_interval = damage_interval_ms
-        self.last_damage_time = pygame.time.get_ticks()
-        self.start_time = pygame.time.get_ticks()
+        self.last_damage_time = self.clock.get_ticks()
+        self.start_time = self.clock.get_ticks()
         self.duration_ms = duration_ms 
         
         # 충돌 박스 위치 조정을 위한 초기값 저장
@@ -94,7 +105,7 @@ class JokerGasCloud(AnimatedEffect):
         self.GROUND_Y_EST = y + initial_size 
 
     def update(self, world: dict):
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         elapsed_time = current_time - self.start_time
         
         if elapsed_time > self.duration_ms:
@@ -109,22 +120,24 @@ class JokerGasCloud(AnimatedEffect):
         self.x = self.initial_x - (new_size - self.initial_size) / 2
         self.y = self.GROUND_Y_EST - new_size
         
-        # 2. 이미지 리스케일링 (original_frame이 로드되었을 경우)
-        if self.original_frame:
-            try:
-                self.img = pygame.transform.scale(self.original_frame, (new_size, new_size))
-            except pygame.error:
-                pass 
-            
-        # 3. 가스 구름의 충돌 박스 크기 업데이트 
+        # 2. 가스 구름의 충돌 박스 크기 업데이트 
+        # (📢 이미지 리스케일링은 draw()에서 크기가 바뀐 경우에만 합니다.)
         self.size = new_size 
 
 
     def draw(self, screen: pygame.Surface):
+        # 이미지 리스케일링 (original_frame이 로드되었을 경우)
+        if self.original_frame and self._scaled_key != self.size:
+            try:
+                self.img = pygame.transform.scale(self.original_frame, (self.size, self.size))
+                self._scaled_key = self.size
+            except pygame.error:
+                pass 
+
         if self.active and self.img:
             screen.blit(self.img, (int(self.x), int(self.y)))
         # 📢 디버깅용: 이미지가 로드되지 않은 경우 사각형으로 위치 확인
-        elif self.active and pygame.time.get_ticks() % 500 < 250:
+        elif self.active and self.clock.get_ticks() % 500 < 250:
             pygame.draw.rect(screen, (255, 255, 255), (int(self.x), int(self.y), self.size, self.size), 2)
 
 
@@ -139,19 +152,18 @@ class JokerGunTossSkill(Skill):
     """
     def __init__(self, name: str, cooldown_ms: int): 
         img_path = "assets/characters/joker/skill1.png"
-        super().__init__(name, cooldown_ms=cooldown_ms, img_path=img_path) 
+        super().__init__(name, cooldown_ms=cooldown_ms) 
         # 이선생과 동일하게 size=200, damage=3, vx=20으로 맞춤
         self.proj_size = 70 
         self.damage = 6
         self.vx = 20
         
         # 이미지는 투사체 생성 시점에 Projectile에 전달
-        if self.img:
-            self.img = pygame.transform.scale(self.img, (self.proj_size, self.proj_size))
+        self.img = _safe_load_and_scale(img_path, (self.proj_size, self.proj_size))
 
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, owner: str = "p1", **kwargs):
         if not self.ready(): return []
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         if user_obj: user_obj.start_attack_animation() 
 
         CHAR_SIZE = 200
@@ -164,17 +176,18 @@ class JokerGunTossSkill(Skill):
         
         # 💡 궁극기 버프 확인 및 데미지 적용
         final_damage = self.damage
-        if user.get("skill1_damage_boost_end_time", 0) > pygame.time.get_ticks():
+        if user.get("skill1_damage_boost_end_time", 0) > self.clock.get_ticks():
             final_damage *= user.get("skill1_damage_multiplier", 1.0) # 기본값 1.0
         
-        proj = Projectile(
+        proj = Projectile.acquire(
             x=spawn_x, 
             y=spawn_y, 
             vx=self.vx * direction, 
             img=self.img, 
             damage=int(final_damage), # 데미지 적용
             owner=owner, 
-            size=self.proj_size
+            size=self.proj_size,
+            clock=self.clock
         )
         
         projectiles = world.setdefault("projectiles", [])
@@ -187,17 +200,17 @@ class JokerConfusionBulletSkill(Skill):
     """조커의 기술 2: 혼란 총알 발사 (데미지 없음, 혼란 적용)"""
     def __init__(self, name: str, cooldown_ms: int):
         img_path = "assets/characters/joker/skill2.png"
-        super().__init__(name, cooldown_ms=cooldown_ms, img_path=img_path) 
+        super().__init__(name, cooldown_ms=cooldown_ms) 
         self.proj_size = 30
         self.vx = 25
         self.confusion_duration = 3000 
 
-        if self.img:
-            self.img = pygame.transform.scale(self.img, (self.proj_size, self.proj_size))
+        self.img = _safe_load_and_scale(img_path, (self.proj_size, self.proj_size))
+        self.img_flipped = _safe_load_and_scale(img_path, (self.proj_size, self.proj_size), flip=True)
 
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, owner: str = "p1", **kwargs):
         if not self.ready(): return []
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         if user_obj: user_obj.start_attack_animation() 
 
         CHAR_SIZE = 200
@@ -209,16 +222,17 @@ class JokerConfusionBulletSkill(Skill):
         
         proj_img = self.img
         if proj_img is not None and not is_facing_right: 
-            proj_img = pygame.transform.flip(proj_img, True, False)
+            proj_img = self.img_flipped
         
-        bullet = JokerConfusionBullet(
+        bullet = JokerConfusionBullet.acquire(
             x=spawn_x, 
             y=spawn_y, 
             vx=self.vx * direction, 
             img=proj_img, 
             owner=owner, 
             size=self.proj_size,
-            confusion_duration=self.confusion_duration
+            confusion_duration=self.confusion_duration,
+            clock=self.clock
         )
         
         projectiles = world.setdefault("projectiles", [])
@@ -256,19 +270,18 @@ class JokerUltimateGasSkill(UltimateSkillBase):
             return [] 
         
         # 2. 쿨다운 리셋 및 게이지 소모
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         user["ultimate_gauge"] = max(0, user["ultimate_gauge"] - self.ult_cost_percent)
             
         # 3. 궁극기 버프 적용 (6초)
-        current_time = pygame.time.get_ticks()
-        end_time = current_time + self.boost_duration
+        current_time = self.clock.get_ticks()
         
         # 🚀 이동 속도 버프
-        user["speed_boost_end_time"] = end_time
+        world["status"].apply(user, "speed_boost", self.boost_duration, current_time)
         user["speed_multiplier"] = self.speed_multiplier 
         
         # 🔫 기술 1 데미지 버프
-        user["skill1_damage_boost_end_time"] = end_time
+        world["status"].apply(user, "damage_boost", self.boost_duration, current_time)
         user["skill1_damage_multiplier"] = self.skill1_damage_multiplier
         
         # 4. 가스 구름 투사체 생성 (지속 피해 효과)
@@ -278,7 +291,7 @@ class JokerUltimateGasSkill(UltimateSkillBase):
         char_center_x = user["x"] + 100
         gas_cloud_y = GROUND_Y - self.gas_size_initial 
         
-        gas_cloud = JokerGasCloud(
+        gas_cloud = JokerGasCloud.acquire(
             x=char_center_x - self.gas_size_initial / 2, 
             y=gas_cloud_y, 
             initial_size=self.gas_size_initial,
@@ -286,11 +299,21 @@ class JokerUltimateGasSkill(UltimateSkillBase):
             damage=self.gas_dot_damage, 
             owner=owner,
             duration_ms=self.gas_duration,
-            damage_interval_ms=self.gas_damage_interval
+            damage_interval_ms=self.gas_damage_interval,
+            clock=self.clock
         )
         
         new_projectiles.append(gas_cloud)
         projectiles = world.setdefault("projectiles", [])
         projectiles.append(gas_cloud)
         
-        return new_projectiles
\ No newline at end of file
+        return new_projectiles
+
+
+# 📢 스킬 레지스트리 등록 (조커가 선택될 때 이 모듈이 import 됩니다)
+@register_character("joker", runtime_images=RUNTIME_IMAGES)
+def create_joker_skills() -> List[Skill]:
+    gun_toss_skill = JokerGunTossSkill(name="joker_gun_toss", cooldown_ms=1500) 
+    confusion_bullet_skill = JokerConfusionBulletSkill(name="joker_confusion_bullet", cooldown_ms=5000) 
+    ultimate_gas_skill = JokerUltimateGasSkill(name="joker_ultimate_gas", cooldown_ms=180) 
+    return [gun_toss_skill, confusion_bullet_skill, ultimate_gas_skill]
@@ -2,21 +2,21 @@
 
 import pygame
 from .skills_base import Skill, UltimateSkillBase, Projectile, MeleeHitbox, AnimatedEffect, UltimateBeltEffect, _safe_load_and_scale
+from .skills_skills_loader import register_character
 from typing import List
 
 # 1. 기술 1: 생선 소환 (투사체)
 class LeesaengseonFishSkill(Skill):
     def __init__(self, name: str, cooldown_ms: int):
         img_path = "assets/characters/leesaengseon/skill1.png"
-        super().__init__(name, cooldown_ms=cooldown_ms, img_path=img_path)
+        super().__init__(name, cooldown_ms=cooldown_ms)
         self.proj_size = 100
         self.damage = 3
-        if self.img:
-            self.img = pygame.transform.scale(self.img, (self.proj_size, self.proj_size))
+        self.img = _safe_load_and_scale(img_path, (self.proj_size, self.proj_size))
 
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, owner: str = "p1", **kwargs):
         if not self.ready(): return []
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         if user_obj: user_obj.start_attack_animation() 
 
         CHAR_SIZE = 200
@@ -26,7 +26,7 @@ class LeesaengseonFishSkill(Skill):
         spawn_x = user["x"] + (CHAR_SIZE // 2 + 50 * direction) - self.proj_size // 2
         spawn_y = user["y"] + CHAR_SIZE // 2 - self.proj_size // 2
         
-        proj = Projectile(spawn_x, spawn_y, vx, self.img, damage=self.damage, owner=owner, size=self.proj_size)
+        proj = Projectile.acquire(spawn_x, spawn_y, vx, self.img, damage=self.damage, owner=owner, size=self.proj_size, clock=self.clock)
         projectiles = world.setdefault("projectiles", [])
         projectiles.append(proj)
         
@@ -36,7 +36,7 @@ class LeesaengseonFishSkill(Skill):
 class LeesaengseonBombSkill(Skill):
     def __init__(self, name: str, cooldown_ms: int):
         img_path = "assets/characters/leesaengseon/skill2.png"
-        super().__init__(name, cooldown_ms=cooldown_ms, img_path=img_path)
+        super().__init__(name, cooldown_ms=cooldown_ms)
         self.proj_size = 140
         self.damage = 7
         self.stun_duration_ms = 1000 
@@ -45,15 +45,14 @@ class LeesaengseonBombSkill(Skill):
         self.explosion_size_final = 200 
         self.explosion_duration = 500 
         
-        if self.img:
-            self.img = pygame.transform.scale(self.img, (self.proj_size, self.proj_size))
+        self.img = _safe_load_and_scale(img_path, (self.proj_size, self.proj_size))
         
         self.effect_img = _safe_load_and_scale("assets/characters/leesaengseon/skill2_effect.png", 
                                                (self.explosion_size_final, self.explosion_size_final))
 
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, owner: str = "p1", **kwargs):
         if not self.ready(): return []
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         if user_obj: user_obj.start_attack_animation() 
 
         CHAR_SIZE = 200
@@ -66,11 +65,13 @@ class LeesaengseonBombSkill(Skill):
         spawn_x = user["x"] + (CHAR_SIZE // 2 + 50 * direction) - self.proj_size // 2
         spawn_y = user["y"] + CHAR_SIZE // 2 - self.proj_size // 2
         
-        bomb = Projectile(spawn_x, spawn_y, vx, self.img, 
+        bomb = Projectile.acquire(spawn_x, spawn_y, vx, self.img, 
                               damage=self.damage, owner=owner, size=self.proj_size, 
-                              vy=vy, gravity=1) 
+                              vy=vy, gravity=1, clock=self.clock) 
                               
         bomb.stuns_target = True
+        # 📢 바닥/캐릭터 충돌 시 gameplay가 이 스킬의 create_explosion_effect를 호출합니다.
+        bomb.collision_skill_instance = self
         
         projectiles = world.setdefault("projectiles", [])
         projectiles.append(bomb)
@@ -83,23 +84,25 @@ class LeesaengseonBombSkill(Skill):
         
         frames = [self.effect_img or pygame.Surface((self.explosion_size_final, self.explosion_size_final), pygame.SRCALPHA)]
         
-        effect = AnimatedEffect(
+        effect = AnimatedEffect.acquire(
             x=x - self.explosion_size_initial / 2, 
             y=y - self.explosion_size_initial / 2,
             frames=frames,
             frame_duration_ms=self.explosion_duration, 
             owner=owner,
             size=self.explosion_size_initial,
-            scale_factor=scale_factor 
+            scale_factor=scale_factor,
+            clock=self.clock
         )
         
-        hitbox = MeleeHitbox(
+        hitbox = MeleeHitbox.acquire(
             x=x - self.explosion_size_final / 2, 
             y=y - self.explosion_size_final / 2,
             damage=self.damage,
             owner=owner,
             duration_ms=200, 
-            size=self.explosion_size_final 
+            size=self.explosion_size_final,
+            clock=self.clock
         )
         hitbox.stuns_target = True 
 
@@ -109,7 +112,7 @@ class LeesaengseonBombSkill(Skill):
 class LeesaengseonUltimateSkill(UltimateSkillBase):
     def __init__(self, name: str, cooldown_ms: int):
         img_path = "assets/characters/leesaengseon/ultimate.png"
-        super().__init__(name, cooldown_ms=cooldown_ms, ult_cost=40, img_path=img_path) 
+        super().__init__(name, cooldown_ms=cooldown_ms, ult_cost=40) 
         self.duration_ms = 4000 
         self.belt_height = 240 
         self.belt_speed = 10 
@@ -127,7 +130,7 @@ class LeesaengseonUltimateSkill(UltimateSkillBase):
             return []
             
         # 3. 쿨다운 리셋 및 게이지 소모
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         user["ultimate_gauge"] = max(0, user["ultimate_gauge"] - self.ult_cost_percent)
             
         # 4. 궁극기 효과 발동
@@ -135,7 +138,7 @@ class LeesaengseonUltimateSkill(UltimateSkillBase):
         screen_w = world.get("screen_width", 1920)
         new_projectiles = []
         
-        belt = UltimateBeltEffect(
+        belt = UltimateBeltEffect.acquire(
             x=-screen_w, 
             y=GROUND_Y - self.belt_height, 
             vx=self.belt_speed, 
@@ -144,10 +147,20 @@ class LeesaengseonUltimateSkill(UltimateSkillBase):
             owner=owner, 
             size=self.belt_height, 
             duration_ms=self.duration_ms,
-            screen_w=screen_w
+            screen_w=screen_w,
+            clock=self.clock
         )
         projectiles = world.setdefault("projectiles", [])
         projectiles.append(belt)
         new_projectiles.append(belt)
         
-        return new_projectiles
\ No newline at end of file
+        return new_projectiles
+
+
+# 📢 스킬 레지스트리 등록 (이생선이 선택될 때 이 모듈이 import 됩니다)
+@register_character("leesaengseon")
+def create_leesaengseon_skills() -> List[Skill]:
+    fish_skill = LeesaengseonFishSkill(name="leesaengseon_fish", cooldown_ms=600) 
+    bomb_skill = LeesaengseonBombSkill(name="leesaengseon_bomb", cooldown_ms=3000) 
+    ultimate_skill = LeesaengseonUltimateSkill(name="leesaengseon_ultimate", cooldown_ms=150) 
+    return [fish_skill, bomb_skill, ultimate_skill]
@@ -1,41 +1,41 @@
 # skills/skills_base.py
 
 import pygame
-import os
 import math
 from typing import List, Optional, Dict, Any
 
-# 헬퍼 함수: 이미지 로드 및 크기 조정
-def _safe_load_and_scale(path, size):
-    if not path or not os.path.exists(path):
-        return None
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        img = pygame.transform.scale(img, size)
-        return img
-    except Exception:
-        # 파일이 없을 때 디버깅을 위해 에러 메시지 주석 처리
-        # print(f"Error loading and scaling image at: {path}")
+from assets import load_image
+from sim_clock import WALL_CLOCK
+from .object_pool import get_pool
+from .collision import bind_collision
+
+# 헬퍼 함수: 이미지 로드 및 크기 조정 (📢 프로세스 전역 레지스트리를 통해 한 번만 디코딩)
+def _safe_load_and_scale(path, size, flip=False):
+    if not path:
         return None
+    return load_image(path, size, flip=flip)
 
 # --- 기본 클래스 ---
 
 class Skill:
     """모든 스킬의 기본 클래스"""
+
+    # 📢 경기 스냅샷(snapshot.py)이 저장/복원하는 속성. 경기 중에 값이 바뀌는 속성을 추가한 스킬은 여기에 더하세요.
+    # (궁극기 단계처럼 경기마다 다른 상태는 skill_state 딕셔너리에 두면 따로 등록하지 않아도 저장됩니다)
+    SNAPSHOT_ATTRS = ("last_used",)
+
     def __init__(self, name: str, cooldown_ms: int, img_path: Optional[str] = None):
         self.name = name
         self.cooldown = cooldown_ms
-        self.last_used = 0
+        self.last_used = None # None: 아직 사용하지 않음 (시뮬레이션 시계는 경기마다 0에서 시작)
+        self.clock = WALL_CLOCK # 📢 gameplay가 경기의 시뮬레이션 시계로 교체합니다.
         self.img = None
         if img_path:
-            try:
-                self.img = pygame.image.load(img_path).convert_alpha()
-            except Exception:
-                self.img = None
+            self.img = load_image(img_path)
 
     def ready(self) -> bool:
         """스킬이 쿨다운이 끝나서 사용할 준비가 되었는지 확인"""
-        return pygame.time.get_ticks() - self.last_used >= self.cooldown
+        return self.last_used is None or self.clock.get_ticks() - self.last_used >= self.cooldown
 
     def activate(self, user: dict, target: dict, skill_state: dict, world: dict, user_obj=None, **kwargs) -> List:
         """
@@ -45,7 +45,7 @@ class Skill:
         if not self.ready():
             return []
             
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         
         # Character 객체의 애니메이션을 시작합니다. (Character 클래스는 외부에서 import)
         if user_obj:
@@ -81,9 +81,25 @@ class UltimateSkillBase(Skill):
 
 class Projectile:
     """발사체 객체의 기본 클래스 (gameplay.py에서 객체로 인식됨)"""
-    def __init__(self, x: float, y: float, vx: float, img: Optional[pygame.Surface], damage: int = 10, owner: str = "p1", size: int = 80, vy: float = 0, gravity: float = 0):
+
+    # 📢 캐릭터와 겹쳤을 때의 동작 이름 (skills/collision.py의 COLLISION_TABLE로 클래스마다 처리 함수가 연결됩니다)
+    # "projectile": 피해를 주고 사라짐 (포물선 투사체는 피해 대신 폭발), "persistent": 피해를 주고 계속 남음,
+    # "confuse": 혼란, "poison_cloud": 독 구름, "freeze_area": 광역 피해 + 빙결, "none": 충돌 무시
+    COLLISION = "projectile"
+
+    # 📢 생성 후에 스킬/경기 루프가 붙이는 속성. 풀에 반납될 때 지워서 다음 사용자에게 남지 않게 합니다.
+    # (경기 루프가 hasattr로 검사하는 속성이 있으므로 기본값으로 덮어쓰지 않고 삭제합니다.)
+    POOL_TRANSIENT_ATTRS = ("source_skill", "collision_skill_instance", "attached_to_char", "hit_already",
+                            "causes_poison", "poison_duration", "poison_dps", "stun_duration_ms",
+                            "freeze_duration", "freeze_effect_class",
+                            "collision_effect_class", "collision_effect_size")
+
+    def __init__(self, x: float, y: float, vx: float, img: Optional[pygame.Surface], damage: int = 10, owner: str = "p1", size: int = 80, vy: float = 0, gravity: float = 0, clock=None):
+        self.clock = clock or WALL_CLOCK # 수명/프레임 계산에 사용하는 시계
         self.x = x
         self.y = y
+        self.prev_x = x # 직전 틱 위치 (렌더링 보간용, 경기 루프가 매 틱 갱신)
+        self.prev_y = y
         self.vx = vx
         self.vy = vy        # 포물선 운동을 위한 Y축 속도
         self.gravity = gravity # 포물선 운동을 위한 중력값
@@ -96,6 +112,27 @@ class Projectile:
         self.stuns_target = False 
         self.causes_confusion = False 
         self.hit_once_only = False # 투사체가 충돌 시 한 번만 타격하고 비활성화될지 여부
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        bind_collision(cls) # 클래스가 정의될 때 충돌 처리 함수를 연결
+
+    # --- 📢 오브젝트 풀 (skills/object_pool.py) ---
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        """반납된 같은 클래스의 객체를 재사용해 만듭니다. (인자는 생성자와 동일)"""
+        return get_pool(cls).acquire(*args, **kwargs)
+
+    def release(self) -> None:
+        """경기 루프가 비활성화된 객체를 목록에서 뺄 때 호출합니다. (이후 이 객체를 참조하면 안 됩니다)"""
+        get_pool(type(self)).release(self)
+
+    def on_release(self) -> None:
+        """풀 반납 훅: 생성자가 다시 채우지 않는 속성을 지웁니다. 속성을 붙이는 새 스킬은 POOL_TRANSIENT_ATTRS에 추가하세요."""
+        for name in self.POOL_TRANSIENT_ATTRS:
+            # 없는 속성을 delattr 하면(AttributeError) CPython이 인스턴스 __dict__를 만들어 이후 속성 접근이 느려지므로 먼저 확인합니다.
+            if hasattr(self, name):
+                delattr(self, name)
         
     def update(self, world: dict):
         self.vy += self.gravity # 중력 적용
@@ -113,18 +150,23 @@ class Projectile:
             screen.blit(self.img, (int(self.x), int(self.y)))
 
 
+bind_collision(Projectile)
+
+
 class MeleeHitbox(Projectile):
     """근접 공격 판정을 위한 발사체 (수명 제한)"""
-    def __init__(self, x, y, damage, owner, duration_ms=200, size=120):
-        super().__init__(x, y, 0, None, damage, owner, size) 
-        self.life_timer = pygame.time.get_ticks() + duration_ms
+    COLLISION = "persistent"
+
+    def __init__(self, x, y, damage, owner, duration_ms=200, size=120, clock=None):
+        super().__init__(x, y, 0, None, damage, owner, size, clock=clock) 
+        self.life_timer = self.clock.get_ticks() + duration_ms
         self.stuns_target = False 
         self.stun_duration_ms = 0
         self.hit_already = False 
         self.attached_to_char = None # 돌진처럼 캐릭터에 붙어서 이동하는지 여부 (캐릭터 owner의 이름)
         
     def update(self, world: dict):
-        if pygame.time.get_ticks() > self.life_timer:
+        if self.clock.get_ticks() > self.life_timer:
             self.active = False
             
         # 캐릭터에 붙어있는 경우, 캐릭터의 위치를 따라갑니다.
@@ -138,19 +180,20 @@ class AnimatedEffect(Projectile):
     """
     재사용 가능한 애니메이션 이펙트 클래스.
     """
-    def __init__(self, x, y, frames: List[pygame.Surface], frame_duration_ms: int, owner: str, size: int, scale_factor: float = 0.0, loops: int = 1):
-        super().__init__(x, y, 0, frames[0] if frames else None, damage=0, owner=owner, size=size) 
+    def __init__(self, x, y, frames: List[pygame.Surface], frame_duration_ms: int, owner: str, size: int, scale_factor: float = 0.0, loops: int = 1, clock=None):
+        super().__init__(x, y, 0, frames[0] if frames else None, damage=0, owner=owner, size=size, clock=clock) 
         
         self.base_frames = frames 
         self.frame_duration = frame_duration_ms
         self.num_frames = len(frames)
         self.current_frame_index = 0
-        self.last_frame_time = pygame.time.get_ticks()
-        self.start_time = pygame.time.get_ticks()
+        self.last_frame_time = self.clock.get_ticks()
+        self.start_time = self.clock.get_ticks()
 
         self.scale_factor = scale_factor
         self.initial_size = size
         self.current_size = size
+        self._scaled_key = None # 📢 마지막으로 스케일한 (프레임, 크기). 스케일은 그릴 때만 수행합니다.
         
         self.loops_left = loops
         
@@ -158,7 +201,8 @@ class AnimatedEffect(Projectile):
         self.total_duration_one_loop = self.frame_duration if self.num_frames <= 1 else (self.num_frames * self.frame_duration)
         self.end_time = self.start_time + self.total_duration_one_loop * self.loops_left # 총 수명 계산
         
-        if self.img:
+        # 📢 이미 같은 크기로 로드된 프레임은 다시 스케일하지 않습니다. (크기 조정 애니메이션은 draw()에서 스케일)
+        if self.img and self.scale_factor == 0 and self.img.get_size() != (self.initial_size, self.initial_size):
             try:
                 self.img = pygame.transform.scale(self.img, (self.initial_size, self.initial_size))
             except Exception:
@@ -166,7 +210,7 @@ class AnimatedEffect(Projectile):
 
 
     def update(self, world: dict):
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         
         # 1. 🌟 수명 종료 체크 (가장 확실한 소멸 로직)
         if current_time > self.end_time:
@@ -202,20 +246,29 @@ class AnimatedEffect(Projectile):
             if self.current_size <= 0: 
                    self.current_size = 1
             
-            if self.base_frames and self.current_frame_index < len(self.base_frames):
-                current_base_img = self.base_frames[self.current_frame_index]
-                try:
-                    new_size = max(1, self.current_size)
-                    self.img = pygame.transform.scale(current_base_img, (new_size, new_size))
-                except Exception:
-                   pass
+            # 📢 이미지 스케일은 draw()에서 합니다. (헤드리스 시뮬레이션에서는 그리지 않으므로 비용 없음)
             
             screen_w = world.get("screen_width", 1920)
             if self.x < -self.current_size or self.x > screen_w + self.current_size:
                    self.active = False
 
 
+    def _rescale(self):
+        """크기 조정 애니메이션의 현재 크기로 이미지를 스케일합니다. (크기/프레임이 바뀐 경우에만)"""
+        if self.scale_factor == 0 or not self.base_frames or self.current_frame_index >= len(self.base_frames):
+            return
+        new_size = max(1, self.current_size)
+        key = (self.current_frame_index, new_size)
+        if key == self._scaled_key:
+            return
+        try:
+            self.img = pygame.transform.scale(self.base_frames[self.current_frame_index], (new_size, new_size))
+            self._scaled_key = key
+        except Exception:
+            pass
+
     def draw(self, screen: pygame.Surface):
+        self._rescale()
         if self.img:
             draw_x = int(self.x - (self.current_size - self.initial_size) / 2)
             draw_y = int(self.y - (self.current_size - self.initial_size) / 2)
@@ -224,15 +277,17 @@ class AnimatedEffect(Projectile):
 # 이생선 궁극기를 위해 이펙트 클래스를 베이스 파일에 유지
 class UltimateBeltEffect(Projectile):
     # ... (기존 로직 유지) ...
-    def __init__(self, x, y, vx, img, damage, owner, size, duration_ms, screen_w):
-        super().__init__(x, y, vx, img, damage, owner, size, vy=0, gravity=0)
-        self.start_time = pygame.time.get_ticks()
+    COLLISION = "persistent"
+
+    def __init__(self, x, y, vx, img, damage, owner, size, duration_ms, screen_w, clock=None):
+        super().__init__(x, y, vx, img, damage, owner, size, vy=0, gravity=0, clock=clock)
+        self.start_time = self.clock.get_ticks()
         self.end_time = self.start_time + duration_ms
         self.screen_w = screen_w
         self.proj_width = screen_w
 
     def update(self, world: dict):
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         if current_time > self.end_time:
             self.active = False
             return
@@ -1,49 +1,63 @@
-from typing import List
-# 각 캐릭터별 스킬 클래스를 임포트합니다.
-from .haegol_skills import HaegolSwingSkill, HaegolBoneSkill, HaegolUltimateSkill
-from .leesaengseon_skills import LeesaengseonFishSkill, LeesaengseonBombSkill, LeesaengseonUltimateSkill
-from .joker_skills import JokerGunTossSkill, JokerConfusionBulletSkill, JokerUltimateGasSkill
-# 🧊 아이스맨 스킬 임포트
-from .iceman_skills import IcemanPunchSkill, IcemanDashSkill, IcemanUltimateSkill
-# .witch_skills 임포트 시 StaffStrikeSkill을 포함하여 임포트합니다.
-from .witch_skills import HealPotionSkill, PoisonPotionUltimate, StaffStrikeSkill 
+import importlib
+from typing import Callable, Dict, List, Optional, Tuple
 from .skills_base import Skill # 타입 힌트용
 
+# 📢 캐릭터 -> 스킬 레지스트리
+# 각 캐릭터의 스킬 모듈은 그 캐릭터가 처음 선택될 때만 import 되며,
+# 모듈 안에서 @register_character(...) 로 자신의 스킬 팩토리를 등록합니다.
+# 모듈 이름이 "skills.<codename>_skills" 규칙을 따르면 로더를 수정하지 않고 새 캐릭터를 추가할 수 있습니다.
+SKILL_MODULE_TEMPLATE = "skills.{codename}_skills"
+
+# 규칙을 따르지 않는 모듈 이름은 register_skill_module()로 지정합니다.
+_skill_modules: Dict[str, str] = {}
+
+# codename -> [skill1, skill2, ultimate]를 새로 만드는 팩토리
+_skill_factories: Dict[str, Callable[[], List[Skill]]] = {}
+
+# codename -> 스킬 발동 중에 생성되는 이펙트 이미지 (path, size) 목록
+_runtime_images: Dict[str, List[Tuple[str, Tuple[int, int]]]] = {}
+
+
+def register_skill_module(codename: str, module_name: str) -> None:
+    """codename의 스킬 모듈 이름을 지정합니다. (기본 규칙: skills.<codename>_skills)"""
+    _skill_modules[codename] = module_name
+
+
+def register_character(codename: str, runtime_images: Optional[List[Tuple[str, Tuple[int, int]]]] = None):
+    """스킬 모듈에서 스킬 팩토리 함수를 등록하는 데코레이터"""
+    def decorator(factory: Callable[[], List[Skill]]):
+        _skill_factories[codename] = factory
+        _runtime_images[codename] = list(runtime_images or [])
+        return factory
+    return decorator
+
+
+def _ensure_loaded(codename: Optional[str]) -> bool:
+    """codename의 스킬 모듈을 필요할 때 한 번만 import 합니다."""
+    if not codename:
+        return False
+    if codename in _skill_factories:
+        return True
+    module_name = _skill_modules.get(codename, SKILL_MODULE_TEMPLATE.format(codename=codename))
+    try:
+        importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        # 다른 모듈이 없어서 실패한 경우는 숨기지 않습니다.
+        if e.name != module_name:
+            raise
+        return False
+    return codename in _skill_factories
+
+
 def get_skills_for_character(codename: str) -> List[Skill]:
     """캐릭터 코드명에 따른 스킬 객체 리스트 [skill1, skill2, ultimate] 반환"""
-    if codename == "haegol":
-        swing_skill = HaegolSwingSkill(name="haegol_swing", cooldown_ms=500) 
-        bone_skill = HaegolBoneSkill(name="haegol_bone", cooldown_ms=1000) 
-        ultimate_skill = HaegolUltimateSkill(name="haegol_ultimate", cooldown_ms=100) 
-        return [swing_skill, bone_skill, ultimate_skill]
-        
-    elif codename == "leesaengseon":
-        fish_skill = LeesaengseonFishSkill(name="leesaengseon_fish", cooldown_ms=600) 
-        bomb_skill = LeesaengseonBombSkill(name="leesaengseon_bomb", cooldown_ms=3000) 
-        ultimate_skill = LeesaengseonUltimateSkill(name="leesaengseon_ultimate", cooldown_ms=150) 
-        return [fish_skill, bomb_skill, ultimate_skill]
-        
-    elif codename == "joker":
-        gun_toss_skill = JokerGunTossSkill(name="joker_gun_toss", cooldown_ms=1500) 
-        confusion_bullet_skill = JokerConfusionBulletSkill(name="joker_confusion_bullet", cooldown_ms=5000) 
-        ultimate_gas_skill = JokerUltimateGasSkill(name="joker_ultimate_gas", cooldown_ms=180) 
-        return [gun_toss_skill, confusion_bullet_skill, ultimate_gas_skill]
-    
-    # 🧊 Iceman 스킬 추가
-    elif codename == "iceman":
-        punch_skill = IcemanPunchSkill(name="iceman_punch", cooldown_ms=500)
-        dash_skill = IcemanDashSkill(name="iceman_dash", cooldown_ms=3000)
-        ultimate_skill = IcemanUltimateSkill(name="iceman_ultimate", cooldown_ms=180)
-        return [punch_skill, dash_skill, ultimate_skill]
-    
-    elif codename == "witch":
-        # HealPotionSkill, StaffStrikeSkill, PoisonPotionUltimate는
-        # __init__에 인자를 받지 않도록 수정했으므로, 인자 없이 호출합니다.
-        heal_potion_skill = HealPotionSkill() 
-        staff_strike_skill = StaffStrikeSkill() 
-        poison_potion_ultimate = PoisonPotionUltimate() 
-        
-        # 활성화된 세 가지 스킬을 모두 반환합니다.
-        return [heal_potion_skill, staff_strike_skill, poison_potion_ultimate]
-        
-    return []
\ No newline at end of file
+    if not _ensure_loaded(codename):
+        return []
+    return _skill_factories[codename]()
+
+
+def get_runtime_images_for_character(codename: str) -> List[Tuple[str, Tuple[int, int]]]:
+    """스킬 객체 생성 시점이 아니라 발동 중에 로드되는 (path, size) 목록을 반환합니다."""
+    if not _ensure_loaded(codename):
+        return []
+    return list(_runtime_images[codename])
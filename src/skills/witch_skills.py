@@ -1,20 +1,28 @@
 import pygame
 import os
 from typing import List, Dict, Any
+from combat_events import HEAL
 
 # AnimatedEffect, Projectile, MeleeHitbox, UltimateSkillBase 등을 사용하기 위해 skills_base에서 임포트
 # (skills_base.py 파일이 프로젝트 루트에 있다고 가정)
 # 만약 skills_base가 다른 위치에 있다면 from .skills_base 대신 경로를 수정해야 합니다.
 from .skills_base import Skill, UltimateSkillBase, Projectile, MeleeHitbox, AnimatedEffect, _safe_load_and_scale 
+from .skills_skills_loader import register_character
 
 ASSET_PATH = os.path.join("assets", "characters", "witch")
 
+# 📢 스킬 발동 중에 생성되는 이펙트 이미지 (맵 로딩 중 미리 로드/아틀라스 패킹 대상)
+RUNTIME_IMAGES = [
+    (os.path.join(ASSET_PATH, "skill1.png"), (100, 100)),          # HealEffect
+    (os.path.join(ASSET_PATH, "ultimate_effect.png"), (150, 150)), # PoisonEffect
+]
+
 
 # --- 이펙트 구현 클래스 (AnimatedEffect 상속) ---
 
 # 회복 이펙트: 위로 올라가며 사라짐
 class HealEffect(AnimatedEffect):
-    def __init__(self, x, y, owner, size):
+    def __init__(self, x, y, owner, size, clock=None):
         img_path = os.path.join(ASSET_PATH, "skill1.png")
         loaded_img = _safe_load_and_scale(img_path, (size, size))
         
@@ -25,17 +33,17 @@ class HealEffect(AnimatedEffect):
         else:
             frames = [loaded_img]
         
-        super().__init__(x, y, frames=frames, frame_duration_ms=100, owner=owner, size=size, loops=1)
+        super().__init__(x, y, frames=frames, frame_duration_ms=100, owner=owner, size=size, loops=1, clock=clock)
         self.vy = -3
         self.gravity = 0 
         self.duration_ms = 800
-        self.end_time = pygame.time.get_ticks() + self.duration_ms
+        self.end_time = self.clock.get_ticks() + self.duration_ms
         self.initial_y = y
         
     def update(self, world: Dict[str, Any]):
         super().update(world)
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         if current_time > self.end_time:
             self.active = False
             return
@@ -44,29 +52,29 @@ class HealEffect(AnimatedEffect):
 
 # 독 폭발 이펙트: 작게 시작해서 빠르게 커지며 사라짐
 class PoisonEffect(AnimatedEffect):
-    def __init__(self, x, y, owner, size):
+    def __init__(self, x, y, owner, size, clock=None):
         img_path = os.path.join(ASSET_PATH, "ultimate_effect.png")
         loaded_img = _safe_load_and_scale(img_path, (size, size))
         frames = [loaded_img] if loaded_img else [pygame.Surface((1, 1), pygame.SRCALPHA)]
         
         super().__init__(x, y, frames=frames, frame_duration_ms=100, owner=owner, size=size, 
-                          scale_factor=300, loops=1) 
+                          scale_factor=300, loops=1, clock=clock) 
         self.duration_ms = 500 
-        self.end_time = pygame.time.get_ticks() + self.duration_ms
+        self.end_time = self.clock.get_ticks() + self.duration_ms
         
     def update(self, world: Dict[str, Any]):
         super().update(world)
         
-        if pygame.time.get_ticks() > self.end_time:
+        if self.clock.get_ticks() > self.end_time:
              self.active = False
              return
 
 
 # 🟢 [수정됨]: 독 포션 전용 투사체 클래스 (TypeError 해결)
 class PoisonPotionProjectile(Projectile):
-    def __init__(self, x, y, vx, img, damage, owner, size, gravity, vy=0):
+    def __init__(self, x, y, vx, img, damage, owner, size, gravity, vy=0, clock=None):
         # **핵심 수정**: vy=vy 인수를 제거하고 vy를 위치 인수로만 전달하여 중복 오류를 해결
-        super().__init__(x, y, vx, img, damage, owner, size, gravity, vy)
+        super().__init__(x, y, vx, img, damage, owner, size, gravity, vy, clock=clock)
         # 이 투사체는 충돌 시 독 디버프를 유발하지 않고,
         # 충돌 후 생성되는 MeleeHitbox(폭발)이 독 디버프를 걸게 됩니다.
         self.is_ultimate_proj = True 
@@ -76,18 +84,21 @@ class PoisonPotionProjectile(Projectile):
 
 class HealPotionSkill(Skill):
     def __init__(self):
-        super().__init__("heal_potion", cooldown_ms=5000, img_path=os.path.join(ASSET_PATH, "skill1.png"))
+        super().__init__("heal_potion", cooldown_ms=5000)
         self.heal_amount_percent = 0.05
 
     def activate(self, user: Dict[str, Any], target: Dict[str, Any], skill_state: Dict[str, Any], world: Dict[str, Any], user_obj=None, **kwargs) -> List[Any]:
         if not self.ready():
             return []
 
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
 
         max_hp = user.get("max_hp", 100)
         heal_amount = max_hp * self.heal_amount_percent
-        user["hp"] = min(max_hp, user["hp"] + heal_amount)
+        hp_before = user["hp"]
+        user["hp"] = min(max_hp, hp_before + heal_amount)
+        owner = kwargs.get("owner")
+        world["events"].emit(HEAL, target=owner, owner=owner, source=self.name, amount=user["hp"] - hp_before)
 
         if user_obj:
             user_obj.start_attack_animation()
@@ -97,23 +108,24 @@ class HealPotionSkill(Skill):
         effect_x = user["x"] + CHAR_SIZE // 2 - effect_size // 2
         effect_y = user["y"] + CHAR_SIZE // 2 - effect_size // 2
         
-        heal_effect = HealEffect(x=effect_x, y=effect_y, owner=user.get("owner", "p1"), size=effect_size)
+        heal_effect = HealEffect.acquire(x=effect_x, y=effect_y, owner=user.get("owner", "p1"), size=effect_size, clock=self.clock)
 
         return [heal_effect] 
 
 
 class StaffStrikeSkill(Skill):
     def __init__(self):
-        super().__init__("staff_strike", cooldown_ms=500, img_path=os.path.join(ASSET_PATH, "skill2.png"))
+        super().__init__("staff_strike", cooldown_ms=500)
         # 🔨 [추가]: 근접 공격 이펙트 로드
         self.effect_size = 150 # 이펙트 크기
         self.effect_frames = self._load_strike_effect()
+        self.effect_frames_flipped = self._load_strike_effect(flip=True)
 
-    def _load_strike_effect(self):
+    def _load_strike_effect(self, flip=False):
         frames = []
         # 공격 애니메이션 이미지 (skill2.png)를 이펙트 프레임으로 사용합니다.
         img_path = os.path.join(ASSET_PATH, "skill2.png")
-        loaded_img = _safe_load_and_scale(img_path, (self.effect_size, self.effect_size))
+        loaded_img = _safe_load_and_scale(img_path, (self.effect_size, self.effect_size), flip=flip)
         
         if loaded_img:
             # 애니메이션 대신 단일 이미지에 회전 효과를 주려면 단일 프레임을 사용합니다.
@@ -130,7 +142,7 @@ class StaffStrikeSkill(Skill):
         if not self.ready():
             return []
 
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         if user_obj:
             user_obj.start_attack_animation()
 
@@ -145,7 +157,7 @@ class StaffStrikeSkill(Skill):
         hitbox_x = user["x"] + center_offset - hitbox_size // 2
         hitbox_y = user["y"] + CHAR_SIZE // 2 - hitbox_size // 2
         
-        hitbox = MeleeHitbox(x=hitbox_x, y=hitbox_y, damage=5, owner=owner, duration_ms=250, size=hitbox_size)
+        hitbox = MeleeHitbox.acquire(x=hitbox_x, y=hitbox_y, damage=5, owner=owner, duration_ms=250, size=hitbox_size, clock=self.clock)
         
         # 2. 🔨 [핵심 수정]: 애니메이티드 이펙트 생성 (시각적 회전)
         effects_to_add = [hitbox]
@@ -159,10 +171,10 @@ class StaffStrikeSkill(Skill):
             # 해골 스킬처럼 방향에 따라 이미지 좌우 반전 적용 (시각적 회전)
             # 기본 이미지가 오른쪽 스윙이라고 가정하고, 왼쪽을 볼 때 뒤집습니다.
             if not is_facing_right:
-                frames_to_use = [pygame.transform.flip(f, True, False) for f in self.effect_frames]
+                frames_to_use = self.effect_frames_flipped
             
-            strike_effect = AnimatedEffect(x=effect_x, y=effect_y, frames=frames_to_use, 
-                                           frame_duration_ms=100, owner=owner, size=self.effect_size, loops=1)
+            strike_effect = AnimatedEffect.acquire(x=effect_x, y=effect_y, frames=frames_to_use, 
+                                           frame_duration_ms=100, owner=owner, size=self.effect_size, loops=1, clock=self.clock)
             effects_to_add.append(strike_effect)
 
         # MeleeHitbox와 AnimatedEffect를 모두 반환
@@ -173,7 +185,7 @@ class StaffStrikeSkill(Skill):
 class PoisonPotionUltimate(UltimateSkillBase):
 # ... (이하 코드는 변경 없음) ...
     def __init__(self):
-        super().__init__("poison_potion_ultimate", cooldown_ms=10000, ult_cost=50, img_path=os.path.join(ASSET_PATH, "ultimate.png"))
+        super().__init__("poison_potion_ultimate", cooldown_ms=10000, ult_cost=50)
         
         proj_size = 100
         self.projectile_size = proj_size
@@ -195,7 +207,7 @@ class PoisonPotionUltimate(UltimateSkillBase):
         if not self.ready() or user.get("ultimate_gauge", 0) < self.ult_cost_percent: 
             return []
 
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = self.clock.get_ticks()
         user["ultimate_gauge"] = max(0, user["ultimate_gauge"] - self.ult_cost_percent)
         
         if user_obj:
@@ -208,7 +220,7 @@ class PoisonPotionUltimate(UltimateSkillBase):
         proj_y = user["y"] + (CHAR_SIZE * 0.3) 
 
         # PoisonPotionProjectile 사용 및 포물선 속도 설정
-        poison_proj = PoisonPotionProjectile( 
+        poison_proj = PoisonPotionProjectile.acquire( 
             x=proj_x,
             y=proj_y,
             vx=direction * 1,
@@ -218,6 +230,7 @@ class PoisonPotionUltimate(UltimateSkillBase):
             owner=owner,
             size=self.projectile_size,
             gravity=0.2,
+            clock=self.clock,
         )
         
         # 충돌 시 처리 로직을 위해 스킬 인스턴스 자체를 투사체에 저장
@@ -233,21 +246,23 @@ class PoisonPotionUltimate(UltimateSkillBase):
         """독 포션 충돌 시 독 폭발 이펙트 및 히트박스 생성"""
         
         # 1. 이펙트 생성
-        effect = PoisonEffect(
+        effect = PoisonEffect.acquire(
             x=x, # 투사체가 충돌한 위치
             y=y,
             owner=owner,
-            size=self.explosion_size
+            size=self.explosion_size,
+            clock=self.clock
         )
         
         # 2. 히트박스 생성 (폭발 피해 및 독 디버프 적용)
-        hitbox = MeleeHitbox(
+        hitbox = MeleeHitbox.acquire(
             x=x - self.explosion_size / 2, 
             y=y - self.explosion_size / 2,
             damage=self.damage,
             owner=owner,
             duration_ms=200, 
-            size=self.explosion_size
+            size=self.explosion_size,
+            clock=self.clock
         )
         
         # 히트박스가 충돌 시 독 디버프를 걸도록 설정
@@ -255,4 +270,12 @@ class PoisonPotionUltimate(UltimateSkillBase):
         hitbox.poison_duration = 15000
         hitbox.poison_dps = 0.01
 
-        return [effect, hitbox]
\ No newline at end of file
+        return [effect, hitbox]
+
+
+# 📢 스킬 레지스트리 등록 (마녀가 선택될 때 이 모듈이 import 됩니다)
+@register_character("witch", runtime_images=RUNTIME_IMAGES)
+def create_witch_skills() -> List[Skill]:
+    # HealPotionSkill, StaffStrikeSkill, PoisonPotionUltimate는
+    # __init__에 인자를 받지 않도록 수정했으므로, 인자 없이 호출합니다.
+    return [HealPotionSkill(), StaffStrikeSkill(), PoisonPotionUltimate()]
@@ -0,0 +1,287 @@
+# snapshot.py
+
+import dis
+import operator
+from types import CodeType, FunctionType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from assets import asset_id, asset_surface
+from player_state import PlayerState
+from skills.object_pool import get_pool
+from skills.skills_base import Projectile
+
+# 📢 경기 전체 스냅샷/복원 (롤백 넷코드, 리플레이 탐색, AI 미리보기)
+# save_match()는 틱 사이의 경기 상태를 미리 만들어 둔 버퍼(SnapshotBuffer.slots, 재사용하는 리스트)에 차례로 적고,
+# load_match()는 같은 순서로 읽어 같은 Match 객체를 그 시점으로 되돌립니다. (Match.snapshot()/restore())
+# 저장 대상:
+# - 경기 틱/시계/승패, 플레이어 상태(PlayerState 슬롯 필드, 플래그, extra, 독 항목)
+# - 캐릭터 애니메이션 타이머(Character.SNAPSHOT_ATTRS), 스킬 쿨다운(Skill.SNAPSHOT_ATTRS)
+# - skill_state(궁극기 단계: is_active, start_time, ult2_activated ...), 통계, world 딕셔너리 (중첩 딕셔너리는 내용을 복사)
+# - 상태 이상 엔진의 힙/효과, 항목 엔티티(생성 순서)와 각 항목 객체의 속성, 대량 투사체 엔진 배열
+# 값은 복사하지 않고 참조만 적습니다. (숫자/문자열은 불변이므로) 바뀌는 컨테이너(딕셔너리/리스트)만 얕게 복사합니다.
+# 📢 Surface는 복사하지 않습니다. 레지스트리 이미지는 에셋 id(AssetRef)로 적고, 레지스트리 밖 Surface는 그대로 참조합니다.
+# 투사체는 풀에서 재사용되는 객체이므로 객체 자체를 기록하고, 복원할 때 풀에 반납된 객체는 다시 꺼내 속성을 되돌립니다.
+# (객체의 __dict__를 읽으면 CPython 3.11에서 속성 접근이 느려지므로 클래스의 메서드가 대입하는 속성 이름으로 읽습니다)
+# 틱 도중(step() 실행 중)에는 저장/복원하면 안 됩니다. 이벤트 대기열은 복원할 때 비웁니다.
+
+# 버퍼의 처음 크기 (칸 수). 모자라면 리스트가 늘어나고 이후에는 그 크기를 재사용합니다.
+DEFAULT_CAPACITY = 256
+# SnapshotRing 기본 길이 (60Hz 기준 0.5초)
+DEFAULT_RING_TICKS = 30
+
+
+class _Missing:
+    """투사체에 없는 속성 표시 (복원할 때 지움)"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<없음>"
+
+
+MISSING = _Missing()
+
+
+class AssetRef(int):
+    """스냅샷 안의 Surface 참조 (assets 레지스트리의 에셋 id)"""
+
+    __slots__ = ()
+
+
+class SnapshotBuffer:
+    """한 시점의 경기 상태. slots는 저장할 때마다 처음부터 덮어쓰는 리스트입니다. (tick이 -1이면 비어 있음)"""
+
+    __slots__ = ("slots", "size", "tick", "bullets")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.slots: List[Any] = [None] * capacity
+        self.size = 0
+        self.tick = -1
+        self.bullets: Optional[Dict[str, Any]] = None # 대량 투사체 엔진 배열 (재사용)
+
+
+_PLAYER_FIELDS = PlayerState.FIELDS + ("flags",)
+_get_player = operator.attrgetter(*_PLAYER_FIELDS)
+
+_getters: Dict[Tuple[str, ...], Callable[[Any], tuple]] = {}
+
+
+def _attr_getter(names: Tuple[str, ...]) -> Callable[[Any], tuple]:
+    """names 속성을 튜플로 읽는 함수 (이름 하나여도 튜플)"""
+    getter = _getters.get(names)
+    if getter is None:
+        if len(names) == 1:
+            single = operator.attrgetter(names[0])
+            getter = lambda obj: (single(obj),)
+        else:
+            getter = operator.attrgetter(*names)
+        _getters[names] = getter
+    return getter
+
+
+# --- 투사체 속성 목록 ---
+
+_layouts: Dict[type, Tuple[str, ...]] = {}
+
+
+def _assigned_names(code: CodeType, found: set) -> None:
+    for ins in dis.get_instructions(code):
+        if ins.opname in ("STORE_ATTR", "DELETE_ATTR"):
+            found.add(ins.argval)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _assigned_names(const, found)
+
+
+def projectile_layout(cls: type) -> Tuple[str, ...]:
+    """cls 객체에서 저장할 속성 이름 (클래스 계층의 메서드가 대입하는 이름 + POOL_TRANSIENT_ATTRS + 풀 표시)
+    스킬/경기 루프가 나중에 붙이는 속성은 풀 반납과 마찬가지로 POOL_TRANSIENT_ATTRS에 있어야 저장됩니다."""
+    names = _layouts.get(cls)
+    if names is None:
+        found = set(getattr(cls, "POOL_TRANSIENT_ATTRS", ()))
+        found.add("_pooled")
+        for klass in cls.__mro__:
+            for value in vars(klass).values():
+                func = getattr(value, "__func__", value) # classmethod/staticmethod
+                if isinstance(func, FunctionType):
+                    _assigned_names(func.__code__, found)
+        # 메서드/프로퍼티 이름(다른 객체에 대입하는 코드에서 섞여 들어온 경우)은 제외합니다.
+        names = _layouts[cls] = tuple(sorted(
+            name for name in found
+            if not callable(getattr(cls, name, None)) and not isinstance(getattr(cls, name, None), property)))
+    return names
+
+
+def prepare_layouts() -> None:
+    """지금까지 정의된 모든 투사체 클래스의 속성 목록을 미리 만듭니다.
+    (클래스마다 처음 한 번 바이트코드를 훑는 데 수 ms가 걸리므로, 경기 도중 첫 저장이 튀지 않게 SnapshotRing이 미리 호출)"""
+    pending = [Projectile]
+    while pending:
+        cls = pending.pop()
+        projectile_layout(cls)
+        pending.extend(cls.__subclasses__())
+
+
+def _encode(value: Any) -> Any:
+    ref = asset_id(value)
+    return value if ref is None else AssetRef(ref)
+
+
+def _collect_dicts(root: Dict[Any, Any], out: List[Any]) -> None:
+    """root와 그 안의 딕셔너리마다 객체, 얕은 복사를 out에 차례로 붙입니다."""
+    out += (root, root.copy())
+    for value in root.values():
+        if type(value) is dict:
+            _collect_dicts(value, out)
+
+
+# --- 저장/복원 ---
+
+def save_match(match, buffer: Optional[SnapshotBuffer] = None) -> SnapshotBuffer:
+    """match의 현재 상태를 buffer에 적습니다. (buffer가 없으면 새로 만듦)"""
+    if buffer is None:
+        buffer = SnapshotBuffer()
+    slots = buffer.slots
+    slots[0:4] = (match.tick, match.clock.now_ms, match.finished, match.winner)
+    pos = 4
+
+    for _, body in match.bodies.rows:
+        slots[pos:pos + 2] = (_get_player(body), body.status_effects[:])
+        pos += 2
+    for _, _, fighter, sprite in match.fighters.rows:
+        slots[pos:pos + 2] = (_attr_getter(sprite.SNAPSHOT_ATTRS)(sprite),
+                              [_attr_getter(skill.SNAPSHOT_ATTRS)(skill) for skill in fighter.skills])
+        pos += 2
+
+    # 중첩 딕셔너리 (개수, 객체, 복사, 객체, 복사, ...)
+    dicts: List[Any] = []
+    _collect_dicts(match.world, dicts)
+    _collect_dicts(match.stats, dicts)
+    for _, body, fighter, _ in match.fighters.rows:
+        _collect_dicts(fighter.skill_state, dicts)
+        _collect_dicts(body.extra, dicts)
+    # 📢 한 칸 쓰기도 슬라이스로 적습니다. (버퍼 끝에 닿으면 리스트가 늘어나도록)
+    slots[pos:pos + 1] = (len(dicts) // 2,)
+    slots[pos + 1:pos + 1 + len(dicts)] = dicts
+    pos += 1 + len(dicts)
+
+    slots[pos:pos + 1] = (match.status.snapshot(),)
+    pos += 1
+
+    # 항목 엔티티 (개수, 다음 생성 순서, 그다음 생성 순서대로 객체, Lifetime, 속성 값)
+    # Lifetime은 만든 뒤 바뀌지 않으므로 복사하지 않고 그대로 저장합니다.
+    items = match.items
+    slots[pos:pos + 2] = (len(items), match._next_seq)
+    pos += 2
+    surface_type = pygame.Surface
+    missing = MISSING
+    for _, proj, lifetime in items.rows:
+        names = _layouts.get(type(proj)) or projectile_layout(type(proj))
+        values = [getattr(proj, name, missing) for name in names]
+        slots[pos:pos + 3] = (proj, lifetime, [_encode(v) if type(v) is surface_type else v for v in values])
+        pos += 3
+
+    # 이전 저장이 더 길었으면 남은 칸을 비웁니다. (풀에 반납된 투사체/딕셔너리 사본을 붙잡지 않도록)
+    old_size = buffer.size
+    if pos < old_size:
+        slots[pos:old_size] = [None] * (old_size - pos)
+
+    buffer.bullets = None if match.bullets is None else match.bullets.snapshot(buffer.bullets)
+    buffer.size = pos
+    buffer.tick = match.tick
+    return buffer
+
+
+def load_match(match, buffer: SnapshotBuffer) -> None:
+    """save_match()로 저장한 시점으로 match를 되돌립니다. (같은 Match 객체에만 사용)"""
+    slots = buffer.slots
+    match.tick, match.clock.now_ms, match.finished, match.winner = slots[0:4]
+    pos = 4
+
+    for _, body in match.bodies.rows:
+        for name, value in zip(_PLAYER_FIELDS, slots[pos]):
+            setattr(body, name, value)
+        body.status_effects[:] = slots[pos + 1]
+        pos += 2
+    for _, _, fighter, sprite in match.fighters.rows:
+        for name, value in zip(sprite.SNAPSHOT_ATTRS, slots[pos]):
+            setattr(sprite, name, value)
+        for skill, values in zip(fighter.skills, slots[pos + 1]):
+            for name, value in zip(skill.SNAPSHOT_ATTRS, values):
+                setattr(skill, name, value)
+        pos += 2
+
+    count = slots[pos]
+    pos += 1
+    for _ in range(count):
+        target, contents = slots[pos], slots[pos + 1]
+        target.clear()
+        target.update(contents)
+        pos += 2
+
+    match.status.restore(slots[pos])
+    pos += 1
+
+    count, next_seq = slots[pos:pos + 2]
+    pos += 2
+    saved = slots[pos:pos + 3 * count]
+    objs = saved[0::3]
+    # 저장 이후 반납된 항목은 풀에서 다시 꺼내 속성을 되돌리고, 같은 생성 순서로 엔티티를 다시 만듭니다.
+    # (저장 이후에 생긴 항목은 _restore_items가 풀에 반납)
+    for proj, values in zip(objs, saved[2::3]):
+        if getattr(proj, "_pooled", False):
+            free = get_pool(type(proj)).free
+            if proj in free:
+                free.remove(proj)
+        for name, value in zip(_layouts[type(proj)], values):
+            if value is MISSING:
+                if hasattr(proj, name):
+                    delattr(proj, name)
+            else:
+                setattr(proj, name, asset_surface(value) if type(value) is AssetRef else value)
+    match._restore_items(objs, saved[1::3], next_seq)
+
+    if buffer.bullets is not None and match.bullets is not None:
+        match.bullets.restore(buffer.bullets)
+    elif match.bullets is not None:
+        match.bullets.clear()
+
+
+class SnapshotRing:
+    """최근 size틱의 스냅샷 (버퍼를 미리 만들어 두고 tick % size 칸을 돌려 씀)"""
+
+    def __init__(self, size: int = DEFAULT_RING_TICKS, capacity: int = DEFAULT_CAPACITY):
+        prepare_layouts()
+        self.buffers = [SnapshotBuffer(capacity) for _ in range(size)]
+
+    def __len__(self) -> int:
+        return len(self.buffers)
+
+    def save(self, match) -> SnapshotBuffer:
+        """match의 현재 틱을 저장합니다. (같은 칸의 size틱 전 스냅샷을 덮어씀)"""
+        return match.snapshot(self.buffers[match.tick % len(self.buffers)])
+
+    def get(self, tick: int) -> Optional[SnapshotBuffer]:
+        """tick의 스냅샷 (이미 덮어썼거나 저장하지 않았으면 None)"""
+        buffer = self.buffers[tick % len(self.buffers)]
+        return buffer if buffer.tick == tick else None
+
+    def restore(self, match, tick: int) -> bool:
+        """match를 tick 시점으로 되돌립니다. (스냅샷이 없으면 False)"""
+        buffer = self.get(tick)
+        if buffer is None:
+            return False
+        match.restore(buffer)
+        return True
+
+    def discard_after(self, tick: int) -> None:
+        """tick보다 뒤의 스냅샷을 무효로 표시합니다. (되돌린 뒤 다시 시뮬레이션하면서 덮어쓸 칸)"""
+        for buffer in self.buffers:
+            if buffer.tick > tick:
+                buffer.tick = -1
+
+    def clear(self) -> None:
+        for buffer in self.buffers:
+            buffer.tick = -1
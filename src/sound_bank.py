@@ -0,0 +1,357 @@
+# sound_bank.py
+
+import io
+import os
+import wave
+import threading
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Any, List
+
+from audio import ensure_mixer
+import derived_cache
+
+# 📢 프로세스 전역 사운드 뱅크 + 채널 관리자
+# - 각 효과음은 프로세스 전체에서 한 번만 디코딩되어 경기 사이에 재사용됩니다.
+# - 스킬 키는 key.get_pressed()로 매 프레임 검사되므로, 같은 소리가 프레임마다 재생 요청될 수 있습니다.
+#   소리별 재트리거 쿨다운(cooldown_ms)과 동시 재생 수 제한(max_voices)으로 이를 걸러내고,
+#   채널이 모두 사용 중이면 우선순위(priority)가 낮은 소리부터 끊어 믹서 채널/CPU 사용량을 일정하게 유지합니다.
+#
+# 📢 메모리 예산
+# - 디코딩된 Sound는 메모리 예산(AUDIO_MEMORY_BUDGET_BYTES) 안에서 LRU로 보관되며, 넘치면 가장 오래 쓰지 않은
+#   (재생 중이 아닌) 소리부터 해제됩니다.
+# - STREAM_MIN_SECONDS보다 긴 WAV는 전체를 디코딩하지 않고 CHUNK_SECONDS 단위로 읽어 Channel.queue로 이어 재생합니다.
+#   (스트리밍 중인 채널은 매 프레임 update()가 다음 조각을 대기열에 넣습니다)
+# - 선택적으로 디코딩된 PCM을 .cache/audio/ 에 저장해 다음 실행에서 디코딩 없이 불러올 수 있습니다.
+
+# 효과음에 사용할 믹서 채널 수 (BGM은 mixer.music으로 별도 재생)
+MIXER_CHANNELS = 8
+
+AUDIO_MEMORY_BUDGET_BYTES = 8 * 1024 * 1024
+STREAM_MIN_SECONDS = 1.5
+CHUNK_SECONDS = 0.25
+
+PCM_CACHE_DIR = os.path.join(".cache", "audio")
+
+# name -> 경로 / 동시 재생 수 / 우선순위 (클수록 중요) / 재트리거 쿨다운
+# (선택) "stream": True/False 로 길이와 관계없이 스트리밍 여부를 지정할 수 있습니다.
+SOUND_CONFIG: Dict[str, Dict[str, Any]] = {
+    "attack": {"path": os.path.join("assets", "audio", "attack.wav"), "max_voices": 3, "priority": 1, "cooldown_ms": 60},
+    "skill": {"path": os.path.join("assets", "audio", "skill.wav"), "max_voices": 2, "priority": 2, "cooldown_ms": 120},
+    "jump": {"path": os.path.join("assets", "audio", "jump.wav"), "max_voices": 2, "priority": 0, "cooldown_ms": 80},
+    "victory": {"path": os.path.join("assets", "audio", "victory.wav"), "max_voices": 1, "priority": 3, "cooldown_ms": 0},
+}
+
+_lock = threading.RLock()
+# name -> Sound (LRU 순서, 앞쪽이 가장 오래 쓰지 않은 것)
+_sounds: "OrderedDict[str, pygame.mixer.Sound]" = OrderedDict()
+_sound_bytes: Dict[str, int] = {}
+# 로드에 실패한 소리 (디스크 재확인을 막습니다)
+_missing = set()
+# name -> 스트리밍 여부 (WAV 헤더만 읽어 한 번 결정)
+_stream_flags: Dict[str, bool] = {}
+
+_budget_bytes = AUDIO_MEMORY_BUDGET_BYTES
+_pcm_cache_enabled = False
+
+_volume = 1.0
+_channels: List[pygame.mixer.Channel] = []
+# 채널 번호 -> 재생 중인 소리 {"name", "priority", "start_ms"}
+_voices: Dict[int, Dict[str, Any]] = {}
+# 채널 번호 -> 스트리밍 상태 {"reader", "chunk_frames", "bytes"}
+_streams: Dict[int, Dict[str, Any]] = {}
+# name -> 마지막 재생 요청이 받아들여진 시각
+_last_played: Dict[str, int] = {}
+
+_stats = {"played": 0, "suppressed": 0, "stolen": 0, "dropped": 0, "peak_voices": 0,
+          "evicted": 0, "streamed": 0, "pcm_cache_hits": 0}
+
+
+def set_memory_budget(budget_bytes: int) -> None:
+    """디코딩된 효과음이 차지할 수 있는 최대 바이트 수. 줄이면 즉시 초과분을 해제합니다."""
+    global _budget_bytes
+    _budget_bytes = max(0, int(budget_bytes))
+    with _lock:
+        _evict()
+
+
+def set_pcm_cache(enabled: bool) -> None:
+    """디코딩된 PCM을 디스크(PCM_CACHE_DIR)에 저장/재사용할지 설정합니다. (기본: 사용 안 함)"""
+    global _pcm_cache_enabled
+    _pcm_cache_enabled = bool(enabled)
+
+
+def _mixer_bytes_per_frame() -> int:
+    _, fmt, mixer_channels = pygame.mixer.get_init()
+    return (abs(fmt) // 8) * mixer_channels
+
+
+def _is_streamed(name: str) -> bool:
+    """긴 WAV인지 헤더만 읽어 판단합니다. (WAV가 아니면 전체 디코딩)"""
+    flag = _stream_flags.get(name)
+    if flag is not None:
+        return flag
+    config = SOUND_CONFIG[name]
+    flag = config.get("stream")
+    if flag is None:
+        flag = False
+        if config["path"].lower().endswith(".wav"):
+            try:
+                with wave.open(config["path"], "rb") as reader:
+                    flag = reader.getnframes() / reader.getframerate() >= STREAM_MIN_SECONDS
+            except (OSError, EOFError, wave.Error):
+                flag = False
+    _stream_flags[name] = flag
+    return flag
+
+
+def _pcm_cache_path(path: str) -> Optional[str]:
+    digest = derived_cache.source_hash(path)
+    if digest is None:
+        return None
+    freq, fmt, mixer_channels = pygame.mixer.get_init()
+    return os.path.join(PCM_CACHE_DIR, f"{digest}_{freq}_{fmt}_{mixer_channels}.pcm")
+
+
+def _decode(path: str) -> pygame.mixer.Sound:
+    """파일을 디코딩합니다. PCM 캐시를 사용하면 믹서 포맷 그대로 저장된 버퍼를 먼저 찾습니다."""
+    cache_path = _pcm_cache_path(path) if _pcm_cache_enabled else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                sound = pygame.mixer.Sound(buffer=f.read())
+            _stats["pcm_cache_hits"] += 1
+            return sound
+        except (OSError, pygame.error):
+            pass
+
+    sound = pygame.mixer.Sound(path)
+    if cache_path:
+        try:
+            os.makedirs(PCM_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(sound.get_raw())
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"PCM 캐시 저장 오류 ({path}): {e}")
+    return sound
+
+
+def _playing_names() -> set:
+    return {v["name"] for i, v in list(_voices.items()) if _channels[i].get_busy()}
+
+
+def _evict() -> None:
+    """예산을 넘으면 재생 중이 아닌 소리를 오래된 순서로 해제합니다. (_lock 안에서 호출)"""
+    if sum(_sound_bytes.values()) <= _budget_bytes:
+        return
+    playing = _playing_names() if _channels else set()
+    for name in list(_sounds.keys()):
+        if sum(_sound_bytes.values()) <= _budget_bytes:
+            break
+        if name in playing:
+            continue
+        del _sounds[name]
+        del _sound_bytes[name]
+        _stats["evicted"] += 1
+
+
+def get_sound(name: str) -> Optional[pygame.mixer.Sound]:
+    """
+    효과음을 디코딩하여 반환합니다. (예산 안에서 캐시, 스트리밍 대상이면 None)
+    믹서를 사용할 수 없거나 파일이 없어도 None을 반환합니다.
+    """
+    config = SOUND_CONFIG.get(name)
+    if config is None or name in _missing or not ensure_mixer():
+        return None
+    with _lock:
+        sound = _sounds.get(name)
+        if sound is not None:
+            _sounds.move_to_end(name)
+            return sound
+        if _is_streamed(name):
+            return None
+        try:
+            sound = _decode(config["path"])
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Error loading sound {config['path']}: {e}")
+            _missing.add(name)
+            return None
+        _sounds[name] = sound
+        _sound_bytes[name] = int(round(sound.get_length() * pygame.mixer.get_init()[0])) * _mixer_bytes_per_frame()
+        _evict()
+    return sound
+
+
+def load_all() -> Dict[str, Optional[pygame.mixer.Sound]]:
+    """SOUND_CONFIG의 효과음을 미리 디코딩합니다. (스트리밍 대상은 헤더만 확인, 맵 로딩 중 미리 로드 스레드에서 호출)"""
+    return {name: get_sound(name) for name in SOUND_CONFIG}
+
+
+def set_volume(volume: float) -> None:
+    """효과음 전체 볼륨 (재생 시 채널 볼륨으로 적용됩니다)"""
+    global _volume
+    _volume = max(0.0, min(1.0, float(volume)))
+
+
+def _ensure_channels() -> bool:
+    if _channels:
+        return True
+    if not ensure_mixer():
+        return False
+    if pygame.mixer.get_num_channels() < MIXER_CHANNELS:
+        pygame.mixer.set_num_channels(MIXER_CHANNELS)
+    _channels.extend(pygame.mixer.Channel(i) for i in range(MIXER_CHANNELS))
+    return True
+
+
+def _close_stream(index: int) -> None:
+    stream = _streams.pop(index, None)
+    if stream is not None:
+        stream["reader"].close()
+
+
+def _active_voices() -> Dict[int, Dict[str, Any]]:
+    """재생이 끝난 채널을 정리하고, 현재 재생 중인 목소리만 반환합니다."""
+    for index in [i for i in _voices if not _channels[i].get_busy()]:
+        del _voices[index]
+        _close_stream(index)
+    return _voices
+
+
+def _next_chunk(stream: Dict[str, Any]) -> Optional[pygame.mixer.Sound]:
+    """스트림에서 다음 조각을 읽어 (믹서 포맷으로 변환된) 작은 Sound로 만듭니다. 끝이면 None."""
+    reader = stream["reader"]
+    frames = reader.readframes(stream["chunk_frames"])
+    if not frames:
+        return None
+    # 조각마다 WAV 헤더를 붙여 SDL이 샘플 포맷/레이트 변환을 하도록 합니다.
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setparams(reader.getparams())
+        writer.writeframes(frames)
+    buffer.seek(0)
+    chunk = pygame.mixer.Sound(file=buffer)
+    stream["bytes"] = int(round(chunk.get_length() * pygame.mixer.get_init()[0])) * _mixer_bytes_per_frame()
+    return chunk
+
+
+def _play_stream(name: str, channel: pygame.mixer.Channel, index: int) -> bool:
+    try:
+        reader = wave.open(SOUND_CONFIG[name]["path"], "rb")
+    except (OSError, EOFError, wave.Error) as e:
+        print(f"Error streaming sound {SOUND_CONFIG[name]['path']}: {e}")
+        _missing.add(name)
+        return False
+    stream = {"reader": reader, "chunk_frames": max(1, int(reader.getframerate() * CHUNK_SECONDS)), "bytes": 0}
+    first = _next_chunk(stream)
+    if first is None:
+        reader.close()
+        return False
+    channel.play(first)
+    _streams[index] = stream
+    second = _next_chunk(stream)
+    if second is not None:
+        channel.queue(second)
+    _stats["streamed"] += 1
+    return True
+
+
+def update() -> None:
+    """스트리밍 중인 채널의 대기열이 비면 다음 조각을 넣습니다. 게임 루프에서 매 프레임 호출합니다."""
+    if not _streams:
+        return
+    _active_voices()
+    for index, stream in list(_streams.items()):
+        channel = _channels[index]
+        if channel.get_queue() is None:
+            chunk = _next_chunk(stream)
+            if chunk is None:
+                # 마지막 조각이 재생 중이면 채널이 끝날 때 _active_voices()가 정리합니다.
+                continue
+            channel.queue(chunk)
+
+
+def play(name: str, now_ms: Optional[int] = None) -> Optional[pygame.mixer.Channel]:
+    """
+    효과음을 재생합니다. 재생되지 않으면 None을 반환합니다.
+    1. 쿨다운 안에 다시 요청되면 무시합니다. (누르고 있는 키로 인한 프레임당 재생 방지)
+    2. 같은 소리가 max_voices개 재생 중이면 가장 오래된 것을 끊고 다시 재생합니다.
+    3. 빈 채널이 없으면 우선순위가 같거나 낮은 소리 중 가장 오래된 것을 끊습니다. 없으면 버립니다.
+    """
+    config = SOUND_CONFIG.get(name)
+    if config is None or name in _missing or not _ensure_channels():
+        return None
+    streamed = _is_streamed(name)
+    sound = None if streamed else get_sound(name)
+    if not streamed and sound is None:
+        return None
+    if now_ms is None:
+        now_ms = pygame.time.get_ticks()
+
+    last = _last_played.get(name)
+    if last is not None and now_ms - last < config["cooldown_ms"]:
+        _stats["suppressed"] += 1
+        return None
+
+    voices = _active_voices()
+    same = [i for i, v in voices.items() if v["name"] == name]
+    if len(same) >= config["max_voices"]:
+        index = min(same, key=lambda i: voices[i]["start_ms"])
+        _stats["stolen"] += 1
+    else:
+        free = [i for i in range(len(_channels)) if i not in voices]
+        if free:
+            index = free[0]
+        else:
+            victims = [i for i, v in voices.items() if v["priority"] <= config["priority"]]
+            if not victims:
+                _stats["dropped"] += 1
+                return None
+            index = min(victims, key=lambda i: (voices[i]["priority"], voices[i]["start_ms"]))
+            _stats["stolen"] += 1
+
+    channel = _channels[index]
+    channel.stop()
+    _close_stream(index)
+    channel.set_volume(_volume)
+    if streamed:
+        if not _play_stream(name, channel, index):
+            return None
+    else:
+        channel.play(sound)
+    voices[index] = {"name": name, "priority": config["priority"], "start_ms": now_ms}
+    _last_played[name] = now_ms
+    _stats["played"] += 1
+    _stats["peak_voices"] = max(_stats["peak_voices"], len(voices))
+    return channel
+
+
+def stop(name: Optional[str] = None) -> None:
+    """name의 재생 중인 목소리를 모두 멈춥니다. (None이면 전체)"""
+    if not _channels:
+        return
+    voices = _active_voices()
+    for index in [i for i, v in voices.items() if name is None or v["name"] == name]:
+        _channels[index].stop()
+        _close_stream(index)
+        del voices[index]
+
+
+def get_resident_bytes() -> int:
+    """현재 메모리에 올라와 있는 디코딩된 오디오 바이트 수 (캐시된 Sound + 스트리밍 조각)"""
+    with _lock:
+        cached = sum(_sound_bytes.values())
+    # 스트림마다 재생 중 조각 + 대기열 조각
+    return cached + sum(2 * s["bytes"] for s in _streams.values())
+
+
+def get_stats() -> Dict[str, int]:
+    stats = dict(_stats)
+    stats["loaded"] = len(_sounds)
+    stats["active_voices"] = len(_active_voices()) if _channels else 0
+    stats["streams"] = len(_streams)
+    stats["resident_bytes"] = get_resident_bytes()
+    stats["budget_bytes"] = _budget_bytes
+    return stats
@@ -0,0 +1,156 @@
+# spatial_hash.py
+
+from typing import Dict, List, Set, Tuple
+
+# 📢 균일 격자 공간 해시 (충돌 광역 단계)
+# 캐릭터/투사체/히트박스/범위 이펙트의 충돌 사각형을 격자 칸에 등록해 두고,
+# 좁은 단계(정확한 사각형 겹침 검사)는 가까운 칸에 있는 후보끼리만 수행합니다.
+# - 칸 크기(cell_size) 이하인 항목은 왼쪽 위 모서리가 있는 칸 하나에만 등록합니다. (느슨한 격자)
+#   두 항목이 겹치려면 모서리 칸이 가로/세로로 1칸 이내여야 하므로, 질의는 사각형이 덮는 칸과 왼쪽/위쪽 1칸을 보고
+#   쌍 검사는 같은 칸 + 오른쪽/아래쪽 이웃 4칸만 봅니다. (같은 쌍이 두 번 나오지 않아 중복 제거가 필요 없음)
+# - 칸보다 큰 항목(범위 이펙트 등)은 따로 모아 두고 항상 후보에 포함합니다.
+# - 증분 갱신: update()는 모서리 칸이 바뀐 경우에만 등록을 옮깁니다. (대부분의 틱에서 비교 한 번)
+# 좌표는 pygame.Rect와 같이 정수로 절사한 값을 사용하며, 최종 판정은 항상 좁은 단계가 합니다.
+# 항목은 정수 핸들로 구분합니다.
+
+# 기본 칸 크기: 캐릭터 충돌 박스(160), 투사체, 근접/돌진 히트박스(최대 300)가 한 칸에 들어가는 크기
+DEFAULT_CELL_SIZE = 320
+
+Cell = Tuple[int, int]
+Rect = Tuple[int, int, int, int]
+_LARGE = None # 큰 항목의 칸 표시
+
+# 쌍 검사에서 보는 이웃 칸 (절반만 보면 모든 인접 칸 쌍이 한 번씩 나옵니다)
+_FORWARD_NEIGHBORS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+class SpatialHash:
+    """정수 핸들 -> 사각형을 격자 칸에 등록하는 공간 해시"""
+
+    __slots__ = ("cell_size", "cells", "where", "rects", "large")
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, Set[int]] = {} # 칸 -> 모서리가 그 칸에 있는 핸들
+        self.where: Dict[int, Cell] = {}      # 핸들 -> 등록된 칸 (큰 항목은 _LARGE)
+        self.rects: Dict[int, Rect] = {}      # 핸들 -> 마지막으로 갱신한 사각형 (overlapping_pairs의 좁은 단계용)
+        self.large: Set[int] = set()          # 칸보다 큰 항목
+
+    def __len__(self) -> int:
+        return len(self.where)
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self.where
+
+    def update(self, handle: int, left: int, top: int, width: int, height: int) -> None:
+        """핸들의 사각형을 등록하거나 옮깁니다. (등록된 칸이 그대로면 비교 한 번으로 끝)"""
+        cs = self.cell_size
+        self.rects[handle] = (left, top, width, height)
+        cell = (left // cs, top // cs) if width <= cs and height <= cs else _LARGE
+        where = self.where
+        old = where.get(handle, 0)
+        if old == cell:
+            return
+        if old != 0:
+            self._unlink(handle, old)
+        where[handle] = cell
+        if cell is _LARGE:
+            self.large.add(handle)
+        else:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = {handle}
+            else:
+                bucket.add(handle)
+
+    def remove(self, handle: int) -> None:
+        self.rects.pop(handle, None)
+        cell = self.where.pop(handle, 0)
+        if cell != 0:
+            self._unlink(handle, cell)
+
+    def _unlink(self, handle: int, cell) -> None:
+        if cell is _LARGE:
+            self.large.discard(handle)
+            return
+        bucket = self.cells[cell]
+        bucket.discard(handle)
+        if not bucket:
+            del self.cells[cell]
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.where.clear()
+        self.rects.clear()
+        self.large.clear()
+
+    def query(self, left: int, top: int, width: int, height: int) -> List[int]:
+        """사각형과 겹칠 수 있는 핸들 목록 (후보, 순서 없음, 좁은 단계 검사 전)"""
+        cs = self.cell_size
+        cells = self.cells
+        found = list(self.large)
+        for cx in range((left // cs) - 1, (left + max(width, 1) - 1) // cs + 1):
+            for cy in range((top // cs) - 1, (top + max(height, 1) - 1) // cs + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def candidate_pairs(self) -> List[Tuple[int, int]]:
+        """겹칠 수 있는 핸들 쌍 (a < b, 각 쌍은 한 번만). 투사체끼리의 상쇄처럼 모든 항목 쌍을 검사할 때 사용합니다."""
+        pairs: List[Tuple[int, int]] = []
+        append = pairs.append
+        cells = self.cells
+        for (cx, cy), bucket in cells.items():
+            members = list(bucket)
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    append((a, b) if a < b else (b, a))
+            for dx, dy in _FORWARD_NEIGHBORS:
+                other = cells.get((cx + dx, cy + dy))
+                if other:
+                    for a in members:
+                        for b in other:
+                            append((a, b) if a < b else (b, a))
+        large = sorted(self.large)
+        for i, a in enumerate(large):
+            for b in large[i + 1:]:
+                append((a, b))
+            for bucket in cells.values():
+                for b in bucket:
+                    append((a, b) if a < b else (b, a))
+        return pairs
+
+    def overlapping_pairs(self) -> List[Tuple[int, int]]:
+        """사각형이 실제로 겹치는 핸들 쌍 (a < b, 정렬됨). 후보 쌍에만 좁은 단계(정수 AABB) 검사를 합니다."""
+        rects = self.rects
+        cells = self.cells
+        hits: List[Tuple[int, int]] = []
+        append = hits.append
+
+        def check(group_a, group_b):
+            for a, (ax, ay, aw, ah) in group_a:
+                ar, ab = ax + aw, ay + ah
+                for b, (bx, by, bw, bh) in group_b:
+                    if bx < ar and ax < bx + bw and by < ab and ay < by + bh:
+                        append((a, b) if a < b else (b, a))
+
+        groups = {cell: [(h, rects[h]) for h in bucket if rects[h][2] > 0 and rects[h][3] > 0]
+                  for cell, bucket in cells.items()}
+        for (cx, cy), members in groups.items():
+            for i, (a, (ax, ay, aw, ah)) in enumerate(members):
+                ar, ab = ax + aw, ay + ah
+                for b, (bx, by, bw, bh) in members[i + 1:]:
+                    if bx < ar and ax < bx + bw and by < ab and ay < by + bh:
+                        append((a, b) if a < b else (b, a))
+            for dx, dy in _FORWARD_NEIGHBORS:
+                other = groups.get((cx + dx, cy + dy))
+                if other:
+                    check(members, other)
+        large = [(h, rects[h]) for h in sorted(self.large) if rects[h][2] > 0 and rects[h][3] > 0]
+        for i, item in enumerate(large):
+            check((item,), large[i + 1:])
+            for members in groups.values():
+                check((item,), members)
+        hits.sort()
+        return hits
@@ -0,0 +1,68 @@
+# startup_profile.py
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple, Any
+
+# 📢 시작 시간 프로파일러
+# main.py가 가장 먼저 이 모듈을 import 하므로, 여기서 잰 시각이 모든 구간의 기준점(0 ms)이 됩니다.
+# - mark(name): 직전 mark 이후 경과 시간을 하나의 구간(import/init 등)으로 기록합니다.
+# - timed(name): 지연 초기화처럼 어느 시점에 일어날지 모르는 작업의 소요 시간을 따로 기록합니다.
+# PROFILE_ENV 환경 변수가 설정되어 있으면 첫 타이틀 프레임 직후 결과를 JSON으로 출력하고 종료합니다.
+# (tools/profile_startup.py 가 이 방식으로 main.py를 실행합니다)
+
+PROFILE_ENV = "BOUNCE_PROFILE_STARTUP"
+
+_T0 = time.perf_counter()
+
+_marks: List[Tuple[str, float]] = []
+_timed: Dict[str, float] = {}
+
+
+def _elapsed_ms(t: float) -> float:
+    return (t - _T0) * 1000
+
+
+def mark(name: str) -> None:
+    _marks.append((name, time.perf_counter()))
+
+
+@contextmanager
+def timed(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timed[name] = _timed.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+def is_enabled() -> bool:
+    return bool(os.environ.get(PROFILE_ENV))
+
+
+def get_report() -> Dict[str, Any]:
+    phases = []
+    prev = _T0
+    for name, t in _marks:
+        phases.append({"phase": name, "ms": (t - prev) * 1000, "at_ms": _elapsed_ms(t)})
+        prev = t
+    return {
+        "phases": phases,
+        "timed": dict(_timed),
+        "total_ms": _elapsed_ms(_marks[-1][1]) if _marks else 0.0,
+    }
+
+
+def first_frame(name: str = "first title frame") -> bool:
+    """첫 화면이 표시된 시점을 기록합니다. 프로파일 모드이면 결과를 출력하고 True(종료 요청)를 반환합니다."""
+    if any(n == name for n, _ in _marks):
+        return False
+    mark(name)
+    if not is_enabled():
+        return False
+    sys.stdout.write(json.dumps(get_report()) + "\n")
+    sys.stdout.flush()
+    return True
@@ -0,0 +1,312 @@
+# status_effects.py
+
+import heapq
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from player_state import PlayerState, STUNNED, CONFUSED, FROZEN, DASHING
+
+# 📢 상태 이상 엔진 (최소 힙 타이머)
+# 빙결/스턴/혼란/대시/버프/독은 모두 StatusEngine.apply(대상, 이름, 지속 시간)으로 겁니다.
+# 걸 때 만료 시각(과 독처럼 주기 효과가 있으면 다음 틱 시각)을 힙에 넣어 두고,
+# 경기 틱마다 advance(now)가 시각이 된 이벤트만 꺼내 처리합니다.
+# 시각이 된 이벤트가 없으면 (대부분의 틱) 힙의 맨 앞을 한 번 비교하고 끝나므로
+# 틱당 비용은 효과 종류 수나 걸려 있는 효과 수와 관계가 없습니다.
+# - 다시 걸어 만료 시각이 바뀌거나 해제된 효과의 이전 이벤트는 힙에서 지우지 않고, 꺼낼 때 버전을 비교해 버립니다.
+# - 대상의 상태 필드(flags 비트, frozen_end_time 같은 만료 시각, 독의 status_effects 항목)는 그대로 유지하므로
+#   HUD/스킬 코드는 기존처럼 읽으면 됩니다.
+# - 만료 판정은 기존 규칙과 같습니다: 플래그/버프는 now > 만료 시각, 독은 now >= 만료 시각에 해제됩니다.
+
+# 독처럼 주기 효과의 다음 틱은 이 값만큼 일찍 깨워 정확한 조건(now - last_tick >= 간격)으로 다시 확인합니다.
+# (부동소수점 시각에서 last + 간격 비교와 now - last 비교가 1ulp 차이로 달라지는 경우 대비)
+_WAKE_EARLY_MS = 1e-6
+
+# 힙 이벤트 동작
+_EXPIRE = 0
+_TICK = 1
+
+
+class StatusEffect:
+    """상태 이상 종류. register_effect()로 EFFECT_TYPES[name]에 등록합니다.
+
+    기본 동작은 flag 비트를 켜고 end_key 필드에 만료 시각을 기록했다가, 만료되면 둘 다 지웁니다.
+    """
+
+    name = ""
+    flag = 0                           # 걸려 있는 동안 켜는 PlayerState.flags 비트 (0이면 없음)
+    end_key: Optional[str] = None      # 만료 시각을 기록하는 상태 키 (HUD의 남은 시간 표시, 스킬의 버프 확인)
+    blocked_by = 0                     # 대상에게 이 플래그 중 하나라도 켜져 있으면 걸리지 않음
+    strict = True                      # True: now > 만료 시각에 해제 / False: now >= 만료 시각에 해제
+    tick_ms = 0.0                      # 0보다 크면 이 간격마다 on_tick 호출
+    suppresses: Tuple[str, ...] = ()   # 걸릴 때 함께 해제하는 효과 이름
+
+    def on_apply(self, engine: "StatusEngine", record: "ActiveEffect", now: float, fresh: bool,
+                 params: Dict[str, Any]) -> None:
+        target = record.target
+        target.flags |= self.flag
+        if self.end_key:
+            target[self.end_key] = record.end_time
+
+    def on_expire(self, engine: "StatusEngine", record: "ActiveEffect", now: float) -> None:
+        target = record.target
+        target.flags &= ~self.flag
+        if self.end_key:
+            target[self.end_key] = 0
+
+    def on_tick(self, engine: "StatusEngine", record: "ActiveEffect", now: float) -> None:
+        pass
+
+
+# 이름 -> 상태 이상 종류
+EFFECT_TYPES: Dict[str, StatusEffect] = {}
+
+
+def register_effect(cls):
+    """상태 이상 종류 등록 데코레이터 (새 버프/디버프는 StatusEffect를 상속해 name과 동작을 정의합니다)"""
+    EFFECT_TYPES[cls.name] = cls()
+    return cls
+
+
+class ActiveEffect:
+    """대상에게 걸려 있는 효과 하나 (힙 이벤트가 참조)"""
+
+    __slots__ = ("effect", "target", "end_time", "version", "alive", "data")
+
+    def __init__(self, effect: StatusEffect, target: PlayerState):
+        self.effect = effect
+        self.target = target
+        self.end_time = 0.0
+        self.version = 0    # 다시 걸 때마다 증가 (이전 만료 이벤트 무효화)
+        self.alive = True   # 만료/해제되면 False (남은 이벤트 무효화)
+        self.data: Optional[Dict[str, Any]] = None # 종류별 부가 상태 (독: status_effects 항목)
+
+
+class StatusEngine:
+    """한 경기의 상태 이상 타이머 (Match.status, 스킬은 world["status"]로 사용)"""
+
+    def __init__(self, clock, on_damage: Optional[Callable[[PlayerState, Optional[str], Optional[str], float], None]] = None,
+                 on_applied: Optional[Callable[[PlayerState, str, float], None]] = None):
+        self.clock = clock
+        # 📢 지속 피해 콜백 (target, owner, source, damage) — Match가 통계/전투 이벤트로 전달
+        self.on_damage = on_damage
+        # 📢 효과 적용 콜백 (target, name, duration_ms) — Match가 전투 이벤트로 전달
+        self.on_applied = on_applied
+        # (시각, strict, 순번, 효과, 버전, 동작). 같은 시각이면 >= 판정(strict=False) 이벤트가 먼저 나옵니다.
+        self._heap: list = []
+        self._seq = 0
+        self._active: Dict[Tuple[PlayerState, str], ActiveEffect] = {}
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def _push(self, due: float, strict: bool, record: ActiveEffect, action: int) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (due, strict, self._seq, record, record.version, action))
+
+    def apply(self, target: PlayerState, name: str, duration_ms: float, now: Optional[float] = None,
+              **params: Any) -> bool:
+        """target에 효과를 겁니다. 이미 걸려 있으면 만료 시각을 새로 정합니다. (blocked_by 때문에 걸리지 않으면 False)"""
+        effect = EFFECT_TYPES[name]
+        if target.flags & effect.blocked_by:
+            return False
+        if now is None:
+            now = self.clock.get_ticks()
+        for other in effect.suppresses:
+            self.cancel(target, other, now)
+
+        key = (target, name)
+        record = self._active.get(key)
+        fresh = record is None
+        if fresh:
+            record = self._active[key] = ActiveEffect(effect, target)
+        else:
+            record.version += 1
+        record.end_time = now + duration_ms
+        effect.on_apply(self, record, now, fresh, params)
+        self._push(record.end_time, effect.strict, record, _EXPIRE)
+        if fresh and effect.tick_ms > 0:
+            self.schedule_tick(record, now + effect.tick_ms)
+        if self.on_applied is not None:
+            self.on_applied(target, name, duration_ms)
+        return True
+
+    def schedule_tick(self, record: ActiveEffect, due: float) -> None:
+        """record의 다음 on_tick을 due 시각 무렵에 호출하도록 예약합니다. (on_tick이 정확한 조건을 다시 확인)"""
+        self._push(due - _WAKE_EARLY_MS, False, record, _TICK)
+
+    def recheck_next_tick(self, record: ActiveEffect, now: float) -> None:
+        """이번 틱이 아니라 다음 경기 틱에 on_tick을 다시 호출합니다."""
+        self._push(now, True, record, _TICK)
+
+    def cancel(self, target: PlayerState, name: str, now: Optional[float] = None) -> bool:
+        """걸려 있는 효과를 즉시 해제합니다. (만료와 같은 정리 동작 실행)"""
+        record = self._active.pop((target, name), None)
+        if record is None:
+            return False
+        record.alive = False
+        record.effect.on_expire(self, record, self.clock.get_ticks() if now is None else now)
+        return True
+
+    def is_active(self, target: PlayerState, name: str) -> bool:
+        return (target, name) in self._active
+
+    def remaining(self, target: PlayerState, name: str, now: Optional[float] = None) -> float:
+        """남은 시간(ms). 걸려 있지 않으면 0"""
+        record = self._active.get((target, name))
+        if record is None:
+            return 0
+        return max(0, record.end_time - (self.clock.get_ticks() if now is None else now))
+
+    def advance(self, now: float) -> None:
+        """now까지 시각이 된 만료/주기 이벤트를 시각 순서대로 처리합니다. (경기 틱마다 한 번)"""
+        heap = self._heap
+        while heap:
+            due, strict, _, record, version, action = heap[0]
+            if due > now or (strict and due == now):
+                return
+            heapq.heappop(heap)
+            if not record.alive:
+                continue
+            if action == _TICK:
+                record.effect.on_tick(self, record, now)
+            elif version == record.version:
+                record.alive = False
+                del self._active[(record.target, record.effect.name)]
+                record.effect.on_expire(self, record, now)
+
+    def snapshot(self) -> tuple:
+        """힙/걸려 있는 효과/효과별 상태를 되돌릴 수 있게 저장합니다. (snapshot.py, 대상 PlayerState 필드는 따로 저장)
+        효과 객체는 그대로 참조하고 바뀌는 값(만료 시각, 버전, 독 항목 내용)만 복사합니다."""
+        records = {id(entry[3]): entry[3] for entry in self._heap}
+        for record in self._active.values():
+            records[id(record)] = record
+        return (self._seq, list(self._heap), dict(self._active),
+                [(r, r.end_time, r.version, r.alive, r.data, None if r.data is None else r.data.copy())
+                 for r in records.values()])
+
+    def restore(self, saved: tuple) -> None:
+        """snapshot() 시점으로 되돌립니다. (독 항목은 같은 딕셔너리 객체의 내용을 되돌려 status_effects와의 연결을 유지)"""
+        self._seq, heap, active, records = saved
+        self._heap[:] = heap
+        self._active.clear()
+        self._active.update(active)
+        for record, end_time, version, alive, data, contents in records:
+            record.end_time = end_time
+            record.version = version
+            record.alive = alive
+            record.data = data
+            if data is not None:
+                data.clear()
+                data.update(contents)
+
+    def clear(self) -> None:
+        """모든 효과를 정리 동작 없이 버립니다. (경기 종료)"""
+        for record in self._active.values():
+            record.alive = False
+        self._active.clear()
+        self._heap.clear()
+
+
+# --- 기본 상태 이상 ---
+
+@register_effect
+class Freeze(StatusEffect):
+    """🧊 빙결: 이동/점프/스킬 불가. 걸리면 스턴/혼란/대시/이동 속도 버프가 풀리고, 빙결 중에는 다시 걸리지 않습니다."""
+    name = "freeze"
+    flag = FROZEN
+    end_key = "frozen_end_time"
+    blocked_by = FROZEN
+    suppresses = ("stun", "confusion", "dash", "speed_boost")
+
+
+@register_effect
+class Stun(StatusEffect):
+    """스턴: 이동/점프/스킬 불가. 스턴/빙결 중에는 다시 걸리지 않습니다. (지속 시간 갱신 없음)"""
+    name = "stun"
+    flag = STUNNED
+    end_key = "stun_end_time"
+    blocked_by = STUNNED | FROZEN
+
+
+@register_effect
+class Confusion(StatusEffect):
+    """혼란: 좌우 이동 반전. 다시 걸리면 지속 시간이 갱신됩니다."""
+    name = "confusion"
+    flag = CONFUSED
+    end_key = "confusion_end_time"
+    blocked_by = FROZEN
+
+
+@register_effect
+class Dash(StatusEffect):
+    """💨 대시: 지속 시간 동안 입력 대신 현재 vx로 이동하고, 끝나면 멈춥니다."""
+    name = "dash"
+    flag = DASHING
+    end_key = "dash_end_time"
+    blocked_by = FROZEN
+
+    def on_expire(self, engine, record, now) -> None:
+        super().on_expire(engine, record, now)
+        record.target.vx = 0
+
+
+@register_effect
+class SpeedBoost(StatusEffect):
+    """🚀 이동 속도 버프 (경기 루프가 now < speed_boost_end_time 동안 적용)"""
+    name = "speed_boost"
+    end_key = "speed_boost_end_time"
+    blocked_by = FROZEN
+
+
+@register_effect
+class DamageBoost(StatusEffect):
+    """🔫 조커 기술 1 데미지 버프 (기술 1이 skill1_damage_boost_end_time > now 동안 적용)"""
+    name = "damage_boost"
+    end_key = "skill1_damage_boost_end_time"
+
+
+@register_effect
+class Poison(StatusEffect):
+    """🟢 독: 100ms마다 dps * max_hp * 0.4 피해. 다시 걸리면 만료 시각/세기/시전자만 갱신합니다. (틱 주기는 유지)
+
+    params: dps, owner, source. 상태는 HUD가 읽는 status_effects 항목({"type": "poison", ...})에 보관합니다.
+    """
+    name = "poison"
+    strict = False
+    tick_ms = 100
+
+    def on_apply(self, engine, record, now, fresh, params) -> None:
+        if fresh:
+            record.data = {
+                "type": "poison",
+                "started_at": now,
+                "expires_at": record.end_time,
+                "dps": float(params.get("dps", 0.0)),
+                "last_tick": now,
+                "owner": params.get("owner"),
+                "source": params.get("source"),
+            }
+            record.target.status_effects.append(record.data)
+        else:
+            data = record.data
+            data["expires_at"] = record.end_time
+            data["dps"] = float(params.get("dps", 0.0))
+            data["owner"] = params.get("owner")
+            data["source"] = params.get("source")
+
+    def on_expire(self, engine, record, now) -> None:
+        record.target.status_effects.remove(record.data)
+
+    def on_tick(self, engine, record, now) -> None:
+        data = record.data
+        if now >= data["expires_at"]:
+            return # 같은 advance()에서 만료 이벤트가 처리됩니다.
+        if now - data["last_tick"] < self.tick_ms:
+            engine.recheck_next_tick(record, now)
+            return
+        target = record.target
+        hp_before = target.hp
+        target.hp = max(0, hp_before - int(data["dps"] * target.max_hp * 0.4))
+        if engine.on_damage is not None:
+            engine.on_damage(target, data["owner"], data["source"], hp_before - target.hp)
+        data["last_tick"] = now
+        engine.schedule_tick(record, now + self.tick_ms)
@@ -0,0 +1,153 @@
+# tools/bench_broadphase.py
+#
+# 📢 충돌 광역 단계(공간 해시) 벤치마크
+# 사용법 (저장소 루트에서): python src/tools/bench_broadphase.py [--ticks 200] [--counts 10 100 1000]
+#
+# 캐릭터 2명과 N개의 항목(범위 이펙트 최대 5개, 나머지는 투사체 80% / 근접 히트박스 20%)이 매 틱 움직이는 장면에서
+# 틱당 비용을 두 가지 질의로 비교합니다. (결과가 같은지도 확인합니다)
+# 1) 캐릭터 대 항목: 전부 선형 검사 vs 격자 증분 갱신 + 캐릭터 칸 질의 + 후보만 좁은 단계
+#    캐릭터가 두 명뿐이라 항목 수와 관계없이 선형 검사가 더 싸므로, 경기의 collision 시스템은 항상 선형 검사입니다.
+# 2) 모든 항목 쌍 (투사체 상쇄, Match.enable_clash): 전부 쌍 검사 O(N^2) vs 격자 증분 갱신 + 칸 공유 쌍만 좁은 단계
+#    경기의 격자(Match.enable_broad_phase)는 이 질의(Match.projectile_pairs)에만 사용합니다.
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spatial_hash import SpatialHash
+from match import HITBOX_WIDTH, HITBOX_HEIGHT
+
+SCREEN_W, SCREEN_H = 1920, 1080
+
+
+def make_entities(rng: random.Random, n: int):
+    """[x, y, vx, vy, size] 목록 (범위 이펙트는 경기처럼 최대 5개)"""
+    areas = min(5, max(1, n // 50))
+    out = []
+    for i in range(n):
+        if i < areas:
+            size = rng.randint(400, 800)
+        elif rng.random() < 0.8:
+            size = rng.randint(30, 100)
+        else:
+            size = rng.randint(120, 300)
+        out.append([rng.uniform(0, SCREEN_W - size), rng.uniform(0, SCREEN_H - size),
+                    rng.uniform(-10, 10), rng.uniform(-4, 4), size])
+    return out
+
+
+def move(entities):
+    for e in entities:
+        e[0] += e[2]
+        e[1] += e[3]
+        if e[0] < -e[4] or e[0] > SCREEN_W:
+            e[2] = -e[2]
+        if e[1] < -e[4] or e[1] > SCREEN_H:
+            e[3] = -e[3]
+
+
+def overlaps(ax, ay, asize_w, asize_h, bx, by, bw, bh):
+    return asize_w > 0 and bw > 0 and ax < bx + bw and bx < ax + asize_w and ay < by + bh and by < ay + asize_h
+
+
+def fighters_linear(entities, fighters):
+    hits = []
+    for fi, (fx, fy) in enumerate(fighters):
+        for i, e in enumerate(entities):
+            x, y, s = int(e[0]), int(e[1]), e[4]
+            if overlaps(x, y, s, s, fx, fy, HITBOX_WIDTH, HITBOX_HEIGHT):
+                hits.append((fi, i))
+    return hits
+
+
+def fighters_grid(grid, entities, fighters):
+    for i, e in enumerate(entities):
+        s = e[4]
+        grid.update(i, int(e[0]), int(e[1]), s, s)
+    hits = []
+    for fi, (fx, fy) in enumerate(fighters):
+        for i in sorted(grid.query(fx, fy, HITBOX_WIDTH, HITBOX_HEIGHT)):
+            e = entities[i]
+            x, y, s = int(e[0]), int(e[1]), e[4]
+            if overlaps(x, y, s, s, fx, fy, HITBOX_WIDTH, HITBOX_HEIGHT):
+                hits.append((fi, i))
+    return hits
+
+
+def pairs_brute(entities):
+    boxes = [(int(e[0]), int(e[1]), e[4]) for e in entities]
+    hits = []
+    for i in range(len(boxes)):
+        ax, ay, asz = boxes[i]
+        for j in range(i + 1, len(boxes)):
+            bx, by, bsz = boxes[j]
+            if overlaps(ax, ay, asz, asz, bx, by, bsz, bsz):
+                hits.append((i, j))
+    return hits
+
+
+def pairs_grid(grid, entities):
+    for i, e in enumerate(entities):
+        s = e[4]
+        grid.update(i, int(e[0]), int(e[1]), s, s)
+    return grid.overlapping_pairs()
+
+
+def bench(n: int, ticks: int, seed: int = 0):
+    rng = random.Random(seed)
+    entities = make_entities(rng, n)
+    fighters = [(200, 700), (1500, 700)]
+    grid_f, grid_p = SpatialHash(), SpatialHash()
+    totals = {"fighters_linear": 0.0, "fighters_grid": 0.0, "pairs_brute": 0.0, "pairs_grid": 0.0}
+    candidates = 0
+    overlapping = 0
+    pair_ticks = ticks if n <= 100 else max(1, ticks // 10) # O(N^2) 검사는 1,000개에서 틱 수를 줄여 측정
+    for tick in range(ticks):
+        move(entities)
+        t0 = time.perf_counter()
+        a = fighters_linear(entities, fighters)
+        t1 = time.perf_counter()
+        b = fighters_grid(grid_f, entities, fighters)
+        t2 = time.perf_counter()
+        assert a == sorted(b), "캐릭터 질의 결과가 다릅니다"
+        totals["fighters_linear"] += t1 - t0
+        totals["fighters_grid"] += t2 - t1
+        if tick < pair_ticks:
+            t0 = time.perf_counter()
+            c = pairs_brute(entities)
+            t1 = time.perf_counter()
+            d = pairs_grid(grid_p, entities)
+            t2 = time.perf_counter()
+            assert c == d, "쌍 질의 결과가 다릅니다"
+            totals["pairs_brute"] += t1 - t0
+            totals["pairs_grid"] += t2 - t1
+            candidates += len(grid_p.candidate_pairs())
+            overlapping += len(c)
+    us = {k: v / (ticks if k.startswith("fighters") else pair_ticks) * 1e6 for k, v in totals.items()}
+    us["candidate_pairs"] = candidates / pair_ticks
+    us["all_pairs"] = n * (n - 1) / 2
+    us["overlapping"] = overlapping / pair_ticks
+    return us
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="공간 해시 광역 단계 벤치마크")
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args(argv)
+
+    print(f"{'N':>6}{'캐릭터: 선형':>14}{'격자':>10}{'쌍: 전부':>14}{'격자':>10}{'겹침/후보/전체 쌍':>24}")
+    for n in args.counts:
+        r = bench(n, args.ticks)
+        print(f"{n:>6}{r['fighters_linear']:>12.1f}us{r['fighters_grid']:>8.1f}us"
+              f"{r['pairs_brute']:>12.1f}us{r['pairs_grid']:>8.1f}us"
+              f"{r['overlapping']:>10.0f}/{r['candidate_pairs']:.0f}/{r['all_pairs']:.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# tools/bench_ecs.py
+#
+# 📢 엔티티-컴포넌트 레지스트리(ecs.py) 벤치마크
+# 사용법 (저장소 루트에서): python src/tools/bench_ecs.py [--ticks 2000] [--counts 10 100 1000]
+#
+# 1) 살아 있는 항목 엔티티 수에 따른 틱당 비용: 실제 경기(Match)에 투사체/근접 히트박스/이펙트/얼음 블록 엔티티를
+#    같은 비율로 N개 유지하며(사라진 만큼 틱 사이에 Match.spawn으로 보충) projectiles/collision 시스템과 틱 전체의 비용을 잽니다.
+#    두 시스템은 생성 순서로 정렬된 뷰(match.items, match.colliders)의 행만 순회하므로 충돌하지 않는 얼음 블록은 충돌 검사에서 빠지고,
+#    엔티티 생성/삭제(뷰 증분 갱신)와 풀 반납 비용도 포함됩니다.
+# 2) 경기 한 틱의 시스템별 비용 (Match.systems, 기본 SYSTEMS 순서)
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from headless import KeyState, run_match
+from match import Match
+from skills.skills_base import Projectile, MeleeHitbox, AnimatedEffect
+from skills.iceman_skills import IceBlock
+
+ITEM_SIZE = 80
+KINDS = ("projectile", "hitbox", "effect", "ice")
+MEASURED = ("projectiles", "collision")
+
+
+def make_item(kind: str, match: Match, rng: random.Random, img: pygame.Surface):
+    """kind 종류의 항목 객체 (화면 안 임의 위치, 두 캐릭터 소유 반반)"""
+    owner = rng.choice(("p1", "p2"))
+    x = rng.uniform(0, match.screen_width - ITEM_SIZE)
+    y = rng.uniform(match.ground_y - 400, match.ground_y - ITEM_SIZE)
+    clock = match.clock
+    if kind == "projectile":
+        return Projectile.acquire(x, y, rng.choice((-8, 8)), img, damage=1, owner=owner, size=ITEM_SIZE, clock=clock)
+    if kind == "hitbox":
+        return MeleeHitbox.acquire(x, y, 1, owner, duration_ms=rng.randint(100, 400), size=ITEM_SIZE, clock=clock)
+    if kind == "effect":
+        return AnimatedEffect.acquire(x, y, [img], rng.randint(100, 400), owner, ITEM_SIZE, clock=clock)
+    return IceBlock.acquire(x, y, ITEM_SIZE, owner, rng.randint(200, 800), clock=clock)
+
+
+def per_tick_us(n: int, ticks: int, seed: int = 0):
+    """항목 엔티티 n개를 유지하는 경기의 (projectiles us, collision us, 틱 전체 us, 평균 충돌 항목 수)"""
+    rng = random.Random(seed)
+    img = pygame.Surface((ITEM_SIZE, ITEM_SIZE))
+    match = Match("haegol", "joker")
+    totals = dict.fromkeys(MEASURED, 0.0)
+
+    def timed(name, system):
+        def run(*args):
+            start = time.perf_counter()
+            system(*args)
+            totals[name] += time.perf_counter() - start
+        return run
+
+    for name in MEASURED:
+        match.systems.replace(name, timed(name, match.systems.get(name)))
+    keys = KeyState()
+    kind = 0
+    colliders = 0
+    step_s = 0.0
+    for _ in range(ticks):
+        fresh = []
+        for _ in range(n - len(match.items)):
+            fresh.append(make_item(KINDS[kind % len(KINDS)], match, rng, img))
+            kind += 1
+        match.spawn(*fresh)
+        for state in (match.p1, match.p2):
+            state.hp = state.max_hp # 경기가 끝나지 않도록 유지
+        colliders += len(match.colliders)
+        start = time.perf_counter()
+        match.step(keys)
+        step_s += time.perf_counter() - start
+    match.close()
+    return (totals["projectiles"] / ticks * 1e6, totals["collision"] / ticks * 1e6,
+            step_s / ticks * 1e6, colliders / ticks)
+
+
+def system_costs():
+    """기본 경기(aggressive 봇끼리)에서 시스템별 틱당 비용 (us)"""
+    import match as match_module
+
+    totals = {name: 0.0 for name, _ in match_module.SYSTEMS}
+
+    def timed(name, system):
+        def run(*args):
+            start = time.perf_counter()
+            system(*args)
+            totals[name] += time.perf_counter() - start
+        return run
+
+    original = match_module.SYSTEMS
+    match_module.SYSTEMS = tuple((name, timed(name, system)) for name, system in original)
+    try:
+        ticks = sum(run_match(a, b, seed=1)["ticks"] for a, b in (("haegol", "joker"), ("witch", "iceman")))
+    finally:
+        match_module.SYSTEMS = original
+    return {name: total / ticks * 1e6 for name, total in totals.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="엔티티-컴포넌트 레지스트리 벤치마크")
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args(argv)
+
+    print("항목 엔티티 수별 틱당 비용 (투사체/근접 히트박스/이펙트/얼음 블록 같은 비율)")
+    print(f"{'항목':>8}{'충돌 항목':>10}{'projectiles':>14}{'collision':>12}{'틱 전체':>12}")
+    for n in args.counts:
+        projectiles_us, collision_us, step_us, colliders = per_tick_us(n, args.ticks)
+        print(f"{n:>8}{colliders:>12.0f}{projectiles_us:>12.1f}us{collision_us:>10.1f}us{step_us:>10.1f}us")
+
+    print("\n경기 시스템별 틱당 비용")
+    for name, us in system_costs().items():
+        print(f"{name:>16}{us:>8.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+# tools/bench_player_state.py
+#
+# 📢 PlayerState(슬롯 + 비트필드) 마이크로벤치마크
+# 사용법 (저장소 루트에서): python src/tools/bench_player_state.py [--ticks 20000] [--matches 4]
+#
+# 1) 플레이어 상태 단계(상태 이상 만료, 게이지, 이동 입력, 물리)의 틱당 비용을
+#    이전 딕셔너리 구현(아래 legacy_* 함수, 교체 전 코드 그대로)과 경기가 실제로 실행하는 status/movement/physics 시스템으로 비교합니다.
+# 2) 필드 하나를 읽는 비용 (dict.get / 슬롯 속성 / 플래그 비트 / 딕셔너리 호환 접근)
+# 3) 봇 대 봇 헤드리스 경기 전체의 틱당 비용 (참고용)
+
+import os
+import sys
+import time
+import timeit
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import KeyState, run_match
+from match import (Match, SYSTEMS, KEY_BINDINGS, SIM_DT_MS, BASE_SPEED, GRAVITY, CHAR_SIZE, STARTING_HP,
+                   GAUGE_PASSIVE_GAIN_PER_MS, MOVE_BOOST_PERCENTAGE)
+from player_state import FROZEN
+
+
+# --- 교체 전 딕셔너리 구현 (비교 기준) ---
+
+def legacy_player_dict(x, y):
+    return {"x": x, "y": y, "vx": 0, "vy": 0, "on_ground": True, "hp": STARTING_HP, "ultimate_gauge": 0, "max_hp": STARTING_HP,
+            "is_stunned": False, "stun_end_time": 0, "invincible_end_time": 0,
+            "is_confused": False, "confusion_end_time": 0, "speed_boost_end_time": 0,
+            "is_frozen": False, "frozen_end_time": 0,
+            "is_dashing": False, "dash_end_time": 0, "last_input_key": None,
+            "status_effects": [], "jump_count": 0}
+
+
+def legacy_update_status_effects(entity):
+    if not isinstance(entity, dict):
+        return
+    effects = entity.get("status_effects")
+    if not effects:
+        return
+
+
+def legacy_update_players(p1, p2, current_time, dt, keys):
+    for char_state in [p1, p2]:
+        if char_state.get("is_frozen", False):
+            if current_time > char_state["frozen_end_time"]:
+                char_state["is_frozen"] = False
+                char_state["frozen_end_time"] = 0
+            else:
+                char_state["is_stunned"] = False
+                char_state["is_confused"] = False
+                char_state["speed_boost_end_time"] = 0
+                char_state["is_dashing"] = False
+                char_state["vx"] = 0
+        if char_state.get("is_stunned", False) and not char_state.get("is_frozen", False):
+            if current_time > char_state["stun_end_time"]:
+                char_state["is_stunned"] = False
+                char_state["stun_end_time"] = 0
+            else:
+                char_state["vx"] = 0
+        if char_state.get("is_dashing", False) and not char_state.get("is_frozen", False):
+            if current_time > char_state["dash_end_time"]:
+                char_state["is_dashing"] = False
+                char_state["dash_end_time"] = 0
+                char_state["vx"] = 0
+        if char_state.get("is_confused", False) and current_time > char_state["confusion_end_time"]:
+            char_state["is_confused"] = False
+            char_state["confusion_end_time"] = 0
+        if char_state.get("speed_boost_end_time", 0) > 0 and current_time > char_state["speed_boost_end_time"]:
+            char_state["speed_boost_end_time"] = 0
+        is_invincible = current_time < char_state.get("invincible_end_time", 0)
+        char_state["is_invincible"] = is_invincible
+
+    for char_state in [p1, p2]:
+        passive_gain = GAUGE_PASSIVE_GAIN_PER_MS * dt
+        char_state["ultimate_gauge"] = min(100, char_state["ultimate_gauge"] + passive_gain)
+        legacy_update_status_effects(char_state)
+
+    for char_state, bindings in ((p1, KEY_BINDINGS["p1"]), (p2, KEY_BINDINGS["p2"])):
+        speed = BASE_SPEED
+        if current_time < char_state.get("speed_boost_end_time", 0):
+            speed *= (1.0 + MOVE_BOOST_PERCENTAGE)
+        if not char_state.get("is_stunned", False) and not char_state.get("is_frozen", False) and not char_state.get("is_dashing", False):
+            direction = -1 if char_state.get("is_confused", False) else 1
+            if keys[bindings["left"]]: char_state["vx"] = -speed * direction
+            elif keys[bindings["right"]]: char_state["vx"] = speed * direction
+            else: char_state["vx"] = 0
+        elif not char_state.get("is_dashing", False):
+            char_state["vx"] = 0
+
+
+def legacy_integrate_physics(p1, p2, dt, initial_y, screen_width):
+    for char_state in [p1, p2]:
+        if char_state.get("is_dashing", False) and not char_state.get("is_frozen", False):
+            char_state["x"] += char_state["vx"] * (dt / 1000)
+        else:
+            char_state["vy"] += GRAVITY
+            char_state["x"] += char_state["vx"]
+        char_state["y"] += char_state["vy"]
+        if char_state["y"] >= initial_y:
+            char_state["y"] = initial_y
+            char_state["vy"] = 0
+            char_state["on_ground"] = True
+            char_state["jump_count"] = 0
+        else:
+            char_state["on_ground"] = False
+        char_state["x"] = max(0, min(screen_width - CHAR_SIZE, char_state["x"]))
+
+
+# --- 측정 ---
+
+def best_us(func, number):
+    """여러 번 반복해 가장 빠른 회차의 1회당 시간 (us)"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def bench_phases(ticks):
+    match = Match("haegol", "joker")
+    keys = KeyState([KEY_BINDINGS["p1"]["right"], KEY_BINDINGS["p2"]["left"]])
+    legacy_p1 = legacy_player_dict(200, match.initial_y)
+    legacy_p2 = legacy_player_dict(match.screen_width - 400, match.initial_y)
+    now = 1000.0
+    systems = dict(SYSTEMS)
+    status, movement, physics = systems["status"], systems["movement"], systems["physics"]
+
+    def run_new():
+        status(match, now, SIM_DT_MS, keys)
+        movement(match, now, SIM_DT_MS, keys)
+        physics(match, now, SIM_DT_MS, keys)
+
+    def run_legacy():
+        legacy_update_players(legacy_p1, legacy_p2, now, SIM_DT_MS, keys)
+        legacy_integrate_physics(legacy_p1, legacy_p2, SIM_DT_MS, match.initial_y, match.screen_width)
+
+    rows = [("보통 (이동 중)", best_us(run_legacy, ticks), best_us(run_new, ticks))]
+
+    # 상태 이상이 걸린 상태: 2P 빙결, 1P 스턴 (만료 전)
+    legacy_p1.update(is_stunned=True, stun_end_time=1e12)
+    legacy_p2.update(is_frozen=True, frozen_end_time=1e12)
+    match.status.apply(match.p1, "stun", 1e12, now)
+    match.status.apply(match.p2, "freeze", 1e12, now)
+    rows.append(("스턴/빙결 중", best_us(run_legacy, ticks), best_us(run_new, ticks)))
+    return rows
+
+
+def bench_access(ticks):
+    legacy = legacy_player_dict(0, 0)
+    state = Match("haegol", "joker").p1
+    number = ticks * 10
+    return [
+        ("dict.get(\"is_frozen\", False)", best_us(lambda: legacy.get("is_frozen", False), number) * 1000),
+        ("state.is_frozen (프로퍼티)", best_us(lambda: state.is_frozen, number) * 1000),
+        ("state.flags & FROZEN", best_us(lambda: state.flags & FROZEN, number) * 1000),
+        ("dict[\"x\"]", best_us(lambda: legacy["x"], number) * 1000),
+        ("state.x (슬롯)", best_us(lambda: state.x, number) * 1000),
+        ("state[\"x\"] (호환 접근)", best_us(lambda: state["x"], number) * 1000),
+    ]
+
+
+def bench_matches(matches):
+    ticks = 0
+    start = time.perf_counter()
+    for seed in range(matches):
+        ticks += run_match("haegol", "joker", seed=seed)["ticks"]
+    return (time.perf_counter() - start) / ticks * 1e6, ticks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PlayerState 마이크로벤치마크")
+    parser.add_argument("--ticks", type=int, default=20000, help="단계별 측정 반복 횟수")
+    parser.add_argument("--matches", type=int, default=4, help="전체 틱 측정에 사용할 경기 수")
+    args = parser.parse_args(argv)
+
+    print("플레이어 상태 단계 (두 플레이어, 틱당)")
+    print(f"{'':16}{'dict':>10}{'PlayerState':>14}{'감소':>8}")
+    for name, legacy_us, new_us in bench_phases(args.ticks):
+        print(f"{name:16}{legacy_us:>8.2f}us{new_us:>12.2f}us{1 - new_us / legacy_us:>8.0%}")
+
+    print()
+    print("필드 접근 1회")
+    for name, ns in bench_access(args.ticks):
+        print(f"  {name:32}{ns:>7.1f}ns")
+
+    if args.matches:
+        us, ticks = bench_matches(args.matches)
+        print()
+        print(f"헤드리스 경기 전체: {us:.1f}us/틱 ({ticks}틱)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# tools/bench_pools.py
+#
+# 📢 오브젝트 풀 벤치마크 (궁극기 위주의 긴 경기)
+# 사용법 (저장소 루트에서): python src/tools/bench_pools.py [--ticks 20000] [--warmup 600] [p1 p2]
+#
+# 양쪽 궁극기 게이지를 매 틱 가득 채운 봇 대 봇 경기를 HP가 줄지 않게 유지하며 길게 돌리고,
+# 워밍업 이후 구간에서 다음을 풀 사용/미사용으로 비교합니다.
+# - 틱당 새로 만든 투사체/히트박스/이펙트 수 (풀 카운터 created)
+# - GC 수집 횟수(세대별)와 GC 일시정지 시간 (gc.callbacks)
+# - 틱당 시뮬레이션 비용
+
+import os
+import gc
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import BotDriver, aggressive_bot
+from match import Match
+from skills import object_pool
+
+
+class GcMonitor:
+    """gc.callbacks로 세대별 수집 횟수와 일시정지 시간을 기록합니다."""
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pauses_ms = []
+        self._start = 0.0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.collections[info["generation"]] += 1
+            self.pauses_ms.append((time.perf_counter() - self._start) * 1000)
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def run(p1, p2, pooling, warmup, ticks):
+    object_pool.set_pooling(pooling)
+    object_pool.reset_pool_stats(clear_free=True)
+    match = Match(p1, p2)
+    driver = BotDriver(match, aggressive_bot, aggressive_bot, seed=0)
+
+    def tick():
+        # 📢 궁극기를 계속 쓰도록 게이지를 채우고, 경기가 끝나지 않도록 HP를 유지합니다.
+        for state in (match.p1, match.p2):
+            state.ultimate_gauge = 100
+            state.hp = state.max_hp
+        driver.step()
+
+    for _ in range(warmup):
+        tick()
+
+    gc.collect()
+    created_before = object_pool.total_created()
+    with GcMonitor() as monitor:
+        start = time.perf_counter()
+        for _ in range(ticks):
+            tick()
+        elapsed = time.perf_counter() - start
+    created = object_pool.total_created() - created_before
+    match.close()
+
+    return {
+        "us_per_tick": elapsed / ticks * 1e6,
+        "created_per_tick": created / ticks,
+        "reused": sum(s["reused"] for s in object_pool.pool_stats().values()),
+        "collections": monitor.collections,
+        "gc_total_ms": sum(monitor.pauses_ms),
+        "gc_max_ms": max(monitor.pauses_ms, default=0.0),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오브젝트 풀 할당/GC 벤치마크")
+    parser.add_argument("p1", nargs="?", default="leesaengseon")
+    parser.add_argument("p2", nargs="?", default="iceman")
+    parser.add_argument("--ticks", type=int, default=20000, help="측정 구간 틱 수")
+    parser.add_argument("--warmup", type=int, default=600, help="측정 전 워밍업 틱 수 (풀이 채워지는 구간)")
+    args = parser.parse_args(argv)
+
+    print(f"{args.p1} vs {args.p2}, 궁극기 상시 사용, {args.ticks}틱 (워밍업 {args.warmup}틱)")
+    print(f"{'':8}{'틱당 생성':>10}{'us/틱':>9}{'GC 0/1/2세대':>16}{'GC 합계':>10}{'GC 최대':>10}")
+    for pooling in (False, True):
+        r = run(args.p1, args.p2, pooling, args.warmup, args.ticks)
+        gens = "/".join(str(c) for c in r["collections"])
+        print(f"{'풀 사용' if pooling else '풀 없음':8}{r['created_per_tick']:>10.3f}{r['us_per_tick']:>9.1f}"
+              f"{gens:>16}{r['gc_total_ms']:>8.1f}ms{r['gc_max_ms']:>8.2f}ms")
+    object_pool.set_pooling(True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
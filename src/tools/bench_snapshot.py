@@ -0,0 +1,110 @@
+# tools/bench_snapshot.py
+#
+# 📢 경기 스냅샷/복원 벤치마크
+# 사용법 (저장소 루트에서): python src/tools/bench_snapshot.py [--ticks 1200] [--ring 16] [--rollback 8]
+#
+# 모든 캐릭터 조합을 aggressive 봇끼리 돌리면서 매 틱 SnapshotRing에 저장하고,
+# --every 틱마다 --rollback 틱 전 스냅샷으로 되돌려 같은 입력으로 다시 시뮬레이션합니다.
+# 1) 저장(Match.snapshot) 비용: 틱당 평균/최대, 버퍼 칸 수
+# 2) 복원(Match.restore) 비용과 되돌린 뒤 --rollback 틱 재시뮬레이션 비용
+# 3) 재시뮬레이션 결과(위치/체력/투사체 수)가 처음 진행과 같은지 확인합니다.
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import BotDriver, aggressive_bot
+from match import Match
+from snapshot import SnapshotRing
+
+CHARACTERS = ("haegol", "witch", "leesaengseon", "joker", "iceman")
+
+
+def observe(match: Match):
+    return (match.p1.x, match.p1.y, match.p1.hp, match.p2.x, match.p2.y, match.p2.hp,
+            match.p1.ultimate_gauge, match.p2.ultimate_gauge, len(match.items))
+
+
+def driver_state(driver: BotDriver):
+    return driver.rng.getstate(), {side: set(actions) for side, actions in driver.held.items()}
+
+
+def load_driver_state(driver: BotDriver, state) -> None:
+    driver.rng.setstate(state[0])
+    driver.held = {side: set(actions) for side, actions in state[1].items()}
+
+
+def run_pair(p1: str, p2: str, ticks: int, ring_size: int, rollback: int, every: int, totals: dict) -> int:
+    """한 조합을 돌리며 비용을 totals에 더하고, 재시뮬레이션이 달라진 횟수를 돌려줍니다."""
+    match = Match(p1, p2)
+    driver = BotDriver(match, aggressive_bot, aggressive_bot)
+    ring = SnapshotRing(ring_size)
+    drivers = [None] * ring_size
+    history = {}
+    mismatches = 0
+    perf = time.perf_counter
+    while match.tick < ticks and not match.finished:
+        start = perf()
+        buffer = ring.save(match)
+        elapsed = perf() - start
+        totals["save_s"] += elapsed
+        totals["save_max"] = max(totals["save_max"], elapsed)
+        totals["saves"] += 1
+        totals["slots"] = max(totals["slots"], buffer.size)
+        totals["projectiles"] += len(match.items)
+        drivers[match.tick % ring_size] = driver_state(driver)
+
+        if match.tick >= rollback and match.tick % every == 0:
+            now = match.tick
+            target = now - rollback
+            start = perf()
+            ring.restore(match, target)
+            totals["restore_s"] += perf() - start
+            load_driver_state(driver, drivers[target % ring_size])
+            for _ in range(rollback):
+                ring.save(match)
+                drivers[match.tick % ring_size] = driver_state(driver)
+                driver.step()
+                if observe(match) != history[match.tick]:
+                    mismatches += 1
+            totals["rollback_s"] += perf() - start
+            totals["rollbacks"] += 1
+            ring.save(match)
+
+        driver.step()
+        history[match.tick] = observe(match)
+    match.close()
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="경기 스냅샷/복원 벤치마크")
+    parser.add_argument("--ticks", type=int, default=1200)
+    parser.add_argument("--ring", type=int, default=16)
+    parser.add_argument("--rollback", type=int, default=8)
+    parser.add_argument("--every", type=int, default=10)
+    args = parser.parse_args(argv)
+    if not 0 < args.rollback < args.ring:
+        parser.error("--rollback은 1 이상 --ring 미만이어야 합니다.")
+
+    totals = {"save_s": 0.0, "save_max": 0.0, "saves": 0, "slots": 0, "projectiles": 0,
+              "restore_s": 0.0, "rollback_s": 0.0, "rollbacks": 0}
+    mismatches = 0
+    for p1 in CHARACTERS:
+        for p2 in CHARACTERS:
+            mismatches += run_pair(p1, p2, args.ticks, args.ring, args.rollback, args.every, totals)
+
+    saves, rollbacks = totals["saves"], max(1, totals["rollbacks"])
+    print(f"저장: {totals['save_s'] / saves * 1e6:.1f}us/틱 (최대 {totals['save_max'] * 1e6:.1f}us), "
+          f"버퍼 최대 {totals['slots']}칸, 평균 투사체 {totals['projectiles'] / saves:.1f}개")
+    print(f"복원: {totals['restore_s'] / rollbacks * 1e6:.1f}us")
+    print(f"되돌리기 + {args.rollback}틱 재시뮬레이션: {totals['rollback_s'] / rollbacks * 1e3:.2f}ms ({rollbacks}회)")
+    print(f"재시뮬레이션 결과: {'같음' if not mismatches else f'{mismatches}틱 다름'}")
+    return 0 if not mismatches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# tools/bench_startup_cache.py
+#
+# 📢 디스크 파생 자산 캐시 콜드/웜 시작 벤치마크
+# 사용법 (저장소 루트에서): python src/tools/bench_startup_cache.py [--runs 5] [--with-atlas]
+#
+# 빈 임시 캐시 디렉토리로 한 번(콜드) 실행한 뒤, 같은 디렉토리로 여러 번(웜) 실행하여
+# 메뉴 배경 + 맵 배경/룰렛 + 전 캐릭터의 파트/스킬 이미지를 준비하는 시간을 비교합니다.
+# 매 실행은 별도 프로세스로 띄우므로 프로세스 내 이미지 레지스트리의 영향을 받지 않습니다.
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import statistics
+import subprocess
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SRC_DIR)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def run_child(cache_dir, with_atlas):
+    """자식 프로세스: 시작 시 로드되는 이미지를 모두 준비하고 걸린 시간을 JSON으로 출력합니다."""
+    import pygame
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    import atlas
+    import assets
+    import derived_cache
+    from preload import GAMEPLAY_SCREEN_SIZE, roulette_sizes
+
+    derived_cache.set_cache_dir(cache_dir)
+    if not with_atlas:
+        atlas.disable_bundle()
+
+    from scenes.maps import map_config
+    from scenes.characters import character_config
+    from skills.skills_skills_loader import get_skills_for_character, get_runtime_images_for_character
+    from animation import Character
+
+    start = time.perf_counter()
+
+    menu_size = (1080, 720)
+    for path in ("assets/img/background.png", "assets/img/characters.png", "assets/img/maps.png"):
+        assets.load_background(path, menu_size)
+
+    roulette_size, pin_size = roulette_sizes(GAMEPLAY_SCREEN_SIZE[0])
+    assets.load_image(os.path.join("assets", "img", "roulette.png"), (roulette_size, roulette_size))
+    assets.load_image(os.path.join("assets", "img", "pin.png"), (pin_size, pin_size))
+    for map_data in map_config["map_list"]:
+        map_path = os.path.join("assets", "maps", f"{map_data['codename']}.png")
+        assets.load_image(map_path, (map_data["rect"].width, map_data["rect"].height), alpha=False)
+        assets.load_image(map_path, GAMEPLAY_SCREEN_SIZE, alpha=False)
+
+    for char in character_config["character_list"]:
+        codename = char["codename"]
+        get_skills_for_character(codename)
+        Character.preload_parts(codename)
+        for path, size in get_runtime_images_for_character(codename):
+            assets.load_image(path, size)
+    derived_cache.flush_index()
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    stats = assets.get_cache_stats()
+    print(json.dumps({"ms": elapsed_ms, "entries": stats["entries"], "derived": derived_cache.get_stats()}))
+
+
+def spawn(cache_dir, with_atlas):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", cache_dir]
+    if with_atlas:
+        cmd.append("--with-atlas")
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="파생 자산 캐시 콜드/웜 시작 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="콜드/웜 각각 반복 횟수")
+    parser.add_argument("--with-atlas", action="store_true", help="캐릭터 아틀라스 번들도 사용")
+    parser.add_argument("--child", metavar="CACHE_DIR", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child, args.with_atlas)
+        return
+
+    cold, warm = [], []
+    for _ in range(args.runs):
+        cache_dir = tempfile.mkdtemp(prefix="derived_cache_")
+        try:
+            cold_result = spawn(cache_dir, args.with_atlas)
+            warm_result = spawn(cache_dir, args.with_atlas)
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        cold.append(cold_result["ms"])
+        warm.append(warm_result["ms"])
+
+    print(f"이미지 {cold_result['entries']}개, 아틀라스 {'사용' if args.with_atlas else '미사용'}, {args.runs}회 중앙값")
+    print(f"  콜드 (PNG 디코딩 + 스케일 + 캐시 저장): {statistics.median(cold):8.1f} ms  {cold_result['derived']}")
+    print(f"  웜   (파생 캐시 읽기 + convert):        {statistics.median(warm):8.1f} ms  {warm_result['derived']}")
+    print(f"  속도 향상: {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# tools/bench_status_effects.py
+#
+# 📢 상태 이상 엔진(최소 힙 타이머) 벤치마크
+# 사용법 (저장소 루트에서): python src/tools/bench_status_effects.py [--ticks 20000] [--types 1 10 100]
+#
+# 1) 효과 종류 수에 따른 틱당 비용: 두 플레이어에게 K종류의 버프를 (만료되지 않을 만큼 길게) 걸어 두고
+#    기존 방식(틱마다 모든 종류의 만료 시각을 비교) vs StatusEngine.advance() (시각이 된 이벤트만 처리)를 비교합니다.
+# 2) 독 지속 피해: 같은 독을 기존 방식(틱마다 status_effects를 다시 만들며 검사)과 엔진으로 처리해 피해량/틱 횟수가 같은지 확인합니다.
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_state import PlayerState
+from sim_clock import SimClock
+from status_effects import StatusEngine, StatusEffect, register_effect, EFFECT_TYPES
+
+SIM_DT_MS = 1000 / 60
+LONG_MS = 1e12
+
+
+def bench_buff_types(k: int):
+    """K종류의 벤치마크용 버프 (PlayerState.extra의 bench_buff_<i>_end_time 키에 만료 시각 기록)"""
+    names = []
+    for i in range(k):
+        name = f"bench_buff_{i}"
+        if name not in EFFECT_TYPES:
+            register_effect(type(f"BenchBuff{i}", (StatusEffect,), {"name": name, "end_key": f"{name}_end_time"}))
+        names.append(name)
+    return names
+
+
+def legacy_tick(players, keys, now):
+    """기존 방식: 틱마다 플레이어별로 모든 종류의 만료 시각을 비교"""
+    for state in players:
+        extra = state.extra
+        for key in keys:
+            end = extra[key]
+            if end > 0 and now > end:
+                extra[key] = 0
+
+
+def per_tick_us(k: int, ticks: int):
+    names = bench_buff_types(k)
+    keys = [EFFECT_TYPES[name].end_key for name in names]
+
+    clock = SimClock()
+    engine = StatusEngine(clock)
+    players = [PlayerState(0, 0, 200), PlayerState(0, 0, 200)]
+    for state in players:
+        for name in names:
+            engine.apply(state, name, LONG_MS, 0)
+
+    now = 0.0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        now += SIM_DT_MS
+        legacy_tick(players, keys, now)
+    legacy = (time.perf_counter() - start) / ticks * 1e6
+
+    now = 0.0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        now += SIM_DT_MS
+        engine.advance(now)
+    heap = (time.perf_counter() - start) / ticks * 1e6
+    return legacy, heap
+
+
+def legacy_poison(entity, now, damage_log):
+    """기존 Match.update_status_effects_for_entity와 같은 규칙"""
+    new_effects = []
+    for eff in entity.status_effects:
+        if now >= eff["expires_at"]:
+            continue
+        if now - eff["last_tick"] >= 100:
+            hp_before = entity.hp
+            entity.hp = max(0, hp_before - int(eff["dps"] * entity.max_hp * 0.4))
+            damage_log.append((now, hp_before - entity.hp))
+            eff["last_tick"] = now
+        new_effects.append(eff)
+    entity.status_effects = new_effects
+
+
+def poison_matches(duration_ms: int = 2000, refresh_at: int = 45, ticks: int = 300):
+    """독을 걸고 refresh_at 틱에 다시 걸었을 때 기존 방식과 엔진의 (시각, 피해) 기록이 같은지"""
+    legacy_state = PlayerState(0, 0, 200)
+    legacy_log = []
+    clock = SimClock()
+    engine_log = []
+    engine = StatusEngine(clock, on_damage=lambda target, owner, source, dmg: engine_log.append((clock.get_ticks(), dmg)))
+    state = PlayerState(0, 0, 200)
+
+    def legacy_apply(now):
+        existing = next((eff for eff in legacy_state.status_effects if eff["type"] == "poison"), None)
+        if existing:
+            existing["expires_at"] = now + duration_ms
+        else:
+            legacy_state.status_effects.append({"type": "poison", "expires_at": now + duration_ms,
+                                                "dps": 0.015, "last_tick": now})
+
+    for tick in range(ticks):
+        now = clock.advance(SIM_DT_MS)
+        legacy_poison(legacy_state, now, legacy_log)
+        engine.advance(now)
+        if tick in (0, refresh_at):
+            legacy_apply(now)
+            engine.apply(state, "poison", duration_ms, now, dps=0.015, owner="p1", source="bench")
+    return legacy_log == engine_log and legacy_state.hp == state.hp, len(engine_log)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상태 이상 엔진 벤치마크")
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--types", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args(argv)
+
+    print(f"{'효과 종류':>8}{'기존 (전부 비교)':>18}{'힙 (advance)':>16}")
+    for k in args.types:
+        legacy, heap = per_tick_us(k, args.ticks)
+        print(f"{k:>8}{legacy:>16.2f}us{heap:>14.2f}us")
+
+    same, ticks = poison_matches()
+    print(f"독 지속 피해: 피해 틱 {ticks}회, 기존 방식과 {'같음' if same else '다름'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+# tools/matchup_matrix.py
+#
+# 📢 매치업 매트릭스 (멀티코어)
+# 사용법 (저장소 루트에서):
+#   python src/tools/matchup_matrix.py [--matches 50] [--workers 32] [--out .cache/matrix.jsonl] [--resume | --overwrite]
+#
+# character_config["character_list"]의 모든 (1P, 2P) 조합마다 시드가 다른 N경기를
+# 헤드리스(headless.run_match, 봇 입력, 렌더링 없음)로 돌려 승률표와 TTK(처치까지 걸린 시간)표를 만듭니다.
+# - 작업은 (조합, 시드 구간) 단위 청크로 나뉘어 프로세스 풀의 모든 코어에 분배됩니다. (공유 상태 없음)
+# - 청크가 끝날 때마다 결과를 JSON Lines 파일에 바로 기록하므로, 중간에 죽어도 끝난 경기는 남습니다.
+#   --resume으로 다시 실행하면 이미 기록된 (1P, 2P, 시드)는 건너뜁니다.
+#   각 줄에는 실행 설정(1P/2P 봇, 최대 경기 시간)도 기록되며, 설정이 다른 파일에는 이어서 실행하지 않습니다.
+#   결과가 있는 파일은 --overwrite를 주지 않으면 덮어쓰지 않습니다.
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from multiprocessing import Pool
+from typing import Dict, Any, List, Optional, Tuple, Iterable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import BOTS, DEFAULT_MAX_DURATION_MS, make_controller, run_match
+
+DEFAULT_OUT = os.path.join(".cache", "matrix.jsonl")
+DEFAULT_CHUNK = 10
+
+# (p1, p2, 시드 목록, 1P 봇, 2P 봇, 최대 경기 시간)
+Chunk = Tuple[str, str, List[int], str, str, float]
+
+# 결과 줄마다 기록하는 실행 설정 (같은 설정의 경기끼리만 한 표에 모읍니다)
+CONFIG_KEYS = ("p1_bot", "p2_bot", "max_duration_ms")
+
+
+def available_cpus() -> int:
+    """이 프로세스가 사용할 수 있는 코어 수 (affinity/cgroup 제한 반영)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def character_codenames() -> List[str]:
+    from scenes.characters import character_config
+    return [c["codename"] for c in character_config["character_list"]]
+
+
+def run_chunk(chunk: Chunk) -> List[Dict[str, Any]]:
+    """워커 프로세스: 한 조합의 시드 구간을 순서대로 실행합니다."""
+    p1, p2, seeds, p1_bot, p2_bot, max_duration_ms = chunk
+    p1_input, p2_input = make_controller(p1_bot), make_controller(p2_bot)
+    config = run_config(p1_bot, p2_bot, max_duration_ms)
+    results = []
+    for seed in seeds:
+        result = run_match(p1, p2, p1_input, p2_input, seed=seed, max_duration_ms=max_duration_ms)
+        result.update(config)
+        results.append(result)
+    return results
+
+
+def run_config(p1_bot: str, p2_bot: str, max_duration_ms: float) -> Dict[str, Any]:
+    return {"p1_bot": p1_bot, "p2_bot": p2_bot, "max_duration_ms": float(max_duration_ms)}
+
+
+def find_config_mismatch(results: List[Dict[str, Any]], config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """config와 다른 설정으로 기록된 첫 결과의 설정 (설정이 없는 예전 줄 포함). 모두 같으면 None."""
+    for r in results:
+        recorded = {key: r.get(key) for key in CONFIG_KEYS}
+        if recorded != config:
+            return recorded
+    return None
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    """기록된 결과를 읽습니다. 마지막 줄이 중간에 잘렸으면 무시합니다."""
+    results = []
+    if not os.path.exists(path):
+        return results
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return results
+
+
+def plan_chunks(codenames: List[str], matches: int, base_seed: int, chunk_size: int,
+                done: Iterable[Tuple[str, str, int]], p1_bot: str, p2_bot: str,
+                max_duration_ms: float) -> List[Chunk]:
+    """아직 기록되지 않은 경기만 청크로 나눕니다. 조합을 번갈아 배치해 긴 매치업이 한쪽에 몰리지 않게 합니다."""
+    done = set(done)
+    per_cell = []
+    for p1 in codenames:
+        for p2 in codenames:
+            seeds = [s for s in range(base_seed, base_seed + matches) if (p1, p2, s) not in done]
+            cell_chunks = [(p1, p2, seeds[i:i + chunk_size], p1_bot, p2_bot, max_duration_ms)
+                           for i in range(0, len(seeds), chunk_size)]
+            per_cell.append(cell_chunks)
+
+    chunks: List[Chunk] = []
+    for round_index in range(max((len(c) for c in per_cell), default=0)):
+        chunks.extend(c[round_index] for c in per_cell if round_index < len(c))
+    return chunks
+
+
+def build_tables(results: List[Dict[str, Any]], codenames: List[str]) -> Dict[str, Any]:
+    """승률표(1P 기준)와 TTK표(승부가 난 경기의 경기 시간 중앙값, 초)"""
+    cells: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for r in results:
+        cells.setdefault((r["p1"], r["p2"]), []).append(r)
+
+    win_rate: Dict[str, Dict[str, Any]] = {}
+    ttk: Dict[str, Dict[str, Any]] = {}
+    counts: Dict[str, Dict[str, int]] = {}
+    for p1 in codenames:
+        win_rate[p1], ttk[p1], counts[p1] = {}, {}, {}
+        for p2 in codenames:
+            cell = cells.get((p1, p2), [])
+            decided = [r for r in cell if r["winner_side"] is not None]
+            counts[p1][p2] = len(cell)
+            win_rate[p1][p2] = (sum(r["winner_side"] == "p1" for r in cell) / len(cell)) if cell else None
+            ttk[p1][p2] = statistics.median(r["duration_ms"] for r in decided) / 1000 if decided else None
+
+    overall = {}
+    for c in codenames:
+        games = [r for r in results if c in (r["p1"], r["p2"]) and r["p1"] != r["p2"]]
+        wins = sum((r["winner_side"] == "p1" and r["p1"] == c) or (r["winner_side"] == "p2" and r["p2"] == c) for r in games)
+        overall[c] = wins / len(games) if games else None
+
+    return {"characters": codenames, "matches": counts, "win_rate": win_rate, "ttk_seconds": ttk, "overall_win_rate": overall}
+
+
+def format_table(title: str, codenames: List[str], table: Dict[str, Dict[str, Any]], fmt: str) -> str:
+    width = max(8, max(len(c) for c in codenames) + 1)
+    lines = [title, "1P \\ 2P".ljust(width) + "".join(c.rjust(width) for c in codenames)]
+    for p1 in codenames:
+        row = "".join((fmt.format(v) if v is not None else "-").rjust(width) for v in (table[p1][p2] for p2 in codenames))
+        lines.append(p1.ljust(width) + row)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="전체 매치업 매트릭스를 멀티코어로 시뮬레이션")
+    parser.add_argument("--matches", type=int, default=50, help="조합당 경기 수")
+    parser.add_argument("--workers", type=int, default=available_cpus(), help="워커 프로세스 수 (기본: 사용 가능한 코어 수)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="워커에 한 번에 넘기는 경기 수")
+    parser.add_argument("--seed", type=int, default=0, help="첫 시드 (조합마다 seed..seed+matches-1)")
+    parser.add_argument("--p1", dest="p1_bot", default="aggressive", choices=sorted(BOTS), help="1P 봇")
+    parser.add_argument("--p2", dest="p2_bot", default="aggressive", choices=sorted(BOTS), help="2P 봇")
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_DURATION_MS / 1000, help="무승부 처리할 경기 시간 (초)")
+    parser.add_argument("--characters", nargs="+", help="대상 캐릭터 (기본: character_list 전체)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="경기 결과 JSON Lines 파일")
+    resume_group = parser.add_mutually_exclusive_group()
+    resume_group.add_argument("--resume", action="store_true", help="기존 결과 파일에 이어서 실행 (없으면 새로 시작)")
+    resume_group.add_argument("--overwrite", action="store_true", help="기존 결과 파일을 지우고 새로 시작")
+    parser.add_argument("--summary", help="승률/TTK 표를 JSON으로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    # 📢 실수로 끝난 결과를 지우지 않도록, 결과가 있는 파일은 --resume/--overwrite 없이는 열지 않습니다.
+    if not (args.resume or args.overwrite) and os.path.exists(args.out) and os.path.getsize(args.out) > 0:
+        parser.error(f"{args.out}에 이미 결과가 있습니다. 이어서 실행하려면 --resume, 지우고 새로 시작하려면 --overwrite를 주세요.")
+
+    codenames = args.characters or character_codenames()
+    if os.path.dirname(args.out):
+        os.makedirs(os.path.dirname(args.out), exist_ok=True)
+
+    config = run_config(args.p1_bot, args.p2_bot, args.max_seconds * 1000)
+    existing = load_results(args.out) if args.resume else []
+    mismatch = find_config_mismatch(existing, config)
+    if mismatch is not None:
+        parser.error(f"{args.out}의 기록은 다른 설정으로 실행되었습니다. (기록: {mismatch}, 지금: {config}) "
+                     "같은 설정으로 실행하거나 --overwrite/다른 --out을 사용하세요.")
+    # 잘린 마지막 줄을 버리고 다시 씁니다. (이어 쓰기 전에 파일을 정상 상태로)
+    with open(args.out, "w", encoding="utf-8") as f:
+        for r in existing:
+            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+
+    done = ((r["p1"], r["p2"], r["seed"]) for r in existing)
+    chunks = plan_chunks(codenames, args.matches, args.seed, max(1, args.chunk), done,
+                         args.p1_bot, args.p2_bot, args.max_seconds * 1000)
+    total = sum(len(c[2]) for c in chunks)
+    print(f"{len(codenames)}x{len(codenames)} 조합, 조합당 {args.matches}경기: "
+          f"기록됨 {len(existing)}, 남은 경기 {total} ({len(chunks)}청크, 워커 {args.workers})", file=sys.stderr)
+
+    start = time.perf_counter()
+    finished = 0
+    results = list(existing)
+    if chunks:
+        with open(args.out, "a", encoding="utf-8") as out, Pool(processes=max(1, args.workers)) as pool:
+            # 📢 청크가 끝나는 순서대로 받아 바로 디스크에 기록합니다.
+            for chunk_results in pool.imap_unordered(run_chunk, chunks):
+                for r in chunk_results:
+                    out.write(json.dumps(r, ensure_ascii=False) + "\n")
+                out.flush()
+                results.extend(chunk_results)
+                finished += len(chunk_results)
+                elapsed = time.perf_counter() - start
+                print(f"\r{finished}/{total}경기 ({finished / elapsed * 60:.0f}경기/분)", end="", file=sys.stderr)
+        print(file=sys.stderr)
+
+    tables = build_tables(results, codenames)
+    print(format_table("승률 (1P 기준)", codenames, tables["win_rate"], "{:.0%}"))
+    print()
+    print(format_table("TTK 중앙값 (초, 승부가 난 경기)", codenames, tables["ttk_seconds"], "{:.1f}"))
+    print()
+    print("전체 승률 (미러전 제외): " + ", ".join(
+        f"{c} {v:.0%}" if v is not None else f"{c} -" for c, v in tables["overall_win_rate"].items()))
+
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(tables, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
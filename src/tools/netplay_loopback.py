@@ -0,0 +1,151 @@
+# tools/netplay_loopback.py
+#
+# 📢 롤백 넷코드(netplay.py) 루프백 시험
+# 사용법 (저장소 루트에서):
+#   python src/tools/netplay_loopback.py [haegol joker] [--ticks 1200] [--latency 60] [--jitter 20] [--loss 0.05]
+#                                        [--delay 2] [--rollback 8]
+#
+# 두 프로세스가 127.0.0.1의 UDP 포트로 연결된 두 피어가 되어 각자 한쪽 캐릭터를 봇 입력으로 조작하며 60Hz 실시간으로 경기를 진행합니다.
+# 보내는 패킷은 --latency(+0~--jitter) ms 늦게 보내고 --loss 확률로 버립니다.
+# 끝나면 두 피어의 최종 상태가 같은지, 그리고 두 피어가 실제로 입력한 값으로 처음부터 (예측 없이) 시뮬레이션한 결과와 같은지 확인하고,
+# 되돌리기 횟수/깊이, 되돌리기 + 재시뮬레이션 최대 시간(한 프레임 16ms 이내여야 함), 대기 프레임 수를 출력합니다.
+
+import os
+import sys
+import time
+import argparse
+from multiprocessing import Process, Queue
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import make_controller, BOTS
+from input_bits import KeyState, actions_to_mask, step_masks
+from match import Match, SIM_DT_MS
+from netplay import RollbackSession, UdpTransport
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def observe(match: Match):
+    """비교할 경기 상태 (두 플레이어, 투사체 종류/위치)"""
+    players = tuple((p.x, p.y, p.vx, p.vy, p.hp, p.ultimate_gauge, p.flags) for p in (match.p1, match.p2))
+    projectiles = tuple((type(proj).__name__, proj.x, proj.y) for _, proj, _ in match.items.rows)
+    return match.tick, match.finished, match.winner, players, projectiles
+
+
+def run_peer(side: str, args, ports, results: Queue) -> None:
+    import random
+
+    local_port, remote_port = ports if side == "p1" else ports[::-1]
+    transport = UdpTransport(("127.0.0.1", local_port), ("127.0.0.1", remote_port),
+                             latency_ms=args.latency, jitter_ms=args.jitter, loss=args.loss,
+                             seed=args.seed + (side == "p2"))
+    match = Match(args.p1, args.p2)
+    session = RollbackSession(match, side, transport, input_delay=args.delay, max_rollback=args.rollback)
+    controller = make_controller(args.p1_input if side == "p1" else args.p2_input)
+    rng = random.Random(args.seed + (side == "p2"))
+    if not session.connect():
+        results.put({"side": side, "error": "연결 시간 초과"})
+        return
+
+    frame_s = SIM_DT_MS / 1000
+    next_frame = time.perf_counter()
+    max_frame_ms = 0.0
+    while True:
+        done = match.finished or match.tick >= args.ticks
+        if done and session.confirmed_tick >= match.tick:
+            break
+        start = time.perf_counter()
+        if done:
+            session.poll()
+        else:
+            session.advance(actions_to_mask(controller(match, side, rng)))
+        max_frame_ms = max(max_frame_ms, (time.perf_counter() - start) * 1000)
+        next_frame += frame_s
+        delay = next_frame - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_frame = time.perf_counter()
+    # 상대도 끝까지 확정할 수 있도록 잠시 더 재전송합니다.
+    linger = time.perf_counter() + 0.5
+    while time.perf_counter() < linger:
+        session.poll()
+        time.sleep(frame_s)
+
+    results.put({"side": side, "state": observe(match), "inputs": bytes(session.local_inputs[:match.tick]),
+                 "stats": session.stats, "max_frame_ms": max_frame_ms,
+                 "sent": transport.sent, "dropped": transport.dropped, "received": transport.received})
+    match.close()
+    transport.close()
+
+
+def replay(p1: str, p2: str, p1_inputs: bytes, p2_inputs: bytes, ticks: int):
+    """확정된 입력으로 처음부터 시뮬레이션한 최종 상태 (기준)"""
+    match = Match(p1, p2)
+    keys = KeyState()
+    previous = (0, 0)
+    while match.tick < ticks and not match.finished:
+        masks = (p1_inputs[match.tick], p2_inputs[match.tick])
+        step_masks(match, keys, masks, previous)
+        previous = masks
+    state = observe(match)
+    match.close()
+    return state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="롤백 넷코드 루프백 시험")
+    parser.add_argument("p1", nargs="?", default="haegol", help="1P 캐릭터 codename")
+    parser.add_argument("p2", nargs="?", default="joker", help="2P 캐릭터 codename")
+    parser.add_argument("--ticks", type=int, default=1200, help="진행할 틱 수 (60Hz 실시간)")
+    parser.add_argument("--latency", type=float, default=60.0, help="보내는 패킷 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=20.0, help="추가 지연 최대값 (ms, 0~jitter 균등)")
+    parser.add_argument("--loss", type=float, default=0.05, help="패킷 손실 확률")
+    parser.add_argument("--delay", type=int, default=2, help="입력 지연 (틱)")
+    parser.add_argument("--rollback", type=int, default=8, help="최대 되돌리기 (틱)")
+    parser.add_argument("--p1-input", default="aggressive", choices=sorted(BOTS))
+    parser.add_argument("--p2-input", default="aggressive", choices=sorted(BOTS))
+    parser.add_argument("--port", type=int, default=47800, help="1P 포트 (2P는 +1)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results: Queue = Queue()
+    ports = (args.port, args.port + 1)
+    peers = [Process(target=run_peer, args=(side, args, ports, results)) for side in ("p1", "p2")]
+    for peer in peers:
+        peer.start()
+    reports = {}
+    for _ in peers:
+        report = results.get()
+        reports[report["side"]] = report
+    for peer in peers:
+        peer.join()
+    errors = [report["error"] for report in reports.values() if "error" in report]
+    if errors:
+        print(", ".join(errors))
+        return 1
+
+    p1, p2 = reports["p1"], reports["p2"]
+    same_peers = p1["state"] == p2["state"]
+    ticks = p1["state"][0]
+    reference = replay(args.p1, args.p2, p1["inputs"], p2["inputs"], ticks)
+    same_reference = p1["state"] == reference
+    worst_ms = 0.0 # 📢 두 프로세스가 같은 CPU를 나눠 쓰므로 최대값에는 스케줄링 지연이 섞일 수 있습니다. (bench_snapshot.py 참고)
+    for side in ("p1", "p2"):
+        report, stats = reports[side], reports[side]["stats"]
+        rollbacks = max(1, stats["rollbacks"])
+        worst_ms = max(worst_ms, stats["max_rollback_ms"])
+        print(f"{side}: 되돌리기 {stats['rollbacks']}회 (평균 {stats['rollback_ticks'] / rollbacks:.1f}틱, "
+              f"최대 {stats['max_rollback_ticks']}틱, 평균 {stats['rollback_ms'] / rollbacks:.2f}ms, 최대 {stats['max_rollback_ms']:.2f}ms), "
+              f"프레임 최대 {report['max_frame_ms']:.2f}ms, 입력 대기 {stats['stalls']}프레임, "
+              f"시간 맞추기 {stats['sync_waits']}프레임, 패킷 보냄 {report['sent']} / 버림 {report['dropped']} / 받음 {report['received']}")
+    print(f"{ticks}틱: 두 피어 상태 {'같음' if same_peers else '다름'}, "
+          f"확정 입력으로 다시 시뮬레이션한 결과와 {'같음' if same_reference else '다름'}")
+    if worst_ms > FRAME_BUDGET_MS:
+        print(f"경고: 되돌리기가 한 프레임({FRAME_BUDGET_MS:.1f}ms)을 넘은 적이 있습니다: {worst_ms:.2f}ms")
+    return 0 if same_peers and same_reference else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
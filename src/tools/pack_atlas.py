@@ -0,0 +1,161 @@
+# tools/pack_atlas.py
+#
+# 📢 오프라인 텍스처 아틀라스 패커
+# 사용법 (저장소 루트에서): python src/tools/pack_atlas.py
+#
+# 1. 더미 디스플레이에서 모든 캐릭터의 Character/스킬 객체를 만들어,
+#    게임이 실제로 요청하는 (path, size) 조합을 자산 레지스트리에서 수집합니다.
+# 2. 캐릭터별로 미리 스케일된 이미지를 선반(shelf) 방식으로 한 장의 아틀라스 페이지에 배치합니다.
+# 3. 이진 인덱스 + RGBA 원시 픽셀을 assets/atlas/characters.atlas 한 파일로 저장합니다.
+#    인덱스에는 원본 PNG의 수정 시각/크기도 함께 기록합니다. (원본이 바뀐 항목은 런타임에서 무시)
+
+import os
+import sys
+import struct
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import atlas
+import assets
+
+MAX_PAGE_WIDTH = 2048
+PADDING = 1
+
+
+def collect_requests():
+    """게임이 사용하는 assets/characters/* 의 (path, size) 목록을 수집합니다."""
+    from scenes.characters import character_config
+    from skills.skills_skills_loader import get_skills_for_character, get_runtime_images_for_character
+    from animation import Character
+
+    # 기존 번들이 있더라도 항상 원본 PNG 기준으로 수집합니다.
+    atlas.disable_bundle()
+    assets.clear_cache()
+
+    runtime_images = []
+    for char in character_config["character_list"]:
+        codename = char["codename"]
+        get_skills_for_character(codename)
+        Character(codename, 1, {}, {})
+        # 스킬 발동 중에만 생성되는 이펙트 이미지 (객체 생성만으로는 수집되지 않음)
+        runtime_images.extend(get_runtime_images_for_character(codename))
+
+    requests = set()
+    for path, size, flip, alpha in assets.iter_cache_keys():
+        if isinstance(path, str) and size is not None and not flip and alpha:
+            norm = atlas.normalize_path(path)
+            if norm.startswith("assets/characters/"):
+                requests.add((norm, size))
+    for path, size in runtime_images:
+        requests.add((atlas.normalize_path(path), size))
+    return requests
+
+
+def shelf_pack(sizes):
+    """(w, h) 목록을 선반 방식으로 배치합니다. 반환: 배치 좌표 목록, 페이지 크기"""
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    positions = [None] * len(sizes)
+    x = y = shelf_h = page_w = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > MAX_PAGE_WIDTH and x > 0:
+            y += shelf_h + PADDING
+            x = shelf_h = 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+        page_w = max(page_w, x)
+    return positions, (page_w, y + shelf_h)
+
+
+def build_pages(requests):
+    by_character = {}
+    for path, size in sorted(requests):
+        by_character.setdefault(path.split("/")[2], []).append((path, size))
+
+    pages = []
+    for name, items in sorted(by_character.items()):
+        images = []
+        for path, size in items:
+            stamp = atlas.source_stamp(path)
+            if stamp is None:
+                continue
+            img = pygame.image.load(path).convert_alpha()
+            # 게임과 동일한 결과를 위해 transform.scale 사용
+            images.append((path, stamp, pygame.transform.scale(img, size)))
+        if not images:
+            continue
+        positions, page_size = shelf_pack([img.get_size() for _, _, img in images])
+        page = pygame.Surface(page_size, pygame.SRCALPHA)
+        page.fill((0, 0, 0, 0))
+        entries = []
+        for (path, stamp, img), pos in zip(images, positions):
+            page.blit(img, pos)
+            entries.append((path, img.get_size(), pos, stamp))
+        pages.append((name, page, entries))
+    return pages
+
+
+def write_bundle(pages, out_path):
+    header_size = struct.calcsize(atlas.HEADER_FMT)
+    page_records = []
+    entry_records = []
+    for page_index, (name, page, entries) in enumerate(pages):
+        page_records.append(name.encode("utf-8"))
+        for path, (w, h), (x, y), (mtime_ns, source_size) in entries:
+            entry_records.append((path.encode("utf-8"), w, h, page_index, x, y, mtime_ns, source_size))
+
+    index_size = header_size
+    index_size += sum(struct.calcsize(atlas.PAGE_FMT) + len(n) for n in page_records)
+    index_size += sum(struct.calcsize(atlas.ENTRY_FMT) + len(e[0]) for e in entry_records)
+
+    # 페이지 데이터 오프셋 계산 (정렬)
+    offsets = []
+    offset = index_size
+    for _, page, _ in pages:
+        offset = (offset + atlas.DATA_ALIGN - 1) // atlas.DATA_ALIGN * atlas.DATA_ALIGN
+        offsets.append(offset)
+        offset += page.get_width() * page.get_height() * 4
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(struct.pack(atlas.HEADER_FMT, atlas.MAGIC, atlas.VERSION, len(pages), len(entry_records)))
+        for (name, page, _), name_bytes, data_offset in zip(pages, page_records, offsets):
+            f.write(struct.pack(atlas.PAGE_FMT, len(name_bytes), page.get_width(), page.get_height(), data_offset))
+            f.write(name_bytes)
+        for path_bytes, w, h, page_index, x, y, mtime_ns, source_size in entry_records:
+            f.write(struct.pack(atlas.ENTRY_FMT, len(path_bytes), w, h, page_index, x, y, mtime_ns, source_size))
+            f.write(path_bytes)
+        for (_, page, _), data_offset in zip(pages, offsets):
+            f.write(b"\0" * (data_offset - f.tell()))
+            f.write(pygame.image.tobytes(page, "RGBA"))
+    os.replace(tmp_path, out_path)
+    return offset
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="캐릭터 텍스처 아틀라스 번들 생성")
+    parser.add_argument("--out", default=atlas.BUNDLE_PATH, help="출력 번들 경로")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    requests = collect_requests()
+    pages = build_pages(requests)
+    total = write_bundle(pages, args.out)
+
+    entry_count = sum(len(entries) for _, _, entries in pages)
+    print(f"{len(pages)}개 페이지, {entry_count}개 이미지 -> {args.out} ({total / 1024 / 1024:.1f} MB)")
+    for name, page, entries in pages:
+        print(f"  {name}: {page.get_width()}x{page.get_height()} ({len(entries)}개)")
+
+
+if __name__ == "__main__":
+    main()
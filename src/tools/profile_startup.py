@@ -0,0 +1,82 @@
+# tools/profile_startup.py
+#
+# 📢 시작 시간 프로파일러 / 회귀 검사
+# 사용법 (저장소 루트에서): python src/tools/profile_startup.py [--runs 5] [--budget 500]
+#
+# main.py를 프로파일 모드(startup_profile.PROFILE_ENV)로 여러 번 실행하여
+# import / 초기화 구간별 시간과 첫 타이틀 프레임까지의 시간(time-to-first-title-frame)을 측정합니다.
+# 중앙값이 예산(FIRST_TITLE_FRAME_BUDGET_MS)을 넘으면 종료 코드 1을 반환하므로 회귀 검사에 사용할 수 있습니다.
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SRC_DIR)
+
+from startup_profile import PROFILE_ENV
+
+# 📢 첫 타이틀 프레임까지의 시간 예산 (main.py 첫 줄 기준, 인터프리터 시작 시간 제외)
+FIRST_TITLE_FRAME_BUDGET_MS = 500
+
+
+def run_once():
+    env = dict(os.environ)
+    env[PROFILE_ENV] = "1"
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, os.path.join(SRC_DIR, "main.py")],
+                          env=env, capture_output=True, text=True, timeout=60)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith("{"):
+            report = json.loads(line)
+            report["wall_ms"] = wall_ms
+            return report
+    raise RuntimeError(f"main.py가 프로파일 결과를 출력하지 않았습니다 (종료 코드 {proc.returncode}):\n{proc.stderr}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="첫 타이틀 프레임까지의 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="반복 실행 횟수 (중앙값 사용)")
+    parser.add_argument("--budget", type=float, default=FIRST_TITLE_FRAME_BUDGET_MS, help="허용 시간 (ms)")
+    parser.add_argument("--json", action="store_true", help="중앙값 결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    reports = [run_once() for _ in range(args.runs)]
+
+    phase_names = [p["phase"] for p in reports[0]["phases"]]
+    phases = {name: statistics.median(next(p["ms"] for p in r["phases"] if p["phase"] == name) for r in reports)
+              for name in phase_names}
+    timed_names = sorted({name for r in reports for name in r["timed"]})
+    timed = {name: statistics.median(r["timed"].get(name, 0.0) for r in reports) for name in timed_names}
+    total = statistics.median(r["total_ms"] for r in reports)
+    wall = statistics.median(r["wall_ms"] for r in reports)
+    passed = total <= args.budget
+
+    if args.json:
+        print(json.dumps({"phases": phases, "timed": timed, "total_ms": total, "wall_ms": wall,
+                          "budget_ms": args.budget, "passed": passed}))
+    else:
+        print(f"시작 시간 ({args.runs}회 중앙값)")
+        for name, ms in phases.items():
+            print(f"  {name:<20} {ms:8.1f} ms")
+        for name, ms in timed.items():
+            print(f"  ({name:<18} {ms:8.1f} ms, 위 구간에 포함)")
+        print(f"  첫 타이틀 프레임      {total:8.1f} ms  (예산 {args.budget:.0f} ms)")
+        print(f"  프로세스 시작 포함    {wall:8.1f} ms")
+        print("통과" if passed else "예산 초과 (시작 시간 회귀)")
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
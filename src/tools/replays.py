@@ -0,0 +1,120 @@
+# tools/replays.py
+#
+# 📢 입력 기록/리플레이 (replay.py)
+# 사용법 (저장소 루트에서):
+#   python src/tools/replays.py record haegol joker out.rpl [--p1 aggressive] [--p2 random] [--seed 0]
+#   python src/tools/replays.py play out.rpl [--speed 1|4|0] [--render] [--scale 0.5]
+#
+# record: 헤드리스 봇 경기를 돌리며 틱마다 두 플레이어의 입력을 기록해 저장합니다. (gameplay 경기는 replays/에 자동 저장)
+# play: 기록된 입력으로 경기를 다시 진행합니다. --speed 1은 실시간, 4는 4배속, 0은 제한 없음이고,
+#       --render를 주면 창에 그립니다. 끝나면 결과(승자/틱/체력)를 출력하므로 record의 출력과 비교할 수 있습니다.
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from replay import InputRecorder, Replay, ReplayPlayer, UNCAPPED
+
+
+def summary(result) -> str:
+    return (f"승자 {result['winner'] or '없음'}, {result['ticks']}틱, "
+            f"체력 p1 {result['hp']['p1']:g} / p2 {result['hp']['p2']:g}")
+
+
+def record(args) -> int:
+    from headless import DEFAULT_MAP, make_controller, run_match
+
+    recorder = InputRecorder(args.p1, args.p2, args.map or DEFAULT_MAP, args.seed)
+    result = run_match(args.p1, args.p2, make_controller(args.p1_input), make_controller(args.p2_input),
+                       seed=args.seed, map_path=args.map or DEFAULT_MAP, recorder=recorder)
+    size = recorder.save(args.out)
+    print(f"{args.out}: {size}바이트 ({recorder.replay.ticks}틱, 런 {len(recorder.replay.runs[0])} + {len(recorder.replay.runs[1])}개)")
+    print(summary(result))
+    return 0
+
+
+def make_renderer(replay: Replay, scale: float):
+    """창에 경기를 그리는 render(match) 함수 (창을 닫으면 False)"""
+    import pygame
+    from assets import load_image
+    from fonts import get_font, render_text, DEFAULT_FONT_PATH
+    from ecs import Scheduler
+    from render_systems import RENDER_SYSTEMS
+
+    width, height = replay.screen_size
+    window = pygame.display.set_mode((int(width * scale), int(height * scale)))
+    pygame.display.set_caption(f"{replay.p1} vs {replay.p2}")
+    canvas = pygame.Surface((width, height)) if scale != 1 else window
+    background = load_image(replay.map_path, (width, height), alpha=False) if replay.map_path else None
+    font = get_font(DEFAULT_FONT_PATH, 30)
+    render_systems = Scheduler(RENDER_SYSTEMS)
+
+    def render(match) -> bool:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                return False
+        if background is not None:
+            canvas.blit(background, (0, 0))
+        else:
+            canvas.fill((0, 0, 100))
+        render_systems.run(match, canvas, 1.0)
+        for x, state in ((50, match.p1), (width - 250, match.p2)):
+            pygame.draw.rect(canvas, (255, 0, 0), (x, 50, 200 * max(0, state.hp) / state.max_hp, 20))
+            pygame.draw.rect(canvas, (255, 255, 255), (x, 50, 200, 20), 2)
+        canvas.blit(render_text(font, f"{match.tick}틱", (255, 255, 255)), (width // 2 - 40, 40))
+        if canvas is not window:
+            pygame.transform.scale(canvas, window.get_size(), window)
+        pygame.display.flip()
+        return True
+
+    return render
+
+
+def play(args) -> int:
+    replay = Replay.load(args.file)
+    render = make_renderer(replay, args.scale) if args.render else None
+    player = ReplayPlayer(replay)
+    start = time.perf_counter()
+    match = player.run(args.speed, render)
+    elapsed = time.perf_counter() - start
+    speed = "제한 없음" if args.speed == UNCAPPED else f"{args.speed:g}배속"
+    print(f"{replay.p1} vs {replay.p2} ({replay.map_path}, 시드 {replay.seed}): {speed}, "
+          f"{match.tick}/{replay.ticks}틱 재생 {elapsed:.2f}초")
+    print(summary(match.get_result()))
+    match.close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="입력 기록/리플레이")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record", help="헤드리스 봇 경기를 기록")
+    rec.add_argument("p1", help="1P 캐릭터 codename")
+    rec.add_argument("p2", help="2P 캐릭터 codename")
+    rec.add_argument("out", help="저장할 리플레이 파일 (.rpl)")
+    rec.add_argument("--p1", dest="p1_input", default="aggressive", help="1P 봇")
+    rec.add_argument("--p2", dest="p2_input", default="aggressive", help="2P 봇")
+    rec.add_argument("--seed", type=int, default=0, help="봇 난수 시드")
+    rec.add_argument("--map", help="맵 이미지 경로 (기록에 저장, 렌더링 배경)")
+
+    pl = commands.add_parser("play", help="리플레이 재생")
+    pl.add_argument("file", help="리플레이 파일 (.rpl)")
+    pl.add_argument("--speed", type=float, default=UNCAPPED, help="재생 속도 (1: 실시간, 4: 4배속, 0: 제한 없음)")
+    pl.add_argument("--render", action="store_true", help="창에 그리기")
+    pl.add_argument("--scale", type=float, default=0.5, help="창 크기 배율 (--render)")
+    args = parser.parse_args(argv)
+
+    if args.command == "play" and not args.render:
+        # 📢 그리지 않을 때는 창/소리 없이 재생합니다. (디스플레이를 초기화하기 전에 설정)
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    return record(args) if args.command == "record" else play(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# tools/simulate.py
+#
+# 📢 헤드리스 경기 시뮬레이터
+# 사용법 (저장소 루트에서):
+#   python src/tools/simulate.py haegol joker [--matches 100] [--p1 aggressive] [--p2 random] [--seed 0]
+#   python src/tools/simulate.py iceman witch --script inputs.json --out results.jsonl
+#
+# 창/렌더링/사운드 없이 gameplay와 같은 전투 규칙(match.Match)으로 경기를 최대 속도로 돌리고,
+# 경기마다 한 줄의 JSON(승자, 경기 시간, 스킬별 피해량, 궁극기 사용 횟수 등)을 출력합니다.
+# 같은 시드/입력이면 항상 같은 결과가 나오므로 밸런스 조정과 회귀 검사에 사용할 수 있습니다.
+
+import os
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from combat_events import EventLog
+from headless import BOTS, DEFAULT_MAP, DEFAULT_MAX_DURATION_MS, load_script, make_controller, run_match
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="헤드리스 경기 시뮬레이터 (경기마다 JSON 한 줄 출력)")
+    parser.add_argument("p1", help="1P 캐릭터 codename")
+    parser.add_argument("p2", help="2P 캐릭터 codename")
+    parser.add_argument("--map", default=DEFAULT_MAP, help="맵 이미지 경로 (결과에 기록)")
+    parser.add_argument("--matches", type=int, default=1, help="경기 수")
+    parser.add_argument("--p1", dest="p1_input", default="aggressive", choices=sorted(BOTS), help="1P 봇")
+    parser.add_argument("--p2", dest="p2_input", default="aggressive", choices=sorted(BOTS), help="2P 봇")
+    parser.add_argument("--script", help="틱별 입력 스크립트 JSON ({\"p1\": [[tick, [actions]], ...]}), 지정한 쪽은 봇 대신 사용")
+    parser.add_argument("--seed", type=int, default=0, help="첫 경기 시드 (경기마다 1씩 증가)")
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_DURATION_MS / 1000, help="무승부 처리할 경기 시간 (초)")
+    parser.add_argument("--out", help="결과 JSON Lines 파일 (기본: 표준 출력)")
+    parser.add_argument("--clash", action="store_true", help="투사체 상쇄 규칙 사용 (서로 다른 캐릭터의 투사체가 부딪히면 둘 다 사라짐)")
+    parser.add_argument("--events", action="store_true", help="경기마다 전투 이벤트 종류별 개수를 결과에 추가 (\"events\")")
+    args = parser.parse_args(argv)
+
+    p1_input = make_controller(args.p1_input)
+    p2_input = make_controller(args.p2_input)
+    if args.script:
+        scripted = load_script(args.script)
+        p1_input = scripted.get("p1", p1_input)
+        p2_input = scripted.get("p2", p2_input)
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    # 📢 승리는 코드네임이 아니라 진영(p1/p2, 무승부 None)으로 셉니다. (미러전에서도 구분되도록)
+    wins = {"p1": 0, "p2": 0, None: 0}
+    start = time.perf_counter()
+    try:
+        for i in range(args.matches):
+            log = EventLog() if args.events else None
+            result = run_match(args.p1, args.p2, p1_input, p2_input, seed=args.seed + i,
+                               max_duration_ms=args.max_seconds * 1000, map_path=args.map,
+                               listeners=[log] if log else (), clash=args.clash)
+            if log:
+                result["events"] = log.counts()
+            wins[result["winner_side"]] += 1
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    # 요약은 표준 에러로 (표준 출력은 JSON Lines만)
+    rate = args.matches / elapsed * 60 if elapsed > 0 else float("inf")
+    print(f"{args.matches}경기 {elapsed:.2f}초 ({rate:.0f}경기/분) "
+          f"1P {args.p1} {wins['p1']}승 / 2P {args.p2} {wins['p2']}승 / 무승부 {wins[None]}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())